@@ -5,9 +5,18 @@ Provides document database operations using Motor async driver.
 """
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    ReplaceOne,
+    UpdateMany,
+    UpdateOne,
+)
+from pymongo.errors import BulkWriteError
 
 from dataflow.adapters.base_adapter import BaseAdapter
 
@@ -29,8 +38,20 @@ class MongoDBAdapter(BaseAdapter):
         >>> await adapter.connect()
         >>> result_id = await adapter.insert_one("users", {"name": "Alice"})
         >>> documents = await adapter.find("users", {"name": "Alice"})
+        >>> async for doc in adapter.find_stream("users", batch_size=500):
+        ...     export(doc)
     """
 
+    # Write model classes accepted in bulk_write() operation specs
+    _BULK_OPERATIONS = {
+        "insert": InsertOne,
+        "update_one": UpdateOne,
+        "update_many": UpdateMany,
+        "replace_one": ReplaceOne,
+        "delete_one": DeleteOne,
+        "delete_many": DeleteMany,
+    }
+
     def __init__(
         self, connection_string: str, database_name: Optional[str] = None, **kwargs
     ):
@@ -399,6 +420,117 @@ class MongoDBAdapter(BaseAdapter):
             logger.error(f"Failed to find documents in {collection}: {e}")
             raise
 
+    async def find_stream(
+        self,
+        collection: str,
+        filter: Optional[dict] = None,
+        projection: Optional[dict] = None,
+        batch_size: int = 1000,
+        page_size: int = 10000,
+        start_after: Any = None,
+        limit: int = 0,
+        **options,
+    ) -> AsyncIterator[dict]:
+        """Stream matching documents in ``_id`` order without materializing them.
+
+        Documents are read in pages of ``page_size`` using range pagination on
+        ``_id`` (``{"_id": {"$gt": last_id}}``) instead of skip/limit, so every
+        page is an index seek and no cursor stays open for the whole export.
+        Within a page the driver fetches ``batch_size`` documents per round
+        trip.
+
+        Args:
+            collection: Collection name
+            filter: Query filter (default: {})
+            projection: Fields to include/exclude (``_id`` is always read for
+                pagination and dropped again if the projection excludes it)
+            batch_size: Documents per server round trip
+            page_size: Documents per range query
+            start_after: Resume after this ``_id`` (e.g. the last one exported)
+            limit: Maximum number of documents to yield (0 = no limit)
+            **options: Additional find options (a ``sort`` option may only
+                ask for ascending ``_id``, the order pages are read in)
+
+        Yields:
+            dict: Matching documents
+
+        Raises:
+            ValueError: If ``sort`` asks for any other order
+
+        Example:
+            >>> async for doc in adapter.find_stream("events", {"type": "click"}):
+            ...     await sink.write(doc)
+        """
+        if not self._connected or self._db is None:
+            raise ConnectionError("Not connected to MongoDB")
+
+        if batch_size <= 0 or page_size <= 0:
+            raise ValueError("batch_size and page_size must be positive")
+
+        sort = options.pop("sort", None)
+        if isinstance(sort, dict):
+            sort = list(sort.items())
+        if sort not in (None, [("_id", 1)]):
+            raise ValueError(
+                "find_stream always returns documents in ascending _id order; "
+                f"sort={sort!r} is not supported"
+            )
+
+        filter = filter or {}
+        drop_id = False
+        if projection is not None and not projection.get("_id", True):
+            # _id is needed for range pagination; read it and drop it per document
+            drop_id = True
+            fields = {k: v for k, v in projection.items() if k != "_id"}
+            if any(fields.values()):
+                projection = {**fields, "_id": True}
+            else:
+                projection = fields or None
+
+        coll = self._db[collection]
+        last_id = start_after
+        yielded = 0
+
+        try:
+            while True:
+                page_filter = filter
+                if last_id is not None:
+                    range_filter = {"_id": {"$gt": last_id}}
+                    page_filter = (
+                        {"$and": [filter, range_filter]} if filter else range_filter
+                    )
+
+                page_limit = page_size
+                if limit > 0:
+                    page_limit = min(page_size, limit - yielded)
+
+                cursor = coll.find(
+                    page_filter,
+                    projection=projection,
+                    sort=[("_id", 1)],
+                    limit=page_limit,
+                    batch_size=min(batch_size, page_limit),
+                    **options,
+                )
+
+                page_count = 0
+                async for document in cursor:
+                    page_count += 1
+                    last_id = document["_id"]
+                    if drop_id:
+                        document.pop("_id", None)
+                    yield document
+
+                yielded += page_count
+                if page_count < page_limit or (limit > 0 and yielded >= limit):
+                    break
+
+            logger.debug(f"Streamed {yielded} documents from {collection}")
+
+        except Exception as e:
+            logger.error(f"Failed to stream documents from {collection}: {e}")
+            raise
+
     async def update_one(
         self,
         collection: str,
@@ -577,6 +709,143 @@ class MongoDBAdapter(BaseAdapter):
             logger.error(f"Failed to delete documents from {collection}: {e}")
             raise
 
+    async def bulk_write(
+        self,
+        collection: str,
+        operations: List[Any],
+        ordered: bool = False,
+        batch_size: int = 1000,
+        **options,
+    ) -> dict:
+        """Execute mixed insert/update/replace/delete operations in batches.
+
+        Operations are sent to the server ``batch_size`` at a time, each batch
+        as one bulk write command, instead of one command per document. With
+        ``ordered=False`` (the default) the server may apply a batch in any
+        order and a failing operation does not stop the others; with
+        ``ordered=True`` processing stops at the first error.
+
+        Args:
+            collection: Collection name
+            operations: Operation specs, either pymongo write models
+                (``InsertOne``, ``UpdateOne``, ...) or dicts such as
+                ``{"op": "insert", "document": {...}}``,
+                ``{"op": "update_one", "filter": {...}, "update": {...}, "upsert": False}``,
+                ``{"op": "replace_one", "filter": {...}, "replacement": {...}}``,
+                ``{"op": "delete_many", "filter": {...}}``
+            ordered: Stop at the first failed operation (default: False)
+            batch_size: Operations per bulk write command
+            **options: Additional bulk_write options
+                - bypass_document_validation: Skip validation
+
+        Returns:
+            dict: Totals across all batches with:
+                - inserted_count, matched_count, modified_count,
+                  deleted_count, upserted_count
+                - upserted_ids: {operation index: upserted id}
+                - batches: Number of bulk write commands sent
+                - errors: Write errors with their operation ``index``
+
+        Example:
+            >>> result = await adapter.bulk_write("users", [
+            ...     {"op": "insert", "document": {"name": "Alice"}},
+            ...     {"op": "update_one", "filter": {"name": "Bob"},
+            ...      "update": {"$set": {"active": True}}},
+            ...     {"op": "delete_many", "filter": {"active": False}},
+            ... ])
+        """
+        if not self._connected or self._db is None:
+            raise ConnectionError("Not connected to MongoDB")
+
+        if not operations:
+            raise ValueError("Operations list cannot be empty")
+
+        if batch_size <= 0:
+            raise ValueError("batch_size must be positive")
+
+        requests = [self._to_write_model(operation) for operation in operations]
+        coll = self._db[collection]
+        totals = {
+            "inserted_count": 0,
+            "matched_count": 0,
+            "modified_count": 0,
+            "deleted_count": 0,
+            "upserted_count": 0,
+            "upserted_ids": {},
+            "batches": 0,
+            "errors": [],
+        }
+
+        for offset in range(0, len(requests), batch_size):
+            batch = requests[offset : offset + batch_size]
+            totals["batches"] += 1
+            try:
+                result = await coll.bulk_write(batch, ordered=ordered, **options)
+                details = result.bulk_api_result
+            except BulkWriteError as e:
+                details = e.details
+            except Exception as e:
+                logger.error(f"Bulk write on {collection} failed: {e}")
+                raise
+
+            self._merge_bulk_result(totals, details, offset)
+            if ordered and details.get("writeErrors"):
+                break
+
+        logger.info(
+            f"Bulk write on {collection}: {len(requests)} operations in "
+            f"{totals['batches']} batches, {len(totals['errors'])} errors"
+        )
+        return totals
+
+    def _to_write_model(self, operation: Any) -> Any:
+        """Convert an operation spec dict into a pymongo write model."""
+        if not isinstance(operation, dict):
+            return operation
+
+        op = operation.get("op")
+        model = self._BULK_OPERATIONS.get(op)
+        if model is None:
+            raise ValueError(
+                f"Unknown bulk operation '{op}'; expected one of "
+                f"{', '.join(self._BULK_OPERATIONS)}"
+            )
+
+        if op == "insert":
+            return InsertOne(operation["document"])
+        if op in ("delete_one", "delete_many"):
+            return model(operation["filter"])
+        if op == "replace_one":
+            return ReplaceOne(
+                operation["filter"],
+                operation["replacement"],
+                upsert=operation.get("upsert", False),
+            )
+        return model(
+            operation["filter"],
+            operation["update"],
+            upsert=operation.get("upsert", False),
+        )
+
+    @staticmethod
+    def _merge_bulk_result(totals: dict, details: dict, offset: int) -> None:
+        """Add one bulk write result (or BulkWriteError details) to totals."""
+        totals["inserted_count"] += details.get("nInserted", 0)
+        totals["matched_count"] += details.get("nMatched", 0)
+        totals["modified_count"] += details.get("nModified", 0)
+        totals["deleted_count"] += details.get("nRemoved", 0)
+        totals["upserted_count"] += details.get("nUpserted", 0)
+        for upsert in details.get("upserted", []):
+            totals["upserted_ids"][offset + upsert["index"]] = str(upsert["_id"])
+        for error in details.get("writeErrors", []):
+            totals["errors"].append(
+                {
+                    "index": offset + error.get("index", 0),
+                    "code": error.get("code"),
+                    "message": error.get("errmsg"),
+                }
+            )
+
     async def count_documents(
         self, collection: str, filter: Optional[dict] = None, **options
     ) -> int:
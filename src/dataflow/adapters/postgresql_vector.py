@@ -3,15 +3,68 @@ PostgreSQL Vector Database Adapter
 
 PostgreSQL adapter with pgvector extension for vector similarity search.
 Extends PostgreSQLAdapter with vector operations for RAG and semantic search.
+
+Query vectors are sent as bound parameters in pgvector's binary wire format
+(a codec is registered on every pooled asyncpg connection), so they are never
+formatted into SQL text.
+
+Note: because of that codec, ``vector`` columns read through this adapter
+come back as ``list`` of floats. Without it asyncpg returns pgvector's text
+form (e.g. ``"[0.1,0.2]"``); code that parsed that string should use the
+list directly.
 """
 
 import logging
-from typing import Any, Dict, List, Optional
+import struct
+from typing import Any, Dict, List, Optional, Sequence
 
+from .exceptions import ConnectionError, QueryError
 from .postgresql import PostgreSQLAdapter
 
 logger = logging.getLogger(__name__)
 
+# Distance operator mapping
+DISTANCE_OPERATORS = {"cosine": "<=>", "l2": "<->", "ip": "<#>"}
+
+# Distance column of the batched LATERAL query, where ``SELECT *`` may
+# already return a table column named "distance"
+_BATCH_DISTANCE_ALIAS = "_vector_distance"
+
+
+def encode_vector(values: Sequence[float]) -> bytes:
+    """Encode a vector in pgvector's binary format (dim, unused, float4[dim])."""
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    dim = len(values)
+    return struct.pack(f">HH{dim}f", dim, 0, *values)
+
+
+def decode_vector(data: bytes) -> List[float]:
+    """Decode a vector from pgvector's binary format."""
+    dim, _ = struct.unpack_from(">HH", data)
+    return list(struct.unpack_from(f">{dim}f", data, 4))
+
+
+async def register_vector_codec(connection) -> bool:
+    """
+    Register the binary pgvector codec on an asyncpg connection.
+
+    Returns:
+        False if the ``vector`` type does not exist (extension not installed)
+    """
+    try:
+        await connection.set_type_codec(
+            "vector",
+            schema="public",
+            encoder=encode_vector,
+            decoder=decode_vector,
+            format="binary",
+        )
+    except ValueError:
+        # asyncpg raises ValueError for unknown types
+        return False
+    return True
+
 
 class PostgreSQLVectorAdapter(PostgreSQLAdapter):
     """
@@ -56,6 +109,26 @@ class PostgreSQLVectorAdapter(PostgreSQLAdapter):
         """Get specific database type identifier."""
         return "postgresql_vector"  # Distinguish from base PostgreSQL
 
+    def get_connection_parameters(self) -> Dict[str, Any]:
+        """
+        Get asyncpg connection parameters, registering the vector codec.
+
+        An ``init`` hook already present in the parameters still runs, before
+        the codec is registered.
+        """
+        params = super().get_connection_parameters()
+        existing_init = params.get("init")
+        if existing_init is None:
+            params["init"] = register_vector_codec
+        else:
+
+            async def init(connection) -> None:
+                await existing_init(connection)
+                await register_vector_codec(connection)
+
+            params["init"] = init
+        return params
+
     def supports_feature(self, feature: str) -> bool:
         """
         Enhanced feature detection including vector operations.
@@ -95,6 +168,10 @@ class PostgreSQLVectorAdapter(PostgreSQLAdapter):
             self._pgvector_installed = True
             logger.info("pgvector extension enabled successfully")
 
+            # Connections opened before the extension existed have no codec
+            if self.connection_pool is not None:
+                self.connection_pool.expire_connections()
+
         except Exception as e:
             self._pgvector_installed = False
             logger.error(f"Failed to enable pgvector extension: {e}")
@@ -226,6 +303,8 @@ class PostgreSQLVectorAdapter(PostgreSQLAdapter):
         distance: str = "cosine",
         filter_conditions: Optional[str] = None,
         return_distance: bool = True,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Semantic similarity search using vector embeddings.
@@ -238,6 +317,8 @@ class PostgreSQLVectorAdapter(PostgreSQLAdapter):
             distance: Distance metric ("cosine", "l2", "ip")
             filter_conditions: Optional WHERE clause (e.g., "category = 'tech'")
             return_distance: Include distance score in results
+            ef_search: HNSW search breadth for this query (hnsw.ef_search)
+            probes: IVFFlat lists to probe for this query (ivfflat.probes)
 
         Returns:
             List of matching records sorted by similarity, with optional distance scores
@@ -250,25 +331,26 @@ class PostgreSQLVectorAdapter(PostgreSQLAdapter):
                 filter_conditions="category = 'AI' AND published = true"
             )
         """
-        # Distance operator mapping
-        distance_ops = {"cosine": "<=>", "l2": "<->", "ip": "<#>"}
-
-        if distance not in distance_ops:
-            raise ValueError(
-                f"Unknown distance metric: {distance}. "
-                f"Must be one of: {list(distance_ops.keys())}"
+        if ef_search is not None or probes is not None:
+            # Index tuning needs SET LOCAL, i.e. a transaction on one connection
+            (results,) = await self.vector_search_batch(
+                table_name,
+                [query_vector],
+                k=k,
+                column_name=column_name,
+                distance=distance,
+                filter_conditions=filter_conditions,
+                return_distance=return_distance,
+                ef_search=ef_search,
+                probes=probes,
             )
+            return results
 
-        op = distance_ops[distance]
-
-        # Convert Python list to PostgreSQL array format
-        vector_str = f"'[{','.join(map(str, query_vector))}]'"
+        op = self._distance_operator(distance)
 
-        # Build query
+        # Build query; the vector is bound as $1 and sent in binary format
         distance_select = (
-            f", {column_name} {op} {vector_str}::vector AS distance"
-            if return_distance
-            else ""
+            f", {column_name} {op} $1::vector AS distance" if return_distance else ""
         )
         where_clause = f"WHERE {filter_conditions}" if filter_conditions else ""
 
@@ -276,16 +358,117 @@ class PostgreSQLVectorAdapter(PostgreSQLAdapter):
         SELECT *{distance_select}
         FROM {table_name}
         {where_clause}
-        ORDER BY {column_name} {op} {vector_str}::vector
-        LIMIT {k}
+        ORDER BY {column_name} {op} $1::vector
+        LIMIT {int(k)}
         """
 
-        results = await self.execute_query(query)
+        results = await self.execute_query(query, [query_vector])
 
         logger.info(f"Vector search on '{table_name}' returned {len(results)} results")
 
         return results
 
+    async def vector_search_batch(
+        self,
+        table_name: str,
+        query_vectors: List[List[float]],
+        k: int = 10,
+        column_name: str = "embedding",
+        distance: str = "cosine",
+        filter_conditions: Optional[str] = None,
+        return_distance: bool = True,
+        ef_search: Optional[int] = None,
+        probes: Optional[int] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Top-k similarity search for many query vectors in one round trip.
+
+        All query vectors are bound as a single ``vector[]`` parameter and
+        searched with one ``LATERAL`` top-k subquery per vector, so each
+        query still uses the vector index.
+
+        Args:
+            table_name: Table to search
+            query_vectors: Query embedding vectors
+            k: Number of results per query vector
+            column_name: Vector column name
+            distance: Distance metric ("cosine", "l2", "ip")
+            filter_conditions: Optional WHERE clause applied to every query
+            return_distance: Include distance score in results
+            ef_search: HNSW search breadth (SET LOCAL hnsw.ef_search)
+            probes: IVFFlat lists to probe (SET LOCAL ivfflat.probes)
+
+        Returns:
+            One result list per query vector, in input order
+
+        Example:
+            results = await adapter.vector_search_batch(
+                "documents", [embedding_a, embedding_b], k=5, ef_search=100
+            )
+        """
+        op = self._distance_operator(distance)
+        if not query_vectors:
+            return []
+
+        settings = []
+        if ef_search is not None:
+            settings.append(f"SET LOCAL hnsw.ef_search = {int(ef_search)}")
+        if probes is not None:
+            settings.append(f"SET LOCAL ivfflat.probes = {int(probes)}")
+
+        where_clause = f"WHERE {filter_conditions}" if filter_conditions else ""
+        query = f"""
+        SELECT q.query_index AS _query_index, r.*
+        FROM unnest($1::vector[]) WITH ORDINALITY AS q(query_vector, query_index)
+        CROSS JOIN LATERAL (
+            SELECT *, {column_name} {op} q.query_vector AS {_BATCH_DISTANCE_ALIAS}
+            FROM {table_name}
+            {where_clause}
+            ORDER BY {column_name} {op} q.query_vector
+            LIMIT {int(k)}
+        ) AS r
+        ORDER BY q.query_index, r.{_BATCH_DISTANCE_ALIAS}
+        """
+
+        if not self.is_connected or not self.connection_pool:
+            raise ConnectionError("Not connected to database")
+
+        try:
+            async with self.connection_pool.acquire() as connection:
+                async with connection.transaction():
+                    for statement in settings:
+                        await connection.execute(statement)
+                    rows = await connection.fetch(query, list(query_vectors))
+        except Exception as e:
+            logger.error(f"Batched vector search failed: {e}")
+            raise QueryError(f"Batched vector search failed: {e}")
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in query_vectors]
+        for row in rows:
+            record = dict(row)
+            index = record.pop("_query_index") - 1
+            score = record.pop(_BATCH_DISTANCE_ALIAS, None)
+            if return_distance:
+                # Same result key as vector_search()
+                record["distance"] = score
+            results[index].append(record)
+
+        logger.info(
+            f"Batched vector search on '{table_name}' ran {len(query_vectors)} "
+            f"queries returning {len(rows)} results"
+        )
+
+        return results
+
+    @staticmethod
+    def _distance_operator(distance: str) -> str:
+        if distance not in DISTANCE_OPERATORS:
+            raise ValueError(
+                f"Unknown distance metric: {distance}. "
+                f"Must be one of: {list(DISTANCE_OPERATORS.keys())}"
+            )
+        return DISTANCE_OPERATORS[distance]
+
     async def hybrid_search(
         self,
         table_name: str,
@@ -341,15 +524,15 @@ class PostgreSQLVectorAdapter(PostgreSQLAdapter):
         # Full-text search results
         text_query_sql = f"""
         SELECT *, ts_rank(to_tsvector('english', {text_column}),
-                         to_tsquery('english', '{text_query}')) AS text_score
+                         to_tsquery('english', $1)) AS text_score
         FROM {table_name}
-        WHERE to_tsvector('english', {text_column}) @@ to_tsquery('english', '{text_query}')
+        WHERE to_tsvector('english', {text_column}) @@ to_tsquery('english', $1)
         ORDER BY text_score DESC
         LIMIT {k * 2}
         """
 
         try:
-            text_results = await self.execute_query(text_query_sql)
+            text_results = await self.execute_query(text_query_sql, [text_query])
         except Exception as e:
             logger.warning(f"Text search failed, falling back to vector search: {e}")
             return vector_results[:k]
@@ -2,14 +2,20 @@
 SQLite Database Adapter
 
 SQLite-specific database adapter implementation.
+
+With ``single_writer=True`` a file database is served by one writer
+connection, fed by an async queue whose requests are group-committed in a
+single transaction, and a pool of ``query_only`` reader connections for
+SELECTs. Writers then never contend for the database lock with each other.
 """
 
 import asyncio
 import logging
 import os
+import sqlite3
 import time
 from contextlib import asynccontextmanager
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import Any, AsyncContextManager, Dict, List, Optional, Tuple
@@ -79,6 +85,37 @@ class SQLiteConnectionPoolStats:
     wal_checkpoint_frequency: int
 
 
+@dataclass
+class SQLiteWriteQueueStats:
+    """Statistics of the single-writer group-commit queue."""
+
+    batches_committed: int = 0
+    requests_committed: int = 0
+    requests_failed: int = 0
+    max_batch_size: int = 0
+    last_batch_size: int = 0
+    busy_retries: int = 0
+
+    @property
+    def avg_batch_size(self) -> float:
+        if self.batches_committed == 0:
+            return 0.0
+        return self.requests_committed / self.batches_committed
+
+
+@dataclass
+class _WriteRequest:
+    """Statements the writer runs atomically on behalf of one caller."""
+
+    statements: List[Tuple[str, Any]]
+    future: asyncio.Future
+    many: bool = False
+    results: List[Any] = field(default_factory=list)
+
+
+_READ_PREFIXES = ("SELECT", "WITH", "PRAGMA")
+
+
 class SQLiteAdapter(DatabaseAdapter):
     """SQLite database adapter."""
 
@@ -129,6 +166,17 @@ class SQLiteAdapter(DatabaseAdapter):
         self.connection_pool_timeout = kwargs.get("connection_pool_timeout", 10.0)
         self.enable_connection_pooling = kwargs.get("enable_connection_pooling", True)
 
+        # Single-writer mode (file databases only): a writer connection fed by
+        # a group-commit queue plus a pool of query_only reader connections
+        self.single_writer = (
+            kwargs.get("single_writer", False) and not self.is_memory_database
+        )
+        self.read_pool_size = kwargs.get("read_pool_size", min(4, self.max_connections))
+        self.write_batch_size = kwargs.get("write_batch_size", 128)
+        self.write_queue_size = kwargs.get("write_queue_size", 10000)
+        self.group_commit_window_ms = kwargs.get("group_commit_window_ms", 0.0)
+        self.max_busy_retries = kwargs.get("max_busy_retries", 5)
+
         # Performance optimization settings
         self.cache_size_mb = kwargs.get("cache_size_mb", 64)  # 64MB default cache
         self.page_size = kwargs.get(
@@ -161,6 +209,15 @@ class SQLiteAdapter(DatabaseAdapter):
             wal_checkpoint_frequency=0,
         )
 
+        # Single-writer state
+        self._writer_connection: Optional[aiosqlite.Connection] = None
+        self._writer_lock = asyncio.Lock()
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._read_pool: Optional[asyncio.Queue] = None
+        self._read_connections: List[aiosqlite.Connection] = []
+        self._write_stats = SQLiteWriteQueueStats()
+
         # Performance monitoring
         self._query_count = 0
         self._total_query_time = 0.0
@@ -199,7 +256,9 @@ class SQLiteAdapter(DatabaseAdapter):
         """Establish SQLite connection with enterprise features."""
         try:
             # Initialize connection pool if enabled
-            if self.enable_connection_pooling:
+            if self.single_writer:
+                await self._start_single_writer()
+            elif self.enable_connection_pooling:
                 await self._initialize_connection_pool()
             else:
                 # Test single connection
@@ -230,7 +289,9 @@ class SQLiteAdapter(DatabaseAdapter):
         """Close SQLite connection and cleanup resources."""
         if self._connection:
             # Close connection pool if enabled
-            if self.enable_connection_pooling:
+            if self.single_writer:
+                await self._stop_single_writer()
+            elif self.enable_connection_pooling:
                 await self._close_connection_pool()
 
             # Perform final WAL checkpoint if needed
@@ -251,7 +312,11 @@ class SQLiteAdapter(DatabaseAdapter):
     @asynccontextmanager
     async def _get_connection(self):
         """Get connection from pool or create new one."""
-        if self.enable_connection_pooling and self._connection_pool:
+        if self.single_writer and self._writer_connection is not None:
+            # DDL and other direct use runs between write batches
+            async with self._writer_lock:
+                yield self._writer_connection
+        elif self.enable_connection_pooling and self._connection_pool:
             # Try to get connection from pool
             async with self._pool_lock:
                 if self._connection_pool:
@@ -306,6 +371,16 @@ class SQLiteAdapter(DatabaseAdapter):
                 f"Executing query: {sqlite_query} with params: {sqlite_params}"
             )
 
+            if self.single_writer:
+                if self._is_read(sqlite_query):
+                    async with self._read_connection() as db:
+                        cursor = await db.execute(sqlite_query, sqlite_params)
+                        rows = await cursor.fetchall()
+                        await cursor.close()
+                        return [dict(row) for row in rows]
+                (results,) = await self._submit_write([(sqlite_query, sqlite_params)])
+                return results
+
             # Use connection from pool
             async with self._get_connection() as db:
                 cursor = await db.execute(sqlite_query, sqlite_params)
@@ -345,6 +420,11 @@ class SQLiteAdapter(DatabaseAdapter):
             results = []
             logger.debug(f"Starting transaction with {len(queries)} queries")
 
+            if self.single_writer:
+                return await self._submit_write(
+                    [self.format_query(query, params) for query, params in queries]
+                )
+
             # Use connection from pool
             async with self._get_connection() as db:
                 # Start transaction
@@ -546,6 +626,13 @@ class SQLiteAdapter(DatabaseAdapter):
         try:
             sqlite_query, sqlite_params = self.format_query(query, params)
 
+            if self.single_writer:
+                ((result,),) = await self._submit_write([(sqlite_query, sqlite_params)])
+                return {
+                    "lastrowid": result["lastrowid"],
+                    "rowcount": result["rows_affected"],
+                }
+
             async with self._get_connection() as db:
                 cursor = await db.execute(sqlite_query, sqlite_params)
                 await db.commit()
@@ -565,6 +652,10 @@ class SQLiteAdapter(DatabaseAdapter):
         try:
             sqlite_query, _ = self.format_query(query, [])
 
+            if self.single_writer:
+                await self._submit_write([(sqlite_query, params_list)], many=True)
+                return
+
             async with self._get_connection() as db:
                 await db.executemany(sqlite_query, params_list)
                 await db.commit()
@@ -661,6 +752,255 @@ class SQLiteAdapter(DatabaseAdapter):
             else:
                 await self._test_connection()
 
+    # ------------------------------------------------------------------
+    # Single-writer mode
+    # ------------------------------------------------------------------
+
+    async def _open_connection(self, query_only: bool = False) -> aiosqlite.Connection:
+        """Open a connection with the configured pragmas applied."""
+        # Autocommit: the writer issues BEGIN IMMEDIATE / COMMIT itself
+        conn = await aiosqlite.connect(
+            self.database_path, timeout=self.timeout, isolation_level=None
+        )
+        conn.row_factory = aiosqlite.Row
+        for pragma, value in self.pragmas.items():
+            await conn.execute(f"PRAGMA {pragma} = {value}")
+        if query_only:
+            await conn.execute("PRAGMA query_only = ON")
+        return conn
+
+    async def _start_single_writer(self) -> None:
+        """Open the writer and reader connections and start the writer task."""
+        db_path = Path(self.database_path)
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._writer_connection = await self._open_connection()
+        self._read_pool = asyncio.Queue()
+        for _ in range(max(1, self.read_pool_size)):
+            conn = await self._open_connection(query_only=True)
+            self._read_connections.append(conn)
+            self._read_pool.put_nowait(conn)
+
+        self._write_queue = asyncio.Queue(maxsize=self.write_queue_size)
+        self._writer_task = asyncio.create_task(self._writer_loop())
+        self._pool_stats.total_connections = len(self._read_connections) + 1
+        self._pool_stats.idle_connections = len(self._read_connections)
+
+        logger.info(
+            f"SQLite single-writer mode: 1 writer, "
+            f"{len(self._read_connections)} readers"
+        )
+
+    async def _stop_single_writer(self) -> None:
+        """Drain the write queue, stop the writer and close all connections."""
+        if self._writer_task is not None:
+            await self._write_queue.put(None)
+            try:
+                await self._writer_task
+            except Exception as e:
+                logger.warning(f"SQLite writer stopped with error: {e}")
+            self._writer_task = None
+
+        for conn in self._read_connections + [self._writer_connection]:
+            if conn is None:
+                continue
+            try:
+                await conn.close()
+            except Exception as e:
+                logger.warning(f"Error closing connection: {e}")
+
+        self._read_connections.clear()
+        self._read_pool = None
+        self._writer_connection = None
+        self._pool_stats.total_connections = 0
+        self._pool_stats.idle_connections = 0
+        self._pool_stats.active_connections = 0
+
+    @staticmethod
+    def _is_read(query: str) -> bool:
+        return query.lstrip().upper().startswith(_READ_PREFIXES)
+
+    @asynccontextmanager
+    async def _read_connection(self):
+        """Borrow a query_only reader connection."""
+        conn = await self._read_pool.get()
+        self._pool_stats.idle_connections -= 1
+        self._pool_stats.active_connections += 1
+        try:
+            yield conn
+        finally:
+            try:
+                if conn.in_transaction:
+                    await conn.rollback()
+            except Exception as e:
+                logger.warning(f"Reader reset failed: {e}")
+            self._pool_stats.idle_connections += 1
+            self._pool_stats.active_connections -= 1
+            self._read_pool.put_nowait(conn)
+
+    async def _submit_write(
+        self, statements: List[Tuple[str, Any]], many: bool = False
+    ) -> List[Any]:
+        """
+        Queue statements for the writer and wait for their commit.
+
+        The statements of one call are applied atomically; calls queued
+        together share a single commit.
+
+        Returns:
+            One result per statement (rows for SELECT/WITH/PRAGMA, otherwise
+            ``[{"rows_affected": ..., "lastrowid": ...}]``)
+        """
+        if self._writer_task is None or self._writer_task.done():
+            raise ConnectionError("SQLite writer is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        await self._write_queue.put(_WriteRequest(statements, future, many))
+        return await future
+
+    async def _writer_loop(self) -> None:
+        """Take queued writes in batches and commit each batch once."""
+        stopping = False
+        while not stopping:
+            request = await self._write_queue.get()
+            if request is None:
+                break
+            batch = [request]
+            if self.group_commit_window_ms > 0:
+                await asyncio.sleep(self.group_commit_window_ms / 1000)
+            while len(batch) < self.write_batch_size:
+                try:
+                    request = self._write_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if request is None:
+                    stopping = True
+                    break
+                batch.append(request)
+
+            async with self._writer_lock:
+                try:
+                    await self._commit_batch(batch)
+                except Exception as e:
+                    # e.g. a failed SAVEPOINT / RELEASE; keep the writer alive
+                    logger.error(f"SQLite write batch failed: {e}")
+                    await self._abort_batch(batch, e)
+
+    async def _commit_batch(self, batch: List[_WriteRequest]) -> None:
+        """Run a batch in one transaction, isolating requests by savepoint."""
+        conn = self._writer_connection
+        try:
+            await self._retry_busy(lambda: conn.execute("BEGIN IMMEDIATE"))
+        except Exception as e:
+            self._write_stats.requests_failed += len(batch)
+            for request in batch:
+                if not request.future.done():
+                    request.future.set_exception(e)
+            return
+
+        failed: Dict[int, Exception] = {}
+        for index, request in enumerate(batch):
+            await conn.execute("SAVEPOINT dataflow_write")
+            try:
+                request.results = await self._run_request(conn, request)
+            except Exception as e:
+                failed[index] = e
+                await conn.execute("ROLLBACK TO dataflow_write")
+            await conn.execute("RELEASE dataflow_write")
+
+        try:
+            await self._retry_busy(lambda: conn.execute("COMMIT"))
+        except Exception as e:
+            await conn.rollback()
+            failed = {index: e for index in range(len(batch))}
+
+        stats = self._write_stats
+        committed = len(batch) - len(failed)
+        if committed:
+            stats.batches_committed += 1
+            stats.requests_committed += committed
+            stats.last_batch_size = committed
+            stats.max_batch_size = max(stats.max_batch_size, committed)
+        stats.requests_failed += len(failed)
+        self._query_count += sum(len(request.statements) for request in batch)
+
+        for index, request in enumerate(batch):
+            if request.future.done():
+                continue
+            if index in failed:
+                request.future.set_exception(failed[index])
+            else:
+                request.future.set_result(request.results)
+
+    async def _abort_batch(self, batch: List[_WriteRequest], error: Exception) -> None:
+        """Roll back a batch that failed outside its requests and fail them."""
+        conn = self._writer_connection
+        try:
+            if conn.in_transaction:
+                await conn.rollback()
+        except Exception as e:
+            logger.warning(f"SQLite writer rollback failed: {e}")
+
+        for request in batch:
+            if not request.future.done():
+                self._write_stats.requests_failed += 1
+                request.future.set_exception(error)
+
+    @staticmethod
+    async def _run_request(conn, request: _WriteRequest) -> List[Any]:
+        results = []
+        for query, params in request.statements:
+            if request.many:
+                cursor = await conn.executemany(query, params)
+            else:
+                cursor = await conn.execute(query, params)
+            if not request.many and SQLiteAdapter._is_read(query):
+                results.append([dict(row) for row in await cursor.fetchall()])
+            else:
+                results.append(
+                    [{"rows_affected": cursor.rowcount, "lastrowid": cursor.lastrowid}]
+                )
+            await cursor.close()
+        return results
+
+    async def _retry_busy(self, operation):
+        """Retry an operation while another process holds the database lock."""
+        for attempt in range(self.max_busy_retries + 1):
+            try:
+                return await operation()
+            except sqlite3.OperationalError as e:
+                message = str(e).lower()
+                if attempt == self.max_busy_retries or (
+                    "locked" not in message and "busy" not in message
+                ):
+                    raise
+                self._write_stats.busy_retries += 1
+                await asyncio.sleep(min(0.01 * 2**attempt, 1.0))
+
+    def get_write_queue_stats(self) -> Dict[str, Any]:
+        """
+        Get single-writer queue statistics.
+
+        Returns:
+            Queue depth, group-commit batch sizes, busy retries and reader
+            pool usage (empty outside single-writer mode)
+        """
+        if not self.single_writer:
+            return {}
+        stats = self._write_stats
+        return {
+            "queue_depth": self._write_queue.qsize() if self._write_queue else 0,
+            "batches_committed": stats.batches_committed,
+            "requests_committed": stats.requests_committed,
+            "requests_failed": stats.requests_failed,
+            "avg_batch_size": stats.avg_batch_size,
+            "max_batch_size": stats.max_batch_size,
+            "last_batch_size": stats.last_batch_size,
+            "busy_retries": stats.busy_retries,
+            "readers_total": len(self._read_connections),
+            "readers_idle": self._read_pool.qsize() if self._read_pool else 0,
+        }
+
     async def _test_connection(self) -> None:
         """Test SQLite connection."""
         try:
@@ -826,6 +1166,17 @@ class SQLiteTransaction:
 
     async def __aenter__(self):
         """Enter transaction context."""
+        if self.adapter.single_writer:
+            # Hold the writer between group-commit batches
+            await self.adapter._writer_lock.acquire()
+            self.connection = self.adapter._writer_connection
+            try:
+                await self.connection.execute("BEGIN IMMEDIATE")
+            except BaseException:
+                self.adapter._writer_lock.release()
+                raise
+            return self
+
         # Get connection from pool
         async with self.adapter._pool_lock:
             if self.adapter._connection_pool:
@@ -866,10 +1217,13 @@ class SQLiteTransaction:
         finally:
             # CRITICAL: Always return connection to pool
             try:
-                async with self.adapter._pool_lock:
-                    self.adapter._connection_pool.append(self.connection)
-                    self.adapter._pool_stats.idle_connections += 1
-                    self.adapter._pool_stats.active_connections -= 1
+                if self.adapter.single_writer:
+                    self.adapter._writer_lock.release()
+                else:
+                    async with self.adapter._pool_lock:
+                        self.adapter._connection_pool.append(self.connection)
+                        self.adapter._pool_stats.idle_connections += 1
+                        self.adapter._pool_stats.active_connections -= 1
             except Exception as pool_error:
                 logger.error(
                     f"Failed to return connection to pool: {pool_error}", exc_info=True
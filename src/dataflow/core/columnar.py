@@ -0,0 +1,252 @@
+"""
+Columnar query results.
+
+``ColumnarResult`` stores a result set as one NumPy array per column instead
+of one dict per row. Integer, float and boolean columns use native dtypes;
+everything else (strings, decimals, timestamps, JSON values) is kept in
+object arrays so values round-trip unchanged. NULLs are tracked with a
+validity mask per column, so integer columns keep their dtype.
+
+Generated List nodes and ``ExpressDataFlow.list`` produce it with
+``result_format="columnar"``; AggregateNode consumes it without converting
+back to records.
+"""
+
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+
+    PYARROW_AVAILABLE = True
+except ImportError:  # pragma: no cover - pyarrow is optional
+    PYARROW_AVAILABLE = False
+
+RESULT_FORMATS = ("records", "columnar")
+
+
+def _build_column(values: List[Any]) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Convert one column of Python values to (array, validity mask or None)."""
+    size = len(values)
+    types = set(map(type, values))
+    valid = None
+    if type(None) in types:
+        types.discard(type(None))
+        valid = np.fromiter((v is not None for v in values), dtype=bool, count=size)
+
+    if types == {bool}:
+        dtype, fill = np.bool_, False
+    elif types == {int}:
+        dtype, fill = np.int64, 0
+    elif types and types <= {int, float}:
+        dtype, fill = np.float64, np.nan
+    else:
+        dtype = None
+
+    if dtype is not None:
+        raw = values if valid is None else [fill if v is None else v for v in values]
+        try:
+            return np.array(raw, dtype=dtype), valid
+        except OverflowError:
+            # Integers beyond int64 stay Python ints
+            pass
+
+    column = np.empty(size, dtype=object)
+    column[:] = values
+    return column, valid
+
+
+class ColumnarResult:
+    """A query result held as NumPy columns.
+
+    Example:
+        result = await db.express.list("Order", limit=1_000_000,
+                                       result_format="columnar")
+        totals = result["amount"].sum()
+        rows = result.to_records()
+    """
+
+    def __init__(
+        self,
+        columns: Dict[str, np.ndarray],
+        validity: Optional[Dict[str, np.ndarray]] = None,
+        num_rows: Optional[int] = None,
+    ):
+        """
+        Initialize from prepared columns.
+
+        Args:
+            columns: Column name to 1-D array, all of the same length
+            validity: Column name to boolean mask (True = not NULL) for columns
+                that contain NULLs; columns without an entry have no NULLs
+            num_rows: Row count (required when there are no columns)
+        """
+        if num_rows is None:
+            num_rows = len(next(iter(columns.values()))) if columns else 0
+        for name, column in columns.items():
+            if len(column) != num_rows:
+                raise ValueError(
+                    f"Column '{name}' has {len(column)} values, expected {num_rows}"
+                )
+        self._columns = dict(columns)
+        self._validity = dict(validity or {})
+        self.num_rows = num_rows
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        columns: Optional[Sequence[str]] = None,
+    ) -> "ColumnarResult":
+        """Build columns from row dicts.
+
+        Args:
+            records: Rows to convert
+            columns: Column names (default: keys of the first row)
+        """
+        records = records if isinstance(records, list) else list(records)
+        if columns is None:
+            columns = list(records[0]) if records else []
+
+        built: Dict[str, np.ndarray] = {}
+        validity: Dict[str, np.ndarray] = {}
+        for name in columns:
+            column, valid = _build_column([record.get(name) for record in records])
+            built[name] = column
+            if valid is not None:
+                validity[name] = valid
+        return cls(built, validity, num_rows=len(records))
+
+    # ------------------------------------------------------------------
+    # Column access
+    # ------------------------------------------------------------------
+
+    @property
+    def column_names(self) -> List[str]:
+        """Column names in result order."""
+        return list(self._columns)
+
+    def column(self, name: str) -> np.ndarray:
+        """The array for a column (NULL slots hold 0, NaN, False or None)."""
+        return self._columns[name]
+
+    def is_valid(self, name: str) -> np.ndarray:
+        """Boolean mask of rows where the column is not NULL."""
+        valid = self._validity.get(name)
+        if valid is None:
+            return np.ones(self.num_rows, dtype=bool)
+        return valid
+
+    def has_nulls(self, name: str) -> bool:
+        """Whether a column contains NULLs."""
+        return name in self._validity
+
+    def to_pylist(self, name: str) -> List[Any]:
+        """Python values of a column, with None for NULLs."""
+        values = self._columns[name].tolist()
+        valid = self._validity.get(name)
+        if valid is not None:
+            for i in np.flatnonzero(~valid).tolist():
+                values[i] = None
+        return values
+
+    def row(self, index: int) -> Dict[str, Any]:
+        """One row as a dict."""
+        if not -self.num_rows <= index < self.num_rows:
+            raise IndexError(f"Row {index} out of range for {self.num_rows} rows")
+        row = {}
+        for name, column in self._columns.items():
+            valid = self._validity.get(name)
+            if valid is not None and not valid[index]:
+                row[name] = None
+            elif column.dtype == object:
+                row[name] = column[index]
+            else:
+                row[name] = column[index].item()
+        return row
+
+    def take(self, indices: np.ndarray) -> "ColumnarResult":
+        """Rows selected by an index array or boolean mask."""
+        columns = {name: column[indices] for name, column in self._columns.items()}
+        validity = {name: valid[indices] for name, valid in self._validity.items()}
+        if indices.dtype == bool:
+            num_rows = int(np.count_nonzero(indices))
+        else:
+            num_rows = len(indices)
+        return ColumnarResult(columns, validity, num_rows=num_rows)
+
+    # ------------------------------------------------------------------
+    # Conversion helpers
+    # ------------------------------------------------------------------
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Convert back to a list of row dicts."""
+        names = self.column_names
+        if not names:
+            return [{} for _ in range(self.num_rows)]
+        values = [self.to_pylist(name) for name in names]
+        return [dict(zip(names, row)) for row in zip(*values)]
+
+    def to_dict(self) -> Dict[str, List[Any]]:
+        """Convert to ``{column: [values]}`` (JSON-serializable for plain types)."""
+        return {name: self.to_pylist(name) for name in self._columns}
+
+    def to_arrow(self) -> "pa.RecordBatch":
+        """Convert to a pyarrow RecordBatch.
+
+        Numeric columns are handed to Arrow without copying their data.
+
+        Raises:
+            ImportError: If pyarrow is not installed
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "pyarrow is required for ColumnarResult.to_arrow(); "
+                "install it with 'pip install pyarrow'"
+            )
+        arrays = []
+        for name, column in self._columns.items():
+            valid = self._validity.get(name)
+            if column.dtype == object:
+                arrays.append(pa.array(self.to_pylist(name)))
+            else:
+                mask = None if valid is None else ~valid
+                arrays.append(pa.array(column, mask=mask))
+        return pa.RecordBatch.from_arrays(arrays, names=self.column_names)
+
+    # ------------------------------------------------------------------
+    # Container protocol
+    # ------------------------------------------------------------------
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __bool__(self) -> bool:
+        return self.num_rows > 0
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._columns
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        return self._columns[name]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        """Iterate rows as dicts, so ``list(result)`` yields records."""
+        return iter(self.to_records())
+
+    def __repr__(self) -> str:
+        return (
+            f"ColumnarResult(num_rows={self.num_rows}, " f"columns={self.column_names})"
+        )
+
+
+def validate_result_format(result_format: str) -> str:
+    """Normalize and check a ``result_format`` argument."""
+    normalized = (result_format or "records").lower()
+    if normalized not in RESULT_FORMATS:
+        raise ValueError(
+            f"Unknown result_format '{result_format}'; "
+            f"expected one of {', '.join(RESULT_FORMATS)}"
+        )
+    return normalized
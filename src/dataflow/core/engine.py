@@ -8,6 +8,7 @@ import asyncio
 import inspect
 import logging
 import os
+import re
 import threading
 import time
 from copy import deepcopy
@@ -42,7 +43,7 @@ from .connection_pool import (
     get_pool_size_from_env,
 )
 from .logging_config import mask_sensitive_values  # Phase 7: Sensitive value masking
-from .nodes import NodeGenerator
+from .nodes import LazyNodeDict, NodeGenerator
 from .schema_cache import create_schema_cache  # ADR-001: Schema cache integration
 
 # ErrorEnhancer for rich error messages
@@ -63,6 +64,11 @@ ErrorEnhancer = PlatformErrorEnhancer
 
 logger = logging.getLogger(__name__)
 
+# Index name in the CREATE INDEX statements produced by _generate_indexes_sql
+_INDEX_NAME_PATTERN = re.compile(
+    r"CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:IF\s+NOT\s+EXISTS\s+)?(\w+)", re.IGNORECASE
+)
+
 
 class DataFlow:
     """Main DataFlow interface."""
@@ -94,6 +100,11 @@ class DataFlow:
         migration_enabled: bool = True,
         auto_migrate: bool = True,  # NEW: Control auto-migration behavior
         existing_schema_mode: bool = False,  # NEW: Safe mode for existing DBs
+        deferred_registration: bool = False,  # Queue DDL until initialize()
+        lazy_nodes: bool = False,  # Build node classes on first use
+        read_replicas: Optional[List[str]] = None,  # Replica URLs for Read/List
+        replica_max_lag: float = 10.0,  # Seconds of lag before a replica is skipped
+        read_your_writes_window: float = 5.0,  # Seconds reads stick to primary
         enable_model_persistence: bool = True,  # NEW: Enable persistent model registry
         tdd_mode: bool = False,  # NEW: Enable TDD mode for testing
         test_context: Optional[Any] = None,  # NEW: TDD test context
@@ -130,6 +141,18 @@ class DataFlow:
             migration_enabled: Enable automatic database migrations (default True)
             auto_migrate: Automatically run migrations on model registration (default True)
             existing_schema_mode: Safe mode for existing databases - validates compatibility (default False)
+            deferred_registration: Queue table creation at @db.model and reconcile all
+                queued models in one transaction during initialize() (default False)
+            lazy_nodes: Register lightweight proxies at @db.model and generate each
+                node class on first lookup or instantiation (default False)
+            read_replicas: Database URLs of read replicas. Generated Read/List
+                nodes (and db.express reads) are balanced across them by
+                outstanding requests and latency; writes stay on the primary
+            replica_max_lag: Replicas lagging more than this many seconds are
+                skipped (see refresh_replication_lag()) (default 10.0)
+            read_your_writes_window: Seconds after a write during which reads in
+                the same asyncio task or query_router.read_your_writes_scope()
+                go to the primary (default 5.0)
             tdd_mode: Enable TDD mode for testing (default False)
             test_context: TDD test context (default None)
             test_mode: Explicit test mode setting (None=auto-detect, True=enable, False=disable)
@@ -340,7 +363,10 @@ class DataFlow:
         self._models = {}
         self._registered_models = {}  # Track registered models for compatibility
         self._model_fields = {}  # Store model field information
-        self._nodes = {}  # Store generated nodes for testing
+        self._nodes = LazyNodeDict()  # Store generated nodes for testing
+        self._lazy_nodes = lazy_nodes
+        # Per-model registration cost, see startup_report()
+        self._startup_timings: Dict[str, Dict[str, Any]] = {}
         self._tenant_context = None if not self.config.security.multi_tenant else {}
 
         # DATAFLOW-ASYNC-MODEL-DECORATOR-001: Deferred relationship detection
@@ -349,6 +375,11 @@ class DataFlow:
         # which would fail in async contexts (pytest async fixtures, FastAPI lifespan, etc.)
         self._pending_relationship_detection: set = set()
 
+        # Deferred registration: models whose tables are created by
+        # reconcile_schema() instead of one sync DDL round per @db.model
+        self._deferred_registration = deferred_registration
+        self._pending_schema_models: List[str] = []
+
         # Initialize ErrorEnhancer for enhanced error messages
         # Use Core ErrorEnhancer for instance-level enhancements
         self.error_enhancer = (
@@ -361,6 +392,13 @@ class DataFlow:
         # Format: {database_type: (node, event_loop_id)} for event loop tracking (v0.10.6+)
         self._async_sql_node_cache = {}  # Keyed by database_type
 
+        # Read/write splitting across replicas (None without read_replicas)
+        self._query_router = None
+        if read_replicas:
+            self._query_router = self._create_query_router(
+                read_replicas, replica_max_lag, read_your_writes_window
+            )
+
         # Store migration control parameters
         self._auto_migrate = auto_migrate
         self._migration_enabled = migration_enabled
@@ -539,6 +577,12 @@ class DataFlow:
             bool: True if initialization successful, False otherwise
         """
         try:
+            # Deferred registration: one catalog snapshot + one DDL transaction
+            # for every queued model. Uses its own sync DDL connection, so it
+            # does not depend on the async connection validation below.
+            if self._pending_schema_models:
+                await asyncio.to_thread(self.reconcile_schema)
+
             # Validate database connectivity
             if not await self._validate_database_connection():
                 logger.error("Database connection validation failed")
@@ -867,6 +911,7 @@ class DataFlow:
         """
         # Validate model
         model_name = cls.__name__
+        started = time.perf_counter()
 
         # Check for duplicate registration
         if model_name in self._models:
@@ -923,6 +968,7 @@ class DataFlow:
             cls  # Store class for backward compatibility
         )
         self._model_fields[model_name] = fields
+        fields_done = time.perf_counter()
 
         # Persist model in registry for multi-application support
         if self._enable_model_persistence and hasattr(self, "_model_registry"):
@@ -930,6 +976,7 @@ class DataFlow:
                 self._model_registry.register_model(model_name, cls)
             except Exception as e:
                 logger.warning(f"Failed to persist model {model_name}: {e}")
+        persistence_done = time.perf_counter()
 
         # DATAFLOW-ASYNC-MODEL-DECORATOR-001: Defer relationship detection
         # Instead of calling _auto_detect_relationships() here (which fails in async contexts),
@@ -938,8 +985,11 @@ class DataFlow:
         self._pending_relationship_detection.add(model_name)
 
         # Generate workflow nodes (TDD-aware if in TDD mode)
+        node_count = len(self._nodes)
         self._generate_crud_nodes(model_name, fields)
         self._generate_bulk_nodes(model_name, fields)
+        node_count = len(self._nodes) - node_count
+        nodes_done = time.perf_counter()
 
         # Add DataFlow attributes
         cls._dataflow = self
@@ -971,7 +1021,17 @@ class DataFlow:
         # CRITICAL FIX: Use sync DDL for immediate table creation when auto_migrate=True
         # This works in ALL contexts including Docker/FastAPI without event loop issues
         # Uses SyncDDLExecutor with psycopg2/sqlite3 (purely synchronous, no asyncio)
-        if self._auto_migrate and not self._existing_schema_mode:
+        if (
+            self._auto_migrate
+            and not self._existing_schema_mode
+            and self._deferred_registration
+        ):
+            # Queue for the batched reconciliation in initialize()
+            self._pending_schema_models.append(model_name)
+            logger.debug(
+                f"Model '{model_name}' registered - table creation deferred to initialize()"
+            )
+        elif self._auto_migrate and not self._existing_schema_mode:
             # Create table immediately using sync DDL
             sync_success = self._create_table_sync(model_name)
             if sync_success:
@@ -990,8 +1050,66 @@ class DataFlow:
                 f"Model '{model_name}' registered - table will be created lazily on first access"
             )
 
+        finished = time.perf_counter()
+        self._startup_timings[model_name] = {
+            "fields_ms": (fields_done - started) * 1000,
+            "persistence_ms": (persistence_done - fields_done) * 1000,
+            "nodes_ms": (nodes_done - persistence_done) * 1000,
+            "ddl_ms": (finished - nodes_done) * 1000,
+            "total_ms": (finished - started) * 1000,
+            "nodes": node_count,
+            "lazy_nodes": self._lazy_nodes,
+            "materialized_nodes": 0,
+            "materialize_ms": 0.0,
+        }
+
         return cls
 
+    def startup_report(self, top: int = 10) -> Dict[str, Any]:
+        """Break down the cost of model registration per model.
+
+        Each model entry has the time spent in @db.model on field extraction,
+        model registry persistence, node generation and sync DDL, plus (with
+        lazy_nodes=True) how many node classes have been generated since and
+        how long that took.
+
+        Args:
+            top: Number of slowest models to list
+
+        Returns:
+            Dict with 'models', 'totals', 'slowest' and 'pending_nodes'
+        """
+        phases = (
+            "fields_ms",
+            "persistence_ms",
+            "nodes_ms",
+            "ddl_ms",
+            "total_ms",
+            "materialize_ms",
+        )
+        totals: Dict[str, Any] = {
+            phase: sum(t[phase] for t in self._startup_timings.values())
+            for phase in phases
+        }
+        totals["models"] = len(self._startup_timings)
+        totals["nodes"] = sum(t["nodes"] for t in self._startup_timings.values())
+        totals["materialized_nodes"] = sum(
+            t["materialized_nodes"] for t in self._startup_timings.values()
+        )
+
+        slowest = sorted(
+            self._startup_timings,
+            key=lambda name: self._startup_timings[name]["total_ms"],
+            reverse=True,
+        )[:top]
+
+        return {
+            "models": {name: dict(t) for name, t in self._startup_timings.items()},
+            "totals": totals,
+            "slowest": slowest,
+            "pending_nodes": len(self._nodes.pending()),
+        }
+
     async def ensure_table_exists(self, model_name: str) -> bool:
         """
         Ensure the table for a model exists, creating it if necessary.
@@ -1115,9 +1233,9 @@ class DataFlow:
     @property
     def has_pending_migrations(self) -> bool:
         """Check if there are any models that might need table creation."""
-        # With lazy table creation, there are no "pending" migrations
-        # Tables are created on-demand when first accessed
-        return False
+        # Only deferred registration queues work; otherwise tables are
+        # created at registration or on-demand when first accessed
+        return bool(self._pending_schema_models)
 
     def ensure_migrations_initialized(self) -> bool:
         """
@@ -5853,7 +5971,59 @@ class DataFlow:
 
         return ConnectionParser.detect_database_type(url)
 
-    def _get_or_create_async_sql_node(self, database_type: str):
+    def _create_query_router(
+        self,
+        replica_urls: List[str],
+        max_replication_lag: float,
+        read_your_writes_window: float,
+    ):
+        """Register the primary and replicas and build their query router."""
+        from ..adapters.connection_parser import ConnectionParser
+        from .database_registry import DatabaseConfig, DatabaseRegistry
+        from .query_router import DatabaseQueryRouter
+
+        registry = DatabaseRegistry()
+        registry.register_database(
+            DatabaseConfig(
+                name="primary",
+                database_url=self.config.database.url or ":memory:",
+                database_type=self._detect_database_type(),
+                is_primary=True,
+            )
+        )
+        for index, url in enumerate(replica_urls):
+            registry.register_database(
+                DatabaseConfig(
+                    name=f"replica_{index}",
+                    database_url=url,
+                    database_type=ConnectionParser.detect_database_type(url),
+                    is_read_replica=True,
+                )
+            )
+        return DatabaseQueryRouter(
+            registry,
+            max_replication_lag=max_replication_lag,
+            read_your_writes_window=read_your_writes_window,
+        )
+
+    @property
+    def query_router(self):
+        """Read replica router, or None when no read_replicas are configured."""
+        return self._query_router
+
+    async def refresh_replication_lag(self) -> Dict[str, float]:
+        """Measure replica lag so lagging replicas stop receiving reads.
+
+        Returns:
+            Mapping of replica name to lag in seconds (empty without replicas)
+        """
+        if self._query_router is None:
+            return {}
+        return await self._query_router.refresh_replication_lag()
+
+    def _get_or_create_async_sql_node(
+        self, database_type: str, read_only: bool = False
+    ):
         """Get or create cached AsyncSQLDatabaseNode for connection pooling.
 
         This method maintains a single AsyncSQLDatabaseNode instance per database type,
@@ -5869,6 +6039,8 @@ class DataFlow:
 
         Args:
             database_type: Database type ('sqlite', 'postgresql', 'mysql')
+            read_only: The caller only reads; with read_replicas configured the
+                node of the replica chosen by the query router is returned
 
         Returns:
             AsyncSQLDatabaseNode: Cached or newly created node instance
@@ -5896,8 +6068,18 @@ class DataFlow:
             # No running event loop - will be created when async operation runs
             current_loop_id = None
 
+        cache_key = database_type
+        connection_string = self.config.database.url or ":memory:"
+        replica_name = None
+        if read_only and self._query_router is not None:
+            target = self._query_router.route_read_query()
+            if target is not None and target.is_read_replica:
+                replica_name = target.name
+                cache_key = f"{database_type}:{replica_name}"
+                connection_string = target.database_url
+
         # Check if we have a cached node and if the event loop matches
-        cached = self._async_sql_node_cache.get(database_type)
+        cached = self._async_sql_node_cache.get(cache_key)
         if cached is not None:
             node, cached_loop_id = cached
             # Return cached node if event loop hasn't changed
@@ -5920,17 +6102,19 @@ class DataFlow:
 
         from kailash.nodes.data.async_sql import AsyncSQLDatabaseNode
 
-        connection_string = self.config.database.url or ":memory:"
-
         # Create new node
         node = AsyncSQLDatabaseNode(
-            node_id=f"dataflow_{database_type}_sql_node",
+            node_id=f"dataflow_{cache_key.replace(':', '_')}_sql_node",
             connection_string=connection_string,
             database_type=database_type,
         )
 
+        self._instrument_sql_node(node)
+        if self._query_router is not None:
+            self._route_sql_node(node, database_type, replica_name)
+
         # Cache the node with event loop ID for tracking
-        self._async_sql_node_cache[database_type] = (node, current_loop_id)
+        self._async_sql_node_cache[cache_key] = (node, current_loop_id)
 
         logger.debug(
             f"Created cached AsyncSQLDatabaseNode for {database_type} "
@@ -5939,6 +6123,98 @@ class DataFlow:
 
         return node
 
+    def _instrument_sql_node(self, node) -> None:
+        """Attribute SQL execution time to the active trace span.
+
+        Only records time while tracing is enabled; otherwise the wrapper
+        adds a single attribute lookup per query.
+        """
+        from .tracing import ExecutionTracer, get_tracer
+
+        execute = node.async_run
+
+        async def traced_async_run(*args, **kwargs):
+            if get_tracer(self) is None:
+                return await execute(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return await execute(*args, **kwargs)
+            finally:
+                ExecutionTracer.add_db_time((time.perf_counter() - start) * 1000)
+
+        node.async_run = traced_async_run
+
+    def _route_sql_node(self, node, database_type: str, replica_name: Optional[str]):
+        """Feed query outcomes of a node back into the query router.
+
+        Replica nodes report outstanding requests, latency and failures, and
+        retry reads on the primary when the replica is unreachable. The
+        primary node records writes so that reads in the same context stick
+        to it (read-your-writes).
+        """
+        from .query_router import is_unavailable_error, is_write_statement
+
+        router = self._query_router
+        execute = node.async_run
+
+        if replica_name is None:
+
+            async def primary_async_run(*args, **kwargs):
+                result = await execute(*args, **kwargs)
+                if is_write_statement(str(kwargs.get("query", ""))):
+                    router.record_write()
+                return result
+
+            node.async_run = primary_async_run
+            return
+
+        async def replica_async_run(*args, **kwargs):
+            try:
+                with router.track_request(replica_name):
+                    return await execute(*args, **kwargs)
+            except Exception as e:
+                if not is_unavailable_error(e):
+                    raise
+                logger.warning(f"Read on {replica_name} failed, using primary: {e}")
+            primary = self._get_or_create_async_sql_node(database_type)
+            return await primary.async_run(*args, **kwargs)
+
+        node.async_run = replica_async_run
+
+    def enable_tracing(self, max_spans: int = 10000, measure_bytes: bool = False):
+        """Start recording per-node execution spans.
+
+        Spans from generated nodes and ``db.express`` operations feed
+        ``Inspector.workflow_performance_profile()``.
+
+        Args:
+            max_spans: Maximum spans retained in memory
+            measure_bytes: Also measure the serialized size of node results.
+                Off by default because it serializes every result.
+
+        Returns:
+            ExecutionTracer collecting the spans
+        """
+        from .tracing import ExecutionTracer
+
+        tracer = getattr(self, "_execution_tracer", None)
+        if tracer is None:
+            tracer = ExecutionTracer(max_spans=max_spans, measure_bytes=measure_bytes)
+            self._execution_tracer = tracer
+        tracer.enabled = True
+        return tracer
+
+    def disable_tracing(self) -> None:
+        """Stop recording spans (already recorded spans are kept)."""
+        tracer = getattr(self, "_execution_tracer", None)
+        if tracer is not None:
+            tracer.enabled = False
+
+    @property
+    def tracer(self):
+        """ExecutionTracer of this instance, or None if tracing was never enabled."""
+        return getattr(self, "_execution_tracer", None)
+
     def _execute_ddl(self, schema_sql: Dict[str, List[str]] = None):
         """Execute DDL statements to create tables (sync version).
 
@@ -6223,6 +6499,134 @@ class DataFlow:
             )
             return False
 
+    def reconcile_schema(self) -> Dict[str, Any]:
+        """Create tables and indexes for models queued by deferred registration.
+
+        Takes one catalog snapshot of existing tables and indexes, diffs every
+        queued model against it, and applies all missing CREATE TABLE/INDEX
+        statements over one connection in a single transaction (PostgreSQL
+        and SQLite; MySQL commits each DDL statement). If the transaction
+        fails, each model falls back to per-model sync DDL.
+
+        Called automatically by initialize(); safe to call directly from
+        sync code.
+
+        Returns:
+            Dict with 'success', 'models', 'executed_count' and optionally 'error'
+        """
+        pending = list(self._pending_schema_models)
+        self._pending_schema_models.clear()
+        if not pending:
+            return {"success": True, "models": [], "executed_count": 0}
+
+        database_url = self.config.database.url
+        if (
+            not database_url
+            or database_url == ":memory:"
+            or database_url == "sqlite:///:memory:"
+        ):
+            # Same limitation as _create_table_sync: a separate connection would
+            # see a different in-memory database, so tables are created lazily
+            logger.debug(
+                f"Skipping schema reconciliation for {len(pending)} models; "
+                f"tables will be created lazily on first access"
+            )
+            return {"success": False, "models": pending, "executed_count": 0}
+
+        db_type = self._detect_database_type()
+        if db_type == "mongodb":
+            return {"success": True, "models": pending, "executed_count": 0}
+
+        try:
+            from ..migrations.sync_ddl_executor import SyncDDLExecutor
+
+            executor = SyncDDLExecutor(database_url)
+            snapshot = executor.get_catalog_snapshot()
+        except Exception as e:
+            snapshot = {"error": str(e)}
+
+        if "error" in snapshot:
+            logger.warning(
+                f"Catalog snapshot failed ({snapshot['error']}); "
+                f"creating {len(pending)} tables individually"
+            )
+            for model_name in pending:
+                self._create_table_sync(model_name)
+            return {
+                "success": False,
+                "models": pending,
+                "executed_count": 0,
+                "error": snapshot["error"],
+            }
+
+        existing_tables = {name.lower() for name in snapshot["tables"]}
+        existing_indexes = {name.lower() for name in snapshot["indexes"]}
+        statements = []
+        reconciled = []
+        for model_name in pending:
+            try:
+                table_name = self._models[model_name]["table_name"]
+                model_statements = []
+                if table_name.lower() not in existing_tables:
+                    model_statements.append(
+                        self._generate_create_table_sql(model_name, db_type)
+                    )
+                for index_sql in self._generate_indexes_sql(model_name, db_type):
+                    match = _INDEX_NAME_PATTERN.search(index_sql)
+                    if match:
+                        index_name = match.group(1).lower()
+                        if index_name in existing_indexes:
+                            continue
+                        existing_indexes.add(index_name)
+                    model_statements.append(index_sql)
+            except Exception as e:
+                logger.warning(
+                    f"Could not generate DDL for '{model_name}': {e}. "
+                    f"Table will be created on first access."
+                )
+                continue
+            statements.extend(model_statements)
+            reconciled.append(model_name)
+
+        if statements:
+            result = executor.execute_ddl_transaction(statements)
+        else:
+            result = {"success": True, "executed_count": 0}
+
+        if not result.get("success"):
+            logger.warning(
+                f"Schema reconciliation failed ({result.get('error')}); "
+                f"creating {len(reconciled)} tables individually"
+            )
+            for model_name in reconciled:
+                self._create_table_sync(model_name)
+            return {
+                "success": False,
+                "models": reconciled,
+                "executed_count": result.get("executed_count", 0),
+                "error": result.get("error"),
+            }
+
+        for model_name in reconciled:
+            schema_checksum = None
+            if self._schema_cache.enable_schema_validation:
+                schema_checksum = self._calculate_schema_checksum(
+                    self._models[model_name]["fields"]
+                )
+            self._schema_cache.mark_table_ensured(
+                model_name, database_url, schema_checksum
+            )
+
+        logger.debug(
+            f"Schema reconciliation: {len(reconciled)} models, "
+            f"{result['executed_count']} DDL statements"
+        )
+        return {
+            "success": True,
+            "models": reconciled,
+            "executed_count": result["executed_count"],
+        }
+
     def create_tables_sync(self, database_type: str = None):
         """Create database tables for all registered models using synchronous DDL.
 
@@ -7810,7 +8214,9 @@ class DataFlow:
 
     # ---- Workflow Binding Integration ----
 
-    def create_workflow(self, workflow_id: str = None) -> "WorkflowBuilder":
+    def create_workflow(
+        self, workflow_id: str = None, optimize: bool = False
+    ) -> "WorkflowBuilder":
         """Create a workflow bound to this DataFlow instance.
 
         Creates a WorkflowBuilder that can be used with add_node() and
@@ -7818,6 +8224,8 @@ class DataFlow:
 
         Args:
             workflow_id: Optional identifier for the workflow
+            optimize: Push ListNode→SmartMergeNode→AggregateNode chains down
+                into a single SQL aggregate at execution time
 
         Returns:
             WorkflowBuilder instance
@@ -7837,7 +8245,7 @@ class DataFlow:
             })
             results, run_id = db.execute_workflow(workflow)
         """
-        return self._workflow_binder.create_workflow(workflow_id)
+        return self._workflow_binder.create_workflow(workflow_id, optimize)
 
     def add_node(
         self,
@@ -7881,6 +8289,7 @@ class DataFlow:
         workflow: "WorkflowBuilder",
         inputs: Optional[Dict[str, Any]] = None,
         runtime=None,
+        optimize: Optional[bool] = None,
     ):
         """Execute a DataFlow-bound workflow.
 
@@ -7888,6 +8297,8 @@ class DataFlow:
             workflow: Workflow from create_workflow()
             inputs: Optional input parameters
             runtime: Optional runtime (creates LocalRuntime if not provided)
+            optimize: Fuse Query→Merge→Aggregate chains into SQL aggregates
+                (defaults to the flag given to create_workflow())
 
         Returns:
             Tuple of (results_dict, run_id)
@@ -7897,7 +8308,7 @@ class DataFlow:
                 "user_id": "user-123"
             })
         """
-        return self._workflow_binder.execute(workflow, inputs, runtime)
+        return self._workflow_binder.execute(workflow, inputs, runtime, optimize)
 
     def get_available_nodes(self, model_name: str = None) -> Dict[str, list]:
         """Get available DataFlow nodes for workflow composition.
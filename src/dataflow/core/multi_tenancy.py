@@ -584,8 +584,12 @@ class TenantManager:
         self,
         registry: Optional[TenantRegistry] = None,
         default_strategy: Union[str, Any] = "schema",
+        pool_router: Optional[Any] = None,
     ):
         self.registry = registry or TenantRegistry()
+        # Optional TenantPoolRouter: when set, schema tenants run on connections
+        # with search_path pinned at connect time instead of rewritten queries
+        self.pool_router = pool_router
         if isinstance(default_strategy, str):
             self.default_strategy = default_strategy
         else:
@@ -687,10 +691,33 @@ class TenantManager:
         if not strategy:
             strategy = self.default_strategy
 
+        pinned = self._uses_pinned_search_path(tenant_config)
+        if (
+            pinned
+            and tenant_config.isolation_strategy == IsolationStrategy.SCHEMA.value
+        ):
+            # Connection search_path already targets the tenant schema
+            logger.info(f"Executing tenant query on pinned pool: {query}")
+            return {
+                "query": query,
+                "tenant_id": tenant_id,
+                "pool_key": self.pool_router.resolve_pool_key(tenant_id),
+            }
+
         # Prepare query execution
         if hasattr(strategy, "prepare_query_execution"):
             strategy.prepare_query_execution(db, tenant_id)
 
+        if pinned:
+            # Hybrid tenant: search_path is pinned, only the row-level
+            # security context needed setting
+            logger.info(f"Executing tenant query on pinned pool: {query}")
+            return {
+                "query": query,
+                "tenant_id": tenant_id,
+                "pool_key": self.pool_router.resolve_pool_key(tenant_id),
+            }
+
         # Modify query for tenant
         if hasattr(strategy, "modify_query_for_tenant"):
             modified_query = strategy.modify_query_for_tenant(query, tenant_id)
@@ -701,6 +728,22 @@ class TenantManager:
         logger.info(f"Executing tenant query: {modified_query}")
         return {"query": modified_query, "tenant_id": tenant_id}
 
+    def acquire_tenant_connection(self, tenant_id: str):
+        """Acquire a connection from the tenant's routed sub-pool.
+
+        Returns an async context manager yielding a connection whose
+        search_path (or database) is already set for the tenant.
+        """
+        if self.pool_router is None:
+            raise ValueError("No pool_router configured for this TenantManager")
+        return self.pool_router.acquire(tenant_id)
+
+    def _uses_pinned_search_path(self, tenant_config: TenantConfig) -> bool:
+        """Check whether the tenant is served by a search_path-pinned pool."""
+        return self.pool_router is not None and (
+            self.pool_router.uses_pinned_search_path(tenant_config.tenant_id)
+        )
+
     def _get_strategy_for_type(self, strategy_type: str):
         """Get strategy by type."""
         return self.isolation_strategies.get(strategy_type)
@@ -4,7 +4,10 @@ DataFlow Node Generation
 Dynamic node generation for database operations.
 """
 
-from typing import Any, Dict, List, Optional, Type, Union
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Type, Union
 
 from kailash.nodes.base import Node, NodeParameter, NodeRegistry
 from kailash.nodes.base_async import AsyncNode
@@ -100,6 +103,74 @@ def convert_datetime_fields(data_dict: dict, model_fields: dict, logger) -> dict
     return data_dict
 
 
+_LAZY_NODE_LOCK = threading.RLock()
+
+
+class LazyNodeProxy(Node):
+    """Registry placeholder for a DataFlow node class that is not built yet.
+
+    Registered under the node's name when lazy node generation is enabled.
+    The real class is generated on first lookup through DataFlow or on first
+    instantiation; instantiating the proxy returns an instance of the real
+    class, and all registrations are then pointed at the real class.
+    """
+
+    _lazy_factory: Optional[Callable[[], Type[Node]]] = None
+    _lazy_target: Optional[Type[Node]] = None
+
+    def __new__(cls, *args, **kwargs):
+        # The returned object is not a proxy instance, so __init__ is skipped
+        return cls.materialize()(*args, **kwargs)
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+
+    # Precomputed so NodeRegistry's constructor check does not re-inspect
+    # the same signature for every proxy
+    __init__.__signature__ = inspect.signature(__init__)
+
+    def get_parameters(self) -> Dict[str, NodeParameter]:
+        return {}
+
+    @classmethod
+    def materialize(cls) -> Type[Node]:
+        """Build (once) and return the real node class."""
+        if cls._lazy_target is None:
+            with _LAZY_NODE_LOCK:
+                if cls._lazy_target is None:
+                    cls._lazy_target = cls._lazy_factory()
+        return cls._lazy_target
+
+
+def _is_lazy_proxy(value: Any) -> bool:
+    return isinstance(value, type) and issubclass(value, LazyNodeProxy)
+
+
+class LazyNodeDict(dict):
+    """Node storage that materializes lazy proxies when they are looked up."""
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        return value.materialize() if _is_lazy_proxy(value) else value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def values(self):
+        return [self[key] for key in self]
+
+    def items(self):
+        return [(key, self[key]) for key in self]
+
+    def pending(self) -> List[str]:
+        """Names of nodes whose classes have not been generated yet."""
+        return [
+            key
+            for key, value in super().items()
+            if _is_lazy_proxy(value) and value._lazy_target is None
+        ]
+
+
 class NodeGenerator:
     """Generates workflow nodes for DataFlow models."""
 
@@ -108,6 +179,8 @@ class NodeGenerator:
         # TDD mode detection and context
         self._tdd_mode = getattr(dataflow_instance, "_tdd_mode", False)
         self._test_context = getattr(dataflow_instance, "_test_context", None)
+        # Lazy generation registers proxies and builds classes on first use
+        self._lazy_nodes = getattr(dataflow_instance, "_lazy_nodes", False)
 
     def _normalize_type_annotation(self, type_annotation: Any) -> Type:
         """Normalize complex type annotations to simple types for NodeParameter.
@@ -186,6 +259,13 @@ class NodeGenerator:
 
     def generate_crud_nodes(self, model_name: str, fields: Dict[str, Any]):
         """Generate CRUD workflow nodes for a model."""
+        if self._lazy_nodes:
+            return self._register_lazy_nodes(
+                model_name,
+                fields,
+                ["create", "read", "update", "delete", "list", "upsert", "count"],
+            )
+
         nodes = {
             f"{model_name}CreateNode": self._create_node_class(
                 model_name, "create", fields
@@ -224,6 +304,13 @@ class NodeGenerator:
 
     def generate_bulk_nodes(self, model_name: str, fields: Dict[str, Any]):
         """Generate bulk operation nodes for a model."""
+        if self._lazy_nodes:
+            return self._register_lazy_nodes(
+                model_name,
+                fields,
+                ["bulk_create", "bulk_update", "bulk_delete", "bulk_upsert"],
+            )
+
         nodes = {
             f"{model_name}BulkCreateNode": self._create_node_class(
                 model_name, "bulk_create", fields
@@ -248,6 +335,64 @@ class NodeGenerator:
 
         return nodes
 
+    @staticmethod
+    def _node_name(model_name: str, operation: str) -> str:
+        return f"{model_name}{operation.replace('_', ' ').title().replace(' ', '')}Node"
+
+    def _register_lazy_nodes(
+        self, model_name: str, fields: Dict[str, Any], operations: List[str]
+    ) -> Dict[str, Type[Node]]:
+        """Register proxies for a model's nodes without generating the classes."""
+        nodes = {}
+        for operation in operations:
+            node_name = self._node_name(model_name, operation)
+            proxy = type(Node)(
+                node_name,
+                (LazyNodeProxy,),
+                {"__doc__": f"Lazily generated DataFlow node for {model_name}."},
+            )
+            proxy._lazy_factory = (
+                lambda proxy=proxy, operation=operation: self._materialize_lazy_node(
+                    proxy, model_name, operation, fields
+                )
+            )
+            nodes[node_name] = proxy
+
+            NodeRegistry.register(proxy, alias=node_name)
+            globals()[node_name] = proxy
+            self.dataflow_instance._nodes[node_name] = proxy
+
+        return nodes
+
+    def _materialize_lazy_node(
+        self,
+        proxy: Type[LazyNodeProxy],
+        model_name: str,
+        operation: str,
+        fields: Dict[str, Any],
+    ) -> Type[Node]:
+        """Generate the real class behind a proxy and replace its registrations."""
+        start = time.perf_counter()
+        node_name = proxy.__name__
+        node_class = self._create_node_class(model_name, operation, fields)
+
+        # Only replace registrations that still point at this proxy
+        if NodeRegistry.list_nodes().get(node_name) is proxy:
+            NodeRegistry.register(node_class, alias=node_name)
+        if globals().get(node_name) is proxy:
+            globals()[node_name] = node_class
+        nodes = self.dataflow_instance._nodes
+        if dict.get(nodes, node_name) is proxy:
+            dict.__setitem__(nodes, node_name, node_class)
+
+        timings = getattr(self.dataflow_instance, "_startup_timings", {})
+        if model_name in timings:
+            timings[model_name]["materialized_nodes"] += 1
+            timings[model_name]["materialize_ms"] += (
+                time.perf_counter() - start
+            ) * 1000
+        return node_class
+
     def _create_node_class(
         self, model_name: str, operation: str, fields: Dict[str, Any]
     ) -> Type[Node]:
@@ -1028,6 +1173,13 @@ class NodeGenerator:
                                 default=False,
                                 description="Include soft-deleted records (models with soft_delete: True auto-filter by default)",
                             ),
+                            "result_format": NodeParameter(
+                                name="result_format",
+                                type=str,
+                                required=False,
+                                default="records",
+                                description="'records' for a list of dicts, 'columnar' for a ColumnarResult of NumPy columns",
+                            ),
                         }
                     )
                     return params
@@ -1194,6 +1346,30 @@ class NodeGenerator:
                 return async_safe_run(self.async_run(**kwargs))
 
             async def async_run(self, **kwargs) -> Dict[str, Any]:
+                """Execute the database operation, recording a span when tracing."""
+                from .tracing import get_tracer
+
+                tracer = get_tracer(self.dataflow_instance)
+                if tracer is None:
+                    return await self._run_operation(**kwargs)
+
+                # Express operations open their own span; enrich it instead
+                span = tracer.current_span()
+                if span is not None and span.source == "express":
+                    return await self._run_operation(**kwargs)
+
+                node_type = (
+                    f"{self.model_name}"
+                    f"{''.join(p.title() for p in self.operation.split('_'))}Node"
+                )
+                with tracer.trace(
+                    getattr(self, "id", None) or node_type, node_type
+                ) as span:
+                    result = await self._run_operation(**kwargs)
+                    tracer.annotate_result(span, result)
+                return result
+
+            async def _run_operation(self, **kwargs) -> Dict[str, Any]:
                 """Execute the database operation using DataFlow components."""
                 import asyncio
                 import logging
@@ -1809,7 +1985,7 @@ class NodeGenerator:
 
                     # Get or create cached AsyncSQLDatabaseNode for connection pooling
                     sql_node = self.dataflow_instance._get_or_create_async_sql_node(
-                        database_type
+                        database_type, read_only=True
                     )
 
                     # Apply tenant isolation to the query
@@ -2454,6 +2630,11 @@ class NodeGenerator:
                     cache_ttl = kwargs.get("cache_ttl")
                     cache_key_override = kwargs.get("cache_key")
                     count_only = kwargs.get("count_only", False)
+                    result_format = kwargs.get("result_format") or "records"
+                    if result_format != "records":
+                        from .columnar import validate_result_format
+
+                        result_format = validate_result_format(result_format)
 
                     # Fix parameter type issues
                     import json
@@ -2649,7 +2830,7 @@ class NodeGenerator:
 
                         # Get or create cached AsyncSQLDatabaseNode for connection pooling
                         sql_node = self.dataflow_instance._get_or_create_async_sql_node(
-                            db_type
+                            db_type, read_only=True
                         )
                         sql_result = await sql_node.async_run(
                             query=query,
@@ -2684,6 +2865,16 @@ class NodeGenerator:
                                     self._deserialize_json_fields(record)
                                     for record in records
                                 ]
+                                if result_format == "columnar":
+                                    from .columnar import ColumnarResult
+
+                                    columns = ColumnarResult.from_records(records)
+                                    return {
+                                        "records": columns,
+                                        "count": len(columns),
+                                        "limit": limit,
+                                        "result_format": "columnar",
+                                    }
                                 return {
                                     "records": records,
                                     "count": len(records),
@@ -2693,9 +2884,30 @@ class NodeGenerator:
                         # Default return
                         if count_only:
                             return {"count": 0}
+                        elif result_format == "columnar":
+                            from .columnar import ColumnarResult
+
+                            return {
+                                "records": ColumnarResult({}),
+                                "count": 0,
+                                "limit": limit,
+                                "result_format": "columnar",
+                            }
                         else:
                             return {"records": [], "count": 0, "limit": limit}
 
+                    # Read-your-writes: a cached result may predate this context's write
+                    query_router = getattr(
+                        self.dataflow_instance, "_query_router", None
+                    )
+                    if query_router is not None and query_router.has_recent_write():
+                        enable_cache = False
+
+                    # Columnar results are meant for large analytical reads;
+                    # keep them out of the record-oriented query cache
+                    if result_format == "columnar" and not count_only:
+                        enable_cache = False
+
                     # Check if cache integration is available
                     cache_integration = getattr(
                         self.dataflow_instance, "_cache_integration", None
@@ -3172,7 +3384,7 @@ class NodeGenerator:
 
                     # Execute SQL query
                     sql_node = self.dataflow_instance._get_or_create_async_sql_node(
-                        db_type
+                        db_type, read_only=True
                     )
                     result = await sql_node.async_run(
                         query=query,
@@ -3670,9 +3882,7 @@ class NodeGenerator:
                 return None
 
         # Set dynamic class name and proper module
-        DataFlowNode.__name__ = (
-            f"{model_name}{operation.replace('_', ' ').title().replace(' ', '')}Node"
-        )
+        DataFlowNode.__name__ = self._node_name(model_name, operation)
         DataFlowNode.__qualname__ = DataFlowNode.__name__
 
         # Set operation-specific docstring
@@ -214,6 +214,7 @@ class ProtectedDataFlow(DataFlowProtectionMixin, DataFlow):
             "connection_protections": len(config.connection_protections),
             "model_protections": len(config.model_protections),
             "audit_events": len(config.auditor.events),
+            "check_metrics": self._protection_engine.get_metrics(),
         }
 
     def disable_protection(self):
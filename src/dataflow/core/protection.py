@@ -11,7 +11,8 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime, time
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Union
+from time import perf_counter_ns
+from typing import Any, Callable, Dict, List, Optional, Pattern, Set, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
@@ -219,7 +220,7 @@ class ProtectionAuditor:
             "reason": reason,
         }
         self.events.append(event)
-        logger.debug(f"Protection check passed: {event}")
+        logger.debug("Protection check passed: %s", event)
 
 
 @dataclass
@@ -280,11 +281,52 @@ class WriteProtectionConfig:
         )
 
 
+@dataclass
+class _ModelRule:
+    """A model protection compiled for constant-time field lookups."""
+
+    protection: ModelProtection
+    fields: Dict[str, FieldProtection] = field(default_factory=dict)
+    field_count: int = -1
+    # (operation, field) -> (allowed, reason) for rules without time windows
+    # or conditions, whose outcome cannot change between checks
+    decisions: Dict[Tuple[OperationType, Optional[str]], Tuple[bool, str]] = field(
+        default_factory=dict
+    )
+
+    def compile_fields(self) -> None:
+        self.fields = {}
+        for field_protection in self.protection.protected_fields:
+            # The first protection of a field wins, as in is_operation_allowed
+            self.fields.setdefault(field_protection.field_name, field_protection)
+        self.field_count = len(self.protection.protected_fields)
+        self.decisions.clear()
+
+
 class WriteProtectionEngine:
-    """Core engine for enforcing write protection rules."""
+    """Core engine for enforcing write protection rules.
+
+    The configured rules are compiled into lookup tables on first use:
+    model protections by model name (with their fields by field name) and
+    connection patterns as compiled regexes whose match results are cached
+    per connection string. The tables are rebuilt when protections are added
+    to, removed from or replaced in the config; call ``invalidate()`` after
+    editing an existing protection in place.
+    """
+
+    # Connection strings whose pattern matches are kept
+    MAX_CACHED_CONNECTIONS = 1024
 
     def __init__(self, config: WriteProtectionConfig):
         self.config = config
+        self._index_signature: Optional[Tuple[Tuple[int, ...], ...]] = None
+        self._model_rules: Dict[str, List[_ModelRule]] = {}
+        self._connection_rules: List[Tuple[Pattern, ConnectionProtection]] = []
+        self._connection_matches: Dict[str, List[ConnectionProtection]] = {}
+        self._check_count = 0
+        self._check_time_ns = 0
+        self._max_check_time_ns = 0
+        self._index_builds = 0
         self._operation_mapping = {
             "create": OperationType.CREATE,
             "read": OperationType.READ,
@@ -318,6 +360,44 @@ class WriteProtectionEngine:
         Raises:
             ProtectionViolation: If operation is blocked
         """
+        started = perf_counter_ns()
+        try:
+            self._check_operation(
+                operation, model_name, field_name, connection_string, context
+            )
+        finally:
+            elapsed = perf_counter_ns() - started
+            self._check_count += 1
+            self._check_time_ns += elapsed
+            if elapsed > self._max_check_time_ns:
+                self._max_check_time_ns = elapsed
+
+    def invalidate(self) -> None:
+        """Rebuild the compiled rule index on the next check."""
+        self._index_signature = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get protection check latency and rule index metrics."""
+        checks = self._check_count
+        return {
+            "checks": checks,
+            "avg_check_latency_us": (
+                self._check_time_ns / checks / 1000 if checks else 0.0
+            ),
+            "max_check_latency_us": self._max_check_time_ns / 1000,
+            "index_builds": self._index_builds,
+            "indexed_models": len(self._model_rules),
+            "cached_connections": len(self._connection_matches),
+        }
+
+    def _check_operation(
+        self,
+        operation: str,
+        model_name: Optional[str],
+        field_name: Optional[str],
+        connection_string: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> None:
         op_type = self._operation_mapping.get(operation, OperationType.CUSTOM_QUERY)
 
         # Check global protection first
@@ -330,65 +410,124 @@ class WriteProtectionEngine:
             self._handle_violation(violation, context)
             return
 
+        self._ensure_index()
+
         # Check connection-level protection
         if connection_string:
-            for conn_protection in self.config.connection_protections:
-                if conn_protection.matches_connection(connection_string):
-                    if not self._check_connection_protection(conn_protection, op_type):
-                        violation = ProtectionViolation(
-                            f"Connection protection blocks {operation}",
-                            op_type,
-                            conn_protection.protection_level,
-                            connection=connection_string,
-                        )
-                        self._handle_violation(violation, context)
-                        return
+            for conn_protection in self._matching_connection_protections(
+                connection_string
+            ):
+                if not self._check_connection_protection(conn_protection, op_type):
+                    violation = ProtectionViolation(
+                        f"Connection protection blocks {operation}",
+                        op_type,
+                        conn_protection.protection_level,
+                        connection=connection_string,
+                    )
+                    self._handle_violation(violation, context)
+                    return
 
         # Check model-level protection
         if model_name:
-            for model_protection in self.config.model_protections:
-                if model_protection.model_name == model_name:
-                    allowed, reason = model_protection.is_operation_allowed(
-                        op_type, field_name, context
+            for rule in self._model_rules.get(model_name, ()):
+                allowed, reason, field_protection = self._check_model_rule(
+                    rule, op_type, field_name, context
+                )
+                if not allowed:
+                    # Field-level protection uses the field's protection level
+                    if field_protection:
+                        message = f"Field protection blocks {operation}: {reason}"
+                        protection_level = field_protection.protection_level
+                    else:
+                        message = f"Model protection blocks {operation}: {reason}"
+                        protection_level = rule.protection.protection_level
+
+                    violation = ProtectionViolation(
+                        message,
+                        op_type,
+                        protection_level,
+                        model=model_name,
+                        field=field_name,
                     )
-                    if not allowed:
-                        # Determine if this is field-level or model-level protection
-                        if field_name and any(
-                            fp.field_name == field_name
-                            for fp in model_protection.protected_fields
-                        ):
-                            message = f"Field protection blocks {operation}: {reason}"
-                            # Use the field's protection level, not the model's
-                            field_protection = next(
-                                (
-                                    fp
-                                    for fp in model_protection.protected_fields
-                                    if fp.field_name == field_name
-                                ),
-                                None,
-                            )
-                            protection_level = (
-                                field_protection.protection_level
-                                if field_protection
-                                else model_protection.protection_level
-                            )
-                        else:
-                            message = f"Model protection blocks {operation}: {reason}"
-                            protection_level = model_protection.protection_level
-
-                        violation = ProtectionViolation(
-                            message,
-                            op_type,
-                            protection_level,
-                            model=model_name,
-                            field=field_name,
-                        )
-                        self._handle_violation(violation, context)
-                        return
+                    self._handle_violation(violation, context)
+                    return
 
         # Operation allowed - log if auditing
         self.config.auditor.log_allowed(op_type, model_name, field_name)
 
+    def _ensure_index(self) -> None:
+        """Compile the rule index if protections were added, removed or replaced."""
+        connections = self.config.connection_protections
+        models = self.config.model_protections
+        # Identities of the protections themselves; the index keeps them
+        # alive, so an id cannot be reused by a replacement
+        signature = (tuple(map(id, connections)), tuple(map(id, models)))
+        if signature == self._index_signature:
+            return
+
+        self._connection_rules = [
+            (re.compile(protection.connection_pattern), protection)
+            for protection in connections
+        ]
+        self._connection_matches = {}
+        self._model_rules = {}
+        for protection in models:
+            self._model_rules.setdefault(protection.model_name, []).append(
+                _ModelRule(protection)
+            )
+        self._index_signature = signature
+        self._index_builds += 1
+
+    def _matching_connection_protections(
+        self, connection_string: str
+    ) -> List[ConnectionProtection]:
+        """Connection protections whose pattern matches, memoized."""
+        matches = self._connection_matches.get(connection_string)
+        if matches is None:
+            if len(self._connection_matches) >= self.MAX_CACHED_CONNECTIONS:
+                self._connection_matches.clear()
+            matches = [
+                protection
+                for pattern, protection in self._connection_rules
+                if pattern.match(connection_string)
+            ]
+            self._connection_matches[connection_string] = matches
+        return matches
+
+    def _check_model_rule(
+        self,
+        rule: _ModelRule,
+        operation: OperationType,
+        field_name: Optional[str],
+        context: Optional[Dict[str, Any]],
+    ) -> Tuple[bool, str, Optional[FieldProtection]]:
+        """Evaluate one model protection; returns (allowed, reason, field)."""
+        protection = rule.protection
+        if len(protection.protected_fields) != rule.field_count:
+            rule.compile_fields()
+        field_protection = rule.fields.get(field_name) if field_name else None
+
+        if protection.time_window or protection.conditions:
+            allowed, reason = protection.is_operation_allowed(
+                operation, field_name, context
+            )
+        else:
+            key = (operation, field_name)
+            decision = rule.decisions.get(key)
+            if decision is None:
+                if field_protection:
+                    allowed_operations = field_protection.allowed_operations
+                    denied_reason = field_protection.reason
+                else:
+                    allowed_operations = protection.allowed_operations
+                    denied_reason = protection.reason
+                allowed = operation in allowed_operations
+                decision = (allowed, "" if allowed else denied_reason)
+                rule.decisions[key] = decision
+            allowed, reason = decision
+
+        return allowed, reason, field_protection
+
     def _check_global_protection(self, operation: OperationType) -> bool:
         """Check global protection rules."""
         global_prot = self.config.global_protection
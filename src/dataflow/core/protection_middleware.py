@@ -296,17 +296,16 @@ class AsyncSQLProtectionWrapper:
 
     def _detect_operation_from_sql(self, query: str) -> str:
         """Detect operation type from SQL query."""
-        query = query.strip().upper()
+        # Only the leading keyword matters; avoid upper-casing the whole query
+        keyword = query.lstrip()[:6].upper()
 
-        if query.startswith("SELECT") or query.startswith("WITH"):
+        if keyword.startswith("SELECT") or keyword.startswith("WITH"):
             return "read"
-        elif query.startswith("INSERT"):
+        elif keyword.startswith("INSERT"):
             return "create"
-        elif query.startswith("UPDATE"):
+        elif keyword.startswith("UPDATE"):
             return "update"
-        elif query.startswith("DELETE"):
+        elif keyword.startswith("DELETE"):
             return "delete"
-        elif any(query.startswith(stmt) for stmt in ["CREATE", "ALTER", "DROP"]):
-            return "custom_query"
         else:
             return "custom_query"
@@ -3,16 +3,34 @@ Database Query Router for Multi-Database Support
 
 Routes queries to appropriate databases based on operation type,
 load balancing, and failover logic.
+
+Read replicas are balanced by outstanding requests and observed latency.
+Replicas that lag behind the primary, or that recently failed, are skipped,
+and reads issued shortly after a write in the same context go to the
+primary (read-your-writes). A context is the current asyncio task (or
+thread, outside a loop) unless a request opens ``read_your_writes_scope``.
 """
 
+import asyncio
 import logging
+import re
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Union
+from typing import Dict, Hashable, List, Optional, Union
 
 from .database_registry import DatabaseConfig, DatabaseRegistry
 
 logger = logging.getLogger(__name__)
 
+# Read-your-writes key of the current request (see read_your_writes_scope)
+_read_your_writes_key: ContextVar[Optional[Hashable]] = ContextVar(
+    "_read_your_writes_key", default=None
+)
+
 
 class QueryType(Enum):
     """Types of database queries."""
@@ -33,15 +51,131 @@ class RoutingStrategy(Enum):
     LEAST_CONNECTIONS = "least_connections"
 
 
+@dataclass
+class ReplicaStats:
+    """Observed load and health of one database."""
+
+    latency_ewma_ms: Optional[float] = None
+    replication_lag_seconds: float = 0.0
+    failures: int = 0
+    unavailable_until: float = 0.0
+    requests: int = 0
+
+
+# Statements that read unless they embed a data-modifying clause
+_READ_STATEMENTS = frozenset({"SELECT", "WITH", "SHOW", "EXPLAIN", "VALUES", "TABLE"})
+_LEADING_KEYWORD = re.compile(r"[\s(]*([A-Za-z]+)")
+_DML_KEYWORD = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+# String literals, quoted identifiers and comments, which may contain keywords
+_SQL_NON_CODE = re.compile(
+    r"'(?:[^']|'')*'|\"(?:[^\"]|\"\")*\"|--[^\n]*|/\*.*?\*/", re.DOTALL
+)
+
+# Driver exception types and messages meaning the database was unreachable
+_UNAVAILABLE_ERROR_TYPES = frozenset(
+    {
+        "PostgresConnectionError",
+        "ConnectionDoesNotExistError",
+        "CannotConnectNowError",
+        "TooManyConnectionsError",
+    }
+)
+_UNAVAILABLE_ERROR_MESSAGES = (
+    "connection refused",
+    "connection reset",
+    "could not connect",
+    "can't connect",
+    "server closed the connection",
+    "terminating connection",
+    "too many connections",
+    "pool is closed",
+    "unable to open database",
+    "name or service not known",
+    "timed out",
+)
+
+
+def is_write_statement(sql: str) -> bool:
+    """
+    Whether a SQL statement may modify data.
+
+    Statements that do not start with a read keyword count as writes. Reads
+    (including ``WITH`` and ``EXPLAIN``) count as writes when they contain a
+    DML keyword outside literals and comments, e.g. ``WITH ... INSERT`` or
+    ``SELECT ... FOR UPDATE``.
+    """
+    code = _SQL_NON_CODE.sub(" ", sql or "")
+    leading = _LEADING_KEYWORD.match(code)
+    if leading is None:
+        return False
+    if leading.group(1).upper() not in _READ_STATEMENTS:
+        return True
+    return _DML_KEYWORD.search(code) is not None
+
+
+def is_unavailable_error(error: BaseException) -> bool:
+    """
+    Whether a failed query means the database could not be reached.
+
+    Query nodes wrap driver errors, so the whole exception chain is checked.
+    Query errors (bad SQL, constraint violations, permissions) return False.
+    """
+    seen = set()
+    while error is not None and id(error) not in seen:
+        seen.add(id(error))
+        if isinstance(error, (OSError, TimeoutError)):
+            return True
+        if _UNAVAILABLE_ERROR_TYPES.intersection(
+            cls.__name__ for cls in type(error).__mro__
+        ):
+            return True
+        message = str(error).lower()
+        if any(marker in message for marker in _UNAVAILABLE_ERROR_MESSAGES):
+            return True
+        error = error.__cause__ or error.__context__
+    return False
+
+
 class DatabaseQueryRouter:
     """Routes queries to appropriate databases based on strategy."""
 
-    def __init__(self, registry: DatabaseRegistry):
+    # PostgreSQL standby lag; NULL (0) on a primary
+    POSTGRESQL_LAG_QUERY = (
+        "SELECT COALESCE(EXTRACT(EPOCH FROM "
+        "now() - pg_last_xact_replay_timestamp()), 0)"
+    )
+
+    def __init__(
+        self,
+        registry: DatabaseRegistry,
+        max_replication_lag: float = 10.0,
+        read_your_writes_window: float = 5.0,
+        failure_cooldown: float = 30.0,
+        latency_smoothing: float = 0.2,
+    ):
+        """
+        Initialize the router.
+
+        Args:
+            registry: Registry holding the primary and replica configurations
+            max_replication_lag: Replicas lagging more than this (seconds)
+                receive no reads
+            read_your_writes_window: Seconds after a write during which reads
+                from the same context go to the primary (0 disables)
+            failure_cooldown: Seconds a replica is skipped after a failed query
+            latency_smoothing: Weight of the newest sample in the latency EWMA
+        """
         self.registry = registry
         self.default_read_strategy = RoutingStrategy.READ_REPLICA
         self.default_write_strategy = RoutingStrategy.PRIMARY_ONLY
+        self.max_replication_lag = max_replication_lag
+        self.read_your_writes_window = read_your_writes_window
+        self.failure_cooldown = failure_cooldown
+        self.latency_smoothing = latency_smoothing
         self._connection_counts: Dict[str, int] = {}
         self._round_robin_index = 0
+        self._replica_stats: Dict[str, ReplicaStats] = {}
+        self._context_writes: Dict[Hashable, float] = {}
 
     def route_query(
         self,
@@ -49,6 +183,7 @@ class DatabaseQueryRouter:
         strategy: Optional[RoutingStrategy] = None,
         preferred_database: Optional[str] = None,
         database_type: Optional[str] = None,
+        context: Optional[Hashable] = None,
     ) -> Optional[DatabaseConfig]:
         """
         Route a query to the appropriate database.
@@ -58,12 +193,17 @@ class DatabaseQueryRouter:
             strategy: Routing strategy to use
             preferred_database: Specific database to prefer
             database_type: Required database type (postgresql, mysql, sqlite)
+            context: Read-your-writes key (defaults to the current scope,
+                asyncio task or thread)
 
         Returns:
             Database configuration to use, or None if no suitable database found
         """
         logger.debug(f"Routing {query_type.value} query with strategy {strategy}")
 
+        if query_type == QueryType.READ and self.has_recent_write(context):
+            strategy = RoutingStrategy.PRIMARY_ONLY
+
         # If specific database requested, try to use it
         if preferred_database:
             db = self.registry.get_database(preferred_database)
@@ -140,15 +280,209 @@ class DatabaseQueryRouter:
     def _select_read_replica(
         self, available_dbs: List[DatabaseConfig]
     ) -> Optional[DatabaseConfig]:
-        """Select read replica, fallback to primary."""
-        # Try read replicas first
-        replicas = [db for db in available_dbs if db.is_read_replica]
+        """Select the least loaded eligible replica, fallback to primary."""
+        replicas = [
+            db
+            for db in available_dbs
+            if db.is_read_replica and db.enabled and self._is_replica_eligible(db.name)
+        ]
         if replicas:
-            return replicas[0]
+            # Rotate the starting point so equally scored replicas share load
+            offset = self._round_robin_index % len(replicas)
+            self._round_robin_index += 1
+            rotated = replicas[offset:] + replicas[:offset]
+            return min(rotated, key=self._replica_score)
 
         # Fallback to primary
         return self._select_primary(available_dbs)
 
+    def _is_replica_eligible(self, name: str) -> bool:
+        stats = self._replica_stats.get(name)
+        if stats is None:
+            return True
+        if stats.replication_lag_seconds > self.max_replication_lag:
+            return False
+        return stats.unavailable_until <= time.monotonic()
+
+    def _replica_score(self, db: DatabaseConfig) -> float:
+        """Expected wait: (outstanding requests + 1) x latency / weight."""
+        stats = self._replica_stats.get(db.name)
+        latency = stats.latency_ewma_ms if stats else None
+        if latency is None:
+            # Unmeasured replicas look as fast as the fastest known one
+            known = [
+                s.latency_ewma_ms
+                for s in self._replica_stats.values()
+                if s.latency_ewma_ms is not None
+            ]
+            latency = min(known) if known else 1.0
+        outstanding = self._connection_counts.get(db.name, 0)
+        return (outstanding + 1) * max(latency, 0.001) / max(db.weight, 1)
+
+    def _stats(self, database_name: str) -> ReplicaStats:
+        stats = self._replica_stats.get(database_name)
+        if stats is None:
+            stats = ReplicaStats()
+            self._replica_stats[database_name] = stats
+        return stats
+
+    # ------------------------------------------------------------------
+    # Read-your-writes
+    # ------------------------------------------------------------------
+
+    def record_write(self, context: Optional[Hashable] = None) -> None:
+        """
+        Note a write so following reads in the same context use the primary.
+
+        Timestamps are kept in router state, keyed by context, so they
+        outlive the task or event loop that wrote (``asyncio.run``,
+        ``LocalRuntime.execute``).
+
+        Args:
+            context: Explicit context key (e.g. a user or session id);
+                defaults to the key of the enclosing ``read_your_writes_scope``,
+                then the current asyncio task, then the current thread
+        """
+        now = time.monotonic()
+        self._context_writes[self._context_key(context)] = now
+        if len(self._context_writes) > 10000:
+            self._prune_context_writes(now)
+
+    def has_recent_write(self, context: Optional[Hashable] = None) -> bool:
+        """Whether the context wrote within the read-your-writes window."""
+        if self.read_your_writes_window <= 0:
+            return False
+        last_write = self._context_writes.get(self._context_key(context), 0.0)
+        return (
+            last_write > 0
+            and time.monotonic() - last_write < self.read_your_writes_window
+        )
+
+    @contextmanager
+    def read_your_writes_scope(self, key: Hashable):
+        """
+        Share read-your-writes stickiness across the tasks of one request.
+
+        Writes and reads inside the block, including those in tasks, event
+        loops and runtime executions started from it, use ``key`` as their
+        context.
+
+        Args:
+            key: Request, session or user identifier
+
+        Example:
+            >>> with db.query_router.read_your_writes_scope(request_id):
+            ...     runtime.execute(create_workflow)
+            ...     runtime.execute(list_workflow)  # reads the primary
+        """
+        token = _read_your_writes_key.set(key)
+        try:
+            yield
+        finally:
+            _read_your_writes_key.reset(token)
+
+    @staticmethod
+    def _context_key(context: Optional[Hashable]) -> Hashable:
+        if context is not None:
+            return context
+        scoped = _read_your_writes_key.get()
+        if scoped is not None:
+            return scoped
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        if task is not None:
+            # Concurrent requests on one event loop thread stay independent
+            return ("task", id(task))
+        return ("thread", threading.get_ident())
+
+    def _prune_context_writes(self, now: float) -> None:
+        cutoff = now - self.read_your_writes_window
+        self._context_writes = {
+            key: at for key, at in self._context_writes.items() if at >= cutoff
+        }
+
+    # ------------------------------------------------------------------
+    # Observed load and health
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def track_request(self, database_name: str):
+        """
+        Count a request as outstanding and record its latency and outcome.
+
+        Only errors that mean the database is unreachable put it on failure
+        cooldown; query errors are re-raised without affecting routing.
+
+        Example:
+            >>> with router.track_request(db.name):
+            ...     rows = await run_query(db)
+        """
+        self.increment_connection_count(database_name)
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception as e:
+            if is_unavailable_error(e):
+                self.record_failure(database_name)
+            raise
+        else:
+            self.record_latency(database_name, (time.perf_counter() - start) * 1000)
+        finally:
+            self.decrement_connection_count(database_name)
+
+    def record_latency(self, database_name: str, latency_ms: float) -> None:
+        """Fold a successful request's latency into the database's EWMA."""
+        stats = self._stats(database_name)
+        stats.requests += 1
+        stats.failures = 0
+        if stats.latency_ewma_ms is None:
+            stats.latency_ewma_ms = latency_ms
+        else:
+            alpha = self.latency_smoothing
+            stats.latency_ewma_ms = alpha * latency_ms + (1 - alpha) * (
+                stats.latency_ewma_ms
+            )
+
+    def record_failure(self, database_name: str) -> None:
+        """Skip a database for ``failure_cooldown`` seconds after an error."""
+        stats = self._stats(database_name)
+        stats.failures += 1
+        stats.unavailable_until = time.monotonic() + self.failure_cooldown
+        logger.warning(
+            f"Database {database_name} failed a routed query; "
+            f"skipping it for {self.failure_cooldown}s"
+        )
+
+    def update_replication_lag(self, database_name: str, lag_seconds: float) -> None:
+        """Record how far a replica is behind the primary."""
+        self._stats(database_name).replication_lag_seconds = float(lag_seconds or 0)
+
+    async def refresh_replication_lag(self) -> Dict[str, float]:
+        """
+        Measure replication lag of every PostgreSQL replica.
+
+        Replicas that cannot be reached are put on failure cooldown.
+
+        Returns:
+            Mapping of replica name to lag in seconds
+        """
+        lags = {}
+        for db in self.registry.get_read_replicas():
+            if db.database_type != "postgresql":
+                continue
+            try:
+                pool = await self.registry.get_connection(db.name)
+                lag = await pool.fetchval(self.POSTGRESQL_LAG_QUERY)
+            except Exception as e:
+                logger.warning(f"Replication lag check failed for {db.name}: {e}")
+                self.record_failure(db.name)
+                continue
+            self.update_replication_lag(db.name, float(lag or 0))
+            lags[db.name] = float(lag or 0)
+        return lags
+
     def _select_round_robin(
         self, available_dbs: List[DatabaseConfig]
     ) -> Optional[DatabaseConfig]:
@@ -218,12 +552,14 @@ class DatabaseQueryRouter:
         self,
         preferred_database: Optional[str] = None,
         database_type: Optional[str] = None,
+        context: Optional[Hashable] = None,
     ) -> Optional[DatabaseConfig]:
         """Route a read query."""
         return self.route_query(
             QueryType.READ,
             preferred_database=preferred_database,
             database_type=database_type,
+            context=context,
         )
 
     def route_write_query(
@@ -264,9 +600,21 @@ class DatabaseQueryRouter:
             "default_write_strategy": self.default_write_strategy.value,
             "connection_counts": self._connection_counts,
             "round_robin_index": self._round_robin_index,
+            "replicas": {
+                name: {
+                    "latency_ewma_ms": stats.latency_ewma_ms,
+                    "replication_lag_seconds": stats.replication_lag_seconds,
+                    "requests": stats.requests,
+                    "failures": stats.failures,
+                    "eligible": self._is_replica_eligible(name),
+                }
+                for name, stats in self._replica_stats.items()
+            },
         }
 
     def reset_statistics(self):
         """Reset routing statistics."""
         self._connection_counts.clear()
         self._round_robin_index = 0
+        self._replica_stats.clear()
+        self._context_writes.clear()
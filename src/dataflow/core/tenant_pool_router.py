@@ -0,0 +1,416 @@
+"""
+Tenant-Aware Connection Pool Routing
+
+Keeps warm per-tenant connection sub-pools so that schema-isolated tenants
+get their ``search_path`` pinned once at connect time instead of having every
+query rewritten or preceded by a ``SET search_path`` round trip.
+
+Features:
+- One sub-pool per schema (schema/hybrid isolation) or per database
+  (database isolation); row-level tenants share a single pool
+- ``search_path`` set through connection ``server_settings`` at connect time
+- Global connection budget with LRU eviction of idle tenant pools
+- Per-tenant pool metrics (acquisitions, wait time, hold time, evictions)
+"""
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from .multi_tenancy import IsolationStrategy, TenantConfig, TenantRegistry
+
+logger = logging.getLogger(__name__)
+
+# Pool key used by tenants that do not need a dedicated pool (row-level security)
+SHARED_POOL_KEY = "__shared__"
+
+
+class TenantPoolExhaustedError(Exception):
+    """Raised when no tenant pool can be created within the connection budget."""
+
+
+@dataclass
+class TenantPoolMetrics:
+    """Metrics for a single tenant sub-pool."""
+
+    pool_key: str
+    max_size: int
+    created_at: float = field(default_factory=time.time)
+    last_used: float = field(default_factory=time.time)
+    acquisitions: int = 0
+    in_use: int = 0
+    total_wait_time_ms: float = 0.0
+    total_hold_time_ms: float = 0.0
+    errors: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return {
+            "pool_key": self.pool_key,
+            "max_size": self.max_size,
+            "created_at": self.created_at,
+            "last_used": self.last_used,
+            "acquisitions": self.acquisitions,
+            "in_use": self.in_use,
+            "avg_wait_time_ms": (
+                self.total_wait_time_ms / self.acquisitions
+                if self.acquisitions
+                else 0.0
+            ),
+            "avg_hold_time_ms": (
+                self.total_hold_time_ms / self.acquisitions
+                if self.acquisitions
+                else 0.0
+            ),
+            "errors": self.errors,
+        }
+
+
+@dataclass
+class _TenantPool:
+    """A live sub-pool and its bookkeeping."""
+
+    pool: Any
+    metrics: TenantPoolMetrics
+    tenant_ids: set = field(default_factory=set)
+
+
+async def _default_pool_factory(**params) -> Any:
+    """Create an asyncpg pool for a tenant."""
+    try:
+        import asyncpg
+    except ImportError:
+        raise ImportError(
+            "asyncpg is required for tenant pool routing. Install with: pip install asyncpg"
+        )
+    return await asyncpg.create_pool(**params)
+
+
+class TenantPoolRouter:
+    """
+    Route tenant connections to warm, search_path-pinned sub-pools.
+
+    Schema-isolated tenants share a pool per schema whose connections are
+    created with ``server_settings={"search_path": "<schema>, public"}``, so
+    queries run unmodified and no per-execution ``SET search_path`` is needed.
+    Database-isolated tenants get a pool per database. The total number of
+    connections reserved by all sub-pools never exceeds
+    ``max_total_connections``; when a new pool does not fit, the least
+    recently used idle pools are closed first.
+
+    Example:
+        router = TenantPoolRouter(
+            registry,
+            connection_params={"host": "localhost", "database": "app", ...},
+            max_total_connections=200,
+        )
+        async with router.acquire("acme") as conn:
+            rows = await conn.fetch("SELECT * FROM users")
+    """
+
+    def __init__(
+        self,
+        registry: TenantRegistry,
+        connection_params: Optional[Dict[str, Any]] = None,
+        max_total_connections: int = 100,
+        per_tenant_min_size: int = 1,
+        per_tenant_max_size: int = 5,
+        shared_pool_max_size: int = 10,
+        pool_factory: Optional[Callable[..., Awaitable[Any]]] = None,
+    ):
+        """
+        Initialize the tenant pool router.
+
+        Args:
+            registry: Tenant registry used to resolve isolation strategy
+            connection_params: Base connection parameters (asyncpg keyword args)
+            max_total_connections: Global budget across all sub-pools
+            per_tenant_min_size: Minimum warm connections per tenant pool
+            per_tenant_max_size: Maximum connections per tenant pool
+            shared_pool_max_size: Maximum connections for the shared pool
+            pool_factory: Async callable creating a pool from keyword params
+                (defaults to ``asyncpg.create_pool``)
+        """
+        if per_tenant_max_size > max_total_connections:
+            raise ValueError("per_tenant_max_size cannot exceed max_total_connections")
+
+        self.registry = registry
+        self.connection_params = dict(connection_params or {})
+        self.max_total_connections = max_total_connections
+        self.per_tenant_min_size = min(per_tenant_min_size, per_tenant_max_size)
+        self.per_tenant_max_size = per_tenant_max_size
+        self.shared_pool_max_size = min(shared_pool_max_size, max_total_connections)
+        self.pool_factory = pool_factory or _default_pool_factory
+
+        # Ordered by recency of use: first entry is least recently used
+        self._pools: "OrderedDict[str, _TenantPool]" = OrderedDict()
+        # Pools being created, and the connections reserved for them
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._pending_reserved = 0
+        # Guards budget reservation and pool bookkeeping; never held while
+        # a pool is being created or closed
+        self._lock = asyncio.Lock()
+
+        self._evictions = 0
+        self._pool_creations = 0
+        self._pool_hits = 0
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def resolve_pool_key(self, tenant_id: str) -> str:
+        """Return the sub-pool key a tenant routes to."""
+        config = self._get_config(tenant_id)
+        strategy = config.isolation_strategy
+
+        if strategy == IsolationStrategy.DATABASE.value:
+            database = self.registry.get_tenant_database(
+                tenant_id
+            ) or config.database_config.get("database", f"tenant_{tenant_id}_db")
+            return f"database:{database}"
+
+        if strategy in (IsolationStrategy.SCHEMA.value, IsolationStrategy.HYBRID.value):
+            schema = self.registry.get_tenant_schema(
+                tenant_id
+            ) or config.database_config.get("schema", f"tenant_{tenant_id}")
+            return f"schema:{schema}"
+
+        return SHARED_POOL_KEY
+
+    def uses_pinned_search_path(self, tenant_id: str) -> bool:
+        """Check whether the tenant's sub-pool pins search_path to its schema."""
+        return self.resolve_pool_key(tenant_id).startswith("schema:")
+
+    def build_pool_params(self, pool_key: str) -> Dict[str, Any]:
+        """Build connection parameters for a sub-pool."""
+        params = dict(self.connection_params)
+        server_settings = dict(params.get("server_settings") or {})
+
+        if pool_key == SHARED_POOL_KEY:
+            params["min_size"] = min(
+                self.per_tenant_min_size, self.shared_pool_max_size
+            )
+            params["max_size"] = self.shared_pool_max_size
+        else:
+            kind, _, target = pool_key.partition(":")
+            if kind == "schema":
+                # Pinned once per connection - no per-query SET search_path
+                server_settings["search_path"] = f'"{target}", public'
+            elif kind == "database":
+                params["database"] = target
+            params["min_size"] = self.per_tenant_min_size
+            params["max_size"] = self.per_tenant_max_size
+
+        if server_settings:
+            params["server_settings"] = server_settings
+        return params
+
+    @asynccontextmanager
+    async def acquire(self, tenant_id: str):
+        """
+        Acquire a connection routed to the tenant's sub-pool.
+
+        Args:
+            tenant_id: Registered tenant identifier
+
+        Yields:
+            Connection whose search_path/database is already set for the tenant
+        """
+        entry = await self._get_or_create_pool(tenant_id)
+        metrics = entry.metrics
+        metrics.in_use += 1
+
+        wait_start = time.perf_counter()
+        try:
+            async with entry.pool.acquire() as conn:
+                acquired_at = time.perf_counter()
+                metrics.acquisitions += 1
+                metrics.total_wait_time_ms += (acquired_at - wait_start) * 1000
+                try:
+                    yield conn
+                finally:
+                    metrics.total_hold_time_ms += (
+                        time.perf_counter() - acquired_at
+                    ) * 1000
+        except Exception:
+            metrics.errors += 1
+            raise
+        finally:
+            metrics.in_use -= 1
+            metrics.last_used = time.time()
+
+    # ------------------------------------------------------------------
+    # Pool lifecycle
+    # ------------------------------------------------------------------
+
+    async def _get_or_create_pool(self, tenant_id: str) -> _TenantPool:
+        """Get the tenant's sub-pool, creating it within the budget if needed."""
+        pool_key = self.resolve_pool_key(tenant_id)
+
+        while True:
+            # Warm pools are served without waiting for other tenants
+            entry = self._pools.get(pool_key)
+            if entry is not None:
+                self._pools.move_to_end(pool_key)
+                entry.tenant_ids.add(tenant_id)
+                self._pool_hits += 1
+                return entry
+
+            pending = self._pending.get(pool_key)
+            if pending is not None:
+                # Another acquirer is creating this pool. Wait for it to finish
+                # either way, then look again: it may have failed, or the new
+                # pool may already have been evicted
+                await asyncio.wait({pending})
+                continue
+
+            params = self.build_pool_params(pool_key)
+            required = params["max_size"]
+            async with self._lock:
+                if pool_key in self._pools or pool_key in self._pending:
+                    continue
+                victims = self._reserve(required)
+                creation = asyncio.get_running_loop().create_future()
+                self._pending[pool_key] = creation
+                self._pending_reserved += required
+            break
+
+        entry = None
+        try:
+            await self._close_entries(victims)
+            pool = await self.pool_factory(**params)
+            entry = _TenantPool(
+                pool=pool,
+                metrics=TenantPoolMetrics(pool_key=pool_key, max_size=required),
+                tenant_ids={tenant_id},
+            )
+        finally:
+            # No await between releasing the reservation and inserting the
+            # entry, so the budget never under-counts
+            del self._pending[pool_key]
+            self._pending_reserved -= required
+            if entry is not None:
+                self._pools[pool_key] = entry
+                self._pool_creations += 1
+            creation.set_result(None)
+
+        logger.debug(f"Created tenant pool {pool_key} (max_size={required})")
+        return entry
+
+    def _reserve(self, required: int) -> List[_TenantPool]:
+        """Detach least recently used idle pools until ``required`` fits the budget.
+
+        Returns:
+            The detached pools, to be closed by the caller outside the lock
+        """
+        excess = self.reserved_connections + required - self.max_total_connections
+        victims = []
+        for key, entry in self._pools.items():
+            if excess <= 0:
+                break
+            if entry.metrics.in_use == 0:
+                victims.append(key)
+                excess -= entry.metrics.max_size
+
+        if excess > 0:
+            raise TenantPoolExhaustedError(
+                f"Connection budget of {self.max_total_connections} exhausted: "
+                f"{self.reserved_connections} reserved by busy tenant pools"
+            )
+
+        self._evictions += len(victims)
+        for key in victims:
+            logger.debug(f"Evicted idle tenant pool {key}")
+        return [self._pools.pop(key) for key in victims]
+
+    async def _close_entries(self, entries: List[_TenantPool]) -> None:
+        """Close detached sub-pools."""
+        for entry in entries:
+            try:
+                await entry.pool.close()
+            except Exception as e:
+                logger.warning(
+                    f"Error closing tenant pool {entry.metrics.pool_key}: {e}"
+                )
+
+    async def evict_idle(self, max_idle_seconds: float) -> int:
+        """
+        Close sub-pools that have been idle longer than ``max_idle_seconds``.
+
+        Returns:
+            Number of pools evicted
+        """
+        cutoff = time.time() - max_idle_seconds
+        async with self._lock:
+            stale = [
+                self._pools.pop(key)
+                for key, entry in list(self._pools.items())
+                if entry.metrics.in_use == 0 and entry.metrics.last_used < cutoff
+            ]
+            self._evictions += len(stale)
+        await self._close_entries(stale)
+        return len(stale)
+
+    async def release_tenant(self, tenant_id: str) -> None:
+        """Close the sub-pool of a removed tenant if no other tenant uses it."""
+        async with self._lock:
+            released = []
+            for key, entry in list(self._pools.items()):
+                entry.tenant_ids.discard(tenant_id)
+                if not entry.tenant_ids and entry.metrics.in_use == 0:
+                    released.append(self._pools.pop(key))
+        await self._close_entries(released)
+
+    async def close_all(self) -> None:
+        """Close every sub-pool."""
+        async with self._lock:
+            entries = list(self._pools.values())
+            self._pools.clear()
+        await self._close_entries(entries)
+
+    # ------------------------------------------------------------------
+    # Metrics
+    # ------------------------------------------------------------------
+
+    @property
+    def reserved_connections(self) -> int:
+        """Connections reserved by live and in-creation sub-pools (sum of max sizes)."""
+        return self._pending_reserved + sum(
+            entry.metrics.max_size for entry in self._pools.values()
+        )
+
+    def get_tenant_metrics(self, tenant_id: str) -> Optional[Dict[str, Any]]:
+        """Get metrics for the sub-pool serving a tenant, if it is warm."""
+        entry = self._pools.get(self.resolve_pool_key(tenant_id))
+        return entry.metrics.to_dict() if entry else None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Get router-wide metrics including every warm sub-pool."""
+        return {
+            "active_pools": len(self._pools),
+            "reserved_connections": self.reserved_connections,
+            "max_total_connections": self.max_total_connections,
+            "pool_creations": self._pool_creations,
+            "pool_hits": self._pool_hits,
+            "evictions": self._evictions,
+            "pools": {
+                key: entry.metrics.to_dict() for key, entry in self._pools.items()
+            },
+        }
+
+    def list_warm_pools(self) -> List[str]:
+        """List warm sub-pool keys from least to most recently used."""
+        return list(self._pools)
+
+    def _get_config(self, tenant_id: str) -> TenantConfig:
+        config = self.registry.get_tenant(tenant_id)
+        if not config:
+            raise ValueError(f"Tenant {tenant_id} not found")
+        if not config.active:
+            raise ValueError(f"Tenant is inactive: {tenant_id}")
+        return config
@@ -0,0 +1,281 @@
+"""Execution tracing for DataFlow nodes and Express operations.
+
+Collects measured per-node spans (wall time, time spent in SQL, rows and
+bytes returned) from generated nodes and ExpressDataFlow so that the
+Inspector can build performance profiles from real executions instead of
+structural estimates.
+
+Tracing is off by default. When disabled the hooks cost one attribute
+lookup per node execution.
+
+Example:
+    tracer = db.enable_tracing()
+    results, run_id = db.execute_workflow(workflow)
+    print(tracer.node_type_stats())
+    print(Inspector(db, workflow).workflow_performance_profile().show())
+"""
+
+import json
+import logging
+import threading
+import time
+from bisect import bisect_left
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass, field
+from typing import Any, Deque, Dict, Iterator, List, Optional
+
+logger = logging.getLogger("dataflow.tracing")
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf)
+DEFAULT_BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+# Span currently being recorded in this task/thread
+_current_span: ContextVar[Optional["NodeSpan"]] = ContextVar(
+    "_current_span", default=None
+)
+
+
+@dataclass
+class NodeSpan:
+    """Measured execution of a single node or Express operation.
+
+    Attributes:
+        node_id: Workflow node id (or "Model.operation" for Express calls)
+        node_type: Generated node type, e.g. "UserListNode"
+        source: "workflow" for generated nodes, "express" for Express calls
+        started_at: Unix timestamp when execution started
+        duration_ms: Wall-clock duration
+        db_time_ms: Time spent awaiting SQL execution
+        db_calls: Number of SQL executions
+        rows: Rows returned or affected, when known
+        bytes: Size of the JSON-serialized result (only with measure_bytes)
+        error: Exception type name if execution failed
+    """
+
+    node_id: str
+    node_type: str
+    source: str = "workflow"
+    started_at: float = field(default_factory=time.time)
+    duration_ms: float = 0.0
+    db_time_ms: float = 0.0
+    db_calls: int = 0
+    rows: Optional[int] = None
+    bytes: Optional[int] = None
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary."""
+        return asdict(self)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, int(round(pct * len(sorted_values))) - 1))
+    return sorted_values[rank]
+
+
+def _result_rows(result: Any) -> Optional[int]:
+    """Best-effort row count for the result shapes generated nodes return."""
+    if isinstance(result, list):
+        return len(result)
+    if not isinstance(result, dict):
+        return None
+    for key in ("records", "data", "items"):
+        if isinstance(result.get(key), list):
+            return len(result[key])
+    for key in ("rows_affected", "processed", "inserted", "updated", "deleted"):
+        value = result.get(key)
+        if isinstance(value, int) and not isinstance(value, bool):
+            return value
+    if "count" in result and isinstance(result["count"], int):
+        return result["count"]
+    return 1 if result else 0
+
+
+def _result_bytes(result: Any) -> Optional[int]:
+    try:
+        return len(json.dumps(result, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return None
+
+
+class ExecutionTracer:
+    """
+    Bounded in-memory collector of node execution spans.
+
+    Keeps the most recent ``max_spans`` spans plus a per-node-type window of
+    durations used for percentile histograms.
+
+    Example:
+        tracer = ExecutionTracer()
+        with tracer.trace("list_users", "UserListNode") as span:
+            result = await node.async_run(**params)
+            tracer.annotate_result(span, result)
+    """
+
+    def __init__(
+        self,
+        max_spans: int = 10000,
+        window_per_type: int = 2048,
+        measure_bytes: bool = False,
+        buckets_ms: tuple = DEFAULT_BUCKETS_MS,
+    ):
+        """
+        Initialize the tracer.
+
+        Args:
+            max_spans: Maximum spans retained (oldest dropped first)
+            window_per_type: Durations retained per node type for percentiles
+            measure_bytes: Serialize results to measure returned bytes.
+                Opt-in: it JSON-encodes every result on the hot path, so
+                span.bytes stays None unless enabled.
+            buckets_ms: Histogram bucket upper bounds in milliseconds
+        """
+        self.enabled = True
+        self.measure_bytes = measure_bytes
+        self.buckets_ms = tuple(buckets_ms)
+        self._window_per_type = window_per_type
+        self._spans: Deque[NodeSpan] = deque(maxlen=max_spans)
+        self._durations: Dict[str, Deque[float]] = {}
+        self._bucket_counts: Dict[str, List[int]] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def current_span() -> Optional[NodeSpan]:
+        """Return the span being recorded in the current context, if any."""
+        return _current_span.get()
+
+    @contextmanager
+    def trace(
+        self, node_id: str, node_type: str, source: str = "workflow"
+    ) -> Iterator[NodeSpan]:
+        """Record a span around a block of code."""
+        span = NodeSpan(node_id=node_id, node_type=node_type, source=source)
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        try:
+            yield span
+        except BaseException as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.duration_ms = (time.perf_counter() - start) * 1000
+            _current_span.reset(token)
+            self.record(span)
+
+    def annotate_result(self, span: NodeSpan, result: Any) -> None:
+        """Fill in rows and bytes from an execution result."""
+        span.rows = _result_rows(result)
+        if self.measure_bytes:
+            span.bytes = _result_bytes(result)
+
+    @staticmethod
+    def add_db_time(elapsed_ms: float) -> None:
+        """Attribute SQL execution time to the span active in this context."""
+        span = _current_span.get()
+        if span is not None:
+            span.db_time_ms += elapsed_ms
+            span.db_calls += 1
+
+    def record(self, span: NodeSpan) -> None:
+        """Store a completed span."""
+        bucket = bisect_left(self.buckets_ms, span.duration_ms)
+        with self._lock:
+            self._spans.append(span)
+            durations = self._durations.get(span.node_type)
+            if durations is None:
+                durations = deque(maxlen=self._window_per_type)
+                self._durations[span.node_type] = durations
+                self._bucket_counts[span.node_type] = [0] * (len(self.buckets_ms) + 1)
+            durations.append(span.duration_ms)
+            self._bucket_counts[span.node_type][bucket] += 1
+
+    def clear(self) -> None:
+        """Drop all recorded spans and histograms."""
+        with self._lock:
+            self._spans.clear()
+            self._durations.clear()
+            self._bucket_counts.clear()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def spans(
+        self, node_ids: Optional[List[str]] = None, source: Optional[str] = None
+    ) -> List[NodeSpan]:
+        """Return recorded spans, optionally filtered by node id and source."""
+        with self._lock:
+            spans = list(self._spans)
+        if node_ids is not None:
+            wanted = set(node_ids)
+            spans = [s for s in spans if s.node_id in wanted]
+        if source is not None:
+            spans = [s for s in spans if s.source == source]
+        return spans
+
+    def node_stats(self, node_ids: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Aggregate spans per node id."""
+        grouped: Dict[str, List[NodeSpan]] = {}
+        for span in self.spans(node_ids):
+            grouped.setdefault(span.node_id, []).append(span)
+        return {node_id: self._summarize(spans) for node_id, spans in grouped.items()}
+
+    def node_type_stats(self) -> Dict[str, Dict]:
+        """Percentile histograms of duration per node type."""
+        with self._lock:
+            snapshot = {
+                node_type: (sorted(durations), list(self._bucket_counts[node_type]))
+                for node_type, durations in self._durations.items()
+            }
+
+        stats = {}
+        for node_type, (durations, counts) in snapshot.items():
+            bounds = [str(b) for b in self.buckets_ms] + ["+Inf"]
+            stats[node_type] = {
+                "count": sum(counts),
+                "mean_ms": sum(durations) / len(durations) if durations else 0.0,
+                "p50_ms": percentile(durations, 0.50),
+                "p90_ms": percentile(durations, 0.90),
+                "p95_ms": percentile(durations, 0.95),
+                "p99_ms": percentile(durations, 0.99),
+                "max_ms": durations[-1] if durations else 0.0,
+                "histogram_ms": dict(zip(bounds, counts)),
+            }
+        return stats
+
+    @staticmethod
+    def _summarize(spans: List[NodeSpan]) -> Dict[str, Any]:
+        durations = sorted(s.duration_ms for s in spans)
+        n = len(spans)
+        rows = [s.rows for s in spans if s.rows is not None]
+        sizes = [s.bytes for s in spans if s.bytes is not None]
+        return {
+            "node_type": spans[-1].node_type,
+            "executions": n,
+            "errors": sum(1 for s in spans if s.error),
+            "total_ms": sum(durations),
+            "mean_ms": sum(durations) / n,
+            "p50_ms": percentile(durations, 0.50),
+            "p95_ms": percentile(durations, 0.95),
+            "max_ms": durations[-1],
+            "mean_db_time_ms": sum(s.db_time_ms for s in spans) / n,
+            "mean_rows": sum(rows) / len(rows) if rows else None,
+            "mean_bytes": sum(sizes) / len(sizes) if sizes else None,
+        }
+
+
+def get_tracer(dataflow_instance: Any) -> Optional[ExecutionTracer]:
+    """Return the instance's tracer if tracing is enabled."""
+    tracer = getattr(dataflow_instance, "_execution_tracer", None)
+    if isinstance(tracer, ExecutionTracer) and tracer.enabled:
+        return tracer
+    return None
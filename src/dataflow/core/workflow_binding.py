@@ -70,13 +70,18 @@ class DataFlowWorkflowBinder:
         """
         self.dataflow_instance = dataflow_instance
         self._workflows: Dict[str, WorkflowBuilder] = {}
+        self._fuser = None
 
-    def create_workflow(self, workflow_id: Optional[str] = None) -> WorkflowBuilder:
+    def create_workflow(
+        self, workflow_id: Optional[str] = None, optimize: bool = False
+    ) -> WorkflowBuilder:
         """Create a workflow bound to this DataFlow instance.
 
         Args:
             workflow_id: Optional identifier for the workflow. If not provided,
                         a unique ID will be generated.
+            optimize: Fuse Query→Merge→Aggregate chains into single SQL
+                     aggregates when the workflow is executed
 
         Returns:
             WorkflowBuilder instance with DataFlow context attached
@@ -93,6 +98,7 @@ class DataFlowWorkflowBinder:
         # Track which DataFlow instance this workflow belongs to
         workflow._dataflow_context = self.dataflow_instance
         workflow._dataflow_workflow_id = workflow_id
+        workflow._dataflow_optimize = optimize
         self._workflows[workflow_id] = workflow
 
         logger.debug("Created workflow '%s' bound to DataFlow instance", workflow_id)
@@ -197,13 +203,20 @@ class DataFlowWorkflowBinder:
         workflow: WorkflowBuilder,
         inputs: Optional[Dict[str, Any]] = None,
         runtime: Optional[Any] = None,
+        optimize: Optional[bool] = None,
     ) -> Tuple[Dict[str, Any], str]:
         """Execute a DataFlow-bound workflow.
 
+        When optimization is enabled, ListNode→SmartMergeNode→AggregateNode
+        chains are executed as one JOIN/GROUP BY query. Fused chains only
+        report the aggregate node's result; the outcome per chain is stored
+        on ``workflow._dataflow_fusion_results``.
+
         Args:
             workflow: Workflow to execute
             inputs: Optional workflow inputs/parameters
             runtime: Optional runtime instance (creates LocalRuntime if not provided)
+            optimize: Override the ``optimize`` flag given to create_workflow()
 
         Returns:
             Tuple of (results_dict, run_id)
@@ -215,10 +228,35 @@ class DataFlowWorkflowBinder:
         if runtime is None:
             runtime = LocalRuntime()
 
+        if optimize is None:
+            optimize = getattr(workflow, "_dataflow_optimize", False)
+        if optimize:
+            workflow = self._fuse(workflow, inputs)
+
         logger.debug("Executing workflow with %d nodes", len(workflow.nodes))
 
         return runtime.execute(workflow.build(), inputs or {})
 
+    def _fuse(
+        self, workflow: WorkflowBuilder, inputs: Optional[Dict[str, Any]]
+    ) -> WorkflowBuilder:
+        """Return a copy of the workflow with fusable chains pushed down to SQL."""
+        from ..optimization.query_fusion import QueryMergeAggregateFuser
+
+        if self._fuser is None:
+            self._fuser = QueryMergeAggregateFuser(self.dataflow_instance)
+
+        fused, results = self._fuser.rewrite(workflow, inputs)
+        workflow._dataflow_fusion_results = results
+        for result in results:
+            if not result.fused:
+                logger.debug(
+                    "Chain ending at '%s' not fused: %s",
+                    result.aggregate_node,
+                    result.reason,
+                )
+        return fused
+
     def get_available_nodes(
         self, model_name: Optional[str] = None
     ) -> Dict[str, List[str]]:
@@ -5,11 +5,16 @@ errors against a database of 50+ patterns using regex and semantic features.
 """
 
 import re
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from dataflow.debug.error_capture import CapturedError, StackFrame
 from dataflow.debug.knowledge_base import KnowledgeBase
+from dataflow.debug.pattern_index import (
+    CompiledPatternIndex,
+    normalize_semantic_features,
+)
 
 
 @dataclass
@@ -41,6 +46,11 @@ class ErrorCategorizer:
     Patterns with combined score > 0.5 are candidates, and the highest scoring
     pattern is selected.
 
+    Patterns are compiled once into a CompiledPatternIndex (literal prefilter,
+    error_type index, precompiled regexes) so that only patterns able to reach
+    the threshold are scored, and recent error signatures are memoized in a
+    bounded LRU cache. The index is rebuilt when the KnowledgeBase reloads.
+
     Usage:
         kb = KnowledgeBase("patterns.yaml", "solutions.yaml")
         categorizer = ErrorCategorizer(kb)
@@ -53,13 +63,21 @@ class ErrorCategorizer:
         print(f"Confidence: {category.confidence:.2f}")
     """
 
-    def __init__(self, knowledge_base: KnowledgeBase):
+    def __init__(self, knowledge_base: KnowledgeBase, cache_size: int = 1024):
         """Initialize ErrorCategorizer with KnowledgeBase.
 
         Args:
             knowledge_base: KnowledgeBase instance with patterns loaded
+            cache_size: Maximum number of memoized error signatures
+                (0 disables the memo)
         """
         self.knowledge_base = knowledge_base
+        self.cache_size = cache_size
+        self._index: Optional[CompiledPatternIndex] = None
+        self._index_keys: Set[str] = set()
+        self._cache: "OrderedDict[Tuple, ErrorCategory]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def categorize(self, error: CapturedError) -> ErrorCategory:
         """Categorize error using pattern matching.
@@ -91,32 +109,82 @@ class ErrorCategorizer:
             >>> category.confidence > 0.5
             True
         """
+        index = self._get_index()
+
         # Extract semantic features
         features = self._extract_features(error)
 
-        # Match against all patterns
+        # Memoized result for an identical error signature
+        signature = self._error_signature(error, features)
+        cached = self._cache.get(signature) if self.cache_size > 0 else None
+        if cached is not None:
+            self._cache.move_to_end(signature)
+            self.cache_hits += 1
+            return replace(cached, features=features)
+        self.cache_misses += 1
+
+        # Match only against patterns that can reach the threshold
         matches = []
-        for pattern_id, pattern in self.knowledge_base.patterns.items():
-            score = self._match_pattern(pattern_id, pattern, error, features)
+        for compiled in index.candidates(error.message, features["error_type"]):
+            score = self._match_pattern(
+                compiled.pattern_id, compiled.pattern, error, features
+            )
             if score >= 0.5:  # Confidence threshold (>= allows pure regex matches)
-                matches.append((pattern_id, pattern, score))
+                matches.append((compiled.pattern_id, compiled.pattern, score))
 
         # Select best match
         if not matches:
-            return ErrorCategory(
+            result = ErrorCategory(
                 category="UNKNOWN",
                 pattern_id="UNKNOWN",
                 confidence=0.0,
                 features=features,
             )
+        else:
+            best_pattern_id, best_pattern, confidence = max(matches, key=lambda x: x[2])
+            result = ErrorCategory(
+                category=best_pattern["category"],
+                pattern_id=best_pattern_id,
+                confidence=confidence,
+                features=features,
+            )
+
+        if self.cache_size > 0:
+            self._cache[signature] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return result
 
-        best_pattern_id, best_pattern, confidence = max(matches, key=lambda x: x[2])
+    def invalidate(self):
+        """Drop the compiled pattern index and memoized results.
 
-        return ErrorCategory(
-            category=best_pattern["category"],
-            pattern_id=best_pattern_id,
-            confidence=confidence,
-            features=features,
+        Call after editing an existing pattern in place; added, removed or
+        renamed patterns and reloads through KnowledgeBase.reload_patterns()
+        are detected automatically.
+        """
+        self._index = None
+        self._cache.clear()
+
+    def _get_index(self) -> CompiledPatternIndex:
+        """Return the compiled index, rebuilding it if patterns changed."""
+        patterns = self.knowledge_base.patterns
+        if (
+            self._index is None
+            or self._index.source is not patterns
+            or patterns.keys() != self._index_keys
+        ):
+            self._index = CompiledPatternIndex(patterns)
+            self._index_keys = set(patterns)
+            self._cache.clear()
+        return self._index
+
+    def _error_signature(self, error: CapturedError, features: Dict[str, Any]) -> Tuple:
+        """Build the memo key: everything categorization depends on."""
+        return (
+            error.error_type,
+            error.message,
+            features["stacktrace_location"],
         )
 
     def _extract_features(self, error: CapturedError) -> Dict[str, Any]:
@@ -208,14 +276,15 @@ class ErrorCategorizer:
         if not regex_pattern:
             return 0.0
 
-        # Extract innermost error message from nested exception chain
-        inner_message = self._extract_inner_error_message(error.message)
+        compiled = self._compiled_regex(regex_pattern)
 
         # Match against both full message and inner message (case insensitive)
-        if re.search(regex_pattern, error.message, re.IGNORECASE):
+        if compiled.search(error.message):
             return 1.0
 
-        if re.search(regex_pattern, inner_message, re.IGNORECASE):
+        # Extract innermost error message from nested exception chain
+        inner_message = self._extract_inner_error_message(error.message)
+        if compiled.search(inner_message):
             return 1.0
 
         return 0.0
@@ -251,18 +320,12 @@ class ErrorCategorizer:
         score = 0.0
         checks = 0
 
-        semantic_features_raw = pattern.get("semantic_features", {})
-
         # Convert list-of-dicts to flat dict if necessary
         # YAML structure: [{error_type: [...]}, {stacktrace_location: [...]}]
         # Target structure: {error_type: [...], stacktrace_location: [...]}
-        if isinstance(semantic_features_raw, list):
-            semantic_features = {}
-            for item in semantic_features_raw:
-                if isinstance(item, dict):
-                    semantic_features.update(item)
-        else:
-            semantic_features = semantic_features_raw
+        semantic_features = normalize_semantic_features(
+            pattern.get("semantic_features", {})
+        )
 
         # Check error_type
         expected_error_types = semantic_features.get("error_type", [])
@@ -291,6 +354,16 @@ class ErrorCategorizer:
         # Average score across all checks
         return score / checks if checks > 0 else 0.0
 
+    def _compiled_regex(self, regex_pattern: str) -> "re.Pattern":
+        """Return a case-insensitive compiled regex, reusing the index's copy."""
+        index = self._index
+        if index is not None:
+            compiled = index.regex_by_source.get(regex_pattern)
+            if compiled is not None:
+                return compiled
+        # re caches compiled patterns internally for ad-hoc patterns
+        return re.compile(regex_pattern, re.IGNORECASE)
+
     def _extract_keywords(self, message: str) -> List[str]:
         """Extract keywords from error message.
 
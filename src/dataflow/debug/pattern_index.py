@@ -0,0 +1,237 @@
+"""Compiled pattern index for fast error categorization.
+
+This module compiles the patterns loaded by KnowledgeBase into a structure
+that narrows the candidate set before any regex is evaluated:
+
+1. Literal prefilter - every pattern regex is parsed once and the literal
+   substrings each alternative *requires* are extracted. An inverted index
+   maps each distinct literal to the patterns that need it, so one pass of
+   substring checks over the message rules out most patterns.
+2. Semantic index - patterns are indexed by expected error_type, since a
+   pattern whose regex cannot match only reaches the confidence threshold
+   when its error_type (or, lacking one, its stacktrace location) matches.
+3. Precompiled regexes - candidate patterns are scored with regexes compiled
+   once at build time.
+
+The index is conservative: a pattern is only skipped when it provably cannot
+reach the ErrorCategorizer confidence threshold.
+"""
+
+import re
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+
+try:  # Python 3.11+
+    from re import _parser as sre_parse
+except ImportError:  # pragma: no cover - older interpreters
+    import sre_parse
+
+# Literal runs shorter than this are too common to be useful filters
+MIN_LITERAL_LENGTH = 3
+
+# Characters that re.IGNORECASE treats as equivalent to an ASCII letter but
+# that str.casefold() leaves alone (dotless i)
+_IGNORECASE_FIXES = str.maketrans({"\u0131": "i"})
+
+# Requirement tree node: (required_literals, [alternatives]), where each
+# alternative group is a list of requirement trees of which one must hold.
+Requirement = Tuple[FrozenSet[str], List[List["Requirement"]]]
+
+
+def normalize_semantic_features(semantic_features_raw: Any) -> Dict[str, Any]:
+    """Flatten the list-of-dicts YAML layout into a single dict."""
+    if isinstance(semantic_features_raw, list):
+        semantic_features: Dict[str, Any] = {}
+        for item in semantic_features_raw:
+            if isinstance(item, dict):
+                semantic_features.update(item)
+        return semantic_features
+    return semantic_features_raw or {}
+
+
+def _literal_char(op, av) -> Optional[str]:
+    """Return the case-folded character an item always matches, if any."""
+    if op is sre_parse.LITERAL:
+        char = chr(av)
+    elif (
+        op is sre_parse.IN
+        and av
+        and all(item_op is sre_parse.LITERAL for item_op, _ in av)
+    ):
+        # Character classes such as [Mm] collapse to one case-folded char
+        folded = {chr(item_av).casefold() for _, item_av in av}
+        if len(folded) != 1:
+            return None
+        char = folded.pop()
+    else:
+        return None
+
+    char = char.casefold()
+    # Only ASCII characters have unambiguous case folding for re.IGNORECASE
+    return char if len(char) == 1 and char.isascii() else None
+
+
+def _build_requirement(items) -> Requirement:
+    """Extract the literals a parsed regex sequence requires to match."""
+    literals: Set[str] = set()
+    alternatives: List[List[Requirement]] = []
+    run: List[str] = []
+
+    def flush():
+        if len(run) >= MIN_LITERAL_LENGTH:
+            literals.add("".join(run))
+        run.clear()
+
+    for op, av in items:
+        char = _literal_char(op, av)
+        if char is not None:
+            run.append(char)
+            continue
+
+        flush()
+        if op is sre_parse.BRANCH:
+            alternatives.append([_build_requirement(branch) for branch in av[1]])
+        elif op is sre_parse.SUBPATTERN:
+            # Groups are required as a whole; their contents are not literal
+            # runs of the enclosing sequence but can still constrain it
+            alternatives.append([_build_requirement(av[-1])])
+    flush()
+
+    return frozenset(literals), alternatives
+
+
+def _requirement_literals(requirement: Requirement) -> Set[str]:
+    literals, alternatives = requirement
+    collected = set(literals)
+    for group in alternatives:
+        for branch in group:
+            collected |= _requirement_literals(branch)
+    return collected
+
+
+def _requirement_satisfied(requirement: Requirement, present: Set[str]) -> bool:
+    literals, alternatives = requirement
+    if not literals <= present:
+        return False
+    return all(
+        any(_requirement_satisfied(branch, present) for branch in group)
+        for group in alternatives
+    )
+
+
+class CompiledPattern:
+    """A KnowledgeBase pattern with its regex and prefilter precompiled."""
+
+    __slots__ = (
+        "pattern_id",
+        "pattern",
+        "order",
+        "regex",
+        "requirement",
+        "error_types",
+        "locations",
+    )
+
+    def __init__(self, pattern_id: str, pattern: Dict, order: int):
+        self.pattern_id = pattern_id
+        self.pattern = pattern
+        self.order = order
+
+        regex_source = pattern.get("regex", "")
+        self.regex = None
+        self.requirement: Optional[Requirement] = None
+        if regex_source:
+            self.regex = re.compile(regex_source, re.IGNORECASE)
+            try:
+                self.requirement = _build_requirement(sre_parse.parse(regex_source))
+            except Exception:
+                # Unparseable for extraction - always evaluate the regex
+                self.requirement = (frozenset(), [])
+
+        semantic_features = normalize_semantic_features(
+            pattern.get("semantic_features", {})
+        )
+        self.error_types = tuple(semantic_features.get("error_type", []) or [])
+        self.locations = tuple(semantic_features.get("stacktrace_location", []) or [])
+
+
+class CompiledPatternIndex:
+    """Inverted literal and semantic index over KnowledgeBase patterns.
+
+    Usage:
+        index = CompiledPatternIndex(knowledge_base.patterns)
+        for compiled in index.candidates(message, error_type):
+            score = ...  # full scoring only for candidates
+    """
+
+    def __init__(self, patterns: Dict[str, Dict]):
+        """Compile patterns into the index.
+
+        Args:
+            patterns: Pattern dictionary from KnowledgeBase
+        """
+        self.source = patterns
+        self.patterns: List[CompiledPattern] = [
+            CompiledPattern(pattern_id, pattern, order)
+            for order, (pattern_id, pattern) in enumerate(patterns.items())
+        ]
+
+        # literal -> patterns whose regex requirement mentions it
+        self.literal_index: Dict[str, List[CompiledPattern]] = {}
+        # patterns whose regex has no extractable literal (always regex-checked)
+        self.unfiltered: List[CompiledPattern] = []
+        # error_type -> patterns expecting it
+        self.error_type_index: Dict[str, List[CompiledPattern]] = {}
+        # patterns without error_type that can still match on location alone
+        self.location_only: List[CompiledPattern] = []
+        # regex source -> compiled regex
+        self.regex_by_source: Dict[str, "re.Pattern"] = {}
+
+        for compiled in self.patterns:
+            if compiled.regex is not None:
+                self.regex_by_source[compiled.regex.pattern] = compiled.regex
+            if compiled.requirement is not None:
+                if _requirement_satisfied(compiled.requirement, set()):
+                    # Some alternative needs no literal at all
+                    self.unfiltered.append(compiled)
+                else:
+                    for literal in _requirement_literals(compiled.requirement):
+                        self.literal_index.setdefault(literal, []).append(compiled)
+
+            for error_type in compiled.error_types:
+                self.error_type_index.setdefault(error_type, []).append(compiled)
+            if not compiled.error_types and compiled.locations:
+                self.location_only.append(compiled)
+
+    def candidates(self, message: str, error_type: str) -> List[CompiledPattern]:
+        """Return patterns that may reach the confidence threshold.
+
+        A pattern is a candidate if its regex could match the message (all
+        literals of some alternative are present) or its semantic features
+        could score fully (error_type match or location-only pattern).
+
+        Args:
+            message: Full error message
+            error_type: Exception class name
+
+        Returns:
+            Candidate patterns in KnowledgeBase order
+        """
+        folded = message.casefold().translate(_IGNORECASE_FIXES)
+        present = {literal for literal in self.literal_index if literal in folded}
+
+        selected: Dict[int, CompiledPattern] = {}
+        for literal in present:
+            for compiled in self.literal_index[literal]:
+                if compiled.order not in selected and _requirement_satisfied(
+                    compiled.requirement, present
+                ):
+                    selected[compiled.order] = compiled
+
+        for compiled in self.unfiltered:
+            selected[compiled.order] = compiled
+        for compiled in self.error_type_index.get(error_type, ()):
+            selected[compiled.order] = compiled
+        for compiled in self.location_only:
+            selected[compiled.order] = compiled
+
+        return [selected[order] for order in sorted(selected)]
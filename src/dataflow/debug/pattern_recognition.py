@@ -21,7 +21,7 @@ Match Score Calculation (0.0-1.0):
 - Different error: 0.0
 """
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set
 
 from dataflow.debug.data_structures import (
     ErrorAnalysis,
@@ -51,6 +51,14 @@ class PatternRecognitionEngine:
         """
         self.knowledge_base = knowledge_base
 
+        # Parsed pattern keys and lookup indexes, maintained incrementally
+        self._parsed_keys: Dict[str, ErrorAnalysis] = {}
+        self._by_error_code: Dict[str, List[str]] = {}
+        self._by_category: Dict[str, List[str]] = {}
+        self._by_node_type: Dict[str, List[str]] = {}
+        self._indexed_source: Optional[Dict[str, List[RankedSolution]]] = None
+        self._indexed_keys: Set[str] = set()
+
     def generate_pattern_key(
         self,
         error_analysis: ErrorAnalysis,
@@ -187,15 +195,22 @@ class PatternRecognitionEngine:
         # Get all cached patterns from Knowledge Base
         # Note: KnowledgeBase stores patterns as Dict[pattern_key, List[RankedSolution]]
         cached_patterns = self._get_all_cached_patterns()
+        self._sync_index(cached_patterns)
 
-        # Calculate match score for each cached pattern
-        for pattern_key, ranked_solutions in cached_patterns.items():
-            # Parse pattern key to extract error_code and category
-            cached_error = self._parse_pattern_key(pattern_key)
+        # Only keys sharing error code, category or node_type can score > 0
+        candidate_keys = set(self._by_error_code.get(error_analysis.error_code, ()))
+        candidate_keys.update(self._by_category.get(error_analysis.category, ()))
+        node_type = error_analysis.context.get("node_type")
+        if node_type is not None:
+            candidate_keys.update(self._by_node_type.get(node_type, ()))
 
-            if cached_error is None:
+        # Calculate match score for each candidate pattern (cache order)
+        for pattern_key, ranked_solutions in cached_patterns.items():
+            if pattern_key not in candidate_keys:
                 continue
 
+            cached_error = self._parsed_keys[pattern_key]
+
             # Calculate match score
             score = self.calculate_match_score(error_analysis, cached_error)
 
@@ -292,6 +307,43 @@ class PatternRecognitionEngine:
             # Persistent storage not implemented in Phase 1
             return {}
 
+    def _sync_index(self, cached_patterns: Dict[str, List[RankedSolution]]):
+        """
+        Keep parsed pattern keys and indexes in sync with the cache.
+
+        New keys are parsed once and added incrementally; the indexes are
+        rebuilt from scratch only if the cache was replaced or lost a key.
+        """
+        if (
+            cached_patterns is self._indexed_source
+            and cached_patterns.keys() == self._indexed_keys
+        ):
+            return
+
+        if (
+            cached_patterns is not self._indexed_source
+            or not self._indexed_keys <= cached_patterns.keys()
+        ):
+            self._parsed_keys = {}
+            self._by_error_code = {}
+            self._by_category = {}
+            self._by_node_type = {}
+            self._indexed_source = cached_patterns
+        self._indexed_keys = set(cached_patterns)
+
+        for pattern_key in cached_patterns:
+            if pattern_key in self._parsed_keys:
+                continue
+            parsed = self._parse_pattern_key(pattern_key)
+            if parsed is None:
+                continue
+            self._parsed_keys[pattern_key] = parsed
+            self._by_error_code.setdefault(parsed.error_code, []).append(pattern_key)
+            self._by_category.setdefault(parsed.category, []).append(pattern_key)
+            node_type = parsed.context.get("node_type")
+            if node_type is not None:
+                self._by_node_type.setdefault(node_type, []).append(pattern_key)
+
     def _parse_pattern_key(self, pattern_key: str) -> Optional[ErrorAnalysis]:
         """
         Parse pattern key to extract error analysis details.
@@ -46,6 +46,7 @@ When to Use Traditional Workflows:
 """
 
 import asyncio
+import contextvars
 import hashlib
 import json
 import logging
@@ -53,13 +54,28 @@ import time
 from collections import OrderedDict
 from dataclasses import dataclass
 from threading import RLock
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    Union,
+)
+
+from ..core.tenant_context import get_current_tenant_id
 
 if TYPE_CHECKING:
     from dataflow import DataFlow
+    from dataflow.core.columnar import ColumnarResult
 
 logger = logging.getLogger(__name__)
 
+OPERATION_DURATION_METRIC = "dataflow_express_operation_duration_seconds"
+
 
 # ============================================================================
 # Query Cache Implementation
@@ -221,6 +237,109 @@ class ExpressQueryCache:
             }
 
 
+# ============================================================================
+# Batched Read Loader
+# ============================================================================
+
+
+class ExpressReadLoader:
+    """
+    DataLoader-style coalescing of single-record reads.
+
+    Reads requested in the same event-loop tick are collected per tenant and
+    model and fetched with one query; each caller then receives its own
+    record (or None). Duplicate ids in a tick share one lookup. A batch runs
+    in the context of the read that opened it, so tenant isolation applies
+    the tenant all of its readers share.
+
+    Example:
+        >>> loader = ExpressReadLoader(fetch_many)
+        >>> users = await asyncio.gather(*(loader.load("User", i) for i in ids))
+    """
+
+    def __init__(
+        self,
+        fetch_many: Callable[[str, List[Any]], Awaitable[Dict[str, Any]]],
+        max_batch_size: int = 500,
+    ):
+        """
+        Initialize the loader.
+
+        Args:
+            fetch_many: Coroutine taking a model and ids and returning records
+                keyed by ``str(id)``
+            max_batch_size: Maximum ids per query
+        """
+        self._fetch_many = fetch_many
+        self.max_batch_size = max_batch_size
+        # (tenant, model) -> str(id) -> (id, waiting futures)
+        self._pending: Dict[tuple, Dict[str, tuple]] = {}
+        self._scheduled: Dict[tuple, asyncio.Handle] = {}
+        self._tasks: set = set()
+        self._stats = {"requested": 0, "deduplicated": 0, "batches": 0}
+
+    async def load(self, model: str, id: Any) -> Optional[Dict[str, Any]]:
+        """Read one record, sharing a query with reads from the same tick."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        batch_key = (get_current_tenant_id(), model)
+        pending = self._pending.setdefault(batch_key, {})
+        key = str(id)
+        self._stats["requested"] += 1
+        if key in pending:
+            self._stats["deduplicated"] += 1
+            pending[key][1].append(future)
+        else:
+            pending[key] = (id, [future])
+
+        if len(pending) >= self.max_batch_size:
+            self._dispatch(batch_key)
+        elif batch_key not in self._scheduled:
+            self._scheduled[batch_key] = loop.call_soon(
+                self._dispatch, batch_key, context=contextvars.copy_context()
+            )
+        return await future
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get batching statistics."""
+        stats = dict(self._stats)
+        batches = stats["batches"]
+        unique = stats["requested"] - stats["deduplicated"]
+        stats["avg_batch_size"] = unique / batches if batches else 0.0
+        return stats
+
+    def _dispatch(self, batch_key: tuple) -> None:
+        # Runs in the scheduling reader's context; the task inherits it
+        handle = self._scheduled.pop(batch_key, None)
+        if handle is not None:
+            handle.cancel()
+        pending = self._pending.pop(batch_key, None)
+        if not pending:
+            return
+        self._stats["batches"] += 1
+        task = asyncio.ensure_future(self._run_batch(batch_key[1], pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, model: str, pending: Dict[str, tuple]) -> None:
+        try:
+            records = await self._fetch_many(model, [id for id, _ in pending.values()])
+        except BaseException as e:
+            for _, futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for key, (_, futures) in pending.items():
+            record = records.get(key)
+            for index, future in enumerate(futures):
+                if not future.done():
+                    # Duplicate readers get their own copy
+                    shared = record if index == 0 or record is None else dict(record)
+                    future.set_result(shared)
+
+
 # ============================================================================
 # ExpressDataFlow Implementation
 # ============================================================================
@@ -257,6 +376,8 @@ class ExpressDataFlow:
         cache_max_size: int = 1000,
         cache_ttl: int = 300,
         warm_schema_on_init: bool = False,
+        batch_reads: bool = True,
+        read_batch_size: int = 500,
     ):
         """
         Initialize ExpressDataFlow.
@@ -267,14 +388,24 @@ class ExpressDataFlow:
             cache_max_size: Maximum cache entries (default: 1000)
             cache_ttl: Cache TTL in seconds (default: 300 = 5 min)
             warm_schema_on_init: Pre-warm schema cache on init (default: False)
+            batch_reads: Coalesce concurrent read() calls of a model into one
+                ``id IN (...)`` query (default: True)
+            read_batch_size: Maximum ids per coalesced query (default: 500)
         """
         self._db = dataflow_instance
         self._cache_enabled = cache_enabled
         self._cache = ExpressQueryCache(max_size=cache_max_size, default_ttl=cache_ttl)
         self._schema_warmed = False
+        self._read_loader = (
+            ExpressReadLoader(self._fetch_records, max_batch_size=read_batch_size)
+            if batch_reads
+            else None
+        )
 
-        # Statistics
-        self._operation_times: List[float] = []
+        # Statistics: fixed-memory latency histograms labelled by operation
+        from ..platform.metrics import PrometheusMetrics
+
+        self._metrics = PrometheusMetrics()
 
         if warm_schema_on_init:
             # Schedule schema warm-up (async-compatible)
@@ -342,14 +473,23 @@ class ExpressDataFlow:
 
     async def _execute_with_timing(self, operation: str, coro) -> Any:
         """Execute operation with timing tracking."""
+        from ..core.tracing import get_tracer
+
+        tracer = get_tracer(self._db)
         start = time.perf_counter()
         try:
-            result = await coro
+            if tracer is None:
+                return await coro
+            with tracer.trace(operation, operation, source="express") as span:
+                result = await coro
+                tracer.annotate_result(span, result)
             return result
         finally:
-            elapsed = (time.perf_counter() - start) * 1000  # ms
-            self._operation_times.append(elapsed)
-            logger.debug(f"Express {operation}: {elapsed:.2f}ms")
+            elapsed = time.perf_counter() - start
+            self._metrics.observe_histogram(
+                OPERATION_DURATION_METRIC, elapsed, labels={"operation": operation}
+            )
+            logger.debug(f"Express {operation}: {elapsed * 1000:.2f}ms")
 
     # ========================================================================
     # CRUD Operations
@@ -414,30 +554,94 @@ class ExpressDataFlow:
                 return cached
 
         async def _read():
-            try:
-                node = self._create_node(model, "Read")
-                result = await node.async_run(id=id)
+            if self._read_loader is not None:
+                result = await self._read_loader.load(model, id)
+            else:
+                result = await self._read_one(model, id)
 
-                # Cache result
-                if self._cache_enabled and cache_key and result:
-                    self._cache.set(cache_key, result, ttl=cache_ttl)
+            # Cache result
+            if self._cache_enabled and cache_key and result:
+                self._cache.set(cache_key, result, ttl=cache_ttl)
 
-                return result
-            except Exception as e:
-                # Check if this is a "not found" error - return None instead of raising
-                error_str = str(e).lower()
-                if (
-                    "not found" in error_str
-                    or "no record" in error_str
-                    or "does not exist" in error_str
-                ):
-                    logger.debug(f"Record not found for {model}.read({id})")
-                    return None
-                # Re-raise other errors
-                raise
+            return result
 
         return await self._execute_with_timing(f"{model}.read", _read())
 
+    async def _read_one(self, model: str, id: Any) -> Optional[Dict[str, Any]]:
+        """Read one record through the model's Read node."""
+        try:
+            node = self._create_node(model, "Read")
+            return await node.async_run(id=id)
+        except Exception as e:
+            # Check if this is a "not found" error - return None instead of raising
+            error_str = str(e).lower()
+            if (
+                "not found" in error_str
+                or "no record" in error_str
+                or "does not exist" in error_str
+            ):
+                logger.debug(f"Record not found for {model}.read({id})")
+                return None
+            # Re-raise other errors
+            raise
+
+    async def _fetch_records(self, model: str, ids: List[Any]) -> Dict[str, Any]:
+        """Fetch records for a read batch, keyed by ``str(id)``.
+
+        A single id keeps the Read node path; several ids are fetched with
+        one ``WHERE id IN (...)`` query using the Read node's column list,
+        tenant isolation, JSON decoding and soft-delete rules.
+        """
+        if len(ids) == 1:
+            return {str(ids[0]): await self._read_one(model, ids[0])}
+
+        node = self._create_node(model, "Read")
+        database_type = self._db._detect_database_type()
+        select_all = self._db._generate_select_sql(model, database_type)["select_all"]
+        params = [self._coerce_id(model, id) for id in ids]
+        if database_type.lower() == "postgresql":
+            placeholders = [f"${i}" for i in range(1, len(params) + 1)]
+        elif database_type.lower() == "mysql":
+            placeholders = ["%s"] * len(params)
+        else:
+            placeholders = ["?"] * len(params)
+        query = f"{select_all} WHERE id IN ({', '.join(placeholders)})"
+        query, params = node._apply_tenant_isolation(query, params)
+
+        sql_node = self._db._get_or_create_async_sql_node(database_type, read_only=True)
+        result = await sql_node.async_run(
+            query=query,
+            params=params,
+            fetch_mode="all",
+            validate_queries=False,
+            transaction_mode="auto",
+        )
+        rows = (result or {}).get("result", {}).get("data") or []
+
+        model_info = self._db._models.get(model)
+        model_config = (
+            model_info.get("config", {}) if isinstance(model_info, dict) else {}
+        )
+        skip_deleted = model_config.get("soft_delete", False)
+
+        records = {}
+        for row in rows:
+            row = node._deserialize_json_fields(row)
+            if skip_deleted and row.get("deleted_at") is not None:
+                continue
+            records[str(row.get("id"))] = {**row, "found": True}
+        return records
+
+    def _coerce_id(self, model: str, id: Any) -> Any:
+        """Convert an id the way the Read node does for the model's id type."""
+        id_type = self._db._model_fields.get(model, {}).get("id", {}).get("type")
+        if id_type is str or not (id_type is int or id_type is None):
+            return id
+        try:
+            return int(id)
+        except (ValueError, TypeError):
+            return id
+
     async def update(
         self, model: str, id: str, fields: Dict[str, Any]
     ) -> Dict[str, Any]:
@@ -506,7 +710,8 @@ class ExpressDataFlow:
         limit: int = 100,
         offset: int = 0,
         cache_ttl: Optional[int] = None,
-    ) -> List[Dict[str, Any]]:
+        result_format: str = "records",
+    ) -> Union[List[Dict[str, Any]], "ColumnarResult"]:
         """
         List records with optional filtering.
 
@@ -516,19 +721,25 @@ class ExpressDataFlow:
             limit: Maximum records to return (default: 100)
             offset: Skip first N records (default: 0)
             cache_ttl: Optional cache TTL override
+            result_format: "records" (default) for a list of dicts, or
+                "columnar" for a ColumnarResult of NumPy columns (not cached)
 
         Returns:
-            List of records
+            List of records, or a ColumnarResult
 
         Example:
             users = await db.express.list("User", filter={"status": "active"}, limit=50)
+            orders = await db.express.list("Order", limit=1_000_000,
+                                           result_format="columnar")
         """
         params = {"filter": filter or {}, "limit": limit, "offset": offset}
+        if result_format != "records":
+            params["result_format"] = result_format
 
         cache_key = None
 
         # Check cache first
-        if self._cache_enabled:
+        if self._cache_enabled and result_format == "records":
             cache_key = self._cache._generate_key(model, "list", params)
             cached = self._cache.get(cache_key)
             if cached is not None:
@@ -874,8 +1085,15 @@ class ExpressDataFlow:
     # ========================================================================
 
     def get_performance_stats(self) -> Dict[str, Any]:
-        """Get performance statistics."""
-        if not self._operation_times:
+        """
+        Get performance statistics.
+
+        Percentiles come from a quantile sketch and are accurate to within
+        1% of the exact value.
+        """
+        histogram = self._metrics.get_aggregate_histogram(OPERATION_DURATION_METRIC)
+        n = histogram.count
+        if n == 0:
             return {
                 "total_operations": 0,
                 "avg_time_ms": 0,
@@ -886,22 +1104,33 @@ class ExpressDataFlow:
                 "p99_time_ms": 0,
             }
 
-        times = sorted(self._operation_times)
-        n = len(times)
-
+        max_ms = histogram.sketch.max * 1000
         return {
             "total_operations": n,
-            "avg_time_ms": sum(times) / n,
-            "min_time_ms": times[0],
-            "max_time_ms": times[-1],
-            "p50_time_ms": times[n // 2],
-            "p95_time_ms": times[int(n * 0.95)] if n >= 20 else times[-1],
-            "p99_time_ms": times[int(n * 0.99)] if n >= 100 else times[-1],
+            "avg_time_ms": histogram.sum * 1000 / n,
+            "min_time_ms": histogram.sketch.min * 1000,
+            "max_time_ms": max_ms,
+            "p50_time_ms": histogram.quantile(0.5) * 1000,
+            "p95_time_ms": histogram.quantile(0.95) * 1000 if n >= 20 else max_ms,
+            "p99_time_ms": histogram.quantile(0.99) * 1000 if n >= 100 else max_ms,
         }
 
+    def get_read_batch_stats(self) -> Dict[str, Any]:
+        """Get statistics of read() coalescing (empty when disabled)."""
+        return self._read_loader.get_stats() if self._read_loader else {}
+
+    def get_metrics_text(self) -> str:
+        """
+        Export operation latency histograms in Prometheus text format.
+
+        Returns:
+            Exposition text with one histogram per operation
+        """
+        return self._metrics.export_text()
+
     def reset_stats(self) -> None:
         """Reset all statistics."""
-        self._operation_times.clear()
+        self._metrics.reset()
         self._cache._hits = 0
         self._cache._misses = 0
         self._cache._evictions = 0
@@ -11,15 +11,19 @@ Key Features:
 - Provides detailed validation reports with suggestions
 - Integrates with DataFlow's PostgreSQL-first execution model
 - Uses DataFlow connection pooling and AsyncSQLDatabaseNode patterns
+- Sampled mode (TABLESAMPLE) with confidence bounds for a quick verdict
+- Chunked exact mode analysing primary-key ranges concurrently
 """
 
 import asyncio
 import logging
+import math
 import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 from kailash.runtime import AsyncLocalRuntime
 from kailash.runtime.local import LocalRuntime
@@ -37,6 +41,14 @@ class ValidationSeverity(Enum):
     CRITICAL = "critical"
 
 
+class ValidationMode(Enum):
+    """How much of the table validation reads."""
+
+    FULL = "full"  # Whole-table analysis queries
+    SAMPLED = "sampled"  # Block sample with confidence bounds
+    CHUNKED = "chunked"  # Exact, primary-key ranges analysed concurrently
+
+
 class ValidationCategory(Enum):
     """Categories of validation issues."""
 
@@ -96,6 +108,11 @@ class ValidationResult:
     column_stats: Optional[ColumnStatistics] = None
     recommended_approach: Optional[str] = None
     estimated_conversion_time_ms: int = 0
+    validation_mode: ValidationMode = ValidationMode.FULL
+    sample_rows: Optional[int] = None
+    # (lower, upper) incompatible row estimate at confidence_level (sampled mode)
+    incompatible_rows_bounds: Optional[Tuple[int, int]] = None
+    confidence_level: Optional[float] = None
 
 
 class DataValidationEngine:
@@ -141,11 +158,22 @@ class DataValidationEngine:
         # Validation configuration
         self.sample_size = 10000  # Number of rows to sample for analysis
         self.analysis_timeout_ms = 30000  # 30 seconds timeout for analysis
+        self.confidence_level = 0.95  # Confidence of sampled estimates
+        self.sample_seed = 42  # REPEATABLE seed so sample queries see one sample
+        self.chunk_count = 16  # Key ranges for chunked analysis
+        self.max_parallel_chunks = 4  # Concurrent chunk queries (connections)
 
         logger.info("Data Validation Engine initialized for PostgreSQL")
 
     async def validate_type_conversion(
-        self, table_name: str, column_name: str, old_type: str, new_type: str
+        self,
+        table_name: str,
+        column_name: str,
+        old_type: str,
+        new_type: str,
+        mode: Union[ValidationMode, str] = ValidationMode.FULL,
+        key_column: str = "id",
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
     ) -> ValidationResult:
         """
         Validate if a column can be safely converted to a new type.
@@ -155,17 +183,47 @@ class DataValidationEngine:
             column_name: Name of the column to convert
             old_type: Current column type
             new_type: Target column type
+            mode: FULL scans the table, SAMPLED estimates from a block sample
+                with confidence bounds, CHUNKED counts exactly by analysing
+                integer key ranges concurrently
+            key_column: Integer primary key used to split CHUNKED analysis
+            progress_callback: Called as ``(chunks_done, chunks_total,
+                rows_scanned)`` after each CHUNKED range completes
 
         Returns:
             ValidationResult with compatibility assessment
         """
         try:
+            mode = ValidationMode(mode)
             logger.info(
-                f"Starting validation for {table_name}.{column_name}: {old_type} -> {new_type}"
+                f"Starting {mode.value} validation for {table_name}.{column_name}: "
+                f"{old_type} -> {new_type}"
             )
 
-            # Step 1: Get column statistics
-            column_stats = await self._analyze_column_data(table_name, column_name)
+            # Step 1: Get column statistics (sampled/chunked modes also count
+            # incompatible rows in the same pass)
+            incompatible_count = None
+            sample = None
+            if mode == ValidationMode.SAMPLED:
+                sample = await self._analyze_column_sample(
+                    table_name, column_name, old_type, new_type
+                )
+                if sample is None:
+                    # Table too small for block sampling to return rows
+                    mode = ValidationMode.FULL
+            if sample is not None:
+                column_stats, incompatible_count = sample["stats"], sample["estimate"]
+            elif mode == ValidationMode.CHUNKED:
+                column_stats, incompatible_count = await self._analyze_column_chunks(
+                    table_name,
+                    column_name,
+                    old_type,
+                    new_type,
+                    key_column,
+                    progress_callback,
+                )
+            else:
+                column_stats = await self._analyze_column_data(table_name, column_name)
 
             # If analysis failed (no rows), this indicates an error
             if column_stats.total_rows == 0 and column_stats.null_count == 0:
@@ -190,9 +248,10 @@ class DataValidationEngine:
             )
 
             # Step 3: Count incompatible data
-            incompatible_count = await self.count_incompatible_data(
-                table_name, column_name, old_type, new_type
-            )
+            if incompatible_count is None:
+                incompatible_count = await self.count_incompatible_data(
+                    table_name, column_name, old_type, new_type
+                )
 
             # Step 4: Generate recommendations
             recommended_approach = self._generate_conversion_recommendation(
@@ -218,7 +277,26 @@ class DataValidationEngine:
                 column_stats=column_stats,
                 recommended_approach=recommended_approach,
                 estimated_conversion_time_ms=estimated_time,
+                validation_mode=mode,
             )
+            if sample is not None:
+                result.sample_rows = sample["sample_rows"]
+                result.incompatible_rows_bounds = sample["bounds"]
+                result.confidence_level = self.confidence_level
+                low, high = sample["bounds"]
+                result.issues.append(
+                    ValidationIssue(
+                        severity=ValidationSeverity.INFO,
+                        category=ValidationCategory.DATA_COMPATIBILITY,
+                        message=(
+                            f"Estimated from a {sample['sample_rows']}-row sample: "
+                            f"{low}-{high} incompatible rows "
+                            f"({self.confidence_level:.0%} confidence)"
+                        ),
+                        affected_rows=incompatible_count,
+                        suggestion="Run chunked validation for exact counts",
+                    )
+                )
 
             logger.info(
                 f"Validation completed: {len(compatibility_issues)} issues found, "
@@ -455,6 +533,297 @@ class DataValidationEngine:
                 total_rows=0, null_count=0, unique_count=0, sample_values=[]
             )
 
+    def _run_analysis_query(self, node_id: str, sql: str) -> List[Dict[str, Any]]:
+        """Execute one analysis query through AsyncSQLDatabaseNode and return rows."""
+        workflow = WorkflowBuilder()
+        workflow.add_node(
+            "AsyncSQLDatabaseNode",
+            node_id,
+            {
+                "connection_string": self.connection_string,
+                "database_type": self.database_type,
+                "query": sql,
+                "timeout_ms": self.analysis_timeout_ms,
+                "validate_queries": False,
+            },
+        )
+
+        init_runtime = LocalRuntime()
+        results, _ = init_runtime.execute(workflow.build())
+
+        if node_id not in results:
+            raise Exception(f"Failed to execute {node_id} query")
+
+        result_data = results[node_id]
+        if result_data.get("error"):
+            raise Exception(f"Query error: {result_data['error']}")
+
+        if "result" in result_data and "data" in result_data["result"]:
+            return result_data["result"]["data"]
+        return result_data.get("rows", [])
+
+    def _sample_source(self, table_name: str, column_name: str, percent: float) -> str:
+        """FROM clause reading a random sample of the table."""
+        if self.database_type == "postgresql":
+            # Block sampling reads only the sampled pages
+            return (
+                f'"{table_name}" TABLESAMPLE SYSTEM ({percent:.6f}) '
+                f"REPEATABLE ({self.sample_seed})"
+            )
+        random_fn = "RAND()" if self.database_type == "mysql" else "RANDOM()"
+        return (
+            f'(SELECT "{column_name}" FROM "{table_name}" '
+            f"ORDER BY {random_fn} LIMIT {self.sample_size}) AS sample"
+        )
+
+    def _aggregate_select(
+        self, column_name: str, old_type: str, new_type: str, source: str
+    ) -> str:
+        """Single-pass counts, length statistics and incompatible rows."""
+        condition = self._generate_incompatibility_condition(
+            column_name, old_type, new_type
+        )
+        incompatible = (
+            f'SUM(CASE WHEN "{column_name}" IS NOT NULL AND {condition} '
+            f"THEN 1 ELSE 0 END)"
+            if condition
+            else "0"
+        )
+        return f"""
+            SELECT
+                COUNT(*) as total_rows,
+                COUNT(*) - COUNT("{column_name}") as null_count,
+                COUNT(DISTINCT "{column_name}") as unique_count,
+                MAX(LENGTH(CAST("{column_name}" AS TEXT))) as max_length,
+                SUM(LENGTH(CAST("{column_name}" AS TEXT))) as total_length,
+                {incompatible} as incompatible_count
+            FROM {source}
+            """
+
+    def _top_values(
+        self, column_name: str, source: str, denominator: int
+    ) -> List[DataSample]:
+        """Most frequent non-NULL values in a sample."""
+        rows = self._run_analysis_query(
+            "sample_values",
+            f"""
+            SELECT "{column_name}" as value, COUNT(*) as value_count
+            FROM {source}
+            WHERE "{column_name}" IS NOT NULL
+            GROUP BY "{column_name}"
+            ORDER BY value_count DESC
+            LIMIT 20
+            """,
+        )
+        return [
+            DataSample(
+                value=row["value"],
+                count=int(row["value_count"]),
+                percentage=round(int(row["value_count"]) * 100.0 / denominator, 2),
+            )
+            for row in rows
+            if denominator
+        ]
+
+    def _wilson_interval(self, successes: int, trials: int) -> Tuple[float, float]:
+        """Wilson score interval for a binomial proportion."""
+        z = NormalDist().inv_cdf(0.5 + self.confidence_level / 2)
+        p = successes / trials
+        denominator = 1 + z * z / trials
+        centre = (p + z * z / (2 * trials)) / denominator
+        margin = (
+            z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials))
+        ) / denominator
+        return max(0.0, centre - margin), min(1.0, centre + margin)
+
+    async def _analyze_column_sample(
+        self, table_name: str, column_name: str, old_type: str, new_type: str
+    ) -> Optional[Dict[str, Any]]:
+        """Estimate column statistics and incompatible rows from a sample.
+
+        On PostgreSQL the sample is ``TABLESAMPLE SYSTEM`` sized to roughly
+        ``sample_size`` rows from the planner's row estimate, so only sampled
+        pages are read. Block sampling keeps rows of a page together, so the
+        bounds assume values are not strongly clustered by physical order.
+
+        Returns:
+            Dict with ``stats`` (scaled to the table), ``estimate`` (incompatible
+            rows), ``bounds`` and ``sample_rows``; None if the sample was empty
+        """
+        estimated_rows = 0
+        if self.database_type == "postgresql":
+            rows = self._run_analysis_query(
+                "estimate_rows",
+                f"""
+                SELECT GREATEST(reltuples, 0)::bigint as estimated_rows
+                FROM pg_class WHERE oid = '"{table_name}"'::regclass
+                """,
+            )
+            estimated_rows = int(rows[0]["estimated_rows"] or 0) if rows else 0
+        else:
+            rows = self._run_analysis_query(
+                "estimate_rows",
+                f'SELECT COUNT(*) as estimated_rows FROM "{table_name}"',
+            )
+            estimated_rows = int(rows[0]["estimated_rows"] or 0) if rows else 0
+
+        percent = 100.0
+        if estimated_rows > 0:
+            percent = min(100.0, max(0.0001, self.sample_size * 100.0 / estimated_rows))
+        source = self._sample_source(table_name, column_name, percent)
+
+        rows = self._run_analysis_query(
+            "analyze_sample",
+            self._aggregate_select(column_name, old_type, new_type, source),
+        )
+        sample_rows = int(rows[0]["total_rows"] or 0) if rows else 0
+        if sample_rows == 0:
+            return None
+
+        row = rows[0]
+        if estimated_rows <= 0:
+            # Never-analysed table: extrapolate from the sampling rate
+            estimated_rows = int(sample_rows * 100.0 / percent)
+        estimated_rows = max(estimated_rows, sample_rows)
+        scale = estimated_rows / sample_rows
+
+        non_null = sample_rows - int(row["null_count"])
+        incompatible = int(row["incompatible_count"] or 0)
+        low, high = self._wilson_interval(incompatible, sample_rows)
+
+        stats = ColumnStatistics(
+            total_rows=estimated_rows,
+            null_count=round(int(row["null_count"]) * scale),
+            unique_count=int(row["unique_count"]),  # Distinct within the sample
+            avg_length=(
+                float(row["total_length"]) / non_null
+                if non_null and row["total_length"]
+                else None
+            ),
+            max_length=int(row["max_length"]) if row["max_length"] else None,
+            sample_values=self._top_values(column_name, source, sample_rows),
+        )
+
+        logger.debug(
+            f"Sampled {sample_rows} of ~{estimated_rows} rows from {table_name}: "
+            f"{incompatible} incompatible"
+        )
+
+        return {
+            "stats": stats,
+            "estimate": round(incompatible * scale),
+            "bounds": (
+                math.floor(low * estimated_rows),
+                math.ceil(high * estimated_rows),
+            ),
+            "sample_rows": sample_rows,
+        }
+
+    async def _analyze_column_chunks(
+        self,
+        table_name: str,
+        column_name: str,
+        old_type: str,
+        new_type: str,
+        key_column: str,
+        progress_callback: Optional[Callable[[int, int, int], None]] = None,
+    ) -> Tuple[ColumnStatistics, int]:
+        """Exact statistics from key ranges analysed concurrently.
+
+        The ``[min, max]`` range of ``key_column`` is split into
+        ``chunk_count`` ranges; up to ``max_parallel_chunks`` run at once,
+        each on its own runtime and connection. Row, NULL, length and
+        incompatible counts are exact; ``unique_count`` sums per-range
+        distinct counts and is an upper bound.
+
+        Returns:
+            (column statistics, incompatible row count)
+        """
+        rows = self._run_analysis_query(
+            "key_range",
+            f"""
+            SELECT MIN("{key_column}") as min_key, MAX("{key_column}") as max_key
+            FROM "{table_name}"
+            """,
+        )
+        min_key = rows[0]["min_key"] if rows else None
+        max_key = rows[0]["max_key"] if rows else None
+        if min_key is None:
+            return ColumnStatistics(total_rows=0, null_count=0, unique_count=0), 0
+        if not isinstance(min_key, int) or not isinstance(max_key, int):
+            raise ValueError(
+                f"Chunked validation requires an integer key column, "
+                f"{key_column} is {type(min_key).__name__}"
+            )
+
+        step = max(1, math.ceil((max_key - min_key + 1) / self.chunk_count))
+        ranges = [
+            (low, min(low + step, max_key + 1))
+            for low in range(min_key, max_key + 1, step)
+        ]
+        slots = asyncio.Semaphore(self.max_parallel_chunks)
+
+        async def analyze_range(index: int, low: int, high: int) -> Dict[str, Any]:
+            source = (
+                f'"{table_name}" WHERE "{key_column}" >= {low} '
+                f'AND "{key_column}" < {high}'
+            )
+            sql = self._aggregate_select(column_name, old_type, new_type, source)
+            async with slots:
+                chunk_rows = await asyncio.to_thread(
+                    self._run_analysis_query, f"analyze_chunk_{index}", sql
+                )
+            return chunk_rows[0] if chunk_rows else {}
+
+        totals = {
+            "total_rows": 0,
+            "null_count": 0,
+            "unique_count": 0,
+            "total_length": 0,
+            "incompatible_count": 0,
+        }
+        max_length = None
+        tasks = [
+            asyncio.ensure_future(analyze_range(i, low, high))
+            for i, (low, high) in enumerate(ranges)
+        ]
+        try:
+            for done, task in enumerate(asyncio.as_completed(tasks), start=1):
+                chunk = await task
+                for name in totals:
+                    totals[name] += int(chunk.get(name) or 0)
+                if chunk.get("max_length") is not None:
+                    max_length = max(max_length or 0, int(chunk["max_length"]))
+                logger.debug(
+                    f"Validated chunk {done}/{len(ranges)} of {table_name} "
+                    f"({totals['total_rows']} rows so far)"
+                )
+                if progress_callback:
+                    progress_callback(done, len(ranges), totals["total_rows"])
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        non_null = totals["total_rows"] - totals["null_count"]
+        sample_values = []
+        if totals["total_rows"]:
+            percent = min(100.0, self.sample_size * 100.0 / totals["total_rows"])
+            sample_values = self._top_values(
+                column_name,
+                self._sample_source(table_name, column_name, percent),
+                min(self.sample_size, totals["total_rows"]),
+            )
+
+        stats = ColumnStatistics(
+            total_rows=totals["total_rows"],
+            null_count=totals["null_count"],
+            unique_count=min(totals["unique_count"], non_null),
+            avg_length=totals["total_length"] / non_null if non_null else None,
+            max_length=max_length,
+            sample_values=sample_values,
+        )
+        return stats, totals["incompatible_count"]
+
     async def _check_type_compatibility(
         self, column_stats: ColumnStatistics, old_type: str, new_type: str
     ) -> List[ValidationIssue]:
@@ -683,6 +1052,27 @@ class DataValidationEngine:
         self, table_name: str, column_name: str, old_type: str, new_type: str
     ) -> Optional[str]:
         """Generate SQL to check data compatibility for type conversion."""
+        condition = self._generate_incompatibility_condition(
+            column_name, old_type, new_type
+        )
+
+        if condition:
+            return f"""
+            SELECT COUNT(*) as incompatible_count
+            FROM "{table_name}"
+            WHERE "{column_name}" IS NOT NULL
+            AND {condition}
+            """
+
+        # Default: no incompatible data
+        return """
+        SELECT 0 as incompatible_count
+        """
+
+    def _generate_incompatibility_condition(
+        self, column_name: str, old_type: str, new_type: str
+    ) -> Optional[str]:
+        """SQL predicate matching non-NULL values that cannot be converted."""
 
         old_type_norm = self._normalize_type_name(old_type)
         new_type_norm = self._normalize_type_name(new_type)
@@ -696,12 +1086,7 @@ class DataValidationEngine:
             "numeric",
             "decimal",
         ]:
-            return f"""
-            SELECT COUNT(*) as incompatible_count
-            FROM "{table_name}"
-            WHERE "{column_name}" IS NOT NULL
-            AND "{column_name}" !~ '^-?[0-9]+\.?[0-9]*$'
-            """
+            return f"\"{column_name}\" !~ '^-?[0-9]+\\.?[0-9]*$'"
 
         # Text to date conversion check
         if old_type_norm in ["text", "varchar", "char"] and new_type_norm in [
@@ -709,16 +1094,10 @@ class DataValidationEngine:
             "timestamp",
             "timestamptz",
         ]:
-            return f"""
-            SELECT COUNT(*) as incompatible_count
-            FROM "{table_name}"
-            WHERE "{column_name}" IS NOT NULL
-            AND "{column_name}" IS NOT NULL
-            AND (
+            return f"""(
                 "{column_name}" !~ '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}}'
                 OR "{column_name}" !~ '^[0-9]{{4}}-[0-9]{{2}}-[0-9]{{2}} [0-9]{{2}}:[0-9]{{2}}:[0-9]{{2}}'
-            )
-            """
+            )"""
 
         # Size constraint check for string types
         if old_type_norm.startswith(
@@ -727,17 +1106,9 @@ class DataValidationEngine:
 
             new_size = self._extract_type_size(new_type)
             if new_size:
-                return f"""
-                SELECT COUNT(*) as incompatible_count
-                FROM "{table_name}"
-                WHERE "{column_name}" IS NOT NULL
-                AND LENGTH("{column_name}") > {new_size}
-                """
+                return f'LENGTH("{column_name}") > {new_size}'
 
-        # Default: no incompatible data
-        return """
-        SELECT 0 as incompatible_count
-        """
+        return None
 
     def _generate_conversion_recommendation(
         self,
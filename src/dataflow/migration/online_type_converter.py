@@ -0,0 +1,763 @@
+"""
+Online Column Type Conversion.
+
+Converts a column's type without rewriting the table under an ACCESS
+EXCLUSIVE lock, which is what ``ALTER COLUMN ... TYPE`` does for most type
+changes (e.g. ``integer`` -> ``bigint``):
+
+1. Add a nullable shadow column of the new type and a trigger that keeps it
+   in sync on every INSERT and UPDATE.
+2. Backfill the shadow column in throttled primary-key batches, one committed
+   transaction per batch, checkpointing the last processed key.
+3. Verify every value converted, enforce NOT NULL through a validated CHECK
+   constraint and rebuild the column's indexes with CREATE INDEX CONCURRENTLY.
+4. Swap the columns in one short transaction: move the default, sequence
+   ownership (widening the sequence to the new integer type) and primary
+   key / unique constraints over, drop the old column and rename the shadow
+   column into its place.
+
+An interrupted or paused conversion resumes from its checkpoint. PostgreSQL
+only; columns referenced by foreign keys, CHECK constraints or multi-column
+or expression indexes are rejected up front.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import asyncpg
+
+from ..migrations.adaptive_backfill import (
+    AdaptiveBackfillController,
+    BackfillBudget,
+    BackfillCheckpoint,
+    BackfillCheckpointStore,
+    get_replication_lag,
+)
+
+logger = logging.getLogger(__name__)
+
+# PostgreSQL truncates identifiers to NAMEDATALEN - 1 bytes
+MAX_IDENTIFIER_LENGTH = 63
+
+# Types a sequence can be declared AS
+SEQUENCE_TYPES = {"smallint", "int2", "integer", "int", "int4", "bigint", "int8"}
+
+
+class OnlineConversionPhase(Enum):
+    """Phases of an online type conversion."""
+
+    PREPARE = "prepare"  # Shadow column and sync trigger
+    BACKFILL = "backfill"  # Throttled batch copy of existing rows
+    VALIDATE = "validate"  # Conversion check and NOT NULL constraint
+    BUILD_INDEXES = "build_indexes"  # CREATE INDEX CONCURRENTLY on the shadow
+    SWAP = "swap"  # Short transaction that swaps the columns
+    COMPLETE = "complete"
+
+
+class OnlineConversionStatus(Enum):
+    """Outcome of an online type conversion run."""
+
+    SUCCESS = "success"
+    PAUSED = "paused"
+    FAILED = "failed"
+
+
+@dataclass
+class OnlineConversionProgress:
+    """Progress report passed to the progress callback."""
+
+    table_name: str
+    column_name: str
+    phase: OnlineConversionPhase
+    rows_processed: int = 0
+    estimated_rows: int = 0
+    last_key: Optional[str] = None
+
+    @property
+    def percent_complete(self) -> float:
+        """Backfill progress in percent (based on the planner's row estimate)."""
+        if self.phase in (
+            OnlineConversionPhase.BUILD_INDEXES,
+            OnlineConversionPhase.SWAP,
+            OnlineConversionPhase.COMPLETE,
+        ):
+            return 100.0
+        if self.estimated_rows <= 0:
+            return 0.0
+        return min(100.0, 100.0 * self.rows_processed / self.estimated_rows)
+
+
+@dataclass
+class OnlineConversionResult:
+    """Result of an online type conversion run."""
+
+    status: OnlineConversionStatus
+    table_name: str
+    column_name: str
+    new_type: str
+    phase: OnlineConversionPhase
+    rows_backfilled: int = 0
+    execution_time: float = 0.0
+    error_message: Optional[str] = None
+    backfill_stats: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def success(self) -> bool:
+        return self.status == OnlineConversionStatus.SUCCESS
+
+
+@dataclass
+class _ColumnIndex:
+    """A single-column index that has to be rebuilt on the shadow column."""
+
+    name: str
+    method: str
+    is_unique: bool
+    constraint_name: Optional[str] = None
+    constraint_type: Optional[str] = None  # "p" or "u"
+
+    @property
+    def shadow_name(self) -> str:
+        return _shadow_identifier(self.name, "_new")
+
+
+@dataclass
+class _ColumnInfo:
+    """Catalog facts about the column being converted."""
+
+    data_type: str
+    not_null: bool
+    default: Optional[str]
+    sequence: Optional[str]
+    indexes: List[_ColumnIndex]
+
+
+ProgressCallback = Callable[[OnlineConversionProgress], None]
+
+
+def _shadow_identifier(name: str, suffix: str) -> str:
+    return name[: MAX_IDENTIFIER_LENGTH - len(suffix)] + suffix
+
+
+class OnlineTypeConverter:
+    """
+    Shadow-column type conversion for large PostgreSQL tables.
+
+    Example:
+        converter = OnlineTypeConverter(BackfillBudget(max_replication_lag=5))
+        result = await converter.convert(
+            connection, "orders", "id", "BIGINT", key_column="id"
+        )
+    """
+
+    def __init__(self, budget: Optional[BackfillBudget] = None, batch_size: int = 5000):
+        """
+        Initialize the converter.
+
+        Args:
+            budget: Latency, lock-wait and replication-lag budget for the
+                backfill and the DDL steps
+            batch_size: Initial backfill batch size
+        """
+        self.budget = budget or BackfillBudget()
+        self.batch_size = batch_size
+        self._pause_requests: Set[Tuple[str, str]] = set()
+
+    def pause(self, table_name: str, column_name: str) -> None:
+        """Ask a running conversion to stop after its current backfill batch.
+
+        The conversion returns ``OnlineConversionStatus.PAUSED``; calling
+        convert() again resumes from the last checkpoint.
+        """
+        self._pause_requests.add((table_name, column_name))
+
+    async def convert(
+        self,
+        connection: asyncpg.Connection,
+        table_name: str,
+        column_name: str,
+        new_type: str,
+        key_column: str = "id",
+        conversion_expression: Optional[str] = None,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> OnlineConversionResult:
+        """
+        Convert a column to ``new_type`` online (or resume a conversion).
+
+        Args:
+            connection: asyncpg connection to the target database
+            table_name: Table to convert
+            column_name: Column to convert
+            new_type: Target PostgreSQL type
+            key_column: Unique, indexed column used to walk the table in batches
+            conversion_expression: SQL expression computing the new value from
+                the quoted column name (default ``CAST("column" AS new_type)``)
+            progress_callback: Called with an OnlineConversionProgress after
+                each phase and backfill batch
+
+        Returns:
+            OnlineConversionResult; failures leave the shadow column and
+            checkpoint in place so the conversion can be resumed or aborted
+        """
+        start_time = time.perf_counter()
+        shadow = _shadow_identifier(column_name, "__new")
+        expression = conversion_expression or f'CAST("{column_name}" AS {new_type})'
+        controller = AdaptiveBackfillController(self.budget, self.batch_size)
+        phase = OnlineConversionPhase.PREPARE
+        progress = OnlineConversionProgress(table_name, column_name, phase)
+
+        def report(new_phase: OnlineConversionPhase) -> None:
+            progress.phase = new_phase
+            if progress_callback:
+                progress_callback(progress)
+
+        def finish(
+            status: OnlineConversionStatus, error: Optional[str] = None
+        ) -> OnlineConversionResult:
+            return OnlineConversionResult(
+                status=status,
+                table_name=table_name,
+                column_name=column_name,
+                new_type=new_type,
+                phase=phase,
+                rows_backfilled=progress.rows_processed,
+                execution_time=time.perf_counter() - start_time,
+                error_message=error,
+                backfill_stats=controller.get_stats(),
+            )
+
+        try:
+            info = await self._inspect_column(connection, table_name, column_name)
+            store = BackfillCheckpointStore(connection)
+            await store.ensure_table()
+            checkpoint = await store.load(table_name, shadow)
+
+            if checkpoint is None:
+                logger.info(
+                    f"Starting online conversion of {table_name}.{column_name}: "
+                    f"{info.data_type} -> {new_type}"
+                )
+                checkpoint = BackfillCheckpoint(
+                    table_name=table_name,
+                    column_name=shadow,
+                    batch_size=self.batch_size,
+                )
+
+                async def prepare():
+                    await self._install_shadow_column(
+                        connection,
+                        table_name,
+                        column_name,
+                        shadow,
+                        new_type,
+                        expression,
+                    )
+                    await store.save(checkpoint)
+
+                await self._locked_transaction(connection, controller, prepare)
+            else:
+                logger.info(
+                    f"Resuming online conversion of {table_name}.{column_name} "
+                    f"after key {checkpoint.last_key!r} "
+                    f"({checkpoint.rows_processed} rows done)"
+                )
+                checkpoint.status = "running"
+                controller = AdaptiveBackfillController(
+                    self.budget, checkpoint.batch_size or self.batch_size
+                )
+            progress.rows_processed = checkpoint.rows_processed
+            progress.last_key = checkpoint.last_key
+            progress.estimated_rows = await self._estimate_rows(connection, table_name)
+            report(phase)
+
+            phase = OnlineConversionPhase.BACKFILL
+            report(phase)
+            completed = await self._backfill(
+                connection,
+                store,
+                checkpoint,
+                controller,
+                table_name,
+                column_name,
+                shadow,
+                key_column,
+                expression,
+                progress,
+                lambda: report(OnlineConversionPhase.BACKFILL),
+            )
+            if not completed:
+                return finish(OnlineConversionStatus.PAUSED)
+
+            phase = OnlineConversionPhase.VALIDATE
+            report(phase)
+            await self._validate_shadow_column(
+                connection, table_name, column_name, shadow, info
+            )
+
+            phase = OnlineConversionPhase.BUILD_INDEXES
+            report(phase)
+            for index in info.indexes:
+                await self._build_shadow_index(connection, table_name, shadow, index)
+
+            phase = OnlineConversionPhase.SWAP
+            report(phase)
+
+            async def swap():
+                await self._swap_columns(
+                    connection, table_name, column_name, shadow, info, new_type
+                )
+                await store.delete(table_name, shadow)
+
+            await self._locked_transaction(
+                connection, controller, swap, lock_table=table_name
+            )
+
+            phase = OnlineConversionPhase.COMPLETE
+            report(phase)
+            logger.info(
+                f"Online conversion of {table_name}.{column_name} to {new_type} "
+                f"completed: {progress.rows_processed} rows backfilled"
+            )
+            return finish(OnlineConversionStatus.SUCCESS)
+
+        except Exception as e:
+            logger.error(
+                f"Online conversion of {table_name}.{column_name} failed "
+                f"during {phase.value}: {e}"
+            )
+            return finish(OnlineConversionStatus.FAILED, str(e))
+
+    async def abort(
+        self, connection: asyncpg.Connection, table_name: str, column_name: str
+    ) -> None:
+        """Remove the shadow column, trigger, indexes and checkpoint of an
+        unfinished conversion, leaving the original column untouched."""
+        shadow = _shadow_identifier(column_name, "__new")
+        function = self._sync_function_name(table_name, column_name)
+        info = await self._inspect_column(connection, table_name, column_name)
+
+        for index in info.indexes:
+            await connection.execute(
+                f'DROP INDEX CONCURRENTLY IF EXISTS "{index.shadow_name}"'
+            )
+        async with connection.transaction():
+            await connection.execute(
+                f'DROP TRIGGER IF EXISTS "{function}" ON "{table_name}"'
+            )
+            await connection.execute(f'DROP FUNCTION IF EXISTS "{function}"()')
+            await connection.execute(
+                f'ALTER TABLE "{table_name}" DROP COLUMN IF EXISTS "{shadow}"'
+            )
+            await BackfillCheckpointStore(connection).delete(table_name, shadow)
+        self._pause_requests.discard((table_name, column_name))
+
+    # ------------------------------------------------------------------
+    # Phases
+    # ------------------------------------------------------------------
+
+    async def _inspect_column(
+        self, connection: asyncpg.Connection, table_name: str, column_name: str
+    ) -> _ColumnInfo:
+        """Read the column definition and the objects that depend on it."""
+        regclass = f'"{table_name}"'
+        column = await connection.fetchrow(
+            """
+            SELECT a.attnum, format_type(a.atttypid, a.atttypmod) AS data_type,
+                   a.attnotnull, a.attidentity,
+                   pg_get_expr(d.adbin, d.adrelid) AS column_default,
+                   pg_get_serial_sequence($3, a.attname) AS sequence
+            FROM pg_attribute a
+            LEFT JOIN pg_attrdef d ON d.adrelid = a.attrelid AND d.adnum = a.attnum
+            WHERE a.attrelid = $1::regclass AND a.attname = $2
+              AND NOT a.attisdropped
+        """,
+            regclass,
+            column_name,
+            regclass,
+        )
+        if column is None:
+            raise ValueError(f"Column {table_name}.{column_name} does not exist")
+        if column["attidentity"]:
+            raise ValueError(
+                f"{table_name}.{column_name} is an identity column; "
+                "online conversion supports serial and plain columns only"
+            )
+
+        blockers = await connection.fetch(
+            """
+            SELECT conname, contype FROM pg_constraint
+            WHERE (contype IN ('c', 'f') AND conrelid = $1::regclass
+                   AND $2::int2 = ANY(conkey))
+               OR (contype = 'f' AND confrelid = $1::regclass
+                   AND $2::int2 = ANY(confkey))
+        """,
+            regclass,
+            column["attnum"],
+        )
+        if blockers:
+            names = ", ".join(row["conname"] for row in blockers)
+            raise ValueError(
+                f"{table_name}.{column_name} is used by foreign key or CHECK "
+                f"constraints ({names}); drop and recreate them around the conversion"
+            )
+
+        index_rows = await connection.fetch(
+            """
+            SELECT ic.relname AS index_name, am.amname AS method,
+                   i.indisunique, i.indnatts,
+                   i.indexprs IS NOT NULL OR i.indpred IS NOT NULL AS is_complex,
+                   c.conname, c.contype
+            FROM pg_index i
+            JOIN pg_class ic ON ic.oid = i.indexrelid
+            JOIN pg_am am ON am.oid = ic.relam
+            LEFT JOIN pg_constraint c
+                   ON c.conindid = i.indexrelid AND c.conrelid = i.indrelid
+            WHERE i.indrelid = $1::regclass AND $2::int2 = ANY(i.indkey::int2[])
+        """,
+            regclass,
+            column["attnum"],
+        )
+        indexes = []
+        for row in index_rows:
+            if row["indnatts"] != 1 or row["is_complex"]:
+                raise ValueError(
+                    f"Index {row['index_name']} on {table_name}.{column_name} is a "
+                    "multi-column, expression or partial index; rebuild it manually"
+                )
+            indexes.append(
+                _ColumnIndex(
+                    name=row["index_name"],
+                    method=row["method"],
+                    is_unique=row["indisunique"],
+                    constraint_name=row["conname"],
+                    constraint_type=row["contype"],
+                )
+            )
+
+        return _ColumnInfo(
+            data_type=column["data_type"],
+            not_null=column["attnotnull"],
+            default=column["column_default"],
+            sequence=column["sequence"],
+            indexes=indexes,
+        )
+
+    async def _install_shadow_column(
+        self,
+        connection: asyncpg.Connection,
+        table_name: str,
+        column_name: str,
+        shadow: str,
+        new_type: str,
+        expression: str,
+    ) -> None:
+        """Add the shadow column and the trigger that keeps it in sync."""
+        function = self._sync_function_name(table_name, column_name)
+        trigger_expression = expression.replace(
+            f'"{column_name}"', f'NEW."{column_name}"'
+        )
+
+        await connection.execute(
+            f'ALTER TABLE "{table_name}" ADD COLUMN IF NOT EXISTS "{shadow}" {new_type}'
+        )
+        await connection.execute(
+            f"""
+            CREATE OR REPLACE FUNCTION "{function}"() RETURNS trigger AS $$
+            BEGIN
+                NEW."{shadow}" := {trigger_expression};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+        """
+        )
+        await connection.execute(
+            f'DROP TRIGGER IF EXISTS "{function}" ON "{table_name}"'
+        )
+        await connection.execute(
+            f"""
+            CREATE TRIGGER "{function}"
+            BEFORE INSERT OR UPDATE ON "{table_name}"
+            FOR EACH ROW EXECUTE FUNCTION "{function}"()
+        """
+        )
+
+    async def _backfill(
+        self,
+        connection: asyncpg.Connection,
+        store: BackfillCheckpointStore,
+        checkpoint: BackfillCheckpoint,
+        controller: AdaptiveBackfillController,
+        table_name: str,
+        column_name: str,
+        shadow: str,
+        key_column: str,
+        expression: str,
+        progress: OnlineConversionProgress,
+        on_batch: Callable[[], None],
+    ) -> bool:
+        """Copy converted values into the shadow column in key order.
+
+        Returns False if the backfill was paused.
+        """
+        key_type = await connection.fetchval(
+            """SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+               WHERE attrelid = $1::regclass AND attname = $2""",
+            f'"{table_name}"',
+            key_column,
+        )
+        if key_type is None:
+            raise ValueError(f"Key column {key_column!r} not found on {table_name}")
+
+        source = expression.replace(
+            f'"{column_name}"', f'"{table_name}"."{column_name}"'
+        )
+        batch_sql = f"""
+            WITH batch AS (
+                SELECT "{key_column}" FROM "{table_name}"
+                {{range}}
+                ORDER BY "{key_column}"
+                LIMIT $1
+            ),
+            updated AS (
+                UPDATE "{table_name}"
+                SET "{shadow}" = {source}
+                FROM batch
+                WHERE "{table_name}"."{key_column}" = batch."{key_column}"
+                  AND "{table_name}"."{column_name}" IS NOT NULL
+                  AND "{table_name}"."{shadow}" IS NULL
+                RETURNING 1
+            )
+            SELECT (SELECT MAX("{key_column}")::text FROM batch) AS last_key,
+                   (SELECT COUNT(*) FROM batch) AS scanned,
+                   (SELECT COUNT(*) FROM updated) AS updated
+        """
+        first_batch_sql = batch_sql.format(range="")
+        next_batch_sql = batch_sql.format(
+            range=f'WHERE "{key_column}" > $2::text::{key_type}'
+        )
+        check_replication = True
+
+        while True:
+            if (table_name, column_name) in self._pause_requests:
+                self._pause_requests.discard((table_name, column_name))
+                checkpoint.status = "paused"
+                checkpoint.batch_size = controller.batch_size
+                await store.save(checkpoint)
+                logger.info(
+                    f"Online conversion of {table_name}.{column_name} paused "
+                    f"at key {checkpoint.last_key!r}"
+                )
+                return False
+
+            async def run_batch():
+                if checkpoint.last_key is None:
+                    row = await connection.fetchrow(
+                        first_batch_sql, controller.batch_size
+                    )
+                else:
+                    row = await connection.fetchrow(
+                        next_batch_sql, controller.batch_size, checkpoint.last_key
+                    )
+                if row["scanned"]:
+                    checkpoint.last_key = row["last_key"]
+                    checkpoint.rows_processed += row["scanned"]
+                    checkpoint.batch_size = controller.batch_size
+                    await store.save(checkpoint)
+                return row
+
+            started = time.perf_counter()
+            row = await self._locked_transaction(connection, controller, run_batch)
+            latency = time.perf_counter() - started
+            if not row["scanned"]:
+                return True
+
+            progress.rows_processed = checkpoint.rows_processed
+            progress.last_key = checkpoint.last_key
+            on_batch()
+
+            lag = None
+            if check_replication:
+                lag = await get_replication_lag(connection)
+                check_replication = lag is not None
+            controller.record_batch(row["updated"], latency, lag)
+
+            if controller.sleep_seconds > 0:
+                controller.pause_taken()
+                await asyncio.sleep(controller.sleep_seconds)
+
+    async def _validate_shadow_column(
+        self,
+        connection: asyncpg.Connection,
+        table_name: str,
+        column_name: str,
+        shadow: str,
+        info: _ColumnInfo,
+    ) -> None:
+        """Check every value converted; enforce NOT NULL without a long lock.
+
+        The CHECK constraint is added NOT VALID and validated under a SHARE
+        UPDATE EXCLUSIVE lock, which lets the swap's SET NOT NULL skip its
+        own table scan.
+        """
+        lost = await connection.fetchval(
+            f"""
+            SELECT COUNT(*) FROM "{table_name}"
+            WHERE "{column_name}" IS NOT NULL AND "{shadow}" IS NULL
+        """
+        )
+        if lost:
+            raise ValueError(
+                f"{lost} values of {table_name}.{column_name} did not convert; "
+                "fix the data or the conversion expression and resume"
+            )
+
+        if info.not_null:
+            check = _shadow_identifier(shadow, "_not_null")
+            await connection.execute(
+                f'ALTER TABLE "{table_name}" DROP CONSTRAINT IF EXISTS "{check}"'
+            )
+            await connection.execute(
+                f'ALTER TABLE "{table_name}" ADD CONSTRAINT "{check}" '
+                f'CHECK ("{shadow}" IS NOT NULL) NOT VALID'
+            )
+            await connection.execute(
+                f'ALTER TABLE "{table_name}" VALIDATE CONSTRAINT "{check}"'
+            )
+
+    async def _build_shadow_index(
+        self,
+        connection: asyncpg.Connection,
+        table_name: str,
+        shadow: str,
+        index: _ColumnIndex,
+    ) -> None:
+        """Build one replacement index concurrently (must run outside a transaction)."""
+        valid = await connection.fetchval(
+            """SELECT i.indisvalid FROM pg_index i
+               WHERE i.indexrelid = to_regclass($1)""",
+            f'"{index.shadow_name}"',
+        )
+        if valid is False:
+            # Left behind by an interrupted concurrent build
+            await connection.execute(
+                f'DROP INDEX CONCURRENTLY IF EXISTS "{index.shadow_name}"'
+            )
+        unique = "UNIQUE " if index.is_unique else ""
+        await connection.execute(
+            f'CREATE {unique}INDEX CONCURRENTLY IF NOT EXISTS "{index.shadow_name}" '
+            f'ON "{table_name}" USING {index.method} ("{shadow}")'
+        )
+
+    async def _swap_columns(
+        self,
+        connection: asyncpg.Connection,
+        table_name: str,
+        column_name: str,
+        shadow: str,
+        info: _ColumnInfo,
+        new_type: str,
+    ) -> None:
+        """Move everything over to the shadow column (runs in one transaction)."""
+        table = f'"{table_name}"'
+        function = self._sync_function_name(table_name, column_name)
+
+        await connection.execute(f'DROP TRIGGER IF EXISTS "{function}" ON {table}')
+        if info.sequence:
+            # Otherwise the sequence is dropped along with the old column
+            await connection.execute(
+                f'ALTER SEQUENCE {info.sequence} OWNED BY {table}."{shadow}"'
+            )
+            if new_type.strip().lower() in SEQUENCE_TYPES:
+                # An integer sequence would still stop at 2^31 - 1 after widening
+                await connection.execute(
+                    f"ALTER SEQUENCE {info.sequence} AS {new_type}"
+                )
+        if info.default is not None:
+            await connection.execute(
+                f'ALTER TABLE {table} ALTER COLUMN "{shadow}" SET DEFAULT {info.default}'
+            )
+        if info.not_null:
+            check = _shadow_identifier(shadow, "_not_null")
+            await connection.execute(
+                f'ALTER TABLE {table} ALTER COLUMN "{shadow}" SET NOT NULL'
+            )
+            await connection.execute(f'ALTER TABLE {table} DROP CONSTRAINT "{check}"')
+
+        for index in info.indexes:
+            if index.constraint_name:
+                await connection.execute(
+                    f'ALTER TABLE {table} DROP CONSTRAINT "{index.constraint_name}"'
+                )
+        await connection.execute(f'ALTER TABLE {table} DROP COLUMN "{column_name}"')
+        await connection.execute(
+            f'ALTER TABLE {table} RENAME COLUMN "{shadow}" TO "{column_name}"'
+        )
+
+        for index in info.indexes:
+            if index.constraint_type in ("p", "u"):
+                kind = "PRIMARY KEY" if index.constraint_type == "p" else "UNIQUE"
+                await connection.execute(
+                    f'ALTER TABLE {table} ADD CONSTRAINT "{index.constraint_name}" '
+                    f'{kind} USING INDEX "{index.shadow_name}"'
+                )
+            else:
+                await connection.execute(
+                    f'ALTER INDEX "{index.shadow_name}" RENAME TO "{index.name}"'
+                )
+        await connection.execute(f'DROP FUNCTION IF EXISTS "{function}"()')
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    async def _locked_transaction(
+        self,
+        connection: asyncpg.Connection,
+        controller: AdaptiveBackfillController,
+        work: Callable[[], Awaitable[Any]],
+        lock_table: Optional[str] = None,
+    ) -> Any:
+        """Run ``work`` in a transaction bounded by the budget's lock wait.
+
+        Lock timeouts back the controller off and retry, up to the budget's
+        ``max_lock_retries`` consecutive timeouts.
+        """
+        lock_timeout_ms = int(self.budget.max_lock_wait * 1000)
+        while True:
+            try:
+                async with connection.transaction():
+                    await connection.execute(
+                        f"SET LOCAL lock_timeout = {lock_timeout_ms}"
+                    )
+                    if lock_table:
+                        await connection.execute(
+                            f'LOCK TABLE "{lock_table}" IN ACCESS EXCLUSIVE MODE'
+                        )
+                    return await work()
+            except asyncpg.exceptions.LockNotAvailableError:
+                if not controller.record_lock_timeout():
+                    raise
+                logger.warning(
+                    f"Timed out waiting for a lock; retrying with batch size "
+                    f"{controller.batch_size} after {controller.sleep_seconds:.1f}s"
+                )
+                controller.pause_taken()
+                await asyncio.sleep(controller.sleep_seconds)
+
+    async def _estimate_rows(
+        self, connection: asyncpg.Connection, table_name: str
+    ) -> int:
+        """Planner row estimate (no table scan)."""
+        estimate = await connection.fetchval(
+            "SELECT reltuples::bigint FROM pg_class WHERE oid = $1::regclass",
+            f'"{table_name}"',
+        )
+        return max(int(estimate or 0), 0)
+
+    @staticmethod
+    def _sync_function_name(table_name: str, column_name: str) -> str:
+        return _shadow_identifier(f"{table_name}_{column_name}", "_shadow_sync")
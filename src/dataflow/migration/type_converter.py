@@ -9,6 +9,7 @@ Key Features:
 - Type compatibility matrix for decision making
 - Query impact analysis for existing queries
 - Safe conversion strategies with rollback capability
+- Online shadow-column conversion for large tables (no ACCESS EXCLUSIVE rewrite)
 - Integration with DataFlow's PostgreSQL execution model
 """
 
@@ -20,15 +21,24 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
+import asyncpg
 from kailash.runtime import AsyncLocalRuntime
 from kailash.runtime.local import LocalRuntime
 from kailash.workflow.builder import WorkflowBuilder
 
+from ..migrations.adaptive_backfill import BackfillBudget
 from .data_validation_engine import (
     DataValidationEngine,
     ValidationResult,
     ValidationSeverity,
 )
+from .online_type_converter import (
+    OnlineConversionPhase,
+    OnlineConversionResult,
+    OnlineConversionStatus,
+    OnlineTypeConverter,
+    ProgressCallback,
+)
 from .orchestration_engine import (
     Migration,
     MigrationOperation,
@@ -39,6 +49,16 @@ from .orchestration_engine import (
 
 logger = logging.getLogger(__name__)
 
+# Online conversion phase -> ConversionStep.operation of the ONLINE_SHADOW plan
+_ONLINE_PHASE_STEPS = {
+    OnlineConversionPhase.PREPARE: "add_shadow_column",
+    OnlineConversionPhase.BACKFILL: "backfill_shadow_column",
+    OnlineConversionPhase.VALIDATE: "validate_shadow_column",
+    OnlineConversionPhase.BUILD_INDEXES: "build_shadow_indexes",
+    OnlineConversionPhase.SWAP: "swap_columns",
+    OnlineConversionPhase.COMPLETE: "swap_columns",
+}
+
 
 class ConversionStrategy(Enum):
     """Strategies for type conversion."""
@@ -47,6 +67,7 @@ class ConversionStrategy(Enum):
     MULTI_STEP = "multi_step"  # Multiple operations with temp columns
     REBUILD_TABLE = "rebuild_table"  # Create new table and migrate data
     MANUAL_INTERVENTION = "manual"  # Requires manual data cleanup
+    ONLINE_SHADOW = "online_shadow"  # Trigger-synced shadow column, batched backfill
 
 
 class ConversionRisk(Enum):
@@ -109,6 +130,7 @@ class ConversionResult:
     execution_time_ms: int
     error_message: Optional[str] = None
     rollback_performed: bool = False
+    online_result: Optional[OnlineConversionResult] = None
 
 
 @dataclass
@@ -704,6 +726,7 @@ class SafeTypeConverter:
         self.data_validator = DataValidationEngine(connection_string)
         self.compatibility_matrix = TypeCompatibilityMatrix()
         self.query_analyzer = QueryImpactAnalyzer(connection_string)
+        self.online_converter = OnlineTypeConverter()
 
         # ✅ FIX: Detect async context and use appropriate runtime
         try:
@@ -723,7 +746,16 @@ class SafeTypeConverter:
         logger.info("Safe Type Converter initialized")
 
     async def convert_column_type_safe(
-        self, table_name: str, column_name: str, old_type: str, new_type: str
+        self,
+        table_name: str,
+        column_name: str,
+        old_type: str,
+        new_type: str,
+        online: bool = False,
+        key_column: str = "id",
+        backfill_budget: Optional[BackfillBudget] = None,
+        connection: Optional[asyncpg.Connection] = None,
+        progress_callback: Optional[ProgressCallback] = None,
     ) -> ConversionResult:
         """
         Safely convert a column type with comprehensive validation and rollback.
@@ -733,6 +765,14 @@ class SafeTypeConverter:
             column_name: Name of the column
             old_type: Current column type
             new_type: Target column type
+            online: Use the ONLINE_SHADOW strategy (PostgreSQL) instead of
+                ALTER COLUMN TYPE, keeping the table writable throughout;
+                re-running a paused or failed online conversion resumes it
+            key_column: Unique, indexed column the online backfill walks
+            backfill_budget: Throttling budget for the online backfill
+            connection: asyncpg connection for the online strategy (one is
+                opened from the connection string if omitted)
+            progress_callback: Receives OnlineConversionProgress updates
 
         Returns:
             ConversionResult with execution details
@@ -769,7 +809,15 @@ class SafeTypeConverter:
                 )
 
             # Step 3: Execute using orchestration engine if available
-            if self.orchestration_engine:
+            if online:
+                plan.strategy = ConversionStrategy.ONLINE_SHADOW
+                plan.steps = self._generate_online_conversion_steps(
+                    table_name, column_name, new_type
+                )
+                result = await self._execute_online(
+                    plan, key_column, backfill_budget, connection, progress_callback
+                )
+            elif self.orchestration_engine:
                 result = await self._execute_with_orchestration(plan)
             else:
                 result = self._execute_direct(plan)
@@ -962,6 +1010,50 @@ class SafeTypeConverter:
 
         return steps
 
+    def _generate_online_conversion_steps(
+        self, table_name: str, column_name: str, new_type: str
+    ) -> List[ConversionStep]:
+        """Describe the phases of an ONLINE_SHADOW conversion.
+
+        The steps are executed by OnlineTypeConverter; the SQL shown is the
+        statement that does the main work of each phase.
+        """
+        shadow = f"{column_name}__new"
+        return [
+            ConversionStep(
+                operation="add_shadow_column",
+                sql_template=f'ALTER TABLE "{table_name}" ADD COLUMN IF NOT EXISTS "{shadow}" {new_type}',
+                risk_level=RiskLevel.LOW,
+                rollback_sql=f'ALTER TABLE "{table_name}" DROP COLUMN IF EXISTS "{shadow}"',
+                description="Add shadow column and sync trigger",
+            ),
+            ConversionStep(
+                operation="backfill_shadow_column",
+                sql_template=f'UPDATE "{table_name}" SET "{shadow}" = ... /* key-range batches */',
+                risk_level=RiskLevel.LOW,
+                validation_query=f'SELECT COUNT(*) FROM "{table_name}" WHERE "{shadow}" IS NULL AND "{column_name}" IS NOT NULL',
+                description="Backfill shadow column in throttled batches",
+            ),
+            ConversionStep(
+                operation="validate_shadow_column",
+                sql_template=f'ALTER TABLE "{table_name}" VALIDATE CONSTRAINT "{shadow}_not_null"',
+                risk_level=RiskLevel.LOW,
+                description="Verify converted values and NOT NULL",
+            ),
+            ConversionStep(
+                operation="build_shadow_indexes",
+                sql_template=f'CREATE INDEX CONCURRENTLY ... ON "{table_name}" ("{shadow}")',
+                risk_level=RiskLevel.LOW,
+                description="Rebuild the column's indexes concurrently",
+            ),
+            ConversionStep(
+                operation="swap_columns",
+                sql_template=f'ALTER TABLE "{table_name}" RENAME COLUMN "{shadow}" TO "{column_name}"',
+                risk_level=RiskLevel.MEDIUM,
+                description="Swap shadow column in (short transaction)",
+            ),
+        ]
+
     def _get_conversion_expression(
         self, column_name: str, old_type: str, new_type: str
     ) -> str:
@@ -1056,6 +1148,71 @@ class SafeTypeConverter:
             error_message=migration_result.error_message,
         )
 
+    def pause_online_conversion(self, table_name: str, column_name: str) -> None:
+        """Pause a running online conversion after its current backfill batch."""
+        self.online_converter.pause(table_name, column_name)
+
+    async def _execute_online(
+        self,
+        plan: ConversionPlan,
+        key_column: str,
+        backfill_budget: Optional[BackfillBudget],
+        connection: Optional[asyncpg.Connection],
+        progress_callback: Optional[ProgressCallback],
+    ) -> ConversionResult:
+        """Execute conversion plan with the shadow-column strategy."""
+
+        if self.database_type != "postgresql":
+            return ConversionResult(
+                success=False,
+                plan=plan,
+                executed_steps=0,
+                execution_time_ms=0,
+                error_message="Online type conversion requires PostgreSQL",
+            )
+
+        if backfill_budget is not None:
+            self.online_converter.budget = backfill_budget
+
+        owns_connection = connection is None
+        if owns_connection:
+            connection = await asyncpg.connect(self.connection_string)
+        try:
+            online_result = await self.online_converter.convert(
+                connection,
+                plan.table_name,
+                plan.column_name,
+                plan.new_type,
+                key_column=key_column,
+                conversion_expression=self._get_conversion_expression(
+                    plan.column_name, plan.old_type, plan.new_type
+                ),
+                progress_callback=progress_callback,
+            )
+        finally:
+            if owns_connection:
+                await connection.close()
+
+        phase_order = [step.operation for step in plan.steps]
+        executed_steps = (
+            len(phase_order)
+            if online_result.success
+            else phase_order.index(_ONLINE_PHASE_STEPS[online_result.phase])
+        )
+        return ConversionResult(
+            success=online_result.success,
+            plan=plan,
+            executed_steps=executed_steps,
+            execution_time_ms=0,
+            error_message=online_result.error_message
+            or (
+                "Online conversion paused"
+                if online_result.status == OnlineConversionStatus.PAUSED
+                else None
+            ),
+            online_result=online_result,
+        )
+
     def _execute_direct(self, plan: ConversionPlan) -> ConversionResult:
         """Execute conversion plan directly without orchestration engine."""
 
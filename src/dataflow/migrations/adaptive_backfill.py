@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Adaptive Backfill Control for DataFlow Migrations
+
+Throttles long-running backfills (e.g. populating a new NOT NULL column on a
+very large table) so they stay within latency, lock-wait and replication-lag
+budgets on a busy primary, and checkpoints progress so a backfill can be
+paused and resumed.
+
+The controller works in AIMD fashion: batches grow gradually while every
+budget is met and shrink (with a longer pause between batches) as soon as
+one is exceeded.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLE = "dataflow_backfill_checkpoints"
+
+
+@dataclass
+class BackfillBudget:
+    """Resource budget for a throttled backfill."""
+
+    target_batch_latency: float = 0.5  # seconds per batch
+    max_lock_wait: float = 2.0  # seconds; used as the batch lock_timeout
+    max_replication_lag: float = 10.0  # seconds of replay lag on any standby
+    min_batch_size: int = 500
+    max_batch_size: int = 50000
+    min_sleep: float = 0.0  # seconds between batches
+    max_sleep: float = 30.0
+    max_lock_retries: int = 5  # consecutive lock timeouts before giving up
+    growth_factor: float = 1.25
+
+    def __post_init__(self):
+        if self.min_batch_size <= 0 or self.max_batch_size < self.min_batch_size:
+            raise ValueError("Invalid batch size bounds for backfill budget")
+        if self.target_batch_latency <= 0:
+            raise ValueError("target_batch_latency must be positive")
+
+
+@dataclass
+class BackfillCheckpoint:
+    """Persisted progress of a backfill."""
+
+    table_name: str
+    column_name: str
+    last_key: Optional[str] = None
+    rows_processed: int = 0
+    batch_size: Optional[int] = None
+    status: str = "running"
+    updated_at: Optional[datetime] = None
+
+
+class AdaptiveBackfillController:
+    """
+    Adjusts backfill batch size and inter-batch sleep from observed load.
+
+    Feed it the outcome of every batch with record_batch() or
+    record_lock_timeout(); read batch_size and sleep_seconds for the next one.
+    """
+
+    def __init__(self, budget: BackfillBudget, initial_batch_size: int):
+        self.budget = budget
+        self.batch_size = self._clamp_batch(initial_batch_size)
+        self.sleep_seconds = budget.min_sleep
+        self.consecutive_lock_timeouts = 0
+
+        self.stats: Dict[str, Any] = {
+            "batches": 0,
+            "rows": 0,
+            "lock_timeouts": 0,
+            "throttled_batches": 0,
+            "max_batch_latency": 0.0,
+            "max_replication_lag": 0.0,
+            "total_sleep": 0.0,
+        }
+
+    def _clamp_batch(self, size: float) -> int:
+        return int(
+            max(self.budget.min_batch_size, min(self.budget.max_batch_size, size))
+        )
+
+    def _clamp_sleep(self, seconds: float) -> float:
+        return max(self.budget.min_sleep, min(self.budget.max_sleep, seconds))
+
+    def _back_off(self, factor: float) -> None:
+        """Shrink the batch by ``factor`` and lengthen the pause."""
+        self.batch_size = self._clamp_batch(self.batch_size * factor)
+        self.sleep_seconds = self._clamp_sleep(max(self.sleep_seconds * 2, 0.1))
+        self.stats["throttled_batches"] += 1
+
+    def record_batch(
+        self, rows: int, latency: float, replication_lag: Optional[float] = None
+    ) -> None:
+        """Adapt to a completed batch.
+
+        Args:
+            rows: Rows updated by the batch
+            latency: Seconds the batch transaction took
+            replication_lag: Worst standby replay lag in seconds, if known
+        """
+        self.consecutive_lock_timeouts = 0
+        self.stats["batches"] += 1
+        self.stats["rows"] += rows
+        self.stats["max_batch_latency"] = max(self.stats["max_batch_latency"], latency)
+        if replication_lag is not None:
+            self.stats["max_replication_lag"] = max(
+                self.stats["max_replication_lag"], replication_lag
+            )
+
+        target = self.budget.target_batch_latency
+        if (
+            replication_lag is not None
+            and replication_lag > self.budget.max_replication_lag
+        ):
+            # Standbys are falling behind: halve and wait at least the excess lag
+            self._back_off(0.5)
+            self.sleep_seconds = self._clamp_sleep(
+                max(
+                    self.sleep_seconds,
+                    replication_lag - self.budget.max_replication_lag,
+                )
+            )
+        elif latency > target:
+            # Scale towards the target latency, at most halving per batch
+            self._back_off(max(0.5, target / latency))
+        else:
+            growth = self.budget.growth_factor
+            if latency > 0:
+                growth = min(growth, target / latency)
+            self.batch_size = self._clamp_batch(self.batch_size * max(1.0, growth))
+            self.sleep_seconds = self._clamp_sleep(self.sleep_seconds / 2)
+
+    def record_lock_timeout(self) -> bool:
+        """Adapt to a batch that gave up waiting for a lock.
+
+        Returns:
+            True if the batch should be retried, False once the budget's
+            ``max_lock_retries`` consecutive timeouts have been reached
+        """
+        self.consecutive_lock_timeouts += 1
+        self.stats["lock_timeouts"] += 1
+        self._back_off(0.5)
+        return self.consecutive_lock_timeouts <= self.budget.max_lock_retries
+
+    def pause_taken(self) -> None:
+        """Account for one inter-batch sleep."""
+        self.stats["total_sleep"] += self.sleep_seconds
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Controller statistics for execution results."""
+        return {
+            **self.stats,
+            "batch_size": self.batch_size,
+            "sleep_seconds": self.sleep_seconds,
+        }
+
+
+async def get_replication_lag(connection: asyncpg.Connection) -> Optional[float]:
+    """Worst replay lag of connected standbys in seconds.
+
+    Returns None when pg_stat_replication cannot be read.
+    """
+    try:
+        lag = await connection.fetchval(
+            """SELECT COALESCE(MAX(EXTRACT(EPOCH FROM replay_lag)), 0)
+               FROM pg_stat_replication"""
+        )
+        return float(lag or 0.0)
+    except Exception as e:
+        logger.debug(f"Replication lag unavailable: {e}")
+        return None
+
+
+class BackfillCheckpointStore:
+    """
+    Stores backfill checkpoints in the target database.
+
+    Checkpoints are written in the same transaction as the batch they
+    describe, so a resumed backfill never skips or repeats committed work.
+    """
+
+    def __init__(self, connection: asyncpg.Connection):
+        self.connection = connection
+
+    async def ensure_table(self) -> None:
+        """Create the checkpoint table if needed."""
+        await self.connection.execute(
+            f"""
+            CREATE TABLE IF NOT EXISTS {CHECKPOINT_TABLE} (
+                table_name VARCHAR(255) NOT NULL,
+                column_name VARCHAR(255) NOT NULL,
+                last_key TEXT,
+                rows_processed BIGINT NOT NULL DEFAULT 0,
+                batch_size INTEGER,
+                status VARCHAR(20) NOT NULL DEFAULT 'running',
+                updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (table_name, column_name)
+            )
+        """
+        )
+
+    async def load(
+        self, table_name: str, column_name: str
+    ) -> Optional[BackfillCheckpoint]:
+        """Load the checkpoint of a backfill, if one exists."""
+        row = await self.connection.fetchrow(
+            f"""
+            SELECT last_key, rows_processed, batch_size, status, updated_at
+            FROM {CHECKPOINT_TABLE}
+            WHERE table_name = $1 AND column_name = $2
+        """,
+            table_name,
+            column_name,
+        )
+        if row is None:
+            return None
+        return BackfillCheckpoint(
+            table_name=table_name,
+            column_name=column_name,
+            last_key=row["last_key"],
+            rows_processed=row["rows_processed"],
+            batch_size=row["batch_size"],
+            status=row["status"],
+            updated_at=row["updated_at"],
+        )
+
+    async def save(self, checkpoint: BackfillCheckpoint) -> None:
+        """Insert or update a checkpoint."""
+        await self.connection.execute(
+            f"""
+            INSERT INTO {CHECKPOINT_TABLE}
+                (table_name, column_name, last_key, rows_processed,
+                 batch_size, status, updated_at)
+            VALUES ($1, $2, $3, $4, $5, $6, CURRENT_TIMESTAMP)
+            ON CONFLICT (table_name, column_name) DO UPDATE SET
+                last_key = EXCLUDED.last_key,
+                rows_processed = EXCLUDED.rows_processed,
+                batch_size = EXCLUDED.batch_size,
+                status = EXCLUDED.status,
+                updated_at = CURRENT_TIMESTAMP
+        """,
+            checkpoint.table_name,
+            checkpoint.column_name,
+            checkpoint.last_key,
+            checkpoint.rows_processed,
+            checkpoint.batch_size,
+            checkpoint.status,
+        )
+
+    async def delete(self, table_name: str, column_name: str) -> None:
+        """Remove the checkpoint of a finished backfill."""
+        await self.connection.execute(
+            f"DELETE FROM {CHECKPOINT_TABLE} WHERE table_name = $1 AND column_name = $2",
+            table_name,
+            column_name,
+        )
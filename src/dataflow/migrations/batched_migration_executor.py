@@ -10,15 +10,19 @@ Key Features:
 - Maintains backward compatibility with AutoMigrationSystem
 - Target performance: <10s for typical operations
 - Respects operation dependencies and safety constraints
+- Parallel batches run on separate connections drawn from a bounded pool
+- Per-statement lock_timeout/statement_timeout and timing metrics
 
 Alpha Release: PostgreSQL-optimized implementation.
 """
 
 import asyncio
 import logging
+import re
 import time
 from collections import defaultdict
-from dataclasses import dataclass
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set, Tuple
 
@@ -26,6 +30,45 @@ from .auto_migration_system import MigrationOperation, MigrationType
 
 logger = logging.getLogger(__name__)
 
+# Statements that PostgreSQL refuses to run inside a transaction block
+_AUTOCOMMIT_PATTERN = re.compile(r"\bCONCURRENTLY\b", re.IGNORECASE)
+
+_IDENTIFIER = r'((?:"[^"]+"|\w+)(?:\.(?:"[^"]+"|\w+))?)'
+
+# (pattern, operation type) used to recover operations from SQL batches
+_STATEMENT_PATTERNS = [
+    (
+        re.compile(
+            rf"^\s*CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?{_IDENTIFIER}",
+            re.IGNORECASE,
+        ),
+        MigrationType.CREATE_TABLE,
+    ),
+    (
+        re.compile(
+            r"^\s*CREATE\s+(?:UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?"
+            r'(?:IF\s+NOT\s+EXISTS\s+)?(?:(?:"[^"]+"|\w+)\s+)?ON\s+(?:ONLY\s+)?'
+            + _IDENTIFIER,
+            re.IGNORECASE,
+        ),
+        MigrationType.ADD_INDEX,
+    ),
+    (
+        re.compile(
+            rf"^\s*ALTER\s+TABLE\s+(?:ONLY\s+)?{_IDENTIFIER}\s+ADD\s+CONSTRAINT\b",
+            re.IGNORECASE,
+        ),
+        MigrationType.ADD_CONSTRAINT,
+    ),
+]
+
+_REFERENCES_PATTERN = re.compile(rf"\bREFERENCES\s+{_IDENTIFIER}", re.IGNORECASE)
+
+
+def _normalize_table(name: str) -> str:
+    """Strip quotes and schema from a table identifier."""
+    return name.replace('"', "").split(".")[-1].lower()
+
 
 class AsyncMockContextManager:
     """Helper class for mocking async context managers in tests."""
@@ -49,6 +92,18 @@ class BatchExecutionStrategy(Enum):
     HYBRID = "hybrid"
 
 
+@dataclass
+class StatementTiming:
+    """Execution time of a single DDL statement."""
+
+    sql: str
+    batch_index: int
+    duration: float
+    parallel: bool
+    success: bool
+    error: Optional[str] = None
+
+
 @dataclass
 class BatchMetrics:
     """Metrics for batch execution performance."""
@@ -59,6 +114,13 @@ class BatchMetrics:
     strategy_used: BatchExecutionStrategy
     parallel_batches: int = 0
     sequential_batches: int = 0
+    statement_timings: List[StatementTiming] = field(default_factory=list)
+
+    def slowest_statements(self, limit: int = 5) -> List[StatementTiming]:
+        """Statements that took longest, slowest first."""
+        return sorted(self.statement_timings, key=lambda t: t.duration, reverse=True)[
+            :limit
+        ]
 
 
 class BatchedMigrationExecutor:
@@ -70,22 +132,44 @@ class BatchedMigrationExecutor:
     data integrity and operation dependencies.
     """
 
-    def __init__(self, connection, connection_manager=None):
+    def __init__(
+        self,
+        connection,
+        connection_manager=None,
+        pool=None,
+        max_parallel: int = 4,
+        lock_timeout: Optional[float] = None,
+        statement_timeout: Optional[float] = None,
+    ):
         """
         Initialize BatchedMigrationExecutor.
 
         Args:
             connection: Database connection for executing operations (fallback)
             connection_manager: Optional MigrationConnectionManager for optimized connection handling
+            pool: Optional asyncpg-style pool (``async with pool.acquire()``);
+                parallel-safe batches only run concurrently when a pool is given,
+                since statements on one connection always serialize
+            max_parallel: Maximum statements of a batch running at once
+            lock_timeout: Seconds a statement may wait for a lock (PostgreSQL)
+            statement_timeout: Seconds a statement may run (PostgreSQL)
         """
         self.connection = connection
         self.connection_manager = connection_manager
+        self.pool = pool
         self.metrics: Optional[BatchMetrics] = None
 
         # Configuration for batching behavior
         self.max_batch_size = 50  # Maximum operations per batch
         self.parallel_threshold = 3  # Minimum operations for parallel consideration
         self.timeout_per_operation = 30  # Seconds per operation timeout
+        self.max_parallel = max(1, max_parallel)
+        self.lock_timeout = lock_timeout
+        self.statement_timeout = statement_timeout
+
+        # Per-statement timings of the current execution
+        self._statement_timings: List[StatementTiming] = []
+        self._batch_index = 0
 
         # Operation compatibility matrix
         self._init_compatibility_matrix()
@@ -101,6 +185,19 @@ class BatchedMigrationExecutor:
         if self.connection_manager and connection != self.connection:
             self.connection_manager.return_migration_connection(connection)
 
+    @asynccontextmanager
+    async def _acquire_connection(self):
+        """Check out a dedicated connection from the pool for one statement."""
+        if self.pool is not None:
+            async with self.pool.acquire() as connection:
+                yield connection
+        else:
+            connection = self._get_connection()
+            try:
+                yield connection
+            finally:
+                self._return_connection(connection)
+
     def _init_compatibility_matrix(self):
         """Initialize operation type compatibility matrix for batching."""
         # Define which operation types can be safely batched together
@@ -424,9 +521,48 @@ class BatchedMigrationExecutor:
             # Multiple operations on same table - not safe for parallel
             return False
 
+        # A foreign key to another table of the batch needs that table first
+        batch_tables = {_normalize_table(table) for table in tables}
+        for op in operations:
+            own_table = _normalize_table(op.table_name)
+            for referenced in _REFERENCES_PATTERN.findall(op.sql_up or ""):
+                referenced = _normalize_table(referenced)
+                if referenced != own_table and referenced in batch_tables:
+                    return False
+
         # All checks passed
         return True
 
+    def _parse_statement(self, sql: str) -> Optional[MigrationOperation]:
+        """Recover the operation type and table of a SQL statement, if known."""
+        for pattern, operation_type in _STATEMENT_PATTERNS:
+            match = pattern.match(sql)
+            if match:
+                return MigrationOperation(
+                    operation_type=operation_type,
+                    table_name=_normalize_table(match.group(1)),
+                    description=sql[:100],
+                    sql_up=sql,
+                    sql_down="",
+                )
+        return None
+
+    def _can_run_in_parallel(self, sql_statements: List[str]) -> bool:
+        """Check whether a SQL batch may run concurrently on pooled connections."""
+        if self.pool is None:
+            return False
+
+        operations = []
+        for sql in sql_statements:
+            if not sql.strip():
+                continue
+            operation = self._parse_statement(sql)
+            if operation is None:
+                return False
+            operations.append(operation)
+
+        return self._is_safe_for_parallel(operations)
+
     def _get_batch_execution_strategy(
         self, operations: List[MigrationOperation]
     ) -> str:
@@ -473,6 +609,7 @@ class BatchedMigrationExecutor:
         total_operations = sum(len(batch) for batch in batches)
         parallel_batches = 0
         sequential_batches = 0
+        self._statement_timings = []
 
         logger.info(
             f"Executing {len(batches)} batches with {total_operations} operations"
@@ -484,10 +621,13 @@ class BatchedMigrationExecutor:
                     f"Executing batch {i+1}/{len(batches)} with {len(batch)} operations"
                 )
 
-                # Determine execution strategy for this batch
-                # For now, we'll execute sequentially within each batch
-                # but batches themselves are executed sequentially
-                strategy = "sequential"  # Safe default
+                # Batches run one after another; statements of a batch run
+                # concurrently only when they are independent and pooled
+                self._batch_index = i
+                if self._can_run_in_parallel(batch):
+                    strategy = "parallel"
+                else:
+                    strategy = "sequential"
 
                 if strategy == "parallel" and len(batch) > 1:
                     # Execute operations in parallel
@@ -508,14 +648,22 @@ class BatchedMigrationExecutor:
 
         execution_time = time.time() - start_time
 
+        if parallel_batches and sequential_batches:
+            strategy_used = BatchExecutionStrategy.HYBRID
+        elif parallel_batches:
+            strategy_used = BatchExecutionStrategy.PARALLEL
+        else:
+            strategy_used = BatchExecutionStrategy.SEQUENTIAL
+
         # Store metrics
         self.metrics = BatchMetrics(
             total_operations=total_operations,
             total_batches=len(batches),
             execution_time=execution_time,
-            strategy_used=BatchExecutionStrategy.SEQUENTIAL,  # Default for now
+            strategy_used=strategy_used,
             parallel_batches=parallel_batches,
             sequential_batches=sequential_batches,
+            statement_timings=list(self._statement_timings),
         )
 
         logger.info(f"All batches executed successfully in {execution_time:.2f}s")
@@ -535,6 +683,7 @@ class BatchedMigrationExecutor:
                 # For mocked connections, just verify the calls are made
                 for sql in sql_statements:
                     if sql.strip():
+                        started = time.perf_counter()
                         # Mock execution - just call the methods to verify they're called
                         transaction_ctx = connection.transaction()
                         cursor_ctx = connection.cursor()
@@ -547,59 +696,25 @@ class BatchedMigrationExecutor:
                             if hasattr(cursor, "execute"):
                                 await cursor.execute(sql)
 
+                        self._record_timing(sql, started, parallel=False)
                         logger.debug(f"Mock executed: {sql[:100]}...")
                 return True
             else:
-                # Real database connection with retry logic if connection manager available
+
+                async def execute_batch():
+                    if hasattr(connection, "transaction"):
+                        # AsyncPG style
+                        await self._execute_statements_async(connection, sql_statements)
+                    else:
+                        # Traditional connection style
+                        self._execute_statements_sync(connection, sql_statements)
+
                 if self.connection_manager:
                     # Use connection manager's retry logic for better reliability
-                    async def execute_batch():
-                        # Execute with proper transaction handling
-                        if hasattr(connection, "transaction"):
-                            # AsyncPG style
-                            async with connection.transaction():
-                                for sql in sql_statements:
-                                    if sql.strip():
-                                        await connection.execute(sql)
-                                        logger.debug(f"Executed: {sql[:100]}...")
-                        else:
-                            # Traditional connection style
-                            cursor = connection.cursor()
-                            try:
-                                for sql in sql_statements:
-                                    if sql.strip():
-                                        cursor.execute(sql)
-                                        logger.debug(f"Executed: {sql[:100]}...")
-                                connection.commit()
-                            except Exception:
-                                connection.rollback()
-                                raise
-                            finally:
-                                cursor.close()
-
-                    # Execute with retry logic
                     await self.connection_manager.execute_with_retry(execute_batch)
                 else:
                     # Fallback to direct execution
-                    if hasattr(connection, "transaction"):
-                        async with connection.transaction():
-                            for sql in sql_statements:
-                                if sql.strip():
-                                    await connection.execute(sql)
-                                    logger.debug(f"Executed: {sql[:100]}...")
-                    else:
-                        cursor = connection.cursor()
-                        try:
-                            for sql in sql_statements:
-                                if sql.strip():
-                                    cursor.execute(sql)
-                                    logger.debug(f"Executed: {sql[:100]}...")
-                            connection.commit()
-                        except Exception:
-                            connection.rollback()
-                            raise
-                        finally:
-                            cursor.close()
+                    await execute_batch()
 
                 return True
 
@@ -612,46 +727,52 @@ class BatchedMigrationExecutor:
                 self._return_connection(connection)
 
     async def _execute_batch_parallel(self, sql_statements: List[str]) -> bool:
-        """Execute a batch of SQL statements in parallel with connection optimization."""
-        connections = []
-        try:
-            # Create tasks for parallel execution with individual connections
-            tasks = []
-            for sql in sql_statements:
-                if sql.strip():  # Skip empty statements
-                    # Get a separate connection for each parallel task
-                    task_connection = self._get_connection()
-                    connections.append(task_connection)
-                    task = self._execute_single_statement_with_connection(
-                        sql, task_connection
-                    )
-                    tasks.append(task)
+        """Execute a batch of SQL statements concurrently on pooled connections.
 
-            # Execute all statements in parallel
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        Each statement runs on its own connection checked out of ``self.pool``,
+        at most ``max_parallel`` at a time. Without a pool there is only one
+        connection, so statements run one after another.
+        """
+        statements = [sql for sql in sql_statements if sql.strip()]
+
+        if self.pool is None:
+            try:
+                async with self._acquire_connection() as connection:
+                    for sql in statements:
+                        await self._execute_single_statement_with_connection(
+                            sql, connection
+                        )
+                return True
+            except Exception as e:
+                logger.error(f"Parallel batch execution failed: {e}")
+                return False
 
-            # Check for any failures
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Parallel execution failed: {result}")
-                    return False
+        slots = asyncio.Semaphore(self.max_parallel)
 
-            return True
+        async def run_statement(sql: str) -> None:
+            async with slots:
+                async with self._acquire_connection() as connection:
+                    await self._execute_single_statement_with_connection(
+                        sql, connection, parallel=True
+                    )
 
-        except Exception as e:
-            logger.error(f"Parallel batch execution failed: {e}")
-            return False
-        finally:
-            # Return all connections to pool
-            for connection in connections:
-                self._return_connection(connection)
+        # Independent statements keep running when one fails
+        results = await asyncio.gather(
+            *(run_statement(sql) for sql in statements), return_exceptions=True
+        )
+
+        # Check for any failures
+        failed = [result for result in results if isinstance(result, Exception)]
+        for result in failed:
+            logger.error(f"Parallel execution failed: {result}")
+        return not failed
 
     async def _execute_single_statement(self, sql: str) -> None:
         """Execute a single SQL statement (legacy method)."""
         await self._execute_single_statement_with_connection(sql, self.connection)
 
     async def _execute_single_statement_with_connection(
-        self, sql: str, connection
+        self, sql: str, connection, parallel: bool = False
     ) -> None:
         """Execute a single SQL statement with a specific connection."""
         try:
@@ -660,6 +781,7 @@ class BatchedMigrationExecutor:
 
             if is_mock:
                 # For mocked connections
+                started = time.perf_counter()
                 transaction_ctx = connection.transaction()
                 cursor_ctx = connection.cursor()
 
@@ -669,43 +791,23 @@ class BatchedMigrationExecutor:
                     cursor = await cursor_ctx.__aenter__()
                     if hasattr(cursor, "execute"):
                         await cursor.execute(sql)
+                self._record_timing(sql, started, parallel)
             else:
-                # Real database connection with retry logic if connection manager available
+
+                async def execute_statement():
+                    if hasattr(connection, "transaction"):
+                        # AsyncPG style
+                        await self._execute_async_statement(connection, sql, parallel)
+                    else:
+                        # Traditional connection style
+                        self._execute_statements_sync(connection, [sql], parallel)
+
                 if self.connection_manager:
                     # Use connection manager's retry logic
-                    async def execute_statement():
-                        if hasattr(connection, "transaction"):
-                            # AsyncPG style
-                            async with connection.transaction():
-                                await connection.execute(sql)
-                        else:
-                            # Traditional connection style
-                            cursor = connection.cursor()
-                            try:
-                                cursor.execute(sql)
-                                connection.commit()
-                            except Exception:
-                                connection.rollback()
-                                raise
-                            finally:
-                                cursor.close()
-
                     await self.connection_manager.execute_with_retry(execute_statement)
                 else:
                     # Fallback to direct execution
-                    if hasattr(connection, "transaction"):
-                        async with connection.transaction():
-                            await connection.execute(sql)
-                    else:
-                        cursor = connection.cursor()
-                        try:
-                            cursor.execute(sql)
-                            connection.commit()
-                        except Exception:
-                            connection.rollback()
-                            raise
-                        finally:
-                            cursor.close()
+                    await execute_statement()
 
             logger.debug(f"Executed: {sql[:100]}...")
 
@@ -713,6 +815,122 @@ class BatchedMigrationExecutor:
             logger.error(f"Failed to execute statement: {sql[:100]}... Error: {e}")
             raise
 
+    async def _execute_statements_async(
+        self, connection, sql_statements: List[str], parallel: bool = False
+    ) -> None:
+        """Execute statements on an asyncpg-style connection.
+
+        The batch runs in one transaction unless it contains statements such as
+        ``CREATE INDEX CONCURRENTLY`` that cannot run inside a transaction
+        block; then every statement runs on its own.
+        """
+        statements = [sql for sql in sql_statements if sql.strip()]
+        if any(_AUTOCOMMIT_PATTERN.search(sql) for sql in statements):
+            for sql in statements:
+                await self._execute_async_statement(connection, sql, parallel)
+            return
+
+        async with connection.transaction():
+            for sql in statements:
+                await self._timed_execute(
+                    connection, sql, parallel, in_transaction=True
+                )
+
+    async def _execute_async_statement(
+        self, connection, sql: str, parallel: bool
+    ) -> None:
+        """Execute one statement, in its own transaction unless it forbids one."""
+        if _AUTOCOMMIT_PATTERN.search(sql):
+            await self._timed_execute(connection, sql, parallel, in_transaction=False)
+        else:
+            async with connection.transaction():
+                await self._timed_execute(
+                    connection, sql, parallel, in_transaction=True
+                )
+
+    async def _timed_execute(
+        self, connection, sql: str, parallel: bool, in_transaction: bool
+    ) -> None:
+        """Execute one statement under the configured timeouts and time it."""
+        started = time.perf_counter()
+        try:
+            await self._apply_timeouts(connection, local=in_transaction)
+            try:
+                await connection.execute(sql)
+            finally:
+                if not in_transaction:
+                    await self._reset_timeouts(connection)
+        except Exception as e:
+            self._record_timing(sql, started, parallel, error=e)
+            raise
+        self._record_timing(sql, started, parallel)
+        logger.debug(f"Executed: {sql[:100]}...")
+
+    def _execute_statements_sync(
+        self, connection, sql_statements: List[str], parallel: bool = False
+    ) -> None:
+        """Execute statements in one transaction on a DB-API connection."""
+        cursor = connection.cursor()
+        try:
+            for sql in sql_statements:
+                if sql.strip():
+                    started = time.perf_counter()
+                    try:
+                        cursor.execute(sql)
+                    except Exception as e:
+                        self._record_timing(sql, started, parallel, error=e)
+                        raise
+                    self._record_timing(sql, started, parallel)
+                    logger.debug(f"Executed: {sql[:100]}...")
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            cursor.close()
+
+    async def _apply_timeouts(self, connection, local: bool) -> None:
+        """Set lock_timeout/statement_timeout before a statement (PostgreSQL).
+
+        Inside a transaction ``SET LOCAL`` scopes them to that transaction;
+        otherwise they are set on the session and reset afterwards.
+        """
+        command = "SET LOCAL" if local else "SET"
+        if self.lock_timeout is not None:
+            await connection.execute(
+                f"{command} lock_timeout = {int(self.lock_timeout * 1000)}"
+            )
+        if self.statement_timeout is not None:
+            await connection.execute(
+                f"{command} statement_timeout = {int(self.statement_timeout * 1000)}"
+            )
+
+    async def _reset_timeouts(self, connection) -> None:
+        """Restore session timeouts changed by _apply_timeouts."""
+        if self.lock_timeout is not None:
+            await connection.execute("RESET lock_timeout")
+        if self.statement_timeout is not None:
+            await connection.execute("RESET statement_timeout")
+
+    def _record_timing(
+        self,
+        sql: str,
+        started: float,
+        parallel: bool,
+        error: Optional[Exception] = None,
+    ) -> None:
+        """Record the duration of one statement for BatchMetrics."""
+        self._statement_timings.append(
+            StatementTiming(
+                sql=sql.strip(),
+                batch_index=self._batch_index,
+                duration=time.perf_counter() - started,
+                parallel=parallel,
+                success=error is None,
+                error=str(error) if error is not None else None,
+            )
+        )
+
     def estimate_execution_time(self, batches: List[List[str]]) -> float:
         """
         Estimate execution time for batched operations.
@@ -12,14 +12,23 @@ in production databases.
 import asyncio
 import hashlib
 import logging
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import asyncpg
 
+from .adaptive_backfill import (
+    AdaptiveBackfillController,
+    BackfillBudget,
+    BackfillCheckpoint,
+    BackfillCheckpointStore,
+    get_replication_lag,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,6 +51,7 @@ class AdditionResult(Enum):
     PERFORMANCE_TIMEOUT = "performance_timeout"
     ROLLBACK_REQUIRED = "rollback_required"
     VALIDATION_FAILED = "validation_failed"
+    PAUSED = "paused"
 
 
 @dataclass
@@ -94,6 +104,11 @@ class NotNullAdditionPlan:
     validate_constraints: bool = True
     performance_monitoring: bool = True
 
+    # Throttled backfill: commit per batch within this budget, checkpointing
+    # progress on backfill_key so the backfill can be paused and resumed
+    backfill_budget: Optional[BackfillBudget] = None
+    backfill_key: str = "id"
+
     # Execution details
     estimated_duration: Optional[float] = None
     affected_rows: Optional[int] = None
@@ -398,6 +413,9 @@ class NotNullColumnHandler:
         # Savepoint configuration for batch recovery (not implemented yet)
         self._use_savepoints = False
 
+        # (table, column) backfills asked to pause after their current batch
+        self._pause_requests: Set[Tuple[str, str]] = set()
+
         # Initialize strategies
         self.strategies = {
             DefaultValueType.STATIC: StaticDefaultStrategy(),
@@ -624,6 +642,12 @@ class NotNullColumnHandler:
         lock_key = None
         lock_acquired = False
 
+        # Throttled backfills commit every batch instead of one transaction
+        throttled = (
+            plan.execution_strategy == "batched_update"
+            and plan.backfill_budget is not None
+        )
+
         try:
             # Acquire advisory lock if enabled
             if self._use_advisory_locks:
@@ -639,6 +663,11 @@ class NotNullColumnHandler:
                         f"Could not acquire advisory lock {lock_key} for table {plan.table_name}"
                     )
 
+            if throttled:
+                result = await self._execute_throttled_addition(plan, connection)
+                result.execution_time = (datetime.now() - start_time).total_seconds()
+                return result
+
             # Start transaction for rollback capability
             async with connection.transaction():
                 # Execute based on strategy
@@ -681,7 +710,9 @@ class NotNullColumnHandler:
                 result=AdditionResult.ROLLBACK_REQUIRED,
                 execution_time=execution_time,
                 affected_rows=0,
-                rollback_executed=True,  # Transaction will rollback automatically
+                # Transaction will rollback automatically; committed backfill
+                # batches are kept and resume from their checkpoint
+                rollback_executed=not throttled,
                 error_message=str(e),
                 constraint_violations=[str(e)],
             )
@@ -699,6 +730,14 @@ class NotNullColumnHandler:
                         f"Failed to release advisory lock {lock_key}: {unlock_error}"
                     )
 
+    def pause_backfill(self, table_name: str, column_name: str) -> None:
+        """Ask a running throttled backfill to stop after its current batch.
+
+        The backfill returns an ``AdditionResult.PAUSED`` result; executing the
+        same plan again resumes from the last checkpoint.
+        """
+        self._pause_requests.add((table_name, column_name))
+
     async def rollback_not_null_addition(
         self, plan: NotNullAdditionPlan, connection: Optional[asyncpg.Connection] = None
     ) -> AdditionExecutionResult:
@@ -987,23 +1026,10 @@ class NotNullColumnHandler:
             and self._has_column_references(default_expr)
         )
 
-        if is_computed_with_column_refs:
-            # Step 1: Add nullable column WITHOUT default (PostgreSQL limitation)
-            await connection.execute(
-                f"""
-                ALTER TABLE {plan.table_name}
-                ADD COLUMN {plan.column.name} {plan.column.data_type}
-            """
-            )
-        else:
-            # Step 1: Add nullable column with default (works for static/function defaults)
-            await connection.execute(
-                f"""
-                ALTER TABLE {plan.table_name}
-                ADD COLUMN {plan.column.name} {plan.column.data_type}
-                DEFAULT {default_expr}
-            """
-            )
+        # Step 1: Add nullable column
+        await self._add_nullable_column(
+            plan, connection, default_expr, is_computed_with_column_refs
+        )
 
         # Step 2: Update all NULL values in batches using the computed expression
         batch_size = plan.batch_size
@@ -1034,7 +1060,51 @@ class NotNullColumnHandler:
             if batch_size > 10000:
                 await asyncio.sleep(0.01)
 
-        # Step 3: Add NOT NULL constraint
+        # Steps 3-4: Add NOT NULL constraint and default
+        await self._finalize_not_null_column(
+            plan, connection, default_expr, is_computed_with_column_refs
+        )
+
+        return AdditionExecutionResult(
+            result=AdditionResult.SUCCESS,
+            execution_time=0.0,  # Will be set by caller
+            affected_rows=total_updated,
+        )
+
+    async def _add_nullable_column(
+        self,
+        plan: NotNullAdditionPlan,
+        connection: asyncpg.Connection,
+        default_expr: str,
+        is_computed_with_column_refs: bool,
+    ) -> None:
+        """Add the new column as nullable, ready to be backfilled."""
+        if is_computed_with_column_refs:
+            # Add nullable column WITHOUT default (PostgreSQL limitation)
+            await connection.execute(
+                f"""
+                ALTER TABLE {plan.table_name}
+                ADD COLUMN {plan.column.name} {plan.column.data_type}
+            """
+            )
+        else:
+            # Add nullable column with default (works for static/function defaults)
+            await connection.execute(
+                f"""
+                ALTER TABLE {plan.table_name}
+                ADD COLUMN {plan.column.name} {plan.column.data_type}
+                DEFAULT {default_expr}
+            """
+            )
+
+    async def _finalize_not_null_column(
+        self,
+        plan: NotNullAdditionPlan,
+        connection: asyncpg.Connection,
+        default_expr: str,
+        is_computed_with_column_refs: bool,
+    ) -> None:
+        """Add the NOT NULL constraint (and default) once backfill is complete."""
         await connection.execute(
             f"""
             ALTER TABLE {plan.table_name}
@@ -1042,7 +1112,7 @@ class NotNullColumnHandler:
         """
         )
 
-        # Step 4: Add default constraint if it's not a column-referencing computed expression
+        # Add default constraint if it's not a column-referencing computed expression
         if not is_computed_with_column_refs:
             await connection.execute(
                 f"""
@@ -1051,10 +1121,158 @@ class NotNullColumnHandler:
             """
             )
 
+    async def _execute_throttled_addition(
+        self, plan: NotNullAdditionPlan, connection: asyncpg.Connection
+    ) -> AdditionExecutionResult:
+        """Execute NOT NULL addition with an adaptive, resumable backfill.
+
+        Rows are backfilled in ascending ``plan.backfill_key`` order, one
+        committed transaction per batch. Batch size and the pause between
+        batches follow the plan's BackfillBudget (batch latency, lock waits,
+        replication lag), and the last processed key is checkpointed with
+        every batch.
+        """
+        budget = plan.backfill_budget
+        table, column = plan.table_name, plan.column.name
+        key = plan.backfill_key
+
+        strategy = self.strategies[plan.column.default_type]
+        default_expr = strategy.generate_default_expression(plan.column)
+        is_computed_with_column_refs = (
+            plan.column.default_type == DefaultValueType.COMPUTED
+            and self._has_column_references(default_expr)
+        )
+
+        store = BackfillCheckpointStore(connection)
+        await store.ensure_table()
+        checkpoint = await store.load(table, column)
+
+        if checkpoint is None:
+            checkpoint = BackfillCheckpoint(
+                table_name=table, column_name=column, batch_size=plan.batch_size
+            )
+            async with connection.transaction():
+                await self._add_nullable_column(
+                    plan, connection, default_expr, is_computed_with_column_refs
+                )
+                await store.save(checkpoint)
+        else:
+            self.logger.info(
+                f"Resuming backfill of {table}.{column} after key "
+                f"{checkpoint.last_key!r} ({checkpoint.rows_processed} rows done)"
+            )
+            checkpoint.status = "running"
+
+        key_type = await connection.fetchval(
+            """SELECT format_type(atttypid, atttypmod) FROM pg_attribute
+               WHERE attrelid = $1::regclass AND attname = $2""",
+            table,
+            key,
+        )
+        if key_type is None:
+            raise ValueError(f"Backfill key column {key!r} not found on {table}")
+
+        batch_sql = f"""
+            WITH batch AS (
+                SELECT {key} AS batch_key FROM {table}
+                {{range}}
+                ORDER BY {key}
+                LIMIT $1
+            ),
+            updated AS (
+                UPDATE {table}
+                SET {column} = {default_expr}
+                FROM batch
+                WHERE {table}.{key} = batch.batch_key AND {table}.{column} IS NULL
+                RETURNING 1
+            )
+            SELECT (SELECT MAX(batch_key)::text FROM batch) AS last_key,
+                   (SELECT COUNT(*) FROM batch) AS scanned,
+                   (SELECT COUNT(*) FROM updated) AS updated
+        """
+        first_batch_sql = batch_sql.format(range="")
+        next_batch_sql = batch_sql.format(range=f"WHERE {key} > $2::text::{key_type}")
+
+        controller = AdaptiveBackfillController(
+            budget, checkpoint.batch_size or plan.batch_size
+        )
+        rows_this_run = 0
+        check_replication = True
+
+        while True:
+            if (table, column) in self._pause_requests:
+                self._pause_requests.discard((table, column))
+                checkpoint.status = "paused"
+                checkpoint.batch_size = controller.batch_size
+                await store.save(checkpoint)
+                self.logger.info(
+                    f"Backfill of {table}.{column} paused at key {checkpoint.last_key!r}"
+                )
+                return AdditionExecutionResult(
+                    result=AdditionResult.PAUSED,
+                    execution_time=0.0,  # Will be set by caller
+                    affected_rows=rows_this_run,
+                    performance_metrics={
+                        "checkpoint": checkpoint,
+                        "backfill": controller.get_stats(),
+                    },
+                )
+
+            started = time.perf_counter()
+            try:
+                async with connection.transaction():
+                    await connection.execute(
+                        f"SET LOCAL lock_timeout = {int(budget.max_lock_wait * 1000)}"
+                    )
+                    if checkpoint.last_key is None:
+                        row = await connection.fetchrow(
+                            first_batch_sql, controller.batch_size
+                        )
+                    else:
+                        row = await connection.fetchrow(
+                            next_batch_sql, controller.batch_size, checkpoint.last_key
+                        )
+                    if row["scanned"]:
+                        checkpoint.last_key = row["last_key"]
+                        checkpoint.rows_processed += row["updated"]
+                        checkpoint.batch_size = controller.batch_size
+                        await store.save(checkpoint)
+            except asyncpg.exceptions.LockNotAvailableError:
+                if not controller.record_lock_timeout():
+                    raise
+                self.logger.warning(
+                    f"Backfill batch on {table} timed out waiting for a lock; "
+                    f"retrying with batch size {controller.batch_size}"
+                )
+                controller.pause_taken()
+                await asyncio.sleep(controller.sleep_seconds)
+                continue
+
+            latency = time.perf_counter() - started
+            if not row["scanned"]:
+                break
+
+            rows_this_run += row["updated"]
+            lag = None
+            if check_replication:
+                lag = await get_replication_lag(connection)
+                check_replication = lag is not None
+            controller.record_batch(row["updated"], latency, lag)
+
+            if controller.sleep_seconds > 0:
+                controller.pause_taken()
+                await asyncio.sleep(controller.sleep_seconds)
+
+        await self._finalize_not_null_column(
+            plan, connection, default_expr, is_computed_with_column_refs
+        )
+        await store.delete(table, column)
+
         return AdditionExecutionResult(
             result=AdditionResult.SUCCESS,
             execution_time=0.0,  # Will be set by caller
-            affected_rows=total_updated,
+            affected_rows=checkpoint.rows_processed,
+            performance_metrics={"backfill": controller.get_stats()},
         )
 
     def _has_column_references(self, expression: str) -> bool:
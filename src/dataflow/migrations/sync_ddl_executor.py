@@ -245,6 +245,118 @@ class SyncDDLExecutor:
                 except Exception:
                     pass
 
+    def execute_ddl_transaction(self, sql_statements: List[str]) -> Dict[str, Any]:
+        """
+        Execute DDL statements over one connection in a single transaction.
+
+        PostgreSQL and SQLite support transactional DDL, so either every
+        statement is applied or none is. MySQL commits implicitly after each
+        DDL statement; there the statements still share one connection but
+        a failure leaves earlier statements applied.
+
+        Args:
+            sql_statements: List of DDL SQL statements
+
+        Returns:
+            Dict with 'success', 'executed_count', 'transactional' and
+            optionally 'error' / 'failed_sql'
+        """
+        transactional = self._db_type in ("postgresql", "sqlite")
+        conn = None
+        executed = 0
+        try:
+            conn = self._get_sync_connection()
+            if self._db_type == "postgresql":
+                conn.autocommit = False
+            elif self._db_type == "sqlite":
+                # Manage the transaction explicitly so DDL is not auto-committed
+                conn.isolation_level = None
+            cursor = conn.cursor()
+
+            if self._db_type == "sqlite":
+                cursor.execute("BEGIN")
+            for sql in sql_statements:
+                cursor.execute(sql)
+                executed += 1
+
+            if self._db_type == "sqlite":
+                cursor.execute("COMMIT")
+            elif transactional:
+                conn.commit()
+
+            cursor.close()
+            logger.debug(
+                f"Successfully executed {executed} DDL statements in one transaction"
+            )
+            return {
+                "success": True,
+                "executed_count": executed,
+                "transactional": transactional,
+            }
+
+        except Exception as e:
+            logger.error(f"DDL transaction failed at statement {executed + 1}: {e}")
+            if conn is not None and transactional:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            return {
+                "success": False,
+                "error": str(e),
+                "executed_count": 0 if transactional else executed,
+                "transactional": transactional,
+                "failed_sql": (
+                    sql_statements[executed] if executed < len(sql_statements) else None
+                ),
+            }
+
+        finally:
+            if conn:
+                try:
+                    conn.close()
+                except Exception:
+                    pass
+
+    def get_catalog_snapshot(self) -> Dict[str, Any]:
+        """
+        Read all table and index names with a single catalog query.
+
+        Returns:
+            Dict with 'tables' and 'indexes' sets, or 'error'
+        """
+        if self._db_type == "postgresql":
+            sql = """
+                SELECT 'table', table_name FROM information_schema.tables
+                WHERE table_schema = 'public'
+                UNION ALL
+                SELECT 'index', indexname FROM pg_indexes
+                WHERE schemaname = 'public'
+            """
+        elif self._db_type == "sqlite":
+            sql = (
+                "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index')"
+            )
+        elif self._db_type == "mysql":
+            sql = """
+                SELECT 'table', table_name FROM information_schema.tables
+                WHERE table_schema = DATABASE()
+                UNION ALL
+                SELECT DISTINCT 'index', index_name FROM information_schema.statistics
+                WHERE table_schema = DATABASE()
+            """
+        else:
+            return {"error": f"Catalog snapshot not supported for {self._db_type}"}
+
+        result = self.execute_query(sql)
+        if "error" in result:
+            return result
+
+        snapshot = {"tables": set(), "indexes": set()}
+        for kind, name in result.get("result", []):
+            snapshot["tables" if kind == "table" else "indexes"].add(name)
+        return snapshot
+
     def execute_query(self, sql: str, params: Optional[Tuple] = None) -> Dict[str, Any]:
         """
         Execute a query and return results (for schema inspection).
@@ -2,7 +2,7 @@
 
 from .aggregate_operations import AggregateNode
 from .mongodb_nodes import AggregateNode as MongoAggregateNode
-from .mongodb_nodes import BulkDocumentInsertNode
+from .mongodb_nodes import BulkDocumentInsertNode, BulkDocumentWriteNode
 from .mongodb_nodes import CreateIndexNode as MongoCreateIndexNode
 from .mongodb_nodes import (
     DocumentCountNode,
@@ -50,6 +50,7 @@ __all__ = [
     "DocumentDeleteNode",
     "MongoAggregateNode",
     "BulkDocumentInsertNode",
+    "BulkDocumentWriteNode",
     "MongoCreateIndexNode",
     "DocumentCountNode",
 ]
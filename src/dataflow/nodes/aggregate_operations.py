@@ -14,6 +14,16 @@ from kailash.nodes.base import Node, NodeParameter, NodeRegistry
 
 from .workflow_connection_manager import SmartNodeConnectionMixin
 
+try:
+    import numpy as np
+
+    from ..core.columnar import ColumnarResult
+    from .columnar_aggregation import aggregate_records
+
+    NUMPY_AVAILABLE = True
+except ImportError:  # pragma: no cover - NumPy is optional
+    NUMPY_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -26,6 +36,13 @@ class AggregateNode(Node):
     - Grouping operations: "sum of amount by category", "average price by region"
     - Smart field detection: automatically finds numeric fields for aggregation
     - Complex expressions: "sum of amount where status is active"
+    - Multiple aggregates per call via ``aggregations``, sharing one grouping pass
+
+    When NumPy is installed, records are converted to columns once and all
+    aggregates are computed with vectorized group operations; otherwise the
+    row-wise implementation is used. ``data`` may also be the ColumnarResult
+    of a List node run with ``result_format="columnar"``, which is
+    aggregated without converting it back to records.
     """
 
     def __init__(self, **kwargs):
@@ -35,7 +52,10 @@ class AggregateNode(Node):
         """Define parameters for AggregateNode."""
         return {
             "data": NodeParameter(
-                name="data", type=list, required=True, description="Data to aggregate"
+                name="data",
+                type=Any,
+                required=True,
+                description="Records (list of dicts) or a ColumnarResult to aggregate",
             ),
             "aggregate_expression": NodeParameter(
                 name="aggregate_expression",
@@ -50,6 +70,17 @@ class AggregateNode(Node):
                 default=[],
                 description="Fields to group by (auto-detected from expression if not specified)",
             ),
+            "aggregations": NodeParameter(
+                name="aggregations",
+                type=list,
+                required=False,
+                default=[],
+                description=(
+                    "Additional aggregates computed with the same grouping, as "
+                    "expressions ('max of amount') or dicts with function, field "
+                    "and optional name"
+                ),
+            ),
             "filter_expression": NodeParameter(
                 name="filter_expression",
                 type=str,
@@ -86,6 +117,7 @@ class AggregateNode(Node):
         filter_expression = kwargs.get("filter_expression")
         numeric_fields = kwargs.get("numeric_fields", [])
         return_details = kwargs.get("return_details", False)
+        aggregations = kwargs.get("aggregations") or []
 
         logger.info(f"Executing AggregateNode with expression: {aggregate_expression}")
 
@@ -101,7 +133,7 @@ class AggregateNode(Node):
             # Auto-detect numeric fields if not specified
             if not numeric_fields:
                 numeric_fields = self._auto_detect_numeric_fields(
-                    data[0] if data else {}
+                    self._first_record(data)
                 )
 
             # Apply filter if specified
@@ -115,9 +147,21 @@ class AggregateNode(Node):
             )
 
             # Perform aggregation
-            result = self._perform_aggregation(filtered_data, agg_config)
+            specs = [(agg_config["function"], agg_config["field"])]
+            names = []
+            for spec in aggregations:
+                name, function, field = self._parse_aggregation_spec(
+                    spec, numeric_fields
+                )
+                names.append(name)
+                specs.append((function, field))
 
-            return {
+            results = self._perform_aggregations(
+                filtered_data, specs, agg_config["group_by"]
+            )
+            result = results[0]
+
+            output = {
                 "result": result,
                 "aggregate_expression": aggregate_expression,
                 "aggregation_function": agg_config["function"],
@@ -128,6 +172,9 @@ class AggregateNode(Node):
                 "parsed_successfully": True,
                 "details": agg_config.get("details") if return_details else None,
             }
+            if aggregations:
+                output["aggregations"] = dict(zip(names, results[1:]))
+            return output
 
         except Exception as e:
             logger.error(f"Failed to execute aggregation '{aggregate_expression}': {e}")
@@ -149,8 +196,19 @@ class AggregateNode(Node):
 
         return numeric_fields
 
+    def _first_record(self, data: Any) -> Dict:
+        """First record of the input, for field type detection."""
+        if not data:
+            return {}
+        if NUMPY_AVAILABLE and isinstance(data, ColumnarResult):
+            return data.row(0)
+        return data[0]
+
     def _apply_filter(self, data: List[Dict], filter_expression: str) -> List[Dict]:
         """Apply simple filter to data before aggregation."""
+        if NUMPY_AVAILABLE and isinstance(data, ColumnarResult):
+            return self._apply_columnar_filter(data, filter_expression)
+
         # Simple filter implementation - could be enhanced to use NaturalLanguageFilterNode
         filter_expr = filter_expression.lower().strip()
 
@@ -176,6 +234,29 @@ class AggregateNode(Node):
 
         return data
 
+    def _apply_columnar_filter(
+        self, data: "ColumnarResult", filter_expression: str
+    ) -> "ColumnarResult":
+        """Apply the simple filter patterns to a ColumnarResult."""
+        filter_expr = filter_expression.lower().strip()
+
+        match = re.search(r"where\s+(\w+)\s+is\s+(\w+)", filter_expr)
+        if match:
+            field, value = match.groups()
+            value = value.lower()
+            values = data.to_pylist(field) if field in data else [""] * len(data)
+            keep = [str(v).lower() == value for v in values]
+            return data.take(np.array(keep, dtype=bool))
+
+        match = re.search(r'where\s+(\w+)\s+equals\s+(["\']?)([^"\']+)\2', filter_expr)
+        if match:
+            field, _, value = match.groups()
+            values = data.to_pylist(field) if field in data else [""] * len(data)
+            keep = [str(v) == value for v in values]
+            return data.take(np.array(keep, dtype=bool))
+
+        return data
+
     def _parse_aggregate_expression(
         self, expression: str, numeric_fields: List[str], group_by: List[str]
     ) -> Dict[str, Any]:
@@ -275,6 +356,42 @@ class AggregateNode(Node):
         # Fall back to first numeric field
         return numeric_fields[0] if numeric_fields else None
 
+    def _parse_aggregation_spec(
+        self, spec: Union[str, Dict[str, Any]], numeric_fields: List[str]
+    ) -> tuple:
+        """Resolve an ``aggregations`` entry to (name, function, field)."""
+        if isinstance(spec, dict):
+            function = spec.get("function", "sum")
+            field = spec.get("field")
+            name = spec.get("name")
+        else:
+            parsed = self._parse_aggregate_expression(spec, numeric_fields, [])
+            function, field, name = parsed["function"], parsed["field"], None
+
+        if name is None:
+            name = f"{function}_{field}" if field else function
+        return name, function, field
+
+    def _perform_aggregations(
+        self,
+        data: List[Dict],
+        specs: List[tuple],
+        group_by: List[str],
+    ) -> List[Any]:
+        """Compute several (function, field) aggregates over the same groups."""
+        if not data:
+            return [None] * len(specs)
+
+        if NUMPY_AVAILABLE:
+            return aggregate_records(data, specs, group_by)
+
+        return [
+            self._perform_aggregation(
+                data, {"function": function, "field": field, "group_by": group_by}
+            )
+            for function, field in specs
+        ]
+
     def _perform_aggregation(self, data: List[Dict], agg_config: Dict[str, Any]) -> Any:
         """Perform the actual aggregation operation."""
         function = agg_config["function"]
@@ -1,7 +1,9 @@
 """DataFlow Bulk Create Node with Connection Pool - SDK Compliant Implementation."""
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import contextlib
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from kailash.nodes.base import NodeParameter, register_node
 from kailash.nodes.base_async import AsyncNode
@@ -9,6 +11,90 @@ from kailash.sdk_exceptions import NodeExecutionError, NodeValidationError
 
 from .workflow_connection_manager import SmartNodeConnectionMixin
 
+# Bound-parameter limits per statement; larger batches are split
+_MAX_BIND_PARAMS = {"postgresql": 32767, "mysql": 65535, "sqlite": 32766}
+
+
+class AdaptiveBatchSizer:
+    """Batch size controller driven by measured per-batch latency.
+
+    Tracks a smoothed per-record latency and sizes the next batch so that it
+    takes about ``target_latency`` seconds, changing by at most 2x per batch.
+    """
+
+    def __init__(
+        self,
+        initial_size: int,
+        min_size: int,
+        max_size: int,
+        target_latency: float,
+        smoothing: float = 0.3,
+    ):
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.target_latency = target_latency
+        self.smoothing = smoothing
+        self._size = min(max(initial_size, self.min_size), self.max_size)
+        self._per_record: Optional[float] = None
+
+    @property
+    def size(self) -> int:
+        """Size of the next batch."""
+        return self._size
+
+    def record(self, batch_size: int, seconds: float) -> None:
+        """Feed the measured latency of a completed batch."""
+        if batch_size <= 0:
+            return
+        per_record = max(seconds, 1e-9) / batch_size
+        if self._per_record is None:
+            self._per_record = per_record
+        else:
+            self._per_record += self.smoothing * (per_record - self._per_record)
+
+        desired = int(self.target_latency / self._per_record)
+        desired = min(max(desired, self._size // 2), self._size * 2)
+        self._size = min(max(desired, self.min_size), self.max_size)
+
+
+class _WorkflowPoolConnection:
+    """asyncpg-style facade over a WorkflowConnectionPool connection."""
+
+    def __init__(self, pool: Any, connection_id: str):
+        self._pool = pool
+        self.connection_id = connection_id
+
+    async def _run(self, query: str, params: Sequence[Any]) -> List[Dict[str, Any]]:
+        result = await self._pool.async_run(
+            operation="execute",
+            connection_id=self.connection_id,
+            query=query,
+            params=list(params),
+            fetch_mode="all",
+        )
+        if not result.get("success"):
+            raise NodeExecutionError(result.get("error") or "Query failed")
+        return result.get("data") or []
+
+    async def fetch(self, query: str, *params: Any) -> List[Dict[str, Any]]:
+        return await self._run(query, params)
+
+    async def execute(self, query: str, *params: Any) -> Optional[int]:
+        rows = await self._run(query, params)
+        if rows and isinstance(rows[0], dict) and "rows_affected" in rows[0]:
+            return rows[0]["rows_affected"]
+        return None
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        await self._run("BEGIN", ())
+        try:
+            yield self
+        except BaseException:
+            await self._run("ROLLBACK", ())
+            raise
+        await self._run("COMMIT", ())
+
 
 @register_node()
 class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
@@ -23,7 +109,12 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
         connection_pool_id: ID of DataFlowConnectionManager in workflow (optional)
         connection_string: Database connection string for fallback direct processing (optional)
         database_type: Type of database (postgresql, mysql, sqlite)
-        batch_size: Records per batch for processing
+        batch_size: Records per batch for processing (initial size when adaptive)
+        max_concurrent_batches: Batches executed at once on separate pooled connections
+        adaptive_batch_size: Resize batches from measured per-batch latency
+        min_batch_size / max_batch_size: Bounds for adaptive batch sizing
+        target_batch_latency_ms: Latency each adaptive batch aims for
+        batch_transactions: Run each batch in its own transaction
         conflict_resolution: How to handle conflicts (error, skip, update)
         auto_timestamps: Automatically add created_at/updated_at
         multi_tenant: Enable tenant isolation
@@ -41,6 +132,12 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
         When use_pooled_connection=True and connection_pool_id is set, this node will
         use WorkflowConnectionPool for optimized batch processing. Otherwise, it falls
         back to direct execution using AsyncSQLDatabaseNode (requires connection_string).
+
+        Pooled ingest shards the input into batches that up to
+        max_concurrent_batches workers execute at once, each batch on its own
+        pooled connection. Returned IDs follow input order regardless of the
+        order in which batches finish (IDs need RETURNING, so they are not
+        returned for MySQL).
     """
 
     def __init__(self, **kwargs):
@@ -49,6 +146,12 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
         self.table_name = kwargs.pop("table_name", None)
         self.database_type = kwargs.pop("database_type", "postgresql")
         self.batch_size = kwargs.pop("batch_size", 1000)
+        self.max_concurrent_batches = kwargs.pop("max_concurrent_batches", 4)
+        self.adaptive_batch_size = kwargs.pop("adaptive_batch_size", False)
+        self.min_batch_size = kwargs.pop("min_batch_size", 100)
+        self.max_batch_size = kwargs.pop("max_batch_size", 10000)
+        self.target_batch_latency_ms = kwargs.pop("target_batch_latency_ms", 250.0)
+        self.batch_transactions = kwargs.pop("batch_transactions", False)
         self.conflict_resolution = kwargs.pop("conflict_resolution", "error")
         self.auto_timestamps = kwargs.pop("auto_timestamps", True)
         self.multi_tenant = kwargs.pop("multi_tenant", False)
@@ -182,6 +285,9 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
                     "used_connection_pool": actually_used_pool,
                 },
             }
+            if "concurrency" in results:
+                result["metadata"]["concurrency"] = results["concurrency"]
+                result["metadata"]["final_batch_size"] = results["final_batch_size"]
 
             # Add optional fields based on operation results
             if tenant_id and self.multi_tenant:
@@ -251,13 +357,13 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
 
     async def _execute_batched_inserts_with_pool(
         self,
-        pool: Any,  # WorkflowConnectionPool instance
+        pool: Any,  # WorkflowConnectionPool or asyncpg-style pool
         data: List[Dict[str, Any]],
         tenant_id: Optional[str],
         return_ids: bool,
         dry_run: bool,
     ) -> Dict[str, Any]:
-        """Execute batched inserts using connection pool."""
+        """Execute batched inserts concurrently on pooled connections."""
         results = {
             "created_count": 0,
             "skipped_count": 0,
@@ -274,35 +380,99 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
             results["batches"] = (len(data) + self.batch_size - 1) // self.batch_size
             return results
 
-        # Process in batches using pool connections
-        for i in range(0, len(data), self.batch_size):
-            batch = data[i : i + self.batch_size]
-            results["batches"] += 1
-
-            try:
-                # Get connection from pool
-                async with pool.acquire() as conn:
-                    batch_result = await self._execute_batch_with_connection(
-                        conn, batch, tenant_id, return_ids
-                    )
-
-                    # Aggregate results
-                    results["created_count"] += batch_result.get("created_count", 0)
-                    results["skipped_count"] += batch_result.get("skipped_count", 0)
-                    results["conflict_count"] += batch_result.get("conflict_count", 0)
-                    results["error_count"] += batch_result.get("error_count", 0)
-
-                    if return_ids and "created_ids" in batch_result:
-                        results["created_ids"].extend(batch_result["created_ids"])
+        records = data
+        if self.multi_tenant and tenant_id:
+            records = [{**record, "tenant_id": tenant_id} for record in data]
+
+        sizer = None
+        if self.adaptive_batch_size:
+            sizer = AdaptiveBatchSizer(
+                self.batch_size,
+                self.min_batch_size,
+                self.max_batch_size,
+                self.target_batch_latency_ms / 1000,
+            )
 
-            except Exception as e:
-                results["error_count"] += len(batch)
-                results["errors"].append(f"Batch {results['batches']} error: {str(e)}")
+        next_offset = 0
+        stopped = False
+        ids_by_offset: Dict[int, List[Any]] = {}
+
+        def take_batch() -> Optional[Tuple[int, int, List[Dict[str, Any]]]]:
+            # No await between reading and advancing the offset, so workers
+            # never take overlapping slices
+            nonlocal next_offset
+            if stopped or next_offset >= len(records):
+                return None
+            size = sizer.size if sizer else self.batch_size
+            start = next_offset
+            next_offset += size
+            results["batches"] += 1
+            return results["batches"], start, records[start : start + size]
+
+        async def worker() -> None:
+            nonlocal stopped
+            while (item := take_batch()) is not None:
+                number, start, batch = item
+                try:
+                    async with self._acquire_pool_connection(pool) as conn:
+                        began = time.perf_counter()
+                        batch_result = await self._execute_batch_with_connection(
+                            conn, batch, tenant_id, return_ids
+                        )
+                        elapsed = time.perf_counter() - began
+                except Exception as e:
+                    results["error_count"] += len(batch)
+                    results["errors"].append(f"Batch {number} error: {str(e)}")
+                    if self.conflict_resolution == "error":
+                        stopped = True
+                    continue
+
+                if sizer:
+                    sizer.record(len(batch), elapsed)
+                results["created_count"] += batch_result.get("created_count", 0)
+                results["skipped_count"] += batch_result.get("skipped_count", 0)
+                results["conflict_count"] += batch_result.get("conflict_count", 0)
+                results["error_count"] += batch_result.get("error_count", 0)
+                if return_ids and "created_ids" in batch_result:
+                    ids_by_offset[start] = batch_result["created_ids"]
+
+        first_batches = -(-len(records) // max(1, self.batch_size))
+        concurrency = max(1, min(self._pool_concurrency(pool), first_batches))
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+
+        for start in sorted(ids_by_offset):
+            results["created_ids"].extend(ids_by_offset[start])
+        results["concurrency"] = concurrency
+        results["final_batch_size"] = sizer.size if sizer else self.batch_size
+        return results
 
-                if self.conflict_resolution == "error":
-                    break
+    def _pool_concurrency(self, pool: Any) -> int:
+        """Concurrent batch limit, capped by the pool size when it is known."""
+        limit = max(1, self.max_concurrent_batches)
+        pool_size = getattr(pool, "max_connections", None)
+        if not isinstance(pool_size, int) and callable(
+            getattr(type(pool), "get_max_size", None)
+        ):
+            pool_size = pool.get_max_size()  # asyncpg.Pool
+        if isinstance(pool_size, int) and pool_size > 0:
+            limit = min(limit, pool_size)
+        return limit
+
+    @contextlib.asynccontextmanager
+    async def _acquire_pool_connection(self, pool: Any):
+        """Check out one connection, for WorkflowConnectionPool or asyncpg-style pools."""
+        from kailash.nodes.data.workflow_connection_pool import WorkflowConnectionPool
 
-        return results
+        if isinstance(pool, WorkflowConnectionPool):
+            acquired = await pool.async_run(operation="acquire")
+            connection_id = acquired["connection_id"]
+            try:
+                yield _WorkflowPoolConnection(pool, connection_id)
+            finally:
+                await pool.async_run(operation="release", connection_id=connection_id)
+        else:
+            async with pool.acquire() as conn:
+                yield conn
 
     async def _execute_batch_with_connection(
         self,
@@ -311,14 +481,120 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
         tenant_id: Optional[str],
         return_ids: bool,
     ) -> Dict[str, Any]:
-        """Execute a single batch using provided connection."""
-        # This would use the actual connection to execute SQL
-        # For now, simulate the execution
+        """Insert one batch on a pooled connection.
+
+        The connection follows the asyncpg interface (``fetch``, ``execute``
+        and, for batch transactions, ``transaction()``). Batches exceeding
+        the database's bind-parameter limit are split into several statements.
+        """
+        columns = list(dict.fromkeys(key for record in batch for key in record))
+        returning = return_ids and self.database_type.lower() != "mysql"
+
+        created_count = 0
+        created_ids: List[Any] = []
+        transaction = (
+            conn.transaction() if self.batch_transactions else contextlib.nullcontext()
+        )
+        async with transaction:
+            for rows in self._split_for_bind_limit(batch, columns):
+                query, params = self._build_insert_query(rows, columns, returning)
+                if returning:
+                    inserted = await conn.fetch(query, *params)
+                    created_ids.extend(row["id"] for row in inserted)
+                    created_count += len(inserted)
+                else:
+                    status = await conn.execute(query, *params)
+                    created_count += self._rows_affected(status, len(rows))
+
+        skipped = (
+            len(batch) - created_count if self.conflict_resolution == "skip" else 0
+        )
         return {
-            "created_count": len(batch),
-            "created_ids": list(range(len(batch))) if return_ids else [],
+            "created_count": created_count,
+            "skipped_count": skipped,
+            "created_ids": created_ids,
         }
 
+    @staticmethod
+    def _rows_affected(status: Any, default: int) -> int:
+        """Row count from an execute() result ("INSERT 0 5", an int or None)."""
+        if isinstance(status, int) and not isinstance(status, bool):
+            return status
+        if isinstance(status, str):
+            tail = status.rsplit(" ", 1)[-1]
+            if tail.isdigit():
+                return int(tail)
+        return default
+
+    def _split_for_bind_limit(
+        self, batch: List[Dict[str, Any]], columns: List[str]
+    ) -> List[List[Dict[str, Any]]]:
+        """Split a batch so each statement stays within the bind-parameter limit."""
+        limit = _MAX_BIND_PARAMS.get(self.database_type.lower(), 32766)
+        rows_per_statement = max(1, limit // max(1, len(columns)))
+        return [
+            batch[i : i + rows_per_statement]
+            for i in range(0, len(batch), rows_per_statement)
+        ]
+
+    def _build_insert_query(
+        self,
+        rows: List[Dict[str, Any]],
+        columns: List[str],
+        returning: bool = False,
+    ) -> Tuple[str, List[Any]]:
+        """Build a multi-row INSERT honoring conflict_resolution."""
+        database_type = self.database_type.lower()
+        column_names = ", ".join(columns)
+        values_placeholders = []
+        params: List[Any] = []
+
+        for record in rows:
+            if database_type == "postgresql":
+                placeholders = ", ".join(
+                    [
+                        f"${j + 1}"
+                        for j in range(len(params), len(params) + len(columns))
+                    ]
+                )
+            elif database_type == "mysql":
+                placeholders = ", ".join(["%s"] * len(columns))
+            else:  # sqlite
+                placeholders = ", ".join(["?"] * len(columns))
+
+            values_placeholders.append(f"({placeholders})")
+            params.extend([record.get(col) for col in columns])
+
+        values_clause = ", ".join(values_placeholders)
+        query = f"INSERT INTO {self.table_name} ({column_names}) VALUES {values_clause}"
+
+        # Handle conflict resolution
+        if self.conflict_resolution == "skip":
+            # Use ON CONFLICT DO NOTHING for PostgreSQL/SQLite
+            if database_type in ["postgresql", "sqlite"]:
+                query += " ON CONFLICT (id) DO NOTHING"
+            else:  # MySQL
+                query += " ON DUPLICATE KEY UPDATE id = id"
+        elif self.conflict_resolution == "update":
+            update_columns = [col for col in columns if col != "id"]
+            # Use ON CONFLICT DO UPDATE for PostgreSQL/SQLite
+            if database_type in ["postgresql", "sqlite"]:
+                if update_columns:
+                    set_parts = [f"{col} = EXCLUDED.{col}" for col in update_columns]
+                    query += f" ON CONFLICT (id) DO UPDATE SET {', '.join(set_parts)}"
+                else:
+                    query += " ON CONFLICT (id) DO NOTHING"
+            else:  # MySQL
+                if update_columns:
+                    set_parts = [f"{col} = VALUES({col})" for col in update_columns]
+                    query += f" ON DUPLICATE KEY UPDATE {', '.join(set_parts)}"
+                else:
+                    query += " ON DUPLICATE KEY UPDATE id = id"
+
+        if returning:
+            query += " RETURNING id"
+        return query, params
+
     async def _process_direct(
         self,
         data: List[Dict[str, Any]],
@@ -390,68 +666,11 @@ class BulkCreatePoolNode(SmartNodeConnectionMixin, AsyncNode):
                 }
 
             columns = list(processed_data[0].keys())
-            column_names = ", ".join(columns)
 
             # Process in batches
             for i in range(0, len(processed_data), self.batch_size):
                 batch = processed_data[i : i + self.batch_size]
-                values_placeholders = []
-                params = []
-
-                # Build batch INSERT query
-                for record in batch:
-                    if self.database_type.lower() == "postgresql":
-                        placeholders = ", ".join(
-                            [
-                                f"${j + 1}"
-                                for j in range(len(params), len(params) + len(columns))
-                            ]
-                        )
-                    elif self.database_type.lower() == "mysql":
-                        placeholders = ", ".join(["%s"] * len(columns))
-                    else:  # sqlite
-                        placeholders = ", ".join(["?"] * len(columns))
-
-                    values_placeholders.append(f"({placeholders})")
-                    params.extend([record.get(col) for col in columns])
-
-                values_clause = ", ".join(values_placeholders)
-
-                # Handle conflict resolution
-                if self.conflict_resolution == "skip":
-                    # Use ON CONFLICT DO NOTHING for PostgreSQL/SQLite
-                    if self.database_type.lower() in ["postgresql", "sqlite"]:
-                        conflict_clause = "ON CONFLICT (id) DO NOTHING"
-                    else:  # MySQL
-                        conflict_clause = "ON DUPLICATE KEY UPDATE id = id"
-                    query = f"INSERT INTO {self.table_name} ({column_names}) VALUES {values_clause} {conflict_clause}"
-                elif self.conflict_resolution == "update":
-                    # Use ON CONFLICT DO UPDATE for PostgreSQL/SQLite
-                    if self.database_type.lower() in ["postgresql", "sqlite"]:
-                        update_columns = [col for col in columns if col != "id"]
-                        if update_columns:
-                            set_parts = [
-                                f"{col} = EXCLUDED.{col}" for col in update_columns
-                            ]
-                            conflict_clause = (
-                                f"ON CONFLICT (id) DO UPDATE SET {', '.join(set_parts)}"
-                            )
-                        else:
-                            conflict_clause = "ON CONFLICT (id) DO NOTHING"
-                    else:  # MySQL
-                        update_columns = [col for col in columns if col != "id"]
-                        if update_columns:
-                            set_parts = [
-                                f"{col} = VALUES({col})" for col in update_columns
-                            ]
-                            conflict_clause = (
-                                f"ON DUPLICATE KEY UPDATE {', '.join(set_parts)}"
-                            )
-                        else:
-                            conflict_clause = "ON DUPLICATE KEY UPDATE id = id"
-                    query = f"INSERT INTO {self.table_name} ({column_names}) VALUES {values_clause} {conflict_clause}"
-                else:  # error mode (default)
-                    query = f"INSERT INTO {self.table_name} ({column_names}) VALUES {values_clause}"
+                query, params = self._build_insert_query(batch, columns)
 
                 # Execute batch using AsyncSQLDatabaseNode
                 sql_node = AsyncSQLDatabaseNode(
@@ -0,0 +1,357 @@
+"""
+Columnar aggregation engine for AggregateNode.
+
+Converts a list of record dicts into NumPy columns once (a ColumnarResult
+from a columnar List query is used directly), factorizes the
+group-by keys into integer codes and evaluates every requested aggregate
+with vectorized passes (bincount, reduceat, lexsort) instead of re-scanning
+Python lists per group.
+
+Semantics match the row-wise AggregateNode implementation:
+- values are taken from ``record.get(field)``; None and values ``float()``
+  rejects are skipped
+- groups are keyed on ``str(record.get(field, ""))`` in first-seen order
+- ``count`` of a field counts non-null values, without a field it counts rows
+- ``std``/``variance`` are sample statistics and 0 for a single value
+- ``mode`` returns the first-seen most common value
+"""
+
+import math
+from operator import methodcaller
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from ..core.columnar import ColumnarResult
+
+# Column value types for which ``a == b`` implies ``str(a) == str(b)``.
+# Mixing e.g. int with float or bool would merge 1, 1.0 and True.
+_HASHABLE_LABEL_TYPES = (
+    frozenset({str, int, type(None)}),
+    frozenset({str, bool, type(None)}),
+)
+
+
+class ColumnarFrame:
+    """Column view over a list of records, built lazily per field.
+
+    A ColumnarResult is used as is: its native numeric columns and NULL
+    masks are read directly instead of being rebuilt from records.
+    """
+
+    def __init__(self, data: Union[List[Dict[str, Any]], ColumnarResult]):
+        self.data = data
+        self.size = len(data)
+        self._columnar = isinstance(data, ColumnarResult)
+        self._numeric: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._not_null: Dict[str, np.ndarray] = {}
+
+    def _values(self, field: str, default: Any = None) -> List[Any]:
+        """Python values of a field, ``default`` where the field is missing."""
+        if not self._columnar:
+            return list(map(methodcaller("get", field, default), self.data))
+        if field not in self.data:
+            return [default] * self.size
+        return self.data.to_pylist(field)
+
+    def numeric(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (float values, valid mask) for a field."""
+        cached = self._numeric.get(field)
+        if cached is not None:
+            return cached
+
+        if self._columnar and field in self.data:
+            column = self.data.column(field)
+            if column.dtype.kind in "biuf":
+                values = column.astype(np.float64, copy=False)
+                self._numeric[field] = (values, self.not_null(field))
+                return self._numeric[field]
+
+        raw = self._values(field)
+        valid = self.not_null(field).copy()
+        try:
+            values = np.array(raw, dtype=np.float64)
+            if values.shape != (self.size,):
+                raise ValueError("non-scalar values")
+        except (ValueError, TypeError):
+            values = np.zeros(self.size, dtype=np.float64)
+            for i, value in enumerate(raw):
+                if value is None:
+                    continue
+                try:
+                    values[i] = float(value)
+                except (ValueError, TypeError):
+                    valid[i] = False
+
+        self._numeric[field] = (values, valid)
+        return values, valid
+
+    def not_null(self, field: str) -> np.ndarray:
+        """Return the mask of records where the field is present and not None."""
+        mask = self._not_null.get(field)
+        if mask is None and self._columnar:
+            if field in self.data:
+                mask = self.data.is_valid(field)
+            else:
+                mask = np.zeros(self.size, dtype=bool)
+            self._not_null[field] = mask
+        elif mask is None:
+            mask = np.fromiter(
+                (record.get(field) is not None for record in self.data),
+                dtype=bool,
+                count=self.size,
+            )
+            self._not_null[field] = mask
+        return mask
+
+    def factorize(
+        self, group_by: Sequence[str]
+    ) -> Tuple[np.ndarray, List[Tuple[str, ...]]]:
+        """Map records to dense group codes in first-seen order."""
+        if not group_by:
+            return np.zeros(self.size, dtype=np.intp), [()]
+
+        columns = [self._factorize_column(name) for name in group_by]
+        if len(columns) == 1:
+            codes, labels = columns[0]
+            return codes, [(label,) for label in labels]
+
+        if math.prod(len(labels) for _, labels in columns) >= 2**62:
+            return self._factorize_tuples(group_by)
+
+        # Combine per-column codes into one integer key per record
+        combined = np.zeros(self.size, dtype=np.int64)
+        for codes, labels in columns:
+            combined = combined * len(labels) + codes
+        _, first, inverse = np.unique(combined, return_index=True, return_inverse=True)
+
+        # np.unique sorts keys; renumber groups in first-seen order
+        order = np.argsort(first, kind="stable")
+        rank = np.empty(order.size, dtype=np.intp)
+        rank[order] = np.arange(order.size)
+        keys = [
+            tuple(labels[codes[row]] for codes, labels in columns)
+            for row in first[order].tolist()
+        ]
+        return rank[inverse.reshape(-1)], keys
+
+    def _factorize_column(self, name: str) -> Tuple[np.ndarray, List[str]]:
+        """Codes and str() labels for one group-by column."""
+        raw = self._values(name, "")
+        if any(set(map(type, raw)) <= safe for safe in _HASHABLE_LABEL_TYPES):
+            # Equal values have equal str() here, so hash the raw values and
+            # only stringify the distinct ones
+            labels: Dict[str, int] = {}
+            lookup = {
+                value: labels.setdefault(str(value), len(labels))
+                for value in dict.fromkeys(raw)
+            }
+        else:
+            raw = list(map(str, raw))
+            labels = lookup = {
+                label: code for code, label in enumerate(dict.fromkeys(raw))
+            }
+        codes = np.fromiter(map(lookup.__getitem__, raw), dtype=np.intp, count=len(raw))
+        return codes, list(labels)
+
+    def _factorize_tuples(
+        self, group_by: Sequence[str]
+    ) -> Tuple[np.ndarray, List[Tuple[str, ...]]]:
+        keys = list(zip(*(map(str, self._values(name, "")) for name in group_by)))
+        index = {key: code for code, key in enumerate(dict.fromkeys(keys))}
+        codes = np.fromiter(
+            map(index.__getitem__, keys), dtype=np.intp, count=len(keys)
+        )
+        return codes, list(index)
+
+
+def _group_starts(sorted_codes: np.ndarray) -> np.ndarray:
+    """Start offsets of each run of equal codes in a sorted code array."""
+    if sorted_codes.size == 0:
+        return np.zeros(0, dtype=np.intp)
+    return np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+
+
+def _reduce_sorted(
+    ufunc: np.ufunc, codes: np.ndarray, values: np.ndarray, n_groups: int
+) -> np.ndarray:
+    """Apply ufunc.reduceat per group; groups without values become NaN."""
+    out = np.full(n_groups, np.nan)
+    if values.size == 0:
+        return out
+    order = np.argsort(codes, kind="stable")
+    sorted_codes = codes[order]
+    starts = _group_starts(sorted_codes)
+    out[sorted_codes[starts]] = ufunc.reduceat(values[order], starts)
+    return out
+
+
+def _median(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    out = np.full(n_groups, np.nan)
+    if values.size == 0:
+        return out
+    order = np.lexsort((values, codes))
+    sorted_codes, sorted_values = codes[order], values[order]
+    starts = _group_starts(sorted_codes)
+    counts = np.diff(np.r_[starts, sorted_codes.size])
+    low = sorted_values[starts + (counts - 1) // 2]
+    high = sorted_values[starts + counts // 2]
+    out[sorted_codes[starts]] = (low + high) / 2
+    return out
+
+
+def _mode(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    out = np.full(n_groups, np.nan)
+    if values.size == 0:
+        return out
+    # lexsort is stable, so equal pairs keep their original record order
+    order = np.lexsort((values, codes))
+    sorted_codes, sorted_values = codes[order], values[order]
+
+    # Runs of identical (group, value) pairs
+    pair_starts = np.flatnonzero(
+        np.r_[
+            True,
+            (sorted_codes[1:] != sorted_codes[:-1])
+            | (sorted_values[1:] != sorted_values[:-1]),
+        ]
+    )
+    pair_counts = np.diff(np.r_[pair_starts, sorted_codes.size])
+    pair_codes = sorted_codes[pair_starts]
+    pair_values = sorted_values[pair_starts]
+    pair_first_seen = order[pair_starts]
+
+    # Most common value per group, ties broken by first occurrence
+    best = np.lexsort((pair_first_seen, -pair_counts, pair_codes))
+    best_codes = pair_codes[best]
+    first = _group_starts(best_codes)
+    out[best_codes[first]] = pair_values[best][first]
+    return out
+
+
+def _spread(
+    codes: np.ndarray, values: np.ndarray, n_groups: int, counts: np.ndarray
+) -> np.ndarray:
+    """Sample variance per group (two-pass for numerical stability)."""
+    sums = np.bincount(codes, weights=values, minlength=n_groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+        deviations = values - means[codes]
+        squares = np.bincount(
+            codes, weights=deviations * deviations, minlength=n_groups
+        )
+        return squares / (counts - 1)
+
+
+def aggregate_columns(
+    frame: ColumnarFrame,
+    codes: np.ndarray,
+    n_groups: int,
+    function: str,
+    field: Optional[str],
+) -> List[Any]:
+    """Evaluate one aggregate for every group.
+
+    Args:
+        frame: Columnar view of the records
+        codes: Group code per record (from ColumnarFrame.factorize)
+        n_groups: Number of distinct codes
+        function: Aggregation function name (unknown names fall back to sum)
+        field: Field to aggregate, or None
+
+    Returns:
+        One Python value (or None) per group, indexed by group code
+    """
+    if function == "count":
+        if field:
+            mask = frame.not_null(field)
+            counts = np.bincount(codes[mask], minlength=n_groups)
+        else:
+            counts = np.bincount(codes, minlength=n_groups)
+        return [int(count) for count in counts]
+
+    if not field:
+        return [None] * n_groups
+
+    values, valid = frame.numeric(field)
+    group_codes = codes[valid]
+    group_values = values[valid]
+    counts = np.bincount(group_codes, minlength=n_groups)
+
+    if function == "average":
+        sums = np.bincount(group_codes, weights=group_values, minlength=n_groups)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            results = sums / counts
+    elif function == "min":
+        results = _reduce_sorted(np.minimum, group_codes, group_values, n_groups)
+    elif function == "max":
+        results = _reduce_sorted(np.maximum, group_codes, group_values, n_groups)
+    elif function == "median":
+        results = _median(group_codes, group_values, n_groups)
+    elif function == "mode":
+        results = _mode(group_codes, group_values, n_groups)
+    elif function in ("std", "variance"):
+        results = _spread(group_codes, group_values, n_groups, counts)
+        if function == "std":
+            results = np.sqrt(results)
+    else:
+        results = np.bincount(group_codes, weights=group_values, minlength=n_groups)
+
+    output: List[Any] = []
+    for count, value in zip(counts.tolist(), results.tolist()):
+        if count == 0:
+            output.append(None)
+        elif function in ("std", "variance") and count == 1:
+            output.append(0)
+        else:
+            output.append(value)
+    return output
+
+
+def aggregate_records(
+    data: Union[List[Dict[str, Any]], ColumnarResult],
+    aggregations: Sequence[Tuple[str, Optional[str]]],
+    group_by: Sequence[str],
+) -> List[Any]:
+    """Compute several aggregates over the same records in one grouping pass.
+
+    Args:
+        data: Records or a ColumnarResult to aggregate (must not be empty)
+        aggregations: (function, field) pairs
+        group_by: Fields to group by; empty for a single scalar per aggregate
+
+    Returns:
+        One result per aggregation: a scalar without grouping, otherwise a
+        dict of ``{group_name: {"value", "count", "group_fields"}}``
+    """
+    frame = ColumnarFrame(data)
+    codes, keys = frame.factorize(group_by)
+    n_groups = len(keys)
+
+    per_aggregate = [
+        aggregate_columns(frame, codes, n_groups, function, field)
+        for function, field in aggregations
+    ]
+    if not group_by:
+        return [values[0] for values in per_aggregate]
+
+    sizes = np.bincount(codes, minlength=n_groups).tolist()
+    if len(group_by) == 1:
+        names = [key[0] for key in keys]
+    else:
+        names = [
+            " | ".join(f"{name}={value}" for name, value in zip(group_by, key))
+            for key in keys
+        ]
+
+    return [
+        {
+            name: {
+                "value": values[code],
+                "count": sizes[code],
+                "group_fields": dict(zip(group_by, keys[code])),
+            }
+            for code, name in enumerate(names)
+        }
+        for values in per_aggregate
+    ]
@@ -682,6 +682,136 @@ class BulkDocumentInsertNode(AsyncNode):
             }
 
 
+@register_node()
+class BulkDocumentWriteNode(AsyncNode):
+    """Apply mixed insert/update/delete operations to a MongoDB collection.
+
+    Operations are grouped into bulk write commands of ``batch_size``
+    operations each instead of one command per document. Unordered batches
+    (the default) keep going past failed operations; failures are reported
+    in ``errors`` with the index of the operation that caused them.
+
+    Parameters:
+        collection (str): Collection name [REQUIRED]
+        operations (list): Operation specs [REQUIRED], each a dict with an
+            ``op`` of insert, update_one, update_many, replace_one,
+            delete_one or delete_many
+        ordered (bool): Stop at the first failed operation (default: False)
+        batch_size (int): Operations per bulk write command (default: 1000)
+        bypass_document_validation (bool): Skip validation (default: False)
+
+    Returns:
+        dict: Result with keys:
+            - success (bool): Whether all operations succeeded
+            - inserted_count, matched_count, modified_count,
+              deleted_count, upserted_count (int): Totals
+            - upserted_ids (dict): Operation index to upserted ID
+            - batches (int): Number of bulk write commands sent
+            - errors (list): Failed operations
+            - collection (str): Collection name
+
+    Example:
+        >>> workflow.add_node("BulkDocumentWriteNode", "sync_users", {
+        ...     "collection": "users",
+        ...     "operations": [
+        ...         {"op": "insert", "document": {"name": "Alice"}},
+        ...         {"op": "update_one", "filter": {"name": "Bob"},
+        ...          "update": {"$set": {"status": "active"}}, "upsert": True},
+        ...         {"op": "delete_many", "filter": {"status": "deleted"}}
+        ...     ]
+        ... })
+    """
+
+    def get_parameters(self) -> Dict[str, NodeParameter]:
+        """Define node parameters."""
+        return {
+            "collection": NodeParameter(
+                name="collection",
+                type=str,
+                required=True,
+                description="Collection name",
+            ),
+            "operations": NodeParameter(
+                name="operations",
+                type=list,
+                required=True,
+                description="List of insert/update/replace/delete operations",
+            ),
+            "ordered": NodeParameter(
+                name="ordered",
+                type=bool,
+                required=False,
+                default=False,
+                description="Stop at the first failed operation",
+            ),
+            "batch_size": NodeParameter(
+                name="batch_size",
+                type=int,
+                required=False,
+                default=1000,
+                description="Operations per bulk write command",
+            ),
+            "bypass_document_validation": NodeParameter(
+                name="bypass_document_validation",
+                type=bool,
+                required=False,
+                default=False,
+                description="Skip document validation",
+            ),
+        }
+
+    async def async_run(self, **kwargs) -> Dict[str, Any]:
+        """Execute bulk write operation.
+
+        Args:
+            **kwargs: Node parameters
+
+        Returns:
+            dict: Bulk write result
+
+        Raises:
+            ValueError: If adapter is not MongoDBAdapter
+        """
+        validated_inputs = self.validate_inputs(**kwargs)
+
+        adapter = self.dataflow_instance.adapter
+
+        if not isinstance(adapter, MongoDBAdapter):
+            raise ValueError(
+                f"BulkDocumentWriteNode requires MongoDBAdapter, got {type(adapter).__name__}"
+            )
+
+        try:
+            result = await adapter.bulk_write(
+                collection=validated_inputs["collection"],
+                operations=validated_inputs["operations"],
+                ordered=validated_inputs.get("ordered", False),
+                batch_size=validated_inputs.get("batch_size", 1000),
+                bypass_document_validation=validated_inputs.get(
+                    "bypass_document_validation", False
+                ),
+            )
+
+            return {
+                "success": not result["errors"],
+                **result,
+                "collection": validated_inputs["collection"],
+            }
+
+        except Exception as e:
+            logger.error(f"Bulk document write failed: {e}")
+            return {
+                "success": False,
+                "inserted_count": 0,
+                "matched_count": 0,
+                "modified_count": 0,
+                "deleted_count": 0,
+                "upserted_count": 0,
+                "error": str(e),
+                "collection": validated_inputs["collection"],
+            }
+
+
 @register_node()
 class CreateIndexNode(AsyncNode):
     """Create index on MongoDB collection.
@@ -0,0 +1,242 @@
+"""Durable checkpoint store for DataFlow sagas.
+
+Checkpoints are incremental: a saga run stores its initial context once and
+then one row per completed or compensated step holding only that step's
+result and context updates. The context at any point is rebuilt by replaying
+the deltas in order, so checkpoint cost does not grow with the context.
+
+Backed by a local SQLite database in WAL mode with synchronous=FULL, so a
+checkpoint is durable once the call returns.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+# Step event kinds
+COMPLETED = "completed"
+COMPENSATED = "compensated"
+COMPENSATION_FAILED = "compensation_failed"
+
+
+@dataclass
+class SagaCheckpoint:
+    """A saga run rebuilt from its checkpoints."""
+
+    saga_id: str
+    state: str
+    context: Dict[str, Any]
+    completed_steps: List[Dict[str, Any]] = field(default_factory=list)
+    compensated_steps: List[Dict[str, Any]] = field(default_factory=list)
+    failed_step: Optional[Dict[str, Any]] = None
+
+
+def definition_fingerprint(steps: List[Dict[str, Any]]) -> str:
+    """Hash of a saga's step ids and dependencies."""
+    shape = [
+        [step.get("id", step.get("name")), step.get("depends_on")] for step in steps
+    ]
+    return hashlib.sha256(json.dumps(shape, default=str).encode()).hexdigest()[:16]
+
+
+class SagaCheckpointStore:
+    """SQLite-backed saga checkpoints.
+
+    Example:
+        store = SagaCheckpointStore("/var/lib/app/sagas.db")
+        node = DataFlowSagaCoordinatorNode(checkpoint_store=store)
+        # After a restart, running the same saga_id resumes it
+        await node.async_run(saga_id="order-1001", saga_definition=definition)
+    """
+
+    def __init__(self, path: str):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS saga_runs (
+                saga_id TEXT PRIMARY KEY,
+                fingerprint TEXT NOT NULL,
+                state TEXT NOT NULL,
+                initial_context TEXT NOT NULL,
+                failed_step TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE TABLE IF NOT EXISTS saga_step_events (
+                saga_id TEXT NOT NULL,
+                seq INTEGER NOT NULL,
+                step_id TEXT NOT NULL,
+                step_name TEXT,
+                kind TEXT NOT NULL,
+                result TEXT,
+                context_updates TEXT,
+                recorded_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                PRIMARY KEY (saga_id, seq)
+            );
+        """
+        )
+        self._connection.commit()
+
+    async def start(
+        self, saga_id: str, fingerprint: str, initial_context: Dict[str, Any]
+    ) -> None:
+        """Register a new saga run (no-op if it already exists)."""
+        await self._run(
+            "INSERT OR IGNORE INTO saga_runs "
+            "(saga_id, fingerprint, state, initial_context) VALUES (?, ?, ?, ?)",
+            (saga_id, fingerprint, "running", _dumps(initial_context)),
+        )
+
+    async def load(self, saga_id: str, fingerprint: str) -> Optional[SagaCheckpoint]:
+        """Rebuild a saga run from its checkpoints.
+
+        Raises:
+            ValueError: If the run was checkpointed with a different definition
+        """
+        return await asyncio.to_thread(self._load, saga_id, fingerprint)
+
+    async def record_step(
+        self,
+        saga_id: str,
+        step_id: str,
+        step_name: str,
+        result: Any,
+        context_updates: Dict[str, Any],
+    ) -> None:
+        """Checkpoint one completed step as a context delta."""
+        await self._append_event(
+            saga_id, step_id, step_name, COMPLETED, result, context_updates
+        )
+
+    async def record_compensation(
+        self, saga_id: str, step_id: str, step_name: str, failed: bool = False
+    ) -> None:
+        """Checkpoint the compensation of one step."""
+        await self._append_event(
+            saga_id,
+            step_id,
+            step_name,
+            COMPENSATION_FAILED if failed else COMPENSATED,
+            None,
+            None,
+        )
+
+    async def set_state(
+        self, saga_id: str, state: str, failed_step: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Update the state of a saga run."""
+        await self._run(
+            "UPDATE saga_runs SET state = ?, "
+            "failed_step = COALESCE(?, failed_step), "
+            "updated_at = CURRENT_TIMESTAMP WHERE saga_id = ?",
+            (state, _dumps(failed_step) if failed_step else None, saga_id),
+        )
+
+    async def delete(self, saga_id: str) -> None:
+        """Remove a saga run and its checkpoints."""
+        await asyncio.to_thread(self._delete, saga_id)
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._connection.close()
+
+    # ------------------------------------------------------------------
+    # Blocking helpers (run on a worker thread)
+    # ------------------------------------------------------------------
+
+    async def _run(self, sql: str, params: tuple) -> None:
+        await asyncio.to_thread(self._execute, sql, params)
+
+    def _execute(self, sql: str, params: tuple) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(sql, params)
+
+    async def _append_event(self, saga_id, step_id, step_name, kind, result, updates):
+        await asyncio.to_thread(
+            self._insert_event, saga_id, step_id, step_name, kind, result, updates
+        )
+
+    def _insert_event(self, saga_id, step_id, step_name, kind, result, updates):
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT INTO saga_step_events "
+                "(saga_id, seq, step_id, step_name, kind, result, context_updates) "
+                "SELECT ?, COALESCE(MAX(seq), 0) + 1, ?, ?, ?, ?, ? "
+                "FROM saga_step_events WHERE saga_id = ?",
+                (
+                    saga_id,
+                    step_id,
+                    step_name,
+                    kind,
+                    _dumps(result),
+                    _dumps(updates) if updates else None,
+                    saga_id,
+                ),
+            )
+
+    def _load(self, saga_id: str, fingerprint: str) -> Optional[SagaCheckpoint]:
+        with self._lock:
+            run = self._connection.execute(
+                "SELECT fingerprint, state, initial_context, failed_step "
+                "FROM saga_runs WHERE saga_id = ?",
+                (saga_id,),
+            ).fetchone()
+            if run is None:
+                return None
+            events = self._connection.execute(
+                "SELECT step_id, step_name, kind, result, context_updates "
+                "FROM saga_step_events WHERE saga_id = ? ORDER BY seq",
+                (saga_id,),
+            ).fetchall()
+
+        if run[0] != fingerprint:
+            raise ValueError(
+                f"Saga {saga_id} was checkpointed with a different definition"
+            )
+
+        checkpoint = SagaCheckpoint(
+            saga_id=saga_id,
+            state=run[1],
+            context=json.loads(run[2]),
+            failed_step=json.loads(run[3]) if run[3] else None,
+        )
+        for step_id, step_name, kind, result, updates in events:
+            if kind == COMPLETED:
+                checkpoint.completed_steps.append(
+                    {"id": step_id, "name": step_name, "result": json.loads(result)}
+                )
+                if updates:
+                    checkpoint.context.update(json.loads(updates))
+            else:
+                compensated = {"id": step_id, "name": step_name}
+                if kind == COMPENSATION_FAILED:
+                    compensated["compensation_failed"] = True
+                checkpoint.compensated_steps.append(compensated)
+        return checkpoint
+
+    def _delete(self, saga_id: str) -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM saga_step_events WHERE saga_id = ?", (saga_id,)
+            )
+            self._connection.execute(
+                "DELETE FROM saga_runs WHERE saga_id = ?", (saga_id,)
+            )
+
+
+def _dumps(value: Any) -> str:
+    return json.dumps(value, default=str)
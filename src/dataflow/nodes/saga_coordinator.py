@@ -1,10 +1,11 @@
 """DataFlow Saga Coordinator Node - SDK Compliant Implementation."""
 
 import asyncio
+import inspect
 import uuid
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from kailash.nodes.base import NodeParameter, register_node
 from kailash.nodes.base_async import AsyncNode
@@ -13,6 +14,8 @@ from kailash.nodes.transaction.saga_coordinator import (
 )
 from kailash.sdk_exceptions import NodeExecutionError, NodeValidationError
 
+from .saga_checkpoint_store import SagaCheckpointStore, definition_fingerprint
+
 
 class SagaState(Enum):
     """Saga execution states."""
@@ -25,6 +28,15 @@ class SagaState(Enum):
     COMPENSATED = "compensated"
 
 
+class _StepFailed(Exception):
+    """A step that failed after exhausting its retries."""
+
+    def __init__(self, error: Exception, retries: int):
+        super().__init__(str(error))
+        self.error = error
+        self.retries = retries
+
+
 @register_node()
 class DataFlowSagaCoordinatorNode(AsyncNode):
     """Node for coordinating saga transactions in DataFlow operations.
@@ -39,12 +51,26 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
         enable_partial_rollback: Allow partial rollback on failure
         enable_step_retries: Enable automatic step retries
         enable_compensation_retries: Enable compensation retries
+        checkpoint_path: SQLite file for durable checkpoints (or pass a
+            SagaCheckpointStore as checkpoint_store); without one,
+            checkpoints are kept in memory only
+        step_handler: Object with async ``execute(step, context)`` and
+            ``compensate(step, compensation, context)`` methods, used for
+            steps whose action / compensation is not a callable
 
     Runtime Parameters (provided during execution):
         saga_definition: Definition of saga steps and compensations
         initial_context: Initial context for saga execution
         checkpoint_enabled: Enable checkpointing for recovery
         async_compensation: Execute compensations asynchronously
+        saga_id: Stable id of the saga run; running a checkpointed id again
+            resumes it after its last completed step
+
+    Steps run one after another unless they declare ``depends_on`` (a list
+    of step ids, possibly empty): steps whose dependencies are met are
+    grouped into levels and each level runs concurrently. A step without
+    ``depends_on`` depends on the step before it. Compensation walks the
+    levels in reverse, compensating the steps of a level concurrently.
     """
 
     def __init__(self, **kwargs):
@@ -58,13 +84,18 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
         self.enable_compensation_retries = kwargs.pop(
             "enable_compensation_retries", True
         )
+        self.step_handler = kwargs.pop("step_handler", None)
+        self.checkpoint_store = kwargs.pop("checkpoint_store", None)
+        checkpoint_path = kwargs.pop("checkpoint_path", None)
+        if self.checkpoint_store is None and checkpoint_path:
+            self.checkpoint_store = SagaCheckpointStore(checkpoint_path)
 
         # Call parent constructor
         super().__init__(**kwargs)
 
         # Initialize the SDK SagaCoordinator
         self.saga_coordinator = SDKSagaCoordinator(
-            node_id=f"{self.node_id}_sdk_saga",
+            node_id=f"{self.id}_sdk_saga",
             compensation_strategy=self.compensation_strategy,
             timeout=self.timeout_seconds,
             max_retries=self.max_retries,
@@ -101,11 +132,18 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
                 default=False,
                 description="Execute compensations asynchronously",
             ),
+            "saga_id": NodeParameter(
+                name="saga_id",
+                type=str,
+                required=False,
+                default=None,
+                description="Saga run id; a checkpointed id is resumed",
+            ),
         }
 
     async def async_run(self, **kwargs) -> dict[str, Any]:
         """Execute saga transaction asynchronously."""
-        saga_id = str(uuid.uuid4())
+        saga_id = kwargs.get("saga_id") or str(uuid.uuid4())
         start_time = datetime.utcnow()
 
         try:
@@ -138,6 +176,23 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
                 "start_time": start_time,
             }
 
+            # Resume from durable checkpoints, or register the new run
+            resumed_steps = 0
+            if self.checkpoint_store and checkpoint_enabled:
+                fingerprint = definition_fingerprint(saga_definition["steps"])
+                checkpoint = await self.checkpoint_store.load(saga_id, fingerprint)
+                if checkpoint is None:
+                    await self.checkpoint_store.start(
+                        saga_id, fingerprint, initial_context
+                    )
+                else:
+                    saga_state["state"] = SagaState(checkpoint.state)
+                    saga_state["context"] = checkpoint.context
+                    saga_state["completed_steps"] = checkpoint.completed_steps
+                    saga_state["compensated_steps"] = checkpoint.compensated_steps
+                    saga_state["failed_step"] = checkpoint.failed_step
+                    resumed_steps = len(checkpoint.completed_steps)
+
             # Execute saga
             result = await self._execute_saga(
                 saga_state, checkpoint_enabled, async_compensation
@@ -161,6 +216,10 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
                     "compensation_strategy": self.compensation_strategy,
                     "checkpoints_created": len(result.get("checkpoints", [])),
                     "retries_used": result.get("total_retries", 0),
+                    "parallel_levels": len(
+                        self._build_step_levels(saga_definition["steps"])
+                    ),
+                    "resumed_steps": resumed_steps,
                 },
             }
 
@@ -233,8 +292,61 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
                     ):
                         errors.append(f"Step {i} missing compensation action")
 
+                if not errors:
+                    try:
+                        self._build_step_levels(steps)
+                    except ValueError as e:
+                        errors.append(str(e))
+
         return {"valid": len(errors) == 0, "errors": errors}
 
+    def _build_step_levels(
+        self, steps: List[Dict[str, Any]]
+    ) -> List[List[Dict[str, Any]]]:
+        """Group steps into levels whose steps can run concurrently.
+
+        Raises:
+            ValueError: On duplicate step ids, unknown dependencies or cycles
+        """
+        step_ids = [step.get("id", step["name"]) for step in steps]
+        if len(set(step_ids)) != len(step_ids):
+            raise ValueError("Step ids must be unique")
+
+        dependencies: Dict[str, List[str]] = {}
+        for i, step in enumerate(steps):
+            depends_on = step.get("depends_on")
+            if depends_on is None:
+                depends_on = step_ids[i - 1 : i]  # the previous step
+            unknown = set(depends_on) - set(step_ids)
+            if unknown:
+                raise ValueError(
+                    f"Step {step_ids[i]} depends on unknown steps {sorted(unknown)}"
+                )
+            dependencies[step_ids[i]] = list(depends_on)
+
+        level_of: Dict[str, int] = {}
+        remaining = dict(zip(step_ids, steps))
+        while remaining:
+            ready = [
+                step_id
+                for step_id in remaining
+                if all(dep in level_of for dep in dependencies[step_id])
+            ]
+            if not ready:
+                raise ValueError(f"Step dependencies form a cycle: {sorted(remaining)}")
+            for step_id in ready:
+                level_of[step_id] = 1 + max(
+                    (level_of[dep] for dep in dependencies[step_id]), default=-1
+                )
+                del remaining[step_id]
+
+        levels: List[List[Dict[str, Any]]] = [
+            [] for _ in range(max(level_of.values()) + 1)
+        ]
+        for step_id, step in zip(step_ids, steps):
+            levels[level_of[step_id]].append(step)
+        return levels
+
     async def _execute_saga(
         self,
         saga_state: Dict[str, Any],
@@ -246,73 +358,111 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
         compensation_latencies = {}
         total_retries = 0
 
+        def failure_result(reason: str) -> Dict[str, Any]:
+            return {
+                "success": False,
+                "state": saga_state["state"],
+                "completed_steps": saga_state["completed_steps"],
+                "failed_step": saga_state["failed_step"],
+                "compensated_steps": saga_state["compensated_steps"],
+                "failure_reason": reason,
+                "context": saga_state["context"],
+                "step_latencies": step_latencies,
+                "compensation_latencies": compensation_latencies,
+                "total_retries": total_retries,
+                "checkpoints": saga_state["checkpoints"],
+            }
+
         try:
-            # Execute steps sequentially
-            for step in saga_state["definition"]["steps"]:
-                step_start = datetime.utcnow()
-                step_id = step.get("id", step["name"])
-
-                # Create checkpoint if enabled
-                if checkpoint_enabled:
-                    await self._create_checkpoint(saga_state)
-
-                # Execute step with retries
-                step_result = None
-                for retry in range(self.max_retries):
-                    try:
-                        step_result = await self._execute_step(
-                            step, saga_state["context"]
-                        )
-                        break
-                    except Exception as e:
-                        total_retries += 1
-                        if retry == self.max_retries - 1:
-                            # Final retry failed
-                            saga_state["failed_step"] = {
+            if saga_state["state"] in (
+                SagaState.COMPENSATING,
+                SagaState.COMPENSATED,
+                SagaState.FAILED,
+            ):
+                # Resumed a saga that had already failed: finish compensating
+                await self._compensate_saga(
+                    saga_state, async_compensation, compensation_latencies
+                )
+                failed = saga_state["failed_step"] or {}
+                return failure_result(failed.get("error", "Saga failed before resume"))
+
+            completed = {step["id"] for step in saga_state["completed_steps"]}
+
+            # Execute levels in order; the steps of a level run concurrently
+            for level in self._build_step_levels(saga_state["definition"]["steps"]):
+                pending = [
+                    step
+                    for step in level
+                    if step.get("id", step["name"]) not in completed
+                ]
+                if not pending:
+                    continue
+
+                outcomes = await asyncio.gather(
+                    *(
+                        self._run_step(step, saga_state["context"], step_latencies)
+                        for step in pending
+                    ),
+                    return_exceptions=True,
+                )
+
+                failure = None
+                for step, outcome in zip(pending, outcomes):
+                    step_id = step.get("id", step["name"])
+                    if isinstance(outcome, BaseException):
+                        retries = getattr(outcome, "retries", 1)
+                        total_retries += retries
+                        if failure is None:
+                            failure = {
                                 "id": step_id,
                                 "name": step["name"],
-                                "error": str(e),
-                                "retries": retry + 1,
-                            }
-                            saga_state["state"] = SagaState.COMPENSATING
-
-                            # Start compensation
-                            await self._compensate_saga(
-                                saga_state, async_compensation, compensation_latencies
-                            )
-
-                            return {
-                                "success": False,
-                                "state": saga_state["state"],
-                                "completed_steps": saga_state["completed_steps"],
-                                "failed_step": saga_state["failed_step"],
-                                "compensated_steps": saga_state["compensated_steps"],
-                                "failure_reason": str(e),
-                                "context": saga_state["context"],
-                                "step_latencies": step_latencies,
-                                "compensation_latencies": compensation_latencies,
-                                "total_retries": total_retries,
-                                "checkpoints": saga_state["checkpoints"],
+                                "error": str(outcome),
+                                "retries": retries,
                             }
+                        continue
 
-                        # Retry with exponential backoff
-                        await asyncio.sleep(2**retry)
+                    step_result, retries = outcome
+                    total_retries += retries
 
-                # Step completed successfully
-                saga_state["completed_steps"].append(
-                    {"id": step_id, "name": step["name"], "result": step_result}
-                )
+                    # Step completed successfully
+                    completed_step = {
+                        "id": step_id,
+                        "name": step["name"],
+                        "result": step_result,
+                    }
+                    saga_state["completed_steps"].append(completed_step)
+                    completed.add(step_id)
+
+                    # Update context with step result
+                    context_updates = {}
+                    if (
+                        isinstance(step_result, dict)
+                        and "context_updates" in step_result
+                    ):
+                        context_updates = step_result["context_updates"]
+                        saga_state["context"].update(context_updates)
 
-                # Update context with step result
-                if isinstance(step_result, dict) and "context_updates" in step_result:
-                    saga_state["context"].update(step_result["context_updates"])
+                    if checkpoint_enabled:
+                        await self._create_checkpoint(
+                            saga_state, completed_step, context_updates
+                        )
 
-                # Record latency
-                step_duration = (datetime.utcnow() - step_start).total_seconds()
-                step_latencies[step_id] = step_duration * 1000
+                if failure is not None:
+                    saga_state["failed_step"] = failure
+                    saga_state["state"] = SagaState.COMPENSATING
+                    await self._persist_state(saga_state, checkpoint_enabled)
+
+                    # Start compensation
+                    await self._compensate_saga(
+                        saga_state, async_compensation, compensation_latencies
+                    )
+                    await self._persist_state(saga_state, checkpoint_enabled)
+
+                    return failure_result(failure["error"])
 
             # All steps completed successfully
             saga_state["state"] = SagaState.COMPLETED
+            await self._persist_state(saga_state, checkpoint_enabled)
 
             return {
                 "success": True,
@@ -332,26 +482,59 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
             await self._compensate_saga(
                 saga_state, async_compensation, compensation_latencies
             )
+            await self._persist_state(saga_state, checkpoint_enabled)
 
-            return {
-                "success": False,
-                "state": saga_state["state"],
-                "completed_steps": saga_state["completed_steps"],
-                "compensated_steps": saga_state["compensated_steps"],
-                "failure_reason": str(e),
-                "context": saga_state["context"],
-                "step_latencies": step_latencies,
-                "compensation_latencies": compensation_latencies,
-                "total_retries": total_retries,
-                "checkpoints": saga_state["checkpoints"],
-            }
+            return failure_result(str(e))
+
+    async def _run_step(
+        self,
+        step: Dict[str, Any],
+        context: Dict[str, Any],
+        step_latencies: Dict[str, float],
+    ) -> Tuple[Any, int]:
+        """Execute one step with retries; returns (result, retries used).
+
+        Raises:
+            _StepFailed: Once the final retry failed
+        """
+        step_start = datetime.utcnow()
+        step_id = step.get("id", step["name"])
+
+        retries = 0
+        for retry in range(self.max_retries):
+            try:
+                step_result = await self._execute_step(step, context)
+                break
+            except Exception as e:
+                retries += 1
+                if retry == self.max_retries - 1:
+                    raise _StepFailed(e, retries) from e
+
+                # Retry with exponential backoff
+                await asyncio.sleep(2**retry)
+
+        # Record latency
+        step_duration = (datetime.utcnow() - step_start).total_seconds()
+        step_latencies[step_id] = step_duration * 1000
+
+        return step_result, retries
 
     async def _execute_step(
         self, step: Dict[str, Any], context: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Execute a single saga step."""
-        # Use SDK saga coordinator to execute step
-        return await self.saga_coordinator.execute_step(step, context)
+        action = step["action"]
+        if callable(action):
+            result = action(context)
+        elif self.step_handler is not None:
+            result = self.step_handler.execute(step, context)
+        else:
+            # Use SDK saga coordinator to execute step
+            result = self.saga_coordinator.execute_step(step, context)
+
+        if inspect.isawaitable(result):
+            result = await result
+        return result
 
     async def _compensate_saga(
         self,
@@ -363,55 +546,78 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
         if self.compensation_strategy == "none":
             return
 
-        # Get steps to compensate
-        steps_to_compensate = []
-        for completed_step in reversed(saga_state["completed_steps"]):
-            step_def = next(
-                (
-                    s
-                    for s in saga_state["definition"]["steps"]
-                    if s.get("id", s["name"]) == completed_step["id"]
-                ),
-                None,
-            )
-            if step_def and "compensation" in step_def:
-                steps_to_compensate.append((completed_step, step_def["compensation"]))
-
-        if async_compensation and self.compensation_strategy == "parallel":
-            # Execute compensations in parallel
-            compensation_tasks = []
-            for completed_step, compensation in steps_to_compensate:
-                task = self._compensate_step_async(
-                    completed_step, compensation, saga_state, compensation_latencies
+        # Get steps to compensate (skipping any compensated before a resume)
+        already_compensated = {
+            step["id"]
+            for step in saga_state["compensated_steps"]
+            if not step.get("compensation_failed")
+        }
+        step_defs = {
+            s.get("id", s["name"]): s for s in saga_state["definition"]["steps"]
+        }
+        to_compensate = {}
+        for completed_step in saga_state["completed_steps"]:
+            step_def = step_defs.get(completed_step["id"])
+            if (
+                step_def
+                and "compensation" in step_def
+                and completed_step["id"] not in already_compensated
+            ):
+                to_compensate[completed_step["id"]] = (
+                    completed_step,
+                    step_def["compensation"],
                 )
-                compensation_tasks.append(task)
 
-            await asyncio.gather(*compensation_tasks, return_exceptions=True)
+        if async_compensation and self.compensation_strategy == "parallel":
+            # Execute all compensations in parallel
+            batches = [list(to_compensate)]
         else:
-            # Execute compensations sequentially
-            for completed_step, compensation in steps_to_compensate:
-                await self._compensate_step(
-                    completed_step, compensation, saga_state, compensation_latencies
+            # Reverse level order; steps of one level never depend on each
+            # other, so their compensations run concurrently
+            batches = [
+                [
+                    step.get("id", step["name"])
+                    for step in level
+                    if step.get("id", step["name"]) in to_compensate
+                ]
+                for level in reversed(
+                    self._build_step_levels(saga_state["definition"]["steps"])
                 )
+            ]
+
+        for batch in batches:
+            await asyncio.gather(
+                *(
+                    self._compensate_step_async(
+                        to_compensate[step_id][0],
+                        to_compensate[step_id][1],
+                        saga_state,
+                        compensation_latencies,
+                    )
+                    for step_id in batch
+                ),
+                return_exceptions=True,
+            )
 
         saga_state["state"] = SagaState.COMPENSATED
 
     async def _compensate_step(
         self,
         step: Dict[str, Any],
-        compensation: Dict[str, Any],
+        compensation: Any,
         saga_state: Dict[str, Any],
         latencies: Dict[str, float],
     ) -> None:
         """Compensate a single step."""
         comp_start = datetime.utcnow()
         step_id = step["id"]
+        attempts = self.max_retries if self.enable_compensation_retries else 1
 
-        for retry in range(self.max_retries if self.enable_compensation_retries else 1):
+        for retry in range(attempts):
             try:
                 # Execute compensation
-                await self.saga_coordinator.execute_compensation(
-                    compensation, saga_state["context"]
+                await self._execute_compensation(
+                    step, compensation, saga_state["context"]
                 )
 
                 # Record successful compensation
@@ -422,6 +628,10 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
                         "compensated_at": datetime.utcnow().isoformat(),
                     }
                 )
+                if self.checkpoint_store:
+                    await self.checkpoint_store.record_compensation(
+                        saga_state["id"], step_id, step["name"]
+                    )
 
                 # Record latency
                 comp_duration = (datetime.utcnow() - comp_start).total_seconds()
@@ -429,7 +639,7 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
 
                 break
             except Exception:
-                if retry == self.max_retries - 1:
+                if retry == attempts - 1:
                     # Log but continue with other compensations
                     saga_state["compensated_steps"].append(
                         {
@@ -438,10 +648,29 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
                             "compensation_failed": True,
                         }
                     )
+                    if self.checkpoint_store:
+                        await self.checkpoint_store.record_compensation(
+                            saga_state["id"], step_id, step["name"], failed=True
+                        )
+                    break
 
                 # Retry with backoff
                 await asyncio.sleep(2**retry)
 
+    async def _execute_compensation(
+        self, step: Dict[str, Any], compensation: Any, context: Dict[str, Any]
+    ) -> None:
+        """Run the compensation of a completed step."""
+        if callable(compensation):
+            result = compensation(context)
+        elif self.step_handler is not None:
+            result = self.step_handler.compensate(step, compensation, context)
+        else:
+            result = self.saga_coordinator.execute_compensation(compensation, context)
+
+        if inspect.isawaitable(result):
+            await result
+
     async def _compensate_step_async(
         self,
         step: Dict[str, Any],
@@ -452,15 +681,41 @@ class DataFlowSagaCoordinatorNode(AsyncNode):
         """Async wrapper for step compensation."""
         await self._compensate_step(step, compensation, saga_state, latencies)
 
-    async def _create_checkpoint(self, saga_state: Dict[str, Any]) -> None:
-        """Create a checkpoint for saga recovery."""
+    async def _create_checkpoint(
+        self,
+        saga_state: Dict[str, Any],
+        completed_step: Dict[str, Any],
+        context_updates: Dict[str, Any],
+    ) -> None:
+        """Checkpoint a completed step as a delta for saga recovery."""
         checkpoint = {
             "timestamp": datetime.utcnow().isoformat(),
+            "step_id": completed_step["id"],
             "completed_steps": len(saga_state["completed_steps"]),
-            "context_snapshot": saga_state["context"].copy(),
+            "context_updates": context_updates,
         }
         saga_state["checkpoints"].append(checkpoint)
 
+        if self.checkpoint_store:
+            await self.checkpoint_store.record_step(
+                saga_state["id"],
+                completed_step["id"],
+                completed_step["name"],
+                completed_step["result"],
+                context_updates,
+            )
+
+    async def _persist_state(
+        self, saga_state: Dict[str, Any], checkpoint_enabled: bool
+    ) -> None:
+        """Record the saga state in the durable checkpoint store."""
+        if self.checkpoint_store and checkpoint_enabled:
+            await self.checkpoint_store.set_state(
+                saga_state["id"],
+                saga_state["state"].value,
+                saga_state["failed_step"],
+            )
+
     def _calculate_avg_latency(self, latencies: Dict[str, float]) -> float:
         """Calculate average latency from latency dictionary."""
         if not latencies:
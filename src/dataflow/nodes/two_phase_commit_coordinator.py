@@ -1,6 +1,8 @@
 """DataFlow Two-Phase Commit Coordinator Node - SDK Compliant Implementation."""
 
 import asyncio
+import inspect
+import logging
 import uuid
 from datetime import datetime
 from enum import Enum
@@ -13,6 +15,10 @@ from kailash.nodes.transaction.two_phase_commit import (
 )
 from kailash.sdk_exceptions import NodeExecutionError, NodeValidationError
 
+from .two_phase_commit_log import TwoPhaseCommitLog
+
+logger = logging.getLogger(__name__)
+
 
 class TransactionPhase(Enum):
     """Two-phase commit transaction phases."""
@@ -40,12 +46,30 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
         max_participants: Maximum number of participants
         enable_recovery: Enable recovery from failures
         recovery_interval: Recovery check interval in seconds
+        max_commit_retries: Commit retries per participant before leaving the
+            transaction to log recovery
+        decision_log_path: Path of the durable decision log (or pass a
+            TwoPhaseCommitLog as decision_log); without one, decisions are
+            kept in memory only
+        participant_handler: Object with async prepare/commit/abort methods
+            called as ``method(participant, transaction_id, data)``; a
+            participant dict may instead carry its own callables under those
+            keys. Log recovery needs the handler, since callables are not
+            persisted.
 
     Runtime Parameters (provided during execution):
         participants: List of transaction participants
         transaction_data: Data for the transaction
         isolation_level: Transaction isolation level
-        synchronous_prepare: Execute prepare phase synchronously
+        synchronous_prepare: Prepare participants one at a time instead of
+            concurrently
+
+    Participants are prepared concurrently, each bounded by prepare_timeout;
+    the first failed vote cancels the outstanding prepares and aborts the
+    transaction. A commit decision is forced to the decision log before any
+    participant commits, and on start-up (enable_recovery) transactions left
+    unfinished in the log are driven to completion: committed if the commit
+    decision was logged, aborted otherwise.
     """
 
     def __init__(self, **kwargs):
@@ -57,13 +81,20 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
         self.max_participants = kwargs.pop("max_participants", 10)
         self.enable_recovery = kwargs.pop("enable_recovery", True)
         self.recovery_interval = kwargs.pop("recovery_interval", 5)
+        self.max_commit_retries = kwargs.pop("max_commit_retries", 3)
+        self.participant_handler = kwargs.pop("participant_handler", None)
+        self.decision_log = kwargs.pop("decision_log", None)
+        decision_log_path = kwargs.pop("decision_log_path", None)
+        if self.decision_log is None and decision_log_path:
+            self.decision_log = TwoPhaseCommitLog(decision_log_path)
+        self._log_recovered = False
 
         # Call parent constructor
         super().__init__(**kwargs)
 
         # Initialize the SDK 2PC Coordinator
         self.tpc_coordinator = SDK2PCCoordinator(
-            node_id=f"{self.node_id}_sdk_2pc",
+            node_id=f"{self.id}_sdk_2pc",
             timeout=self.timeout_seconds,
             prepare_timeout=self.prepare_timeout,
             commit_timeout=self.commit_timeout,
@@ -96,8 +127,8 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
                 name="synchronous_prepare",
                 type=bool,
                 required=False,
-                default=True,
-                description="Execute prepare phase synchronously",
+                default=False,
+                description="Prepare participants one at a time instead of concurrently",
             ),
         }
 
@@ -114,7 +145,7 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
             participants = validated_inputs.get("participants", [])
             transaction_data = validated_inputs.get("transaction_data", {})
             isolation_level = validated_inputs.get("isolation_level", "READ_COMMITTED")
-            synchronous_prepare = validated_inputs.get("synchronous_prepare", True)
+            synchronous_prepare = validated_inputs.get("synchronous_prepare", False)
 
             # Validate participants
             if not participants:
@@ -125,6 +156,17 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
                     f"Too many participants: {len(participants)} > {self.max_participants}"
                 )
 
+            # Stable ids: results, latencies and the decision log refer to them
+            participants = [
+                {**participant, "id": participant.get("id") or f"participant_{i}"}
+                for i, participant in enumerate(participants)
+            ]
+
+            # Finish transactions a previous coordinator left in the log
+            if self.enable_recovery and self.decision_log and not self._log_recovered:
+                self._log_recovered = True
+                await self.recover_transactions()
+
             # Initialize transaction state
             transaction_state = {
                 "id": transaction_id,
@@ -162,9 +204,13 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
                     "isolation_level": isolation_level,
                     "synchronous_prepare": synchronous_prepare,
                     "recovery_enabled": self.enable_recovery,
+                    "decision_logged": self.decision_log is not None,
                 },
             }
 
+            if result.get("recovered"):
+                result_data["metadata"]["recovered_after_commit_failure"] = True
+
             # Add participant details
             if result.get("prepared_participants"):
                 result_data["prepared_participants"] = result["prepared_participants"]
@@ -179,6 +225,11 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
             if result.get("aborted_participants"):
                 result_data["aborted_participants"] = result["aborted_participants"]
 
+            if "pending_participants" in result:
+                # Committed, but these participants have not acknowledged yet
+                result_data["pending_participants"] = result["pending_participants"]
+                result_data["failure_reasons"] = result.get("failure_reasons", [])
+
             # Add performance metrics
             result_data["performance_metrics"] = {
                 "prepare_phase_latency_ms": result.get("prepare_latency", 0) * 1000,
@@ -208,8 +259,14 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
         commit_latency = 0
         participant_latencies = {}
         failure_reasons = []
+        transaction_id = transaction_state["id"]
 
         try:
+            if self.decision_log:
+                await self.decision_log.log_begin(
+                    transaction_id, transaction_state["participants"]
+                )
+
             # Phase 1: Prepare
             prepare_start = datetime.utcnow()
             transaction_state["phase"] = TransactionPhase.PREPARING
@@ -240,8 +297,11 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
                     "participant_latencies": participant_latencies,
                 }
 
-            # All participants prepared - proceed to commit
+            # All participants prepared - the decision must be durable before
+            # any participant is told to commit
             transaction_state["phase"] = TransactionPhase.PREPARED
+            if self.decision_log:
+                await self.decision_log.log_decision(transaction_id, commit=True)
 
             # Phase 2: Commit
             commit_start = datetime.utcnow()
@@ -251,10 +311,19 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
                 transaction_state, participant_latencies, failure_reasons
             )
 
+            recovered = False
+            if not commit_success and self.enable_recovery:
+                # The decision is final: keep driving the stragglers
+                recovered = await self._attempt_recovery(
+                    transaction_state, participant_latencies
+                )
+
             commit_latency = (datetime.utcnow() - commit_start).total_seconds()
 
-            if commit_success:
+            if commit_success or recovered:
                 transaction_state["phase"] = TransactionPhase.COMMITTED
+                if self.decision_log:
+                    await self.decision_log.log_end(transaction_id)
 
                 return {
                     "success": True,
@@ -266,14 +335,10 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
                     "prepare_latency": prepare_latency,
                     "commit_latency": commit_latency,
                     "participant_latencies": participant_latencies,
+                    "recovered": recovered,
                 }
             else:
-                # Commit failed - this is a serious error requiring recovery
-                if self.enable_recovery:
-                    await self._attempt_recovery(
-                        transaction_state, participant_latencies
-                    )
-
+                # Commit failed - left in the decision log for recovery
                 return {
                     "success": False,
                     "phase": transaction_state["phase"],
@@ -290,6 +355,40 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
                 }
 
         except Exception as e:
+            if transaction_state["phase"] in (
+                TransactionPhase.COMMITTING,
+                TransactionPhase.COMMITTED,
+            ):
+                # Past the commit decision nothing may be aborted: the outcome
+                # is COMMITTED and unacknowledged participants await retry
+                committed = {
+                    c["id"] for c in transaction_state["committed_participants"]
+                }
+                # Every participant prepared; list them in the caller's order
+                pending = [
+                    p["id"]
+                    for p in transaction_state["participants"]
+                    if p["id"] not in committed
+                ]
+                logger.error(
+                    f"Transaction {transaction_id} failed after its commit "
+                    f"decision; participants to retry: {pending}: {e}"
+                )
+                transaction_state["phase"] = TransactionPhase.COMMITTED
+                return {
+                    "success": not pending,
+                    "phase": transaction_state["phase"],
+                    "prepared_participants": transaction_state["prepared_participants"],
+                    "committed_participants": transaction_state[
+                        "committed_participants"
+                    ],
+                    "pending_participants": pending,
+                    "failure_reasons": [str(e)],
+                    "prepare_latency": prepare_latency,
+                    "commit_latency": commit_latency,
+                    "participant_latencies": participant_latencies,
+                }
+
             # Unexpected error - abort all
             transaction_state["phase"] = TransactionPhase.ABORTING
             await self._abort_phase(transaction_state, participant_latencies)
@@ -319,96 +418,93 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
         if synchronous:
             # Prepare participants sequentially
             for participant in participants:
-                p_start = datetime.utcnow()
-                participant_id = participant.get("id", str(uuid.uuid4()))
-
                 try:
-                    # Prepare participant
-                    prepare_result = await self._prepare_participant(
-                        participant, transaction_state
+                    result = await self._prepare_participant_async(
+                        participant, transaction_state, latencies
                     )
-
-                    if prepare_result["prepared"]:
-                        transaction_state["prepared_participants"].append(
-                            {
-                                "id": participant_id,
-                                "name": participant.get("name", "unknown"),
-                                "prepared_at": datetime.utcnow().isoformat(),
-                            }
-                        )
-                    else:
-                        transaction_state["failed_participants"].append(
-                            {
-                                "id": participant_id,
-                                "name": participant.get("name", "unknown"),
-                                "reason": prepare_result.get("reason", "Unknown"),
-                            }
-                        )
-                        failure_reasons.append(
-                            f"Participant {participant_id} prepare failed: {prepare_result.get('reason')}"
-                        )
-                        return False
-
-                    # Record latency
-                    p_duration = (datetime.utcnow() - p_start).total_seconds()
-                    latencies[f"{participant_id}_prepare"] = p_duration * 1000
-
                 except Exception as e:
-                    transaction_state["failed_participants"].append(
-                        {
-                            "id": participant_id,
-                            "name": participant.get("name", "unknown"),
-                            "error": str(e),
-                        }
-                    )
-                    failure_reasons.append(
-                        f"Participant {participant_id} prepare error: {str(e)}"
-                    )
+                    result = e
+                if not self._record_prepare_result(
+                    transaction_state, participant, result, failure_reasons
+                ):
                     return False
-        else:
-            # Prepare participants in parallel
-            prepare_tasks = []
-            for participant in participants:
-                task = self._prepare_participant_async(
+            return True
+
+        # Prepare participants concurrently; the phase takes as long as the
+        # slowest participant rather than the sum of all of them
+        tasks = {
+            asyncio.ensure_future(
+                self._prepare_participant_async(
                     participant, transaction_state, latencies
                 )
-                prepare_tasks.append(task)
+            ): participant
+            for participant in participants
+        }
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                result = task.exception() or task.result()
+                if not self._record_prepare_result(
+                    transaction_state, tasks[task], result, failure_reasons
+                ):
+                    # One NO vote decides the outcome; stop waiting for the rest
+                    for other in pending:
+                        other.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                    return False
 
-            results = await asyncio.gather(*prepare_tasks, return_exceptions=True)
+        return True
 
-            # Check results
-            for i, result in enumerate(results):
-                participant = participants[i]
-                participant_id = participant.get("id", str(uuid.uuid4()))
+    def _record_prepare_result(
+        self,
+        transaction_state: Dict[str, Any],
+        participant: Dict[str, Any],
+        result: Any,
+        failure_reasons: List[str],
+    ) -> bool:
+        """Record one prepare vote; returns whether the participant prepared."""
+        participant_id = participant["id"]
 
-                if isinstance(result, Exception):
-                    transaction_state["failed_participants"].append(
-                        {"id": participant_id, "error": str(result)}
-                    )
-                    failure_reasons.append(
-                        f"Participant {participant_id} prepare error: {str(result)}"
-                    )
-                    return False
-                elif not result["prepared"]:
-                    transaction_state["failed_participants"].append(
-                        {
-                            "id": participant_id,
-                            "reason": result.get("reason", "Unknown"),
-                        }
-                    )
-                    failure_reasons.append(
-                        f"Participant {participant_id} prepare failed: {result.get('reason')}"
-                    )
-                    return False
-                else:
-                    transaction_state["prepared_participants"].append(
-                        {
-                            "id": participant_id,
-                            "name": participant.get("name", "unknown"),
-                            "prepared_at": datetime.utcnow().isoformat(),
-                        }
-                    )
+        if isinstance(result, BaseException):
+            if isinstance(result, asyncio.TimeoutError):
+                error = f"prepare timed out after {self.prepare_timeout}s"
+            else:
+                error = str(result)
+            transaction_state["failed_participants"].append(
+                {
+                    "id": participant_id,
+                    "name": participant.get("name", "unknown"),
+                    "error": error,
+                }
+            )
+            failure_reasons.append(
+                f"Participant {participant_id} prepare error: {error}"
+            )
+            return False
+
+        if not result["prepared"]:
+            transaction_state["failed_participants"].append(
+                {
+                    "id": participant_id,
+                    "name": participant.get("name", "unknown"),
+                    "reason": result.get("reason", "Unknown"),
+                }
+            )
+            failure_reasons.append(
+                f"Participant {participant_id} prepare failed: {result.get('reason')}"
+            )
+            return False
 
+        transaction_state["prepared_participants"].append(
+            {
+                "id": participant_id,
+                "name": participant.get("name", "unknown"),
+                "prepared_at": datetime.utcnow().isoformat(),
+            }
+        )
         return True
 
     async def _commit_phase(
@@ -422,15 +518,7 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
         commit_tasks = []
 
         for prepared in transaction_state["prepared_participants"]:
-            # Find original participant data
-            participant = next(
-                (
-                    p
-                    for p in transaction_state["participants"]
-                    if p.get("id") == prepared["id"]
-                ),
-                {"id": prepared["id"]},
-            )
+            participant = self._find_participant(transaction_state, prepared["id"])
 
             task = self._commit_participant_async(
                 participant, transaction_state, latencies
@@ -479,43 +567,100 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
         self, transaction_state: Dict[str, Any], latencies: Dict[str, float]
     ) -> None:
         """Execute the abort phase."""
-        # Abort all prepared participants
-        abort_tasks = []
-
-        for prepared in transaction_state["prepared_participants"]:
-            # Find original participant data
-            participant = next(
-                (
-                    p
-                    for p in transaction_state["participants"]
-                    if p.get("id") == prepared["id"]
-                ),
-                {"id": prepared["id"]},
-            )
-
-            task = self._abort_participant_async(
-                participant, transaction_state, latencies
-            )
-            abort_tasks.append(task)
-
-        results = await asyncio.gather(*abort_tasks, return_exceptions=True)
+        if self.decision_log:
+            await self.decision_log.log_decision(transaction_state["id"], commit=False)
+
+        # Abort every participant that may hold prepared work: those that
+        # prepared and those whose prepare timed out, failed or was
+        # cancelled. Participants that voted NO have already rolled back.
+        contacted = transaction_state.get("contacted_participants", set())
+        voted_no = {
+            failed["id"]
+            for failed in transaction_state["failed_participants"]
+            if "reason" in failed
+        }
+        targets = [
+            participant
+            for participant in transaction_state["participants"]
+            if participant["id"] in contacted and participant["id"] not in voted_no
+        ]
+
+        results = await asyncio.gather(
+            *(
+                self._abort_participant_async(participant, transaction_state, latencies)
+                for participant in targets
+            ),
+            return_exceptions=True,
+        )
 
         # Record aborted participants
-        for i, result in enumerate(results):
-            prepared = transaction_state["prepared_participants"][i]
+        for participant, result in zip(targets, results):
             if not isinstance(result, Exception):
                 transaction_state["aborted_participants"].append(
-                    {"id": prepared["id"], "aborted_at": datetime.utcnow().isoformat()}
+                    {
+                        "id": participant["id"],
+                        "aborted_at": datetime.utcnow().isoformat(),
+                    }
                 )
 
+        if self.decision_log and len(results) == len(
+            transaction_state["aborted_participants"]
+        ):
+            await self.decision_log.log_end(transaction_state["id"])
+
+    def _find_participant(
+        self, transaction_state: Dict[str, Any], participant_id: str
+    ) -> Dict[str, Any]:
+        """Original participant data for a participant id."""
+        return next(
+            (
+                p
+                for p in transaction_state["participants"]
+                if p.get("id") == participant_id
+            ),
+            {"id": participant_id},
+        )
+
+    async def _invoke_participant(
+        self,
+        action: str,
+        participant: Dict[str, Any],
+        transaction_state: Dict[str, Any],
+    ) -> Any:
+        """Call a participant's prepare/commit/abort operation.
+
+        Uses the participant's own callable, then the configured
+        participant_handler, then the SDK 2PC coordinator.
+        """
+        operation = participant.get(action)
+        if not callable(operation) and self.participant_handler is not None:
+            operation = getattr(self.participant_handler, action, None)
+
+        if callable(operation):
+            result = operation(
+                participant, transaction_state["id"], transaction_state["data"]
+            )
+        elif action == "prepare":
+            result = self.tpc_coordinator.prepare_participant(
+                participant, transaction_state["data"]
+            )
+        else:
+            result = getattr(self.tpc_coordinator, f"{action}_participant")(participant)
+
+        if inspect.isawaitable(result):
+            result = await result
+        return result
+
     async def _prepare_participant(
         self, participant: Dict[str, Any], transaction_state: Dict[str, Any]
     ) -> Dict[str, Any]:
         """Prepare a single participant."""
-        # Use SDK 2PC coordinator
-        return await self.tpc_coordinator.prepare_participant(
-            participant, transaction_state["data"]
+        result = await self._invoke_participant(
+            "prepare", participant, transaction_state
         )
+        if isinstance(result, dict):
+            return result
+        return {"prepared": bool(result)}
 
     async def _prepare_participant_async(
         self,
@@ -525,9 +670,15 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
     ) -> Dict[str, Any]:
         """Async wrapper for participant preparation."""
         p_start = datetime.utcnow()
-        participant_id = participant.get("id", str(uuid.uuid4()))
+        participant_id = participant["id"]
+        transaction_state.setdefault("contacted_participants", set()).add(
+            participant_id
+        )
 
-        result = await self._prepare_participant(participant, transaction_state)
+        result = await asyncio.wait_for(
+            self._prepare_participant(participant, transaction_state),
+            timeout=self.prepare_timeout,
+        )
 
         # Record latency
         p_duration = (datetime.utcnow() - p_start).total_seconds()
@@ -543,17 +694,32 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
     ) -> Dict[str, Any]:
         """Async wrapper for participant commit."""
         p_start = datetime.utcnow()
-        participant_id = participant.get("id", str(uuid.uuid4()))
+        participant_id = participant["id"]
 
         try:
-            # Use SDK 2PC coordinator
-            result = await self.tpc_coordinator.commit_participant(participant)
+            result = await asyncio.wait_for(
+                self._invoke_participant("commit", participant, transaction_state),
+                timeout=self.commit_timeout,
+            )
+            if result is False or (
+                isinstance(result, dict) and not result.get("committed", True)
+            ):
+                reason = result.get("reason") if isinstance(result, dict) else None
+                return {"committed": False, "reason": reason or "Commit rejected"}
+
+            if self.decision_log:
+                await self.decision_log.log_ack(transaction_state["id"], participant_id)
 
             # Record latency
             p_duration = (datetime.utcnow() - p_start).total_seconds()
             latencies[f"{participant_id}_commit"] = p_duration * 1000
 
             return {"committed": True}
+        except asyncio.TimeoutError:
+            return {
+                "committed": False,
+                "reason": f"commit timed out after {self.commit_timeout}s",
+            }
         except Exception as e:
             return {"committed": False, "reason": str(e)}
 
@@ -565,26 +731,142 @@ class DataFlowTwoPhaseCommitNode(AsyncNode):
     ) -> None:
         """Async wrapper for participant abort."""
         p_start = datetime.utcnow()
-        participant_id = participant.get("id", str(uuid.uuid4()))
+        participant_id = participant["id"]
 
-        try:
-            # Use SDK 2PC coordinator
-            await self.tpc_coordinator.abort_participant(participant)
+        await asyncio.wait_for(
+            self._invoke_participant("abort", participant, transaction_state),
+            timeout=self.commit_timeout,
+        )
 
-            # Record latency
-            p_duration = (datetime.utcnow() - p_start).total_seconds()
-            latencies[f"{participant_id}_abort"] = p_duration * 1000
-        except Exception:
-            # Log but continue
-            pass
+        # Record latency
+        p_duration = (datetime.utcnow() - p_start).total_seconds()
+        latencies[f"{participant_id}_abort"] = p_duration * 1000
 
     async def _attempt_recovery(
         self, transaction_state: Dict[str, Any], latencies: Dict[str, float]
-    ) -> None:
-        """Attempt to recover from partial commit failure."""
-        # This would implement recovery logic, such as:
-        # - Retrying failed commits
-        # - Recording state for manual intervention
-        # - Triggering compensating transactions
-        # For now, just mark as recovery attempted
-        pass
+    ) -> bool:
+        """Retry commits that failed after the commit decision.
+
+        Returns True once every prepared participant has committed. If
+        retries run out the transaction stays in the decision log and is
+        finished by recover_transactions().
+        """
+        committed = {c["id"] for c in transaction_state["committed_participants"]}
+
+        for attempt in range(1, self.max_commit_retries + 1):
+            remaining = [
+                self._find_participant(transaction_state, prepared["id"])
+                for prepared in transaction_state["prepared_participants"]
+                if prepared["id"] not in committed
+            ]
+            if not remaining:
+                break
+
+            await asyncio.sleep(self.recovery_interval * attempt)
+            results = await asyncio.gather(
+                *(
+                    self._commit_participant_async(
+                        participant, transaction_state, latencies
+                    )
+                    for participant in remaining
+                )
+            )
+            for participant, result in zip(remaining, results):
+                if result["committed"]:
+                    committed.add(participant["id"])
+                    transaction_state["committed_participants"].append(
+                        {
+                            "id": participant["id"],
+                            "committed_at": datetime.utcnow().isoformat(),
+                            "recovery_attempt": attempt,
+                        }
+                    )
+
+        recovered = len(committed) == len(transaction_state["prepared_participants"])
+        if recovered:
+            transaction_state["failed_participants"] = [
+                failed
+                for failed in transaction_state["failed_participants"]
+                if failed.get("phase") != "commit"
+            ]
+        else:
+            logger.error(
+                f"Transaction {transaction_state['id']} is committed but "
+                f"{len(transaction_state['prepared_participants']) - len(committed)} "
+                "participants have not applied it; left for log recovery"
+            )
+        return recovered
+
+    async def recover_transactions(self) -> List[Dict[str, Any]]:
+        """Finish the transactions left unfinished in the decision log.
+
+        Transactions with a logged commit decision are committed on the
+        participants that have not acknowledged it; all others are aborted
+        (presumed abort). Participants are driven concurrently.
+
+        Returns:
+            One summary per recovered transaction
+        """
+        if self.decision_log is None:
+            return []
+
+        outcomes = []
+        for transaction_id, entry in (await self.decision_log.unfinished()).items():
+            commit = entry["decision"] == "commit"
+            participants = [
+                participant
+                for participant in entry["participants"]
+                if participant["id"] not in entry["acked"]
+            ]
+            transaction_state = {
+                "id": transaction_id,
+                "participants": entry["participants"],
+                "data": {},
+            }
+            action = "commit" if commit else "abort"
+            results = await asyncio.gather(
+                *(
+                    asyncio.wait_for(
+                        self._invoke_participant(
+                            action, participant, transaction_state
+                        ),
+                        timeout=self.commit_timeout,
+                    )
+                    for participant in participants
+                ),
+                return_exceptions=True,
+            )
+
+            resolved = True
+            for participant, result in zip(participants, results):
+                if isinstance(result, Exception) or result is False:
+                    resolved = False
+                    logger.error(
+                        f"Recovery could not {action} participant "
+                        f"{participant['id']} of transaction {transaction_id}: "
+                        f"{result}"
+                    )
+                elif commit:
+                    await self.decision_log.log_ack(transaction_id, participant["id"])
+
+            if resolved:
+                if not commit and entry["decision"] is None:
+                    await self.decision_log.log_decision(transaction_id, commit=False)
+                await self.decision_log.log_end(transaction_id)
+
+            outcomes.append(
+                {
+                    "transaction_id": transaction_id,
+                    "decision": action,
+                    "participants": len(participants),
+                    "resolved": resolved,
+                }
+            )
+
+        if outcomes:
+            logger.info(
+                f"Recovered {sum(o['resolved'] for o in outcomes)}/{len(outcomes)} "
+                "transactions from the decision log"
+            )
+        await self.decision_log.compact()
+        return outcomes
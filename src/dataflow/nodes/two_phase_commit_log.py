@@ -0,0 +1,241 @@
+"""Durable decision log for the DataFlow two-phase commit coordinator.
+
+An append-only JSON-lines file. Commit decisions are forced to disk before
+any participant is told to commit; every other record (begin, participant
+acknowledgements, end) is written lazily and rides along with the next
+forced write. Concurrent transactions share fsyncs: records appended while
+a write is in flight are flushed together by the following one (group
+commit).
+
+The log follows the presumed-abort protocol: a transaction with a begin
+record but no commit decision is aborted on recovery, so only the commit
+decision has to be durable.
+"""
+
+import asyncio
+import json
+import logging
+import os
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Record types
+BEGIN = "b"
+COMMIT = "c"
+ABORT = "a"
+ACK = "p"
+END = "e"
+
+
+class TwoPhaseCommitLog:
+    """Append-only, group-fsynced coordinator decision log.
+
+    Example:
+        log = TwoPhaseCommitLog("/var/lib/app/2pc.log")
+        await log.log_begin(tx_id, participants)
+        await log.log_decision(tx_id, commit=True)  # durable before returning
+        ...
+        await log.log_end(tx_id)
+    """
+
+    def __init__(self, path: str, fsync: bool = True, compact_threshold: int = 1000):
+        """
+        Initialize the log.
+
+        Args:
+            path: Log file path (created on first write)
+            fsync: fsync forced writes (disable only for tests)
+            compact_threshold: Rewrite the log without finished transactions
+                after this many transactions have ended
+        """
+        self.path = path
+        self.fsync = fsync
+        self.compact_threshold = compact_threshold
+        self._file = None
+        self._pending: List[Tuple[str, Optional[asyncio.Future]]] = []
+        self._writer: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ended_since_compact = 0
+        self._compact_requested = False
+        self.stats = {"records": 0, "writes": 0, "fsyncs": 0, "compactions": 0}
+
+    # ------------------------------------------------------------------
+    # Records
+    # ------------------------------------------------------------------
+
+    async def log_begin(
+        self, transaction_id: str, participants: List[Dict[str, Any]]
+    ) -> None:
+        """Record the participants of a new transaction (not forced)."""
+        persisted = [
+            {key: value for key, value in participant.items() if not callable(value)}
+            for participant in participants
+        ]
+        await self._append({"t": BEGIN, "x": transaction_id, "p": persisted})
+
+    async def log_decision(self, transaction_id: str, commit: bool) -> None:
+        """Record the outcome; a commit decision is on disk when this returns."""
+        await self._append(
+            {"t": COMMIT if commit else ABORT, "x": transaction_id}, force=commit
+        )
+
+    async def log_ack(self, transaction_id: str, participant_id: str) -> None:
+        """Record that a participant applied the decision (not forced)."""
+        await self._append({"t": ACK, "x": transaction_id, "i": participant_id})
+
+    async def log_end(self, transaction_id: str) -> None:
+        """Record that every participant applied the decision (not forced)."""
+        self._ended_since_compact += 1
+        if self._ended_since_compact >= self.compact_threshold:
+            self._compact_requested = True
+        await self._append({"t": END, "x": transaction_id})
+
+    async def flush(self) -> None:
+        """Wait until every appended record is on disk."""
+        await self._append(None, force=True)
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    async def unfinished(self) -> Dict[str, Dict[str, Any]]:
+        """Transactions without an end record, in log order.
+
+        Returns:
+            transaction_id -> {"participants": [...], "decision": "commit" |
+            "abort" | None, "acked": set of participant ids}
+        """
+        await self.flush()
+        return await asyncio.to_thread(self._read_unfinished)
+
+    async def compact(self) -> None:
+        """Rewrite the log keeping only unfinished transactions."""
+        self._compact_requested = True
+        await self.flush()
+
+    def close(self) -> None:
+        """Close the log file."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # Writer
+    # ------------------------------------------------------------------
+
+    async def _append(self, record: Optional[Dict[str, Any]], force=False) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Runtimes may run each workflow on a fresh event loop
+            self._loop = loop
+            self._writer = None
+
+        future = loop.create_future() if force else None
+        line = json.dumps(record, separators=(",", ":"), default=str) if record else ""
+        self._pending.append((line, future))
+        if self._writer is None or self._writer.done():
+            self._writer = loop.create_task(self._write_pending())
+        if future is not None:
+            await future
+
+    async def _write_pending(self) -> None:
+        """Flush batches until nothing is pending; one fsync per batch."""
+        while self._pending:
+            batch, self._pending = self._pending, []
+            # A compaction requested during the write waits for the next
+            # batch, which holds the records appended alongside the request
+            compact, self._compact_requested = self._compact_requested, False
+            lines = [line for line, _ in batch if line]
+            sync = self.fsync and any(future for _, future in batch)
+            try:
+                await asyncio.to_thread(self._write, lines, sync)
+                if compact:
+                    await asyncio.to_thread(self._compact)
+            except Exception as e:
+                logger.error(f"Two-phase commit log write failed: {e}")
+                self._compact_requested = self._compact_requested or compact
+                for _, future in batch:
+                    if future is not None and not future.done():
+                        future.set_exception(e)
+                continue
+            for _, future in batch:
+                if future is not None and not future.done():
+                    future.set_result(None)
+
+    def _write(self, lines: List[str], sync: bool) -> None:
+        if lines:
+            if self._file is None:
+                self._file = open(self.path, "a+", encoding="utf-8")
+                if self._file.tell() > 0:
+                    self._file.seek(self._file.tell() - 1)
+                    if self._file.read(1) != "\n":
+                        # Terminate a torn record so it cannot merge with ours
+                        self._file.write("\n")
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+            self.stats["records"] += len(lines)
+            self.stats["writes"] += 1
+        if sync and self._file is not None:
+            os.fsync(self._file.fileno())
+            self.stats["fsyncs"] += 1
+
+    def _read_unfinished(self) -> Dict[str, Dict[str, Any]]:
+        transactions: Dict[str, Dict[str, Any]] = {}
+        if not os.path.exists(self.path):
+            return transactions
+        with open(self.path, encoding="utf-8") as log_file:
+            for line_number, line in enumerate(log_file, 1):
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # A torn final write from a crash; nothing after it
+                    logger.warning(
+                        f"Ignoring unreadable record at {self.path}:{line_number}"
+                    )
+                    continue
+                tx = transactions.setdefault(
+                    record["x"], {"participants": [], "decision": None, "acked": set()}
+                )
+                kind = record["t"]
+                if kind == BEGIN:
+                    tx["participants"] = record["p"]
+                elif kind == COMMIT:
+                    tx["decision"] = "commit"
+                elif kind == ABORT:
+                    tx["decision"] = "abort"
+                elif kind == ACK:
+                    tx["acked"].add(record["i"])
+                elif kind == END:
+                    transactions.pop(record["x"])
+        return transactions
+
+    def _compact(self) -> None:
+        unfinished = self._read_unfinished()
+        temp_path = f"{self.path}.compact"
+        with open(temp_path, "w", encoding="utf-8") as temp_file:
+            for tx_id, tx in unfinished.items():
+                records = [{"t": BEGIN, "x": tx_id, "p": tx["participants"]}]
+                if tx["decision"]:
+                    records.append(
+                        {
+                            "t": COMMIT if tx["decision"] == "commit" else ABORT,
+                            "x": tx_id,
+                        }
+                    )
+                records.extend({"t": ACK, "x": tx_id, "i": p} for p in tx["acked"])
+                for record in records:
+                    temp_file.write(json.dumps(record, separators=(",", ":")) + "\n")
+            temp_file.flush()
+            if self.fsync:
+                os.fsync(temp_file.fileno())
+        self.close()
+        os.replace(temp_path, self.path)
+        if self.fsync and hasattr(os, "O_DIRECTORY"):
+            directory = os.open(os.path.dirname(self.path) or ".", os.O_DIRECTORY)
+            try:
+                os.fsync(directory)
+            finally:
+                os.close(directory)
+        self._ended_since_compact = 0
+        self.stats["compactions"] += 1
@@ -2,7 +2,8 @@
 DataFlow Optimization Framework
 
 Tools for analyzing and optimizing DataFlow workflows for better performance.
-Includes workflow analysis, SQL optimization, and index recommendations.
+Includes workflow analysis, SQL pushdown of Query→Merge→Aggregate chains,
+SQL optimization, and index recommendations.
 """
 
 from .index_recommendation_engine import (
@@ -12,6 +13,7 @@ from .index_recommendation_engine import (
     IndexRecommendationEngine,
     IndexType,
 )
+from .query_fusion import FusionResult, QueryMergeAggregateFuser
 from .query_plan_analyzer import (
     BottleneckType,
     PerformanceBottleneck,
@@ -39,6 +41,9 @@ __all__ = [
     "OptimizationOpportunity",
     "PatternType",
     "WorkflowNode",
+    # Query→Merge→Aggregate Fusion
+    "QueryMergeAggregateFuser",
+    "FusionResult",
     # SQL Optimization
     "SQLQueryOptimizer",
     "SQLDialect",
@@ -0,0 +1,712 @@
+"""
+DataFlow Query→Merge→Aggregate Fusion
+
+Runtime counterpart of the WorkflowAnalyzer report: rewrites
+ListNode→SmartMergeNode→AggregateNode chains in a DataFlow-bound workflow
+into a single generated node that runs one JOIN/GROUP BY statement, so only
+the aggregates leave the database instead of both tables.
+
+A chain is only fused when its result is statically known to match the
+Python execution. Anything that depends on runtime data (auto-detected join
+keys, data-sniffed numeric fields), cannot be expressed in SQL (median, mode,
+filter expressions) or is observed by other nodes stays untouched.
+"""
+
+import logging
+from copy import copy
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Type
+
+from kailash.nodes.base import Node, NodeParameter, NodeRegistry
+from kailash.nodes.base_async import AsyncNode
+
+from ..database.query_builder import QueryBuilder, create_query_builder
+
+if TYPE_CHECKING:
+    from kailash.workflow.builder import WorkflowBuilder
+
+    from ..core.engine import DataFlow
+
+logger = logging.getLogger(__name__)
+
+# Aggregation functions with an exact SQL equivalent
+SQL_AGGREGATES = {"sum", "average", "count", "min", "max"}
+
+NUMERIC_TYPES = (int, float, Decimal)
+
+# Columns every generated ListNode may return besides the model fields
+IMPLICIT_COLUMNS = ("id", "created_at", "updated_at")
+
+
+class FusionNotApplicable(Exception):
+    """Raised internally when a chain cannot be fused without changing results."""
+
+
+@dataclass
+class FusionResult:
+    """Outcome of fusing one Query→Merge→Aggregate chain."""
+
+    aggregate_node: str
+    merge_node: str
+    list_nodes: List[str]
+    fused: bool
+    reason: Optional[str] = None
+    sql: Optional[str] = None
+    params: List[Any] = field(default_factory=list)
+
+
+def _create_fused_node_class(dataflow_instance: "DataFlow") -> Type[Node]:
+    """Create the node class executing fused aggregates for a DataFlow instance."""
+
+    class FusedQueryAggregateNode(AsyncNode):
+        """Run a fused JOIN/GROUP BY query and shape it like AggregateNode."""
+
+        def __init__(self, **kwargs):
+            self.dataflow_instance = dataflow_instance
+            super().__init__(**kwargs)
+
+        def get_parameters(self) -> Dict[str, NodeParameter]:
+            return {
+                "fusion_plan": NodeParameter(
+                    name="fusion_plan",
+                    type=dict,
+                    required=True,
+                    description="SQL and output shape produced by QueryMergeAggregateFuser",
+                ),
+            }
+
+        async def async_run(self, **kwargs) -> Dict[str, Any]:
+            plan = kwargs["fusion_plan"]
+            sql_node = self.dataflow_instance._get_or_create_async_sql_node(
+                plan["database_type"]
+            )
+            sql_result = await sql_node.async_run(
+                query=plan["sql"],
+                params=list(plan["params"]),
+                fetch_mode="all",
+                validate_queries=False,
+                transaction_mode="auto",
+            )
+            rows = []
+            if sql_result and "result" in sql_result:
+                rows = sql_result["result"].get("data") or []
+            return shape_aggregate_result(plan, rows)
+
+    return FusedQueryAggregateNode
+
+
+def shape_aggregate_result(plan: Dict[str, Any], rows: List[Dict]) -> Dict[str, Any]:
+    """Convert fused query rows into the AggregateNode output structure.
+
+    Args:
+        plan: Fusion plan (function, group_by, expression, ...)
+        rows: Rows with ``row_count``/``agg_*`` columns and one ``group_<i>``
+            column per group_by field
+
+    Returns:
+        Output identical to AggregateNode.execute on the merged records
+    """
+    function = plan["function"]
+    group_by = plan["group_by"]
+    total = sum(int(row.get("row_count") or 0) for row in rows)
+
+    if total == 0:
+        return {
+            "result": None,
+            "aggregate_expression": plan["aggregate_expression"],
+            "total_records": 0,
+            "parsed_successfully": True,
+        }
+
+    if not group_by:
+        result = _finalize(function, _partial(rows[0]))
+    else:
+        # AggregateNode groups on str(value); merge SQL groups that collide
+        partials: Dict[Tuple[str, ...], Dict[str, Any]] = {}
+        for row in rows:
+            key = tuple(str(row.get(f"group_{i}")) for i in range(len(group_by)))
+            partial = _partial(row)
+            if key in partials:
+                partial = _combine(function, partials[key], partial)
+            partials[key] = partial
+
+        result = {}
+        for key, partial in partials.items():
+            if len(group_by) == 1:
+                group_name = key[0]
+            else:
+                group_name = " | ".join(f"{gb}={gk}" for gb, gk in zip(group_by, key))
+            result[group_name] = {
+                "value": _finalize(function, partial),
+                "count": partial["rows"],
+                "group_fields": dict(zip(group_by, key)),
+            }
+
+    return {
+        "result": result,
+        "aggregate_expression": plan["aggregate_expression"],
+        "aggregation_function": function,
+        "field": plan["field"],
+        "group_by": group_by,
+        "total_records": total,
+        "filtered_records": total,
+        "parsed_successfully": True,
+        "details": plan.get("details"),
+    }
+
+
+def _partial(row: Dict) -> Dict[str, Any]:
+    return {
+        "rows": int(row.get("row_count") or 0),
+        "value": row.get("agg_value"),
+        "values": int(row.get("agg_count") or 0),
+    }
+
+
+def _combine(function: str, left: Dict, right: Dict) -> Dict[str, Any]:
+    combined = {
+        "rows": left["rows"] + right["rows"],
+        "values": left["values"] + right["values"],
+    }
+    values = [v for v in (left["value"], right["value"]) if v is not None]
+    if not values:
+        combined["value"] = None
+    elif function == "min":
+        combined["value"] = min(values)
+    elif function == "max":
+        combined["value"] = max(values)
+    else:
+        combined["value"] = sum(values)
+    return combined
+
+
+def _finalize(function: str, partial: Dict) -> Any:
+    value = partial["value"]
+    if function == "count":
+        return int(value or 0)
+    if value is None:
+        return None
+    if function == "average":
+        return float(value) / partial["values"] if partial["values"] else None
+    return float(value)
+
+
+class QueryMergeAggregateFuser:
+    """
+    Rewrite Query→Merge→Aggregate chains into single SQL aggregates.
+
+    The rewritten workflow replaces the two list nodes, the merge node and
+    the aggregate node with one generated node registered under the
+    aggregate node's id, so downstream connections and result lookups keep
+    working. Intermediate list/merge results are not materialized.
+
+    Example:
+        >>> fuser = QueryMergeAggregateFuser(db)
+        >>> optimized, results = fuser.rewrite(workflow)
+        >>> [r.reason for r in results if not r.fused]
+    """
+
+    def __init__(self, dataflow_instance: "DataFlow"):
+        """Initialize the fuser.
+
+        Args:
+            dataflow_instance: DataFlow instance owning the models
+        """
+        self.dataflow_instance = dataflow_instance
+        self._node_class: Optional[Type[Node]] = None
+        self._aggregate_parser = None
+        self._merge_resolver = None
+
+    def rewrite(
+        self, workflow: "WorkflowBuilder", inputs: Optional[Dict[str, Any]] = None
+    ) -> Tuple["WorkflowBuilder", List[FusionResult]]:
+        """Return a fused copy of the workflow and the per-chain outcomes.
+
+        Args:
+            workflow: DataFlow-bound WorkflowBuilder (left unmodified)
+            inputs: Runtime inputs the workflow will be executed with
+
+        Returns:
+            Tuple of (workflow to execute, fusion results)
+        """
+        results: List[FusionResult] = []
+        rewritten = None
+
+        for chain in self._find_chains(workflow):
+            aggregate_id, merge_id, left_id, right_id = chain
+            result = FusionResult(
+                aggregate_node=aggregate_id,
+                merge_node=merge_id,
+                list_nodes=[left_id, right_id],
+                fused=False,
+            )
+            try:
+                plan = self._plan_chain(workflow, chain, inputs or {})
+            except FusionNotApplicable as e:
+                result.reason = str(e)
+                logger.debug(f"Not fusing chain ending at '{aggregate_id}': {e}")
+            else:
+                if rewritten is None:
+                    rewritten = copy(workflow)
+                    rewritten.nodes = dict(workflow.nodes)
+                    rewritten.connections = list(workflow.connections)
+                self._apply(rewritten, chain, plan)
+                result.fused = True
+                result.sql = plan["sql"]
+                result.params = list(plan["params"])
+                logger.info(
+                    f"Fused {left_id}, {right_id} -> {merge_id} -> {aggregate_id} "
+                    f"into a single SQL aggregate"
+                )
+            results.append(result)
+
+        return (rewritten if rewritten is not None else workflow), results
+
+    # ------------------------------------------------------------------
+    # Chain detection
+    # ------------------------------------------------------------------
+
+    def _find_chains(self, workflow: "WorkflowBuilder") -> List[Tuple[str, ...]]:
+        """Find (aggregate, merge, left list, right list) node id chains."""
+        from ..nodes.aggregate_operations import AggregateNode
+        from ..nodes.smart_operations import SmartMergeNode
+
+        chains = []
+        for aggregate_id, info in workflow.nodes.items():
+            if not self._is_node_class(info, AggregateNode):
+                continue
+            incoming = self._incoming(workflow, aggregate_id)
+            merge_id = next(
+                (c["from_node"] for c in incoming if c["to_input"] == "data"), None
+            )
+            if merge_id is None or not self._is_node_class(
+                workflow.nodes.get(merge_id, {}), SmartMergeNode
+            ):
+                continue
+
+            sides = {}
+            for conn in self._incoming(workflow, merge_id):
+                if conn["to_input"] in ("left_data", "right_data"):
+                    sides[conn["to_input"]] = conn["from_node"]
+            left_id, right_id = sides.get("left_data"), sides.get("right_data")
+            if left_id and right_id and left_id != right_id:
+                if self._list_model(workflow, left_id) and self._list_model(
+                    workflow, right_id
+                ):
+                    chains.append((aggregate_id, merge_id, left_id, right_id))
+        return chains
+
+    @staticmethod
+    def _is_node_class(info: Dict[str, Any], node_class: Type[Node]) -> bool:
+        """Check a builder entry against a node class.
+
+        Type names are ambiguous (the MongoDB AggregateNode shares its name
+        with the DataFlow one), so string entries are resolved through the
+        registry and class entries are compared directly.
+        """
+        if "instance" in info:
+            return False
+        cls = info.get("class")
+        if cls is None:
+            try:
+                cls = NodeRegistry.get(info.get("type", ""))
+            except Exception:
+                return False
+        return isinstance(cls, type) and issubclass(cls, node_class)
+
+    @staticmethod
+    def _incoming(workflow: "WorkflowBuilder", node_id: str) -> List[Dict]:
+        return [c for c in workflow.connections if c.get("to_node") == node_id]
+
+    @staticmethod
+    def _outgoing(workflow: "WorkflowBuilder", node_id: str) -> List[Dict]:
+        return [c for c in workflow.connections if c.get("from_node") == node_id]
+
+    def _list_model(self, workflow: "WorkflowBuilder", node_id: str) -> Optional[str]:
+        """Return the model name if the node is a generated ListNode."""
+        info = workflow.nodes.get(node_id, {})
+        node_type = info.get("type", "")
+        if not node_type.endswith("ListNode"):
+            return None
+        node_class = self.dataflow_instance._nodes.get(node_type)
+        model_name = node_type[: -len("ListNode")]
+        if (
+            node_class is not None
+            and self._is_node_class(info, node_class)
+            and model_name in self.dataflow_instance._models
+        ):
+            return model_name
+        return None
+
+    # ------------------------------------------------------------------
+    # Planning
+    # ------------------------------------------------------------------
+
+    def _plan_chain(
+        self,
+        workflow: "WorkflowBuilder",
+        chain: Tuple[str, ...],
+        inputs: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Build the fused SQL for a chain or raise FusionNotApplicable."""
+        aggregate_id, merge_id, left_id, right_id = chain
+
+        self._check_isolated(workflow, chain, inputs)
+
+        left_model = self._list_model(workflow, left_id)
+        right_model = self._list_model(workflow, right_id)
+        for model_name in (left_model, right_model):
+            if "tenant_id" in self.dataflow_instance.get_model_fields(model_name):
+                raise FusionNotApplicable(
+                    f"model '{model_name}' is tenant-scoped; tenant isolation is "
+                    f"applied per ListNode query"
+                )
+
+        def effective_config(node_id: str) -> Dict[str, Any]:
+            # Node-scoped runtime inputs are known up front and override config
+            return {
+                **workflow.nodes[node_id].get("config", {}),
+                **(inputs.get(node_id) or {}),
+            }
+
+        merge_config = effective_config(merge_id)
+        left_key, right_key = self._resolve_join_keys(merge_config)
+
+        aggregate_config = effective_config(aggregate_id)
+        agg = self._resolve_aggregate(aggregate_config)
+
+        database_type = self.dataflow_instance._detect_database_type().lower()
+        left_sql, left_params = self._list_subquery(
+            left_model, effective_config(left_id), 0
+        )
+        right_sql, right_params = self._list_subquery(
+            right_model,
+            effective_config(right_id),
+            len(left_params),
+        )
+
+        left_columns = self._model_columns(left_model)
+        right_columns = self._model_columns(right_model)
+        for key, columns, model_name in (
+            (left_key, left_columns, left_model),
+            (right_key, right_columns, right_model),
+        ):
+            if key not in columns:
+                raise FusionNotApplicable(
+                    f"join key '{key}' is not a column of model '{model_name}'"
+                )
+
+        q = self._builder("")._quote_identifier
+
+        def column_ref(name: str) -> str:
+            side, column = self._resolve_merged_field(
+                name, left_columns, right_columns, left_key, right_key
+            )
+            return f"{side}.{q(column)}"
+
+        function, agg_field = agg["function"], agg["field"]
+        select = ["COUNT(*) AS row_count"]
+        if function == "count":
+            value_expr = f"COUNT({column_ref(agg_field)})" if agg_field else "COUNT(*)"
+            select.append(f"{value_expr} AS agg_value")
+        else:
+            side, column = self._resolve_merged_field(
+                agg_field, left_columns, right_columns, left_key, right_key
+            )
+            model_name = left_model if side == "l" else right_model
+            field_info = self.dataflow_instance.get_model_fields(model_name)
+            field_type = field_info.get(column, {}).get("type")
+            if field_type not in NUMERIC_TYPES and not (
+                column == "id" and column not in field_info
+            ):
+                raise FusionNotApplicable(
+                    f"field '{agg_field}' is not numeric; AggregateNode would "
+                    f"coerce values with float()"
+                )
+            ref = f"{side}.{q(column)}"
+            sql_function = "SUM" if function == "average" else function.upper()
+            select.append(f"{sql_function}({ref}) AS agg_value")
+            select.append(f"COUNT({ref}) AS agg_count")
+
+        group_refs = [column_ref(name) for name in agg["group_by"]]
+        select = [f"{ref} AS group_{i}" for i, ref in enumerate(group_refs)] + select
+
+        sql = (
+            f"SELECT {', '.join(select)} "
+            f"FROM ({left_sql}) AS l INNER JOIN ({right_sql}) AS r "
+            f"ON l.{q(left_key)} = r.{q(right_key)}"
+        )
+        if group_refs:
+            sql += f" GROUP BY {', '.join(group_refs)}"
+
+        return {
+            "sql": sql,
+            "params": left_params + right_params,
+            "database_type": database_type,
+            "function": function,
+            "field": agg_field,
+            "group_by": agg["group_by"],
+            "aggregate_expression": agg["aggregate_expression"],
+            "details": agg["details"],
+        }
+
+    def _check_isolated(
+        self,
+        workflow: "WorkflowBuilder",
+        chain: Tuple[str, ...],
+        inputs: Dict[str, Any],
+    ) -> None:
+        """Ensure no node outside the chain observes or feeds the chain."""
+        aggregate_id, merge_id, left_id, right_id = chain
+
+        unscoped = [key for key in inputs if key not in workflow.nodes]
+        if unscoped:
+            raise FusionNotApplicable(
+                f"workflow-level inputs {sorted(unscoped)} may reach chain nodes"
+            )
+
+        expected = {
+            left_id: ("records", merge_id, "left_data"),
+            right_id: ("records", merge_id, "right_data"),
+            merge_id: ("merged_data", aggregate_id, "data"),
+        }
+        for node_id, (output, target, target_input) in expected.items():
+            outgoing = self._outgoing(workflow, node_id)
+            if len(outgoing) != 1 or (
+                outgoing[0]["from_output"],
+                outgoing[0]["to_node"],
+                outgoing[0]["to_input"],
+            ) != (output, target, target_input):
+                raise FusionNotApplicable(
+                    f"output of '{node_id}' is consumed outside the chain"
+                )
+
+        for node_id in (left_id, right_id):
+            if self._incoming(workflow, node_id):
+                raise FusionNotApplicable(
+                    f"list node '{node_id}' receives parameters at runtime"
+                )
+        if len(self._incoming(workflow, merge_id)) != 2:
+            raise FusionNotApplicable(f"merge node '{merge_id}' has extra inputs")
+        if len(self._incoming(workflow, aggregate_id)) != 1:
+            raise FusionNotApplicable(
+                f"aggregate node '{aggregate_id}' receives parameters at runtime"
+            )
+
+    def _resolve_join_keys(self, merge_config: Dict[str, Any]) -> Tuple[str, str]:
+        """Resolve SmartMergeNode join keys without looking at the data."""
+        from ..nodes.smart_operations import SmartMergeNode
+
+        merge_type = merge_config.get("merge_type", "auto")
+        if merge_type not in ("auto", "inner"):
+            raise FusionNotApplicable(f"merge_type '{merge_type}' is not an inner join")
+
+        if self._merge_resolver is None:
+            self._merge_resolver = SmartMergeNode()
+
+        join_conditions = dict(merge_config.get("join_conditions") or {})
+        if merge_type == "auto":
+            # Auto mode sniffs record keys unless the model pair is known
+            join_conditions = self._merge_resolver._detect_from_models(
+                merge_config.get("left_model"), merge_config.get("right_model")
+            )
+            if not join_conditions:
+                raise FusionNotApplicable(
+                    "merge_type 'auto' detects join keys from the data"
+                )
+
+        spec = merge_config.get("natural_language_spec")
+        if spec:
+            join_conditions.update(
+                self._merge_resolver._parse_natural_language_spec(spec)
+            )
+
+        left_key = join_conditions.get("left_key")
+        right_key = join_conditions.get("right_key")
+        if not left_key or not right_key:
+            raise FusionNotApplicable("merge has no static join keys")
+        return left_key, right_key
+
+    def _resolve_aggregate(self, aggregate_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the aggregate expression exactly as AggregateNode does."""
+        from ..nodes.aggregate_operations import AggregateNode
+
+        if aggregate_config.get("filter_expression"):
+            raise FusionNotApplicable("filter_expression is applied in Python")
+        if aggregate_config.get("aggregations"):
+            raise FusionNotApplicable("multiple aggregations are not fused")
+
+        expression = aggregate_config.get("aggregate_expression")
+        if not expression:
+            raise FusionNotApplicable("aggregate_expression is not static")
+
+        if self._aggregate_parser is None:
+            self._aggregate_parser = AggregateNode()
+        parser = self._aggregate_parser
+
+        numeric_fields = list(aggregate_config.get("numeric_fields") or [])
+        agg_config = parser._parse_aggregate_expression(
+            expression, numeric_fields, list(aggregate_config.get("group_by") or [])
+        )
+        if not agg_config["field"]:
+            # Without a field in the expression AggregateNode falls back to
+            # the first numeric field it sniffs from the first record
+            raise FusionNotApplicable("aggregate field is auto-detected from the data")
+
+        function = agg_config["function"]
+        if function not in SQL_AGGREGATES:
+            raise FusionNotApplicable(f"'{function}' has no exact SQL aggregate")
+
+        return {
+            "function": function,
+            "field": agg_config["field"],
+            "group_by": agg_config["group_by"],
+            "aggregate_expression": expression,
+            "details": (
+                agg_config.get("details")
+                if aggregate_config.get("return_details")
+                else None
+            ),
+        }
+
+    def _list_subquery(
+        self, model_name: str, config: Dict[str, Any], param_offset: int
+    ) -> Tuple[str, List[Any]]:
+        """Rebuild the SELECT a generated ListNode would run."""
+        import json
+
+        if config.get("count_only"):
+            raise FusionNotApplicable(f"{model_name} list is count_only")
+        if config.get("database_url"):
+            raise FusionNotApplicable(f"{model_name} list overrides database_url")
+
+        limit = config.get("limit", 10)
+        offset = config.get("offset", 0)
+        if not isinstance(limit, int) or not isinstance(offset, int):
+            raise FusionNotApplicable(f"{model_name} list pagination is not static")
+
+        filter_dict = config.get("filter", {})
+        order_by = config.get("order_by", [])
+        if isinstance(filter_dict, str):
+            try:
+                filter_dict = json.loads(filter_dict) if filter_dict.strip() else {}
+            except (json.JSONDecodeError, ValueError):
+                filter_dict = {}
+        if isinstance(order_by, str):
+            try:
+                order_by = json.loads(order_by) if order_by.strip() else []
+            except (json.JSONDecodeError, ValueError):
+                order_by = []
+        filter_dict = dict(filter_dict or {})
+
+        sort = config.get("sort", [])
+        if sort and not order_by:
+            order_by = [
+                {spec["field"]: 1 if spec.get("order", "asc").lower() == "asc" else -1}
+                for spec in sort
+                if isinstance(spec, dict) and spec.get("field")
+            ]
+
+        model_info = self.dataflow_instance._models.get(model_name, {})
+        model_config = (
+            model_info.get("config", {}) if isinstance(model_info, dict) else {}
+        )
+        has_soft_delete = model_config.get("soft_delete", False)
+        if has_soft_delete and not config.get("include_deleted", False):
+            filter_dict.setdefault("deleted_at", {"$null": True})
+
+        table_name = self.dataflow_instance._get_table_name(model_name)
+        builder = self._builder(table_name)
+        builder._parameter_index = param_offset
+
+        try:
+            for field_name, value in filter_dict.items():
+                if isinstance(value, dict):
+                    for op, op_value in value.items():
+                        builder.where(field_name, op, op_value)
+                else:
+                    builder.where(field_name, "$eq", value)
+        except ValueError as e:
+            raise FusionNotApplicable(f"{model_name} filter: {e}")
+
+        # Same default ordering as the ListNode paths, which LIMIT depends on
+        has_filters = "filter" in config or has_soft_delete
+        if order_by:
+            for order_spec in order_by:
+                if isinstance(order_spec, dict):
+                    for field_name, direction in order_spec.items():
+                        builder.order_by(
+                            field_name, "DESC" if direction == -1 else "ASC"
+                        )
+                elif isinstance(order_spec, str) and order_spec.startswith("-"):
+                    builder.order_by(order_spec[1:], "DESC")
+                else:
+                    builder.order_by(order_spec, "ASC")
+        else:
+            builder.order_by("id", "DESC" if has_filters else "ASC")
+
+        builder.limit(limit).offset(offset)
+        return builder.build_select()
+
+    def _builder(self, table_name: str) -> QueryBuilder:
+        return create_query_builder(
+            table_name, self.dataflow_instance.config.database.url
+        )
+
+    def _model_columns(self, model_name: str) -> List[str]:
+        fields = list(self.dataflow_instance.get_model_fields(model_name))
+        return fields + [c for c in IMPLICIT_COLUMNS if c not in fields]
+
+    @staticmethod
+    def _resolve_merged_field(
+        name: str,
+        left_columns: List[str],
+        right_columns: List[str],
+        left_key: str,
+        right_key: str,
+    ) -> Tuple[str, str]:
+        """Map a merged-record field to ("l"|"r", column) like SmartMergeNode."""
+        if name in left_columns:
+            # Right join key overwrites a same-named left field
+            if name == right_key and name != left_key and name in right_columns:
+                return "r", name
+            return "l", name
+        if name in right_columns:
+            return "r", name
+        if name.startswith("right_"):
+            column = name[len("right_") :]
+            if column in left_columns and column in right_columns:
+                if column != right_key:
+                    return "r", column
+        raise FusionNotApplicable(f"field '{name}' is not in the merged records")
+
+    # ------------------------------------------------------------------
+    # Rewriting
+    # ------------------------------------------------------------------
+
+    def _apply(
+        self,
+        workflow: "WorkflowBuilder",
+        chain: Tuple[str, ...],
+        plan: Dict[str, Any],
+    ) -> None:
+        aggregate_id, merge_id, left_id, right_id = chain
+        removed = (merge_id, left_id, right_id)
+
+        # Chain isolation guarantees these nodes only connect to each other
+        workflow.connections = [
+            c
+            for c in workflow.connections
+            if c.get("from_node") not in removed and c.get("to_node") not in removed
+        ]
+        for node_id in removed:
+            workflow.nodes.pop(node_id, None)
+
+        if self._node_class is None:
+            self._node_class = _create_fused_node_class(self.dataflow_instance)
+        workflow.nodes[aggregate_id] = {
+            "type": self._node_class.__name__,
+            "class": self._node_class,
+            "config": {"fusion_plan": plan},
+        }
@@ -898,6 +898,13 @@ class WorkflowPerformanceProfile:
     sequential_bottlenecks: List[str]
     parallel_stages: List[List[str]]
     resource_requirements: Dict[str, Any]
+    # Populated from ExecutionTracer spans when tracing is enabled
+    measured: bool = False
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_ms: float = 0.0
+    node_timings: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    node_type_histograms: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    untraced_nodes: List[str] = field(default_factory=list)
 
     def show(self, color: bool = True) -> str:
         """Format performance profile for display."""
@@ -912,13 +919,40 @@ class WorkflowPerformanceProfile:
         parts.append("")
 
         # Timing
-        parts.append(
-            f"{GREEN}Estimated Execution Time:{RESET} {self.estimated_execution_time_ms:.2f}ms"
+        label = (
+            "Measured Critical Path" if self.measured else "Estimated Execution Time"
         )
+        parts.append(f"{GREEN}{label}:{RESET} {self.estimated_execution_time_ms:.2f}ms")
         parts.append(f"Parallelization Potential: {self.parallelization_potential:.1%}")
         parts.append(f"Parallel Stages: {len(self.parallel_stages)}")
         parts.append("")
 
+        # Measured timings
+        if self.measured:
+            parts.append(
+                f"{BLUE}Critical Path:{RESET} {' -> '.join(self.critical_path)}"
+            )
+            slowest = sorted(
+                self.node_timings.items(),
+                key=lambda item: item[1]["mean_ms"],
+                reverse=True,
+            )
+            parts.append(f"{BLUE}Slowest Nodes:{RESET}")
+            for node_id, stats in slowest[:5]:
+                rows = stats.get("mean_rows")
+                rows_text = f", {rows:.0f} rows" if rows is not None else ""
+                parts.append(
+                    f"  {node_id}: mean {stats['mean_ms']:.2f}ms, "
+                    f"p95 {stats['p95_ms']:.2f}ms, "
+                    f"db {stats['mean_db_time_ms']:.2f}ms{rows_text}"
+                )
+            if self.untraced_nodes:
+                parts.append(
+                    f"{YELLOW}Untraced Nodes ({len(self.untraced_nodes)}):{RESET} "
+                    f"{', '.join(self.untraced_nodes[:5])}"
+                )
+            parts.append("")
+
         # Bottlenecks
         if self.sequential_bottlenecks:
             parts.append(
@@ -3473,13 +3507,111 @@ results, run_id = runtime.execute(workflow.build())
             "estimated_duration_seconds": estimated_time / 1000,
         }
 
-        return WorkflowPerformanceProfile(
+        profile = WorkflowPerformanceProfile(
             estimated_execution_time_ms=estimated_time,
             parallelization_potential=parallelization_potential,
             sequential_bottlenecks=sorted(bottlenecks),
             parallel_stages=parallel_stages,
             resource_requirements=resource_requirements,
         )
+        self._apply_measured_timings(profile, workflow, graph)
+        return profile
+
+    def _apply_measured_timings(
+        self,
+        profile: WorkflowPerformanceProfile,
+        workflow: Any,
+        graph: ConnectionGraph,
+    ) -> None:
+        """
+        Replace structural estimates with measured timings when available.
+
+        Uses spans recorded by the DataFlow ExecutionTracer (see
+        ``DataFlow.enable_tracing()``). Node cost is the measured mean
+        duration; the critical path is the longest cost-weighted path through
+        the workflow DAG. Nodes without spans contribute zero cost and are
+        reported as untraced.
+        """
+        from ..core.tracing import ExecutionTracer
+
+        tracer = getattr(self.db, "_execution_tracer", None)
+        if not isinstance(tracer, ExecutionTracer):
+            return
+
+        node_ids = set(graph.nodes)
+        node_ids.update(getattr(workflow, "nodes", None) or {})
+        timings = tracer.node_stats(sorted(node_ids))
+        if not timings:
+            return
+
+        predecessors: Dict[str, List[str]] = {node: [] for node in node_ids}
+        successors: Dict[str, List[str]] = {node: [] for node in node_ids}
+        for conn in graph.connections:
+            predecessors[conn.target_node].append(conn.source_node)
+            successors[conn.source_node].append(conn.target_node)
+
+        # Kahn's algorithm; cyclic nodes are left out of the path computation
+        in_degree = {node: len(set(predecessors[node])) for node in node_ids}
+        queue: deque = deque(sorted(n for n, d in in_degree.items() if d == 0))
+        order: List[str] = []
+        while queue:
+            node = queue.popleft()
+            order.append(node)
+            for successor in sorted(set(successors[node])):
+                in_degree[successor] -= 1
+                if in_degree[successor] == 0:
+                    queue.append(successor)
+
+        cost = {node: timings.get(node, {}).get("mean_ms", 0.0) for node in node_ids}
+        finish: Dict[str, float] = {}
+        via: Dict[str, Optional[str]] = {}
+        for node in order:
+            best_prev, best_time = None, 0.0
+            for prev in predecessors[node]:
+                if prev in finish and (best_prev is None or finish[prev] > best_time):
+                    best_prev, best_time = prev, finish[prev]
+            finish[node] = best_time + cost[node]
+            via[node] = best_prev
+
+        critical_path: List[str] = []
+        if finish:
+            node: Optional[str] = max(finish, key=lambda n: (finish[n], n))
+            while node is not None:
+                critical_path.append(node)
+                node = via[node]
+            critical_path.reverse()
+        critical_path_ms = finish[critical_path[-1]] if critical_path else 0.0
+
+        total_ms = sum(cost.values())
+        traced_types = {stats["node_type"] for stats in timings.values()}
+        type_stats = tracer.node_type_stats()
+
+        profile.measured = True
+        profile.node_timings = timings
+        profile.node_type_histograms = {
+            node_type: stats
+            for node_type, stats in type_stats.items()
+            if node_type in traced_types
+        }
+        profile.critical_path = critical_path
+        profile.critical_path_ms = critical_path_ms
+        profile.untraced_nodes = sorted(node_ids - set(timings))
+        profile.estimated_execution_time_ms = critical_path_ms
+        profile.parallelization_potential = (
+            1 - critical_path_ms / total_ms if total_ms > 0 else 0.0
+        )
+        profile.resource_requirements.update(
+            {
+                "estimated_duration_seconds": critical_path_ms / 1000,
+                "serial_duration_seconds": total_ms / 1000,
+                "db_time_ms": sum(
+                    stats["mean_db_time_ms"] for stats in timings.values()
+                ),
+                "bytes_returned": sum(
+                    stats["mean_bytes"] or 0 for stats in timings.values()
+                ),
+            }
+        )
 
     def interactive(self):
         """
@@ -6,19 +6,286 @@ Provides production-grade metrics export for monitoring systems:
 - Connection pool metrics (size, utilization, in_use)
 - Workflow execution metrics (count, duration, status)
 - Counter, Gauge, and Histogram support
-- Prometheus-compatible format
+- Fixed-memory, mergeable quantile sketches (DDSketch) for histograms
+- Prometheus text exposition format
 
 Critical for observability in production environments with monitoring
 systems like Prometheus, Datadog, or Grafana.
 """
 
+import bisect
 import logging
+import math
 import threading
 from collections import defaultdict
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Prometheus client default buckets (seconds)
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.075,
+    0.1,
+    0.25,
+    0.5,
+    0.75,
+    1.0,
+    2.5,
+    5.0,
+    7.5,
+    10.0,
+)
+
+
+class QuantileSketch:
+    """
+    DDSketch quantile sketch with bounded memory.
+
+    Values are counted in logarithmic bins, so any quantile is returned
+    within ``relative_accuracy`` of the exact value, independent of how many
+    observations were recorded. At most ``max_bins`` bins are kept per sign;
+    when that limit is exceeded the lowest bins are collapsed, which only
+    affects accuracy of the smallest values. Sketches with the same
+    accuracy can be merged, e.g. to combine per-worker metrics.
+
+    Example:
+        >>> sketch = QuantileSketch(relative_accuracy=0.01)
+        >>> for value in latencies:
+        ...     sketch.add(value)
+        >>> p99 = sketch.quantile(0.99)
+    """
+
+    # Values closer to zero than this are counted as zero
+    MIN_INDEXABLE = 1e-9
+
+    def __init__(self, relative_accuracy: float = 0.01, max_bins: int = 2048):
+        """
+        Initialize the sketch.
+
+        Args:
+            relative_accuracy: Relative error bound of returned quantiles (0-1)
+            max_bins: Maximum number of bins kept for each sign
+        """
+        if not 0 < relative_accuracy < 1:
+            raise ValueError("relative_accuracy must be between 0 and 1")
+        self.relative_accuracy = relative_accuracy
+        self.max_bins = max_bins
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self._positive: Dict[int, int] = {}
+        self._negative: Dict[int, int] = {}
+        self.zero_count = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / self._log_gamma)
+
+    def _value(self, key: int) -> float:
+        return 2 * self._gamma**key / (self._gamma + 1)
+
+    def add(self, value: float, count: int = 1) -> None:
+        """Record a value (``count`` times)."""
+        if value > self.MIN_INDEXABLE:
+            store = self._positive
+            key = self._key(value)
+        elif value < -self.MIN_INDEXABLE:
+            store = self._negative
+            key = self._key(-value)
+        else:
+            store = None
+            self.zero_count += count
+
+        if store is not None:
+            store[key] = store.get(key, 0) + count
+            if len(store) > self.max_bins:
+                self._collapse(store)
+
+        self.count += count
+        self.sum += value * count
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def _collapse(self, store: Dict[int, int]) -> None:
+        """Fold the lowest bins into one so at most max_bins remain."""
+        keys = sorted(store)
+        excess = keys[: len(keys) - self.max_bins + 1]
+        target = excess[-1]
+        store[target] = sum(store.pop(key) for key in excess[:-1]) + store[target]
+
+    def quantile(self, q: float) -> Optional[float]:
+        """
+        Estimate a quantile.
+
+        Args:
+            q: Quantile in [0, 1]
+
+        Returns:
+            Estimated value, or None if the sketch is empty
+        """
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        if self.count == 0:
+            return None
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        rank = q * (self.count - 1)
+        seen = 0
+        # Ascending value order: most negative, zeros, then positives
+        for key in sorted(self._negative, reverse=True):
+            seen += self._negative[key]
+            if seen > rank:
+                return self._clamp(-self._value(key))
+        seen += self.zero_count
+        if seen > rank:
+            return 0.0
+        for key in sorted(self._positive):
+            seen += self._positive[key]
+            if seen > rank:
+                return self._clamp(self._value(key))
+        return self.max
+
+    def _clamp(self, value: float) -> float:
+        return min(max(value, self.min), self.max)
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Add the observations of another sketch with the same accuracy."""
+        if other.relative_accuracy != self.relative_accuracy:
+            raise ValueError("Cannot merge sketches with different relative accuracy")
+        for mine, theirs in (
+            (self._positive, other._positive),
+            (self._negative, other._negative),
+        ):
+            for key, count in theirs.items():
+                mine[key] = mine.get(key, 0) + count
+            while len(mine) > self.max_bins:
+                self._collapse(mine)
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self.sum += other.sum
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    @property
+    def bin_count(self) -> int:
+        """Number of bins currently held (memory footprint)."""
+        return len(self._positive) + len(self._negative)
+
+
+class HistogramMetric:
+    """
+    Histogram with Prometheus cumulative buckets and a quantile sketch.
+
+    Memory is fixed by the number of buckets and the sketch's bin limit,
+    no matter how many values are observed.
+    """
+
+    def __init__(
+        self,
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+        relative_accuracy: float = 0.01,
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            buckets: Upper bounds of the Prometheus buckets (+Inf is implicit)
+            relative_accuracy: Relative error bound of quantile estimates
+        """
+        self.buckets: Tuple[float, ...] = tuple(
+            sorted(b for b in buckets if b != math.inf)
+        )
+        self.bucket_counts: List[int] = [0] * (len(self.buckets) + 1)
+        self.sketch = QuantileSketch(relative_accuracy)
+
+    @property
+    def count(self) -> int:
+        return self.sketch.count
+
+    @property
+    def sum(self) -> float:
+        return self.sketch.sum
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self.bucket_counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sketch.add(value)
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Estimate a quantile from the sketch."""
+        return self.sketch.quantile(q)
+
+    def merge(self, other: "HistogramMetric") -> None:
+        """Add the observations of a histogram with the same buckets."""
+        if other.buckets != self.buckets:
+            raise ValueError("Cannot merge histograms with different buckets")
+        self.bucket_counts = [
+            a + b for a, b in zip(self.bucket_counts, other.bucket_counts)
+        ]
+        self.sketch.merge(other.sketch)
+
+    def cumulative_buckets(self) -> List[Tuple[float, int]]:
+        """(upper bound, cumulative count) pairs, ending with +Inf."""
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (math.inf,), self.bucket_counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Count, sum, min/max and common quantiles."""
+        if self.count == 0:
+            return {"count": 0, "sum": 0}
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "min": self.sketch.min,
+            "max": self.sketch.max,
+            "p50": self.quantile(0.5),
+            "p90": self.quantile(0.9),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+        }
+
+    def exposition_lines(self, name: str, labels: Dict[str, str]) -> List[str]:
+        """Prometheus text exposition samples for this histogram."""
+        lines = []
+        for bound, count in self.cumulative_buckets():
+            bucket_labels = dict(labels, le=_format_value(bound))
+            lines.append(f"{name}_bucket{_format_labels(bucket_labels)} {count}")
+        lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(self.sum)}")
+        lines.append(f"{name}_count{_format_labels(labels)} {self.count}")
+        return lines
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    if value == -math.inf:
+        return "-Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+def _escape_label_value(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    if not labels:
+        return ""
+    pairs = (f'{key}="{_escape_label_value(value)}"' for key, value in labels.items())
+    return "{" + ",".join(pairs) + "}"
+
 
 class MetricsExporter:
     """
@@ -74,14 +341,16 @@ class MetricsExporter:
             if "workflow_executions_total" not in self._metrics:
                 self._metrics["workflow_executions_total"] = defaultdict(int)
             if "workflow_execution_duration_seconds" not in self._metrics:
-                self._metrics["workflow_execution_duration_seconds"] = defaultdict(list)
+                self._metrics["workflow_execution_duration_seconds"] = defaultdict(
+                    HistogramMetric
+                )
 
             # Increment counter
             key = f"{workflow_name}_{status}"
             self._metrics["workflow_executions_total"][key] += 1
 
             # Record duration
-            self._metrics["workflow_execution_duration_seconds"][workflow_name].append(
+            self._metrics["workflow_execution_duration_seconds"][workflow_name].observe(
                 duration_seconds
             )
 
@@ -101,7 +370,9 @@ class PrometheusMetrics:
     Prometheus-compatible metrics collector.
 
     Provides Counter, Gauge, and Histogram metric types
-    compatible with Prometheus exposition format.
+    compatible with Prometheus exposition format. Histograms keep
+    cumulative buckets plus a quantile sketch, so their memory does not
+    grow with the number of observations.
 
     Example:
         >>> metrics = PrometheusMetrics()
@@ -110,15 +381,26 @@ class PrometheusMetrics:
         >>> metrics.observe_histogram("request_duration", 0.5, labels={"endpoint": "/api"})
     """
 
-    def __init__(self):
-        """Initialize Prometheus metrics collector."""
+    def __init__(
+        self,
+        histogram_buckets: Sequence[float] = DEFAULT_BUCKETS,
+        relative_accuracy: float = 0.01,
+    ):
+        """
+        Initialize Prometheus metrics collector.
+
+        Args:
+            histogram_buckets: Upper bounds of histogram buckets
+            relative_accuracy: Relative error bound of histogram quantiles
+        """
+        self.histogram_buckets = tuple(histogram_buckets)
+        self.relative_accuracy = relative_accuracy
         self._counters: Dict[str, Dict[str, int]] = defaultdict(
             lambda: defaultdict(int)
         )
         self._gauges: Dict[str, Dict[str, float]] = defaultdict(dict)
-        self._histograms: Dict[str, Dict[str, list]] = defaultdict(
-            lambda: defaultdict(list)
-        )
+        self._histograms: Dict[str, Dict[str, HistogramMetric]] = defaultdict(dict)
+        self._labels: Dict[str, Dict[str, str]] = {}
         self._lock = threading.Lock()
 
     def increment_counter(
@@ -132,7 +414,7 @@ class PrometheusMetrics:
             labels: Optional label dictionary
             value: Increment value (default: 1)
         """
-        labels_key = self._labels_to_key(labels or {})
+        labels_key = self._remember_labels(labels)
         with self._lock:
             self._counters[name][labels_key] += value
 
@@ -147,7 +429,7 @@ class PrometheusMetrics:
             value: Gauge value
             labels: Optional label dictionary
         """
-        labels_key = self._labels_to_key(labels or {})
+        labels_key = self._remember_labels(labels)
         with self._lock:
             self._gauges[name][labels_key] = value
 
@@ -162,9 +444,13 @@ class PrometheusMetrics:
             value: Observed value
             labels: Optional label dictionary
         """
-        labels_key = self._labels_to_key(labels or {})
+        labels_key = self._remember_labels(labels)
         with self._lock:
-            self._histograms[name][labels_key].append(value)
+            histogram = self._histograms[name].get(labels_key)
+            if histogram is None:
+                histogram = self._new_histogram()
+                self._histograms[name][labels_key] = histogram
+            histogram.observe(value)
 
     def get_counter_value(
         self, name: str, labels: Optional[Dict[str, str]] = None
@@ -211,12 +497,127 @@ class PrometheusMetrics:
             labels: Optional label dictionary
 
         Returns:
-            Dictionary with count and sum
+            Dictionary with count and sum, plus min, max, p50, p90, p95
+            and p99 once observations exist
         """
         labels_key = self._labels_to_key(labels or {})
         with self._lock:
-            observations = self._histograms[name].get(labels_key, [])
-            return {"count": len(observations), "sum": sum(observations)}
+            histogram = self._histograms[name].get(labels_key)
+            if histogram is None:
+                return {"count": 0, "sum": 0}
+            return histogram.stats()
+
+    def get_histogram_quantile(
+        self, name: str, quantile: float, labels: Optional[Dict[str, str]] = None
+    ) -> Optional[float]:
+        """
+        Estimate a histogram quantile.
+
+        Args:
+            name: Metric name
+            quantile: Quantile in [0, 1]
+            labels: Optional label dictionary
+
+        Returns:
+            Estimated value, or None if nothing was observed
+        """
+        labels_key = self._labels_to_key(labels or {})
+        with self._lock:
+            histogram = self._histograms[name].get(labels_key)
+            return histogram.quantile(quantile) if histogram else None
+
+    def get_aggregate_histogram(self, name: str) -> HistogramMetric:
+        """
+        Merge a histogram across all of its label combinations.
+
+        Args:
+            name: Metric name
+
+        Returns:
+            New histogram holding every observation of the metric
+        """
+        merged = self._new_histogram()
+        with self._lock:
+            for histogram in self._histograms[name].values():
+                merged.merge(histogram)
+        return merged
+
+    def merge(self, other: "PrometheusMetrics") -> None:
+        """
+        Merge another collector into this one (e.g. from another worker).
+
+        Counters and histograms are summed; gauges take the other value.
+
+        Args:
+            other: Collector with the same histogram configuration
+        """
+        with other._lock:
+            counters = {n: dict(v) for n, v in other._counters.items()}
+            gauges = {n: dict(v) for n, v in other._gauges.items()}
+            histograms = {n: dict(v) for n, v in other._histograms.items()}
+            labels = dict(other._labels)
+
+        with self._lock:
+            self._labels.update(labels)
+            for name, values in counters.items():
+                for key, value in values.items():
+                    self._counters[name][key] += value
+            for name, values in gauges.items():
+                self._gauges[name].update(values)
+            for name, values in histograms.items():
+                for key, histogram in values.items():
+                    mine = self._histograms[name].get(key)
+                    if mine is None:
+                        mine = self._new_histogram()
+                        self._histograms[name][key] = mine
+                    mine.merge(histogram)
+
+    def reset(self) -> None:
+        """Discard all recorded metrics."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+            self._labels.clear()
+
+    def export_text(self) -> str:
+        """
+        Render all metrics in Prometheus text exposition format.
+
+        Returns:
+            Exposition text, ready to serve from a /metrics endpoint
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                lines.append(f"# TYPE {name} counter")
+                for key, value in sorted(self._counters[name].items()):
+                    lines.append(f"{name}{self._label_text(key)} {value}")
+            for name in sorted(self._gauges):
+                lines.append(f"# TYPE {name} gauge")
+                for key, value in sorted(self._gauges[name].items()):
+                    lines.append(
+                        f"{name}{self._label_text(key)} {_format_value(value)}"
+                    )
+            for name in sorted(self._histograms):
+                lines.append(f"# TYPE {name} histogram")
+                for key, histogram in sorted(self._histograms[name].items()):
+                    lines.extend(
+                        histogram.exposition_lines(name, self._labels.get(key, {}))
+                    )
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def _new_histogram(self) -> HistogramMetric:
+        return HistogramMetric(self.histogram_buckets, self.relative_accuracy)
+
+    def _remember_labels(self, labels: Optional[Dict[str, str]]) -> str:
+        labels_key = self._labels_to_key(labels or {})
+        if labels_key not in self._labels:
+            self._labels[labels_key] = dict(sorted((labels or {}).items()))
+        return labels_key
+
+    def _label_text(self, labels_key: str) -> str:
+        return _format_labels(self._labels.get(labels_key, {}))
 
     @staticmethod
     def _labels_to_key(labels: Dict[str, str]) -> str:
@@ -236,6 +637,9 @@ class PrometheusMetrics:
 
 
 __all__ = [
+    "DEFAULT_BUCKETS",
+    "HistogramMetric",
     "MetricsExporter",
     "PrometheusMetrics",
+    "QuantileSketch",
 ]
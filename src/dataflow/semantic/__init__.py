@@ -5,7 +5,13 @@ This module provides embedding-based semantic search capabilities
 integrated with DataFlow's database operations.
 """
 
+from .embedding_cache import CachedEmbeddingProvider, SQLiteEmbeddingStore
 from .embeddings import EmbeddingProvider, OllamaEmbeddings, OpenAIEmbeddings
+from .keyword_index import (
+    KeywordIndex,
+    PostgresTsvectorKeywordIndex,
+    SQLiteFTS5KeywordIndex,
+)
 from .memory import SemanticMemory, VectorStore
 from .search import HybridSearchEngine, SemanticSearchEngine
 
@@ -15,6 +21,11 @@ __all__ = [
     "EmbeddingProvider",
     "OpenAIEmbeddings",
     "OllamaEmbeddings",
+    "CachedEmbeddingProvider",
+    "SQLiteEmbeddingStore",
     "SemanticSearchEngine",
     "HybridSearchEngine",
+    "KeywordIndex",
+    "SQLiteFTS5KeywordIndex",
+    "PostgresTsvectorKeywordIndex",
 ]
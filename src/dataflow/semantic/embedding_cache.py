@@ -0,0 +1,359 @@
+"""
+Caching and micro-batching layer for embedding providers.
+
+Wraps any EmbeddingProvider so that:
+- embeddings are keyed by a content hash of (model, dimension, text)
+- recently used embeddings live in a bounded in-memory LRU
+- all embeddings persist in a SQLite store, so re-indexing identical
+  content never goes back to the provider
+- identical texts requested concurrently share one in-flight request
+- concurrent embed calls are coalesced into micro-batches of up to
+  ``max_batch_size`` texts or ``batch_window_ms`` of waiting
+"""
+
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .embeddings import EmbeddingProvider, EmbeddingResult
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteEmbeddingStore:
+    """On-disk embedding store keyed by content hash."""
+
+    # SQLite limits the number of bound parameters per statement
+    _MAX_KEYS_PER_QUERY = 500
+
+    def __init__(self, path: str = ":memory:"):
+        """
+        Initialize the store.
+
+        Args:
+            path: SQLite database file (":memory:" for a process-local store)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    dtype TEXT NOT NULL,
+                    vector BLOB NOT NULL,
+                    created_at REAL NOT NULL
+                )
+            """
+        )
+        self._conn.commit()
+
+    def get_many(self, keys: List[str]) -> Dict[str, np.ndarray]:
+        """Load the embeddings stored for the given keys."""
+        found: Dict[str, np.ndarray] = {}
+        with self._lock:
+            for i in range(0, len(keys), self._MAX_KEYS_PER_QUERY):
+                chunk = keys[i : i + self._MAX_KEYS_PER_QUERY]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT key, dtype, vector FROM embeddings "
+                    f"WHERE key IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                for key, dtype, vector in rows:
+                    found[key] = np.frombuffer(vector, dtype=np.dtype(dtype)).copy()
+        return found
+
+    def put_many(self, model: str, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        """Persist embeddings (existing keys are replaced)."""
+        now = time.time()
+        rows = [
+            (key, model, embedding.dtype.str, embedding.tobytes(), now)
+            for key, embedding in items
+        ]
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO embeddings "
+                "(key, model, dtype, vector, created_at) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+            self._conn.commit()
+
+    def count(self) -> int:
+        """Number of stored embeddings."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete all stored embeddings."""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    Embedding provider wrapper with LRU + persistent caching, in-flight
+    deduplication and micro-batching.
+
+    Example:
+        provider = CachedEmbeddingProvider(
+            OpenAIEmbeddings(api_key=key),
+            store_path="embeddings.db",
+        )
+        memory = SemanticMemory(provider, vector_store)
+    """
+
+    def __init__(
+        self,
+        provider: EmbeddingProvider,
+        store_path: Optional[str] = None,
+        store: Optional[SQLiteEmbeddingStore] = None,
+        max_memory_entries: int = 10000,
+        max_batch_size: int = 100,
+        batch_window_ms: float = 5.0,
+    ):
+        """
+        Initialize the caching provider.
+
+        Args:
+            provider: Provider that computes embeddings on cache misses
+            store_path: SQLite file for the persistent store (None disables it)
+            store: Existing store to use instead of opening ``store_path``
+            max_memory_entries: Capacity of the in-memory LRU
+            max_batch_size: Maximum texts per provider request
+            batch_window_ms: How long to wait for more texts before flushing
+        """
+        super().__init__(provider.model_name, provider.dimension, provider.cache_ttl)
+        self.provider = provider
+        self.store = store
+        if self.store is None and store_path is not None:
+            self.store = SQLiteEmbeddingStore(store_path)
+        self.max_memory_entries = max_memory_entries
+        self.max_batch_size = max_batch_size
+        self.batch_window_ms = batch_window_ms
+
+        self._lru: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Future] = {}
+        self._pending: List[Tuple[str, str]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._flush_tasks: set = set()
+        self.stats = {
+            "requested": 0,
+            "memory_hits": 0,
+            "store_hits": 0,
+            "deduplicated": 0,
+            "provider_texts": 0,
+            "provider_batches": 0,
+        }
+
+    def _get_cache_key(self, text: str) -> str:
+        """Content hash identifying an embedding of text by this model."""
+        content = f"{self.model_name}\x00{self.dimension}\x00{text}"
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    # ------------------------------------------------------------------
+    # EmbeddingProvider interface
+    # ------------------------------------------------------------------
+
+    async def embed_text(self, text: Union[str, List[str]]) -> EmbeddingResult:
+        """Embed text, serving repeated content from cache."""
+        texts = [text] if isinstance(text, str) else list(text)
+        keys = [self._get_cache_key(t) for t in texts]
+        self.stats["requested"] += len(texts)
+
+        resolved: Dict[str, np.ndarray] = {}
+        waiting: Dict[str, asyncio.Future] = {}
+        misses: Dict[str, str] = {}
+        for key, txt in zip(keys, texts):
+            if key in resolved or key in waiting or key in misses:
+                self.stats["deduplicated"] += 1
+                continue
+            embedding = self._lru_get(key)
+            if embedding is not None:
+                self.stats["memory_hits"] += 1
+                resolved[key] = embedding
+            elif key in self._in_flight:
+                self.stats["deduplicated"] += 1
+                waiting[key] = self._in_flight[key]
+            else:
+                misses[key] = txt
+
+        if misses:
+            # Register before any await so concurrent callers join these
+            loop = asyncio.get_running_loop()
+            for key in misses:
+                future = loop.create_future()
+                self._in_flight[key] = future
+                waiting[key] = future
+            computed = await self._resolve_misses(misses)
+        else:
+            computed = 0
+
+        if waiting:
+            values = await asyncio.gather(*waiting.values())
+            resolved.update(zip(waiting.keys(), values))
+
+        embeddings = (
+            np.vstack([resolved[key] for key in keys])
+            if keys
+            else np.empty((0, self.dimension))
+        )
+        return EmbeddingResult(
+            embeddings=embeddings,
+            model=self.model_name,
+            dimension=self.dimension,
+            metadata={"cached": computed == 0, "computed": computed},
+        )
+
+    async def embed_batch(
+        self, texts: List[str], batch_size: int = 100
+    ) -> EmbeddingResult:
+        """Embed texts; provider requests are batched by max_batch_size."""
+        return await self.embed_text(texts)
+
+    async def clear_cache(self):
+        """Clear the in-memory and persistent caches."""
+        self._lru.clear()
+        if self.store is not None:
+            await asyncio.to_thread(self.store.clear)
+
+    async def flush(self) -> None:
+        """Send any queued texts to the provider and wait for all batches."""
+        loop = asyncio.get_running_loop()
+        while self._pending:
+            self._spawn_flush(loop)
+        if self._flush_tasks:
+            await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+
+    async def __aenter__(self):
+        """Share one HTTP session of the wrapped provider inside the context."""
+        await self.provider.__aenter__()
+        return self
+
+    async def aclose(self):
+        """Flush queued work and close the wrapped provider's session."""
+        await self.flush()
+        await self.provider.aclose()
+
+    async def close(self) -> None:
+        """Flush queued work and close the provider session and the store."""
+        await self.aclose()
+        if self.store is not None:
+            self.store.close()
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _lru_get(self, key: str) -> Optional[np.ndarray]:
+        embedding = self._lru.get(key)
+        if embedding is not None:
+            self._lru.move_to_end(key)
+        return embedding
+
+    def _lru_put(self, key: str, embedding: np.ndarray) -> None:
+        self._lru[key] = embedding
+        self._lru.move_to_end(key)
+        while len(self._lru) > self.max_memory_entries:
+            self._lru.popitem(last=False)
+
+    def _settle(self, key: str, embedding: np.ndarray) -> None:
+        future = self._in_flight.pop(key, None)
+        if future is not None and not future.done():
+            future.set_result(embedding)
+
+    async def _resolve_misses(self, misses: Dict[str, str]) -> int:
+        """Serve misses from the persistent store, queue the rest.
+
+        Returns:
+            Number of texts queued for the provider
+        """
+        if self.store is not None:
+            try:
+                stored = await asyncio.to_thread(self.store.get_many, list(misses))
+            except Exception as e:
+                logger.warning(f"Embedding store lookup failed: {e}")
+                stored = {}
+            for key, embedding in stored.items():
+                self.stats["store_hits"] += 1
+                self._lru_put(key, embedding)
+                self._settle(key, embedding)
+            misses = {k: t for k, t in misses.items() if k not in stored}
+
+        if not misses:
+            return 0
+
+        self._pending.extend(misses.items())
+        loop = asyncio.get_running_loop()
+        while len(self._pending) >= self.max_batch_size:
+            self._spawn_flush(loop)
+        if self._pending and self._flush_timer is None:
+            self._flush_timer = loop.call_later(
+                self.batch_window_ms / 1000, self._spawn_flush, loop
+            )
+        return len(misses)
+
+    def _spawn_flush(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Take one micro-batch off the queue and send it in the background."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        batch = self._pending[: self.max_batch_size]
+        del self._pending[: self.max_batch_size]
+        if not batch:
+            return
+
+        task = loop.create_task(self._send_batch(batch))
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _send_batch(self, batch: List[Tuple[str, str]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            self.stats["provider_batches"] += 1
+            self.stats["provider_texts"] += len(batch)
+            result = await self.provider.embed_batch(
+                [text for _, text in batch], batch_size=self.max_batch_size
+            )
+            if len(result.embeddings) != len(batch):
+                raise ValueError(
+                    f"Provider returned {len(result.embeddings)} embeddings "
+                    f"for {len(batch)} texts"
+                )
+        except Exception as e:
+            for key in keys:
+                future = self._in_flight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(e)
+            return
+
+        embeddings = [np.asarray(embedding) for embedding in result.embeddings]
+        for key, embedding in zip(keys, embeddings):
+            self._lru_put(key, embedding)
+            self._settle(key, embedding)
+
+        if self.store is not None:
+            try:
+                await asyncio.to_thread(
+                    self.store.put_many, self.model_name, list(zip(keys, embeddings))
+                )
+            except Exception as e:
+                logger.warning(f"Embedding store write failed: {e}")
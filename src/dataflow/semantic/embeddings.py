@@ -8,6 +8,8 @@ import asyncio
 import hashlib
 import json
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Any, Dict, List, Optional, Union
@@ -29,7 +31,13 @@ class EmbeddingResult:
 class EmbeddingProvider(ABC):
     """Abstract base class for embedding providers."""
 
-    def __init__(self, model_name: str, dimension: int, cache_ttl: int = 3600):
+    def __init__(
+        self,
+        model_name: str,
+        dimension: int,
+        cache_ttl: int = 3600,
+        cache_size: int = 10000,
+    ):
         """
         Initialize embedding provider.
 
@@ -37,11 +45,38 @@ class EmbeddingProvider(ABC):
             model_name: Name of the embedding model
             dimension: Dimension of the embeddings
             cache_ttl: Cache time-to-live in seconds
+            cache_size: Maximum cached embeddings (least recently used evicted)
         """
         self.model_name = model_name
         self.dimension = dimension
         self.cache_ttl = cache_ttl
-        self._cache: Dict[str, tuple[np.ndarray, datetime]] = {}
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, tuple[np.ndarray, datetime]]" = OrderedDict()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self):
+        """Reuse one HTTP session for all requests inside the context."""
+        if self._session is None:
+            self._session = aiohttp.ClientSession()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+
+    async def aclose(self):
+        """Close the shared HTTP session, if one is open."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    @asynccontextmanager
+    async def _session_scope(self):
+        """Yield the shared session, or a per-call session outside a context."""
+        if self._session is not None:
+            yield self._session
+        else:
+            async with aiohttp.ClientSession() as session:
+                yield session
 
     @abstractmethod
     async def embed_text(self, text: Union[str, List[str]]) -> EmbeddingResult:
@@ -65,6 +100,7 @@ class EmbeddingProvider(ABC):
         if key in self._cache:
             embedding, timestamp = self._cache[key]
             if datetime.now() - timestamp < timedelta(seconds=self.cache_ttl):
+                self._cache.move_to_end(key)
                 return embedding
             else:
                 del self._cache[key]
@@ -74,6 +110,9 @@ class EmbeddingProvider(ABC):
         """Add embedding to cache."""
         key = self._get_cache_key(text)
         self._cache[key] = (embedding, datetime.now())
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
 
     async def clear_cache(self):
         """Clear the embedding cache."""
@@ -120,7 +159,7 @@ class OpenAIEmbeddings(EmbeddingProvider):
                     metadata={"cached": True},
                 )
 
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             headers = {
                 "Authorization": f"Bearer {self.api_key}",
                 "Content-Type": "application/json",
@@ -205,7 +244,7 @@ class OllamaEmbeddings(EmbeddingProvider):
 
         all_embeddings = []
 
-        async with aiohttp.ClientSession() as session:
+        async with self._session_scope() as session:
             for txt in texts:
                 # Check cache
                 cached = self._get_from_cache(txt)
@@ -0,0 +1,290 @@
+"""
+Keyword index backends for hybrid search.
+
+Keeps a full-text index next to the VectorStore table so keyword search is
+an index lookup instead of a ``LIKE '%term%'`` scan:
+
+- SQLite: an external-content FTS5 table kept in sync with the store table
+  by INSERT/UPDATE/DELETE triggers, ranked with BM25
+- PostgreSQL: a generated ``tsvector`` column with a GIN index, ranked with
+  ``ts_rank_cd``. Adding a stored generated column rewrites the table, so it
+  is created by an explicit setup step (``initialize`` or
+  ``HybridSearchEngine.setup_keyword_index``), never by a search
+
+Both backends report scores in [0, 1) (``rank / (rank + 1)``) so they can be
+fused with cosine similarities by HybridSearchEngine.
+"""
+
+import asyncio
+import json
+import re
+from abc import ABC, abstractmethod
+from typing import Any, Dict, List, Optional
+
+from .search import SearchResult
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _check_identifier(name: str) -> str:
+    if not _IDENTIFIER.match(name):
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return name
+
+
+def _bounded(rank: float) -> float:
+    """Map an unbounded non-negative rank to [0, 1)."""
+    rank = max(float(rank), 0.0)
+    return rank / (rank + 1.0)
+
+
+class KeywordIndex(ABC):
+    """Full-text index over the content column of a VectorStore table."""
+
+    def __init__(self, table_name: str = "semantic_memory"):
+        """
+        Initialize the keyword index.
+
+        Args:
+            table_name: VectorStore table whose ``content`` column is indexed
+        """
+        self.table_name = _check_identifier(table_name)
+        self._initialized = False
+        self._lock = asyncio.Lock()
+
+    async def ensure(self, conn) -> None:
+        """Make sure the index is usable before the first search."""
+        if self._initialized:
+            return
+        async with self._lock:
+            if not self._initialized:
+                await self.prepare(conn)
+                self._initialized = True
+
+    @abstractmethod
+    async def initialize(self, conn) -> None:
+        """Create the index structures and backfill existing rows."""
+
+    async def prepare(self, conn) -> None:
+        """Ready the index for searching (creates it unless overridden)."""
+        await self.initialize(conn)
+
+    @abstractmethod
+    async def search(
+        self,
+        conn,
+        tokens: List[str],
+        limit: int,
+        collection: Optional[str] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        """Return rows matching any token, best first."""
+
+    @staticmethod
+    def _result(row, score: float) -> SearchResult:
+        metadata = row["metadata"]
+        if isinstance(metadata, str):
+            metadata = json.loads(metadata) if metadata else {}
+        return SearchResult(
+            id=str(row["id"]),
+            content=row["content"],
+            score=score,
+            keyword_score=score,
+            metadata=metadata,
+            source="keyword",
+        )
+
+
+class SQLiteFTS5KeywordIndex(KeywordIndex):
+    """FTS5 index synchronized with the store table through triggers."""
+
+    def __init__(self, table_name: str = "semantic_memory", tokenizer: str = "porter"):
+        """
+        Initialize the FTS5 index.
+
+        Args:
+            table_name: VectorStore table whose ``content`` column is indexed
+            tokenizer: FTS5 tokenizer specification
+        """
+        super().__init__(table_name)
+        self.tokenizer = tokenizer
+        self.fts_table = f"{self.table_name}_fts"
+
+    async def initialize(self, conn) -> None:
+        table, fts = self.table_name, self.fts_table
+        existing = await conn.fetch(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", fts
+        )
+
+        await conn.execute(
+            f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5(
+                    content, content='{table}', content_rowid='rowid',
+                    tokenize='{self.tokenizer}'
+                )
+            """
+        )
+        await conn.execute(
+            f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_ai AFTER INSERT ON {table} BEGIN
+                    INSERT INTO {fts}(rowid, content) VALUES (new.rowid, new.content);
+                END
+            """
+        )
+        await conn.execute(
+            f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_ad AFTER DELETE ON {table} BEGIN
+                    INSERT INTO {fts}({fts}, rowid, content)
+                    VALUES ('delete', old.rowid, old.content);
+                END
+            """
+        )
+        await conn.execute(
+            f"""
+                CREATE TRIGGER IF NOT EXISTS {fts}_au AFTER UPDATE OF content ON {table}
+                BEGIN
+                    INSERT INTO {fts}({fts}, rowid, content)
+                    VALUES ('delete', old.rowid, old.content);
+                    INSERT INTO {fts}(rowid, content) VALUES (new.rowid, new.content);
+                END
+            """
+        )
+
+        if not existing:
+            # Index rows written before the triggers existed
+            await conn.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+
+    async def search(
+        self,
+        conn,
+        tokens: List[str],
+        limit: int,
+        collection: Optional[str] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        if not tokens:
+            return []
+
+        table, fts = self.table_name, self.fts_table
+        match = " OR ".join('"{}"'.format(token.replace('"', '""')) for token in tokens)
+        sql = f"""
+            SELECT t.id, t.content, t.metadata, -bm25({fts}) AS rank
+            FROM {fts}
+            JOIN {table} AS t ON t.rowid = {fts}.rowid
+            WHERE {fts} MATCH ?
+        """
+        params: List[Any] = [match]
+
+        if collection:
+            sql += " AND t.collection = ?"
+            params.append(collection)
+
+        for key, value in (metadata_filter or {}).items():
+            path = '$."{}"'.format(str(key).replace('"', '""'))
+            if isinstance(value, (dict, list)):
+                sql += " AND json_extract(t.metadata, ?) = json(?)"
+                params.extend([path, json.dumps(value)])
+            else:
+                sql += " AND json_extract(t.metadata, ?) = ?"
+                params.extend([path, value])
+
+        sql += " ORDER BY rank DESC LIMIT ?"
+        params.append(limit)
+
+        rows = await conn.fetch(sql, *params)
+        return [self._result(row, _bounded(row["rank"])) for row in rows]
+
+
+class PostgresTsvectorKeywordIndex(KeywordIndex):
+    """Generated tsvector column with a GIN index."""
+
+    def __init__(self, table_name: str = "semantic_memory", language: str = "english"):
+        """
+        Initialize the tsvector index.
+
+        Args:
+            table_name: VectorStore table whose ``content`` column is indexed
+            language: Text search configuration
+        """
+        super().__init__(table_name)
+        self.language = _check_identifier(language)
+
+    async def initialize(self, conn) -> None:
+        """Add the tsvector column and GIN index (a one-off migration step)."""
+        table = self.table_name
+        # A stored generated column is maintained by PostgreSQL on every write
+        await conn.execute(
+            f"""
+                ALTER TABLE {table} ADD COLUMN IF NOT EXISTS content_tsv tsvector
+                GENERATED ALWAYS AS (
+                    to_tsvector('{self.language}', coalesce(content, ''))
+                ) STORED
+            """
+        )
+        await conn.execute(
+            f"""
+                CREATE INDEX IF NOT EXISTS idx_{table}_content_tsv
+                ON {table} USING GIN(content_tsv)
+            """
+        )
+
+    async def prepare(self, conn) -> None:
+        """Check the tsvector column exists; searches never run the DDL."""
+        rows = await conn.fetch(
+            """
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = ANY(current_schemas(false))
+                  AND table_name = $1 AND column_name = 'content_tsv'
+            """,
+            self.table_name,
+        )
+        if not rows:
+            raise RuntimeError(
+                f"Keyword index column {self.table_name}.content_tsv is missing; "
+                "run HybridSearchEngine.setup_keyword_index() or "
+                "PostgresTsvectorKeywordIndex.initialize() first"
+            )
+
+    async def search(
+        self,
+        conn,
+        tokens: List[str],
+        limit: int,
+        collection: Optional[str] = None,
+        metadata_filter: Optional[Dict[str, Any]] = None,
+    ) -> List[SearchResult]:
+        if not tokens:
+            return []
+
+        sql = f"""
+            SELECT id, content, metadata, ts_rank_cd(content_tsv, query) AS rank
+            FROM {self.table_name}, to_tsquery('{self.language}', $1) AS query
+            WHERE content_tsv @@ query
+        """
+        # Tokens are \\w+ words, so they are safe tsquery lexemes
+        params: List[Any] = [" | ".join(tokens)]
+
+        if collection:
+            params.append(collection)
+            sql += f" AND collection = ${len(params)}"
+
+        if metadata_filter:
+            params.append(json.dumps(metadata_filter))
+            sql += f" AND metadata @> ${len(params)}::jsonb"
+
+        params.append(limit)
+        sql += f" ORDER BY rank DESC LIMIT ${len(params)}"
+
+        rows = await conn.fetch(sql, *params)
+        return [self._result(row, _bounded(row["rank"])) for row in rows]
+
+
+def create_keyword_index(
+    dialect_type: str, table_name: str = "semantic_memory"
+) -> Optional[KeywordIndex]:
+    """Return the keyword index backend for a database dialect, if any."""
+    if dialect_type == "postgresql":
+        return PostgresTsvectorKeywordIndex(table_name)
+    if dialect_type == "sqlite":
+        return SQLiteFTS5KeywordIndex(table_name)
+    return None
@@ -10,7 +10,7 @@ import json
 import re
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 import asyncpg
 import numpy as np
@@ -19,6 +19,9 @@ from ..database.connection_builder import ConnectionStringBuilder
 from ..database.query_builder import QueryBuilder
 from .memory import MemoryItem, SemanticMemory
 
+if TYPE_CHECKING:
+    from .keyword_index import KeywordIndex
+
 
 @dataclass
 class SearchResult:
@@ -168,6 +171,7 @@ class HybridSearchEngine:
         table_name: str = "documents",
         semantic_weight: float = 0.7,
         keyword_weight: float = 0.3,
+        keyword_index: Optional[Union["KeywordIndex", str]] = None,
     ):
         """
         Initialize hybrid search engine.
@@ -178,6 +182,11 @@ class HybridSearchEngine:
             table_name: Table for keyword search
             semantic_weight: Weight for semantic scores
             keyword_weight: Weight for keyword scores
+            keyword_index: Full-text index used for keyword search. "auto"
+                picks FTS5 (SQLite) or tsvector (PostgreSQL) over the
+                semantic memory's VectorStore table (PostgreSQL needs
+                ``setup_keyword_index()`` once); None keeps the unindexed
+                search over ``table_name``
         """
         self.semantic_memory = semantic_memory
         self.connection_builder = connection_builder
@@ -186,6 +195,22 @@ class HybridSearchEngine:
         self.keyword_weight = keyword_weight
         self.semantic_engine = SemanticSearchEngine(semantic_memory)
 
+        if keyword_index == "auto":
+            from .keyword_index import create_keyword_index
+
+            keyword_index = create_keyword_index(
+                connection_builder.adapter.dialect_type,
+                semantic_memory.vector_store.table_name,
+            )
+        self.keyword_index = keyword_index
+
+    async def setup_keyword_index(self) -> None:
+        """Create the keyword index structures (run once, e.g. at deploy)."""
+        if self.keyword_index is None:
+            return
+        async with self.connection_builder.get_connection() as conn:
+            await self.keyword_index.initialize(conn)
+
     async def search(
         self,
         query: str,
@@ -224,6 +249,7 @@ class HybridSearchEngine:
             limit=limit * 2,
             fields=fields or ["content", "title", "description"],
             metadata_filter=metadata_filter,
+            collection=collection,
         )
 
         # Run both searches in parallel
@@ -242,8 +268,21 @@ class HybridSearchEngine:
         limit: int,
         fields: List[str],
         metadata_filter: Optional[Dict[str, Any]] = None,
+        collection: Optional[str] = None,
     ) -> List[SearchResult]:
         """Perform keyword-based search."""
+        if self.keyword_index is not None:
+            # Indexed search over the VectorStore content (fields are implied)
+            async with self.connection_builder.get_connection() as conn:
+                await self.keyword_index.ensure(conn)
+                return await self.keyword_index.search(
+                    conn,
+                    self._tokenize_query(query),
+                    limit,
+                    collection=collection,
+                    metadata_filter=metadata_filter,
+                )
+
         # Build full-text search query
         query_builder = QueryBuilder(self.connection_builder.adapter)
 
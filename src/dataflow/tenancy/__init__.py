@@ -7,6 +7,7 @@ including query interception, tenant isolation, and security controls.
 
 from .exceptions import QueryParsingError, TenantIsolationError
 from .interceptor import QueryInterceptor
+from .rate_limiter import TokenBucketRateLimiter
 from .security import TenantSecurityManager
 
 __all__ = [
@@ -14,4 +15,5 @@ __all__ = [
     "TenantIsolationError",
     "QueryParsingError",
     "TenantSecurityManager",
+    "TokenBucketRateLimiter",
 ]
@@ -0,0 +1,196 @@
+"""
+Per-tenant query rate limiting for multi-tenant database operations.
+
+Each tenant gets a token bucket: it holds up to ``burst`` tokens, refills at
+``rate_per_minute`` tokens per minute and every query takes one token. A
+check costs O(1) time and each tenant needs O(1) memory, however many
+queries it runs.
+
+With a shared Redis client the limit holds across workers. Redis cannot
+update a token bucket atomically without Lua, so the shared limiter uses the
+equivalent sliding-window counter: a window of ``60 * burst / rate`` seconds
+admits ``burst`` queries, approximated from the counters of the current and
+the previous window (INCR / GET / EXPIRE only).
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RateLimitDecision:
+    """Outcome of a rate limit check."""
+
+    allowed: bool
+    remaining: int
+    retry_after: float = 0.0
+
+
+class _TokenBucket:
+    __slots__ = ("tokens", "updated_at")
+
+    def __init__(self, tokens: float, updated_at: float):
+        self.tokens = tokens
+        self.updated_at = updated_at
+
+
+class TokenBucketRateLimiter:
+    """
+    Constant-time, constant-memory rate limiter keyed by tenant.
+    """
+
+    def __init__(
+        self,
+        redis_client: Optional[Any] = None,
+        key_prefix: str = "dataflow:ratelimit",
+        clock: Optional[Callable[[], float]] = None,
+    ):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            redis_client: Optional synchronous Redis client shared by all
+                workers; without one, limits are enforced per process
+            key_prefix: Prefix for the Redis counter keys
+            clock: Time source in seconds (defaults to ``time.monotonic``
+                locally and ``time.time`` for the shared counters)
+        """
+        self.redis_client = redis_client
+        self.key_prefix = key_prefix
+        self._clock = clock
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+        self._allowed: Dict[str, int] = {}
+        self._rejected: Dict[str, int] = {}
+        self._backend_errors = 0
+
+    def acquire(
+        self, key: str, rate_per_minute: int, burst: Optional[int] = None
+    ) -> RateLimitDecision:
+        """
+        Take one token for ``key``.
+
+        Args:
+            key: Tenant identifier
+            rate_per_minute: Sustained number of queries per minute
+            burst: Bucket capacity (defaults to ``rate_per_minute``)
+
+        Returns:
+            RateLimitDecision for this query
+        """
+        capacity = rate_per_minute if burst is None else burst
+        if rate_per_minute <= 0 or capacity <= 0:
+            decision = RateLimitDecision(allowed=False, remaining=0)
+        elif self.redis_client is not None:
+            try:
+                decision = self._acquire_shared(key, rate_per_minute, capacity)
+            except Exception as e:
+                # Keep limiting locally while the shared backend is unavailable
+                with self._lock:
+                    self._backend_errors += 1
+                logger.warning(f"Shared rate limiter unavailable, using local: {e}")
+                decision = self._acquire_local(key, rate_per_minute, capacity)
+        else:
+            decision = self._acquire_local(key, rate_per_minute, capacity)
+
+        with self._lock:
+            counts = self._allowed if decision.allowed else self._rejected
+            counts[key] = counts.get(key, 0) + 1
+        return decision
+
+    def reset(self, key: str) -> None:
+        """Forget the local bucket of ``key``."""
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def get_metrics(self, key: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Get rate limiter metrics.
+
+        Args:
+            key: Optional tenant filter
+
+        Returns:
+            Allowed / rejected query counts and shared backend errors
+        """
+        with self._lock:
+            if key is not None:
+                allowed = self._allowed.get(key, 0)
+                rejected = self._rejected.get(key, 0)
+            else:
+                allowed = sum(self._allowed.values())
+                rejected = sum(self._rejected.values())
+            backend_errors = self._backend_errors
+        total = allowed + rejected
+        return {
+            "allowed": allowed,
+            "rejected": rejected,
+            "rejection_rate": rejected / total if total else 0.0,
+            "backend": "redis" if self.redis_client is not None else "local",
+            "backend_errors": backend_errors,
+        }
+
+    # Private helper methods
+
+    def _acquire_local(
+        self, key: str, rate_per_minute: int, capacity: int
+    ) -> RateLimitDecision:
+        refill_per_second = rate_per_minute / 60.0
+        now = self._clock() if self._clock else time.monotonic()
+
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = _TokenBucket(capacity, now)
+            else:
+                elapsed = max(0.0, now - bucket.updated_at)
+                bucket.tokens = min(
+                    capacity, bucket.tokens + elapsed * refill_per_second
+                )
+                bucket.updated_at = now
+
+            if bucket.tokens < 1:
+                return RateLimitDecision(
+                    allowed=False,
+                    remaining=0,
+                    retry_after=(1 - bucket.tokens) / refill_per_second,
+                )
+            bucket.tokens -= 1
+            return RateLimitDecision(allowed=True, remaining=int(bucket.tokens))
+
+    def _acquire_shared(
+        self, key: str, rate_per_minute: int, capacity: int
+    ) -> RateLimitDecision:
+        window = 60.0 * capacity / rate_per_minute
+        now = self._clock() if self._clock else time.time()
+        index = int(now // window)
+        previous_weight = 1 - (now - index * window) / window
+
+        current_key = f"{self.key_prefix}:{key}:{index}"
+        count = self.redis_client.incr(current_key)
+        if count == 1:
+            self.redis_client.expire(current_key, math.ceil(2 * window))
+        previous = int(
+            self.redis_client.get(f"{self.key_prefix}:{key}:{index - 1}") or 0
+        )
+
+        estimate = previous * previous_weight + count
+        if estimate > capacity:
+            # Give back the slot so rejected queries do not count
+            self.redis_client.decr(current_key)
+            # The previous window's share decays linearly until it rolls over
+            allowed_share = capacity - count
+            if previous and allowed_share >= 0:
+                retry_after = (previous_weight - allowed_share / previous) * window
+            else:
+                retry_after = previous_weight * window
+            return RateLimitDecision(
+                allowed=False, remaining=0, retry_after=retry_after
+            )
+        return RateLimitDecision(allowed=True, remaining=int(capacity - estimate))
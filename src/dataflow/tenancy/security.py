@@ -10,11 +10,12 @@ import hashlib
 import logging
 import secrets
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Set
 
 from .exceptions import CrossTenantAccessError, TenantSecurityError
+from .rate_limiter import RateLimitDecision, TokenBucketRateLimiter
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +43,7 @@ class SecurityPolicy:
     allow_cross_tenant_access: bool
     allowed_tables: Set[str]
     forbidden_tables: Set[str]
+    burst_capacity: Optional[int] = None
 
     def __post_init__(self):
         if self.allowed_operations is None:
@@ -75,17 +77,22 @@ class TenantSecurityManager:
     Manages security policies and controls for multi-tenant database operations.
     """
 
-    def __init__(self):
-        """Initialize the TenantSecurityManager."""
+    def __init__(self, rate_limiter: Optional[TokenBucketRateLimiter] = None):
+        """
+        Initialize the TenantSecurityManager.
+
+        Args:
+            rate_limiter: Optional rate limiter; pass one built with a Redis
+                client to enforce query rate limits across workers
+        """
         self._policies: Dict[str, SecurityPolicy] = {}
         self._audit_logs: List[SecurityAuditLog] = []
-        self._rate_limits: Dict[str, List[datetime]] = {}
+        self._rate_limiter = rate_limiter or TokenBucketRateLimiter()
         self._blocked_tenants: Set[str] = set()
 
         # Security configuration
         self._default_security_level = SecurityLevel.MEDIUM
         self._max_audit_logs = 10000
-        self._rate_limit_window = timedelta(minutes=1)
 
     def register_tenant(
         self,
@@ -99,6 +106,7 @@ class TenantSecurityManager:
         allow_cross_tenant_access: bool = False,
         allowed_tables: Optional[Set[str]] = None,
         forbidden_tables: Optional[Set[str]] = None,
+        burst_capacity: Optional[int] = None,
     ) -> None:
         """
         Register a tenant with security policies.
@@ -114,6 +122,8 @@ class TenantSecurityManager:
             allow_cross_tenant_access: Whether to allow cross-tenant access
             allowed_tables: Set of allowed table names
             forbidden_tables: Set of forbidden table names
+            burst_capacity: Queries a tenant may run at once before the
+                per-minute rate applies (defaults to max_queries_per_minute)
         """
         if allowed_operations is None:
             allowed_operations = {"SELECT", "INSERT", "UPDATE", "DELETE"}
@@ -135,6 +145,7 @@ class TenantSecurityManager:
             allow_cross_tenant_access=allow_cross_tenant_access,
             allowed_tables=allowed_tables,
             forbidden_tables=forbidden_tables,
+            burst_capacity=burst_capacity,
         )
 
         self._policies[tenant_id] = policy
@@ -181,7 +192,8 @@ class TenantSecurityManager:
                 policy = self._policies[tenant_id]
 
             # Check rate limits
-            if not self._check_rate_limit(tenant_id, policy.max_queries_per_minute):
+            rate_limit = self._check_rate_limit(tenant_id, policy)
+            if not rate_limit.allowed:
                 raise TenantSecurityError(f"Rate limit exceeded for tenant {tenant_id}")
 
             # Check operation permissions
@@ -234,8 +246,7 @@ class TenantSecurityManager:
                 "tenant_id": tenant_id,
                 "security_level": policy.security_level.value,
                 "audit_logged": policy.require_audit_logging,
-                "rate_limit_remaining": policy.max_queries_per_minute
-                - len(self._get_recent_queries(tenant_id)),
+                "rate_limit_remaining": rate_limit.remaining,
             }
 
         except TenantSecurityError as e:
@@ -453,6 +464,8 @@ class TenantSecurityManager:
             ]
         )
 
+        rate_limiter_metrics = self._rate_limiter.get_metrics(tenant_id)
+
         # Cross-tenant access attempts
         cross_tenant_attempts = len(
             [log for log in logs if "CROSS_TENANT" in log.operation]
@@ -464,6 +477,8 @@ class TenantSecurityManager:
             "failed_operations": failed_operations,
             "security_violations": security_violations,
             "rate_limit_violations": rate_limit_violations,
+            "rate_limited_queries": rate_limiter_metrics["rejected"],
+            "rate_limit_rejection_rate": rate_limiter_metrics["rejection_rate"],
             "cross_tenant_attempts": cross_tenant_attempts,
             "blocked_tenants": len(self._blocked_tenants),
             "registered_tenants": len(self._policies),
@@ -472,29 +487,13 @@ class TenantSecurityManager:
 
     # Private helper methods
 
-    def _check_rate_limit(self, tenant_id: str, max_queries_per_minute: int) -> bool:
-        """Check if tenant is within rate limits."""
-        now = datetime.now()
-        cutoff_time = now - self._rate_limit_window
-
-        # Get recent queries for this tenant
-        recent_queries = self._get_recent_queries(tenant_id)
-
-        # Remove old queries
-        recent_queries = [q for q in recent_queries if q > cutoff_time]
-        self._rate_limits[tenant_id] = recent_queries
-
-        # Check if under limit
-        if len(recent_queries) >= max_queries_per_minute:
-            return False
-
-        # Record this query
-        recent_queries.append(now)
-        return True
-
-    def _get_recent_queries(self, tenant_id: str) -> List[datetime]:
-        """Get recent queries for a tenant."""
-        return self._rate_limits.get(tenant_id, [])
+    def _check_rate_limit(
+        self, tenant_id: str, policy: SecurityPolicy
+    ) -> RateLimitDecision:
+        """Check if tenant is within rate limits, consuming one query."""
+        return self._rate_limiter.acquire(
+            tenant_id, policy.max_queries_per_minute, policy.burst_capacity
+        )
 
     def _log_audit_event(
         self,
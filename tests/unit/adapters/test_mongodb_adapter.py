@@ -595,6 +595,198 @@ class TestMongoDBAdapterDocumentOperations:
         assert results == mock_results
 
 
+class _FakeCollection:
+    """Collection stub answering range-paginated finds from a sorted list."""
+
+    def __init__(self, documents):
+        self.documents = documents
+        self.find_calls = []
+
+    def find(self, filter, projection=None, sort=None, limit=0, batch_size=0):
+        self.find_calls.append(
+            {"filter": filter, "projection": projection, "limit": limit}
+        )
+        clauses = filter.get("$and", [filter])
+        last_id = next((c["_id"]["$gt"] for c in clauses if "_id" in c), float("-inf"))
+        page = [dict(d) for d in self.documents if d["_id"] > last_id][:limit]
+
+        async def cursor():
+            for document in page:
+                yield document
+
+        return cursor()
+
+
+class TestMongoDBAdapterStreamingAndBulkWrite:
+    """Test find_stream pagination and bulk_write batching (with mocks)."""
+
+    def _adapter(self, collection):
+        adapter = MongoDBAdapter("mongodb://localhost:27017/testdb")
+        mock_db = MagicMock()
+        mock_db.__getitem__.return_value = collection
+        adapter._connected = True
+        adapter._db = mock_db
+        return adapter
+
+    @pytest.mark.asyncio
+    async def test_find_stream_paginates_on_id(self):
+        """Pages are range queries on _id, not skip/limit."""
+        collection = _FakeCollection([{"_id": i, "n": i} for i in range(25)])
+        adapter = self._adapter(collection)
+
+        documents = [
+            d
+            async for d in adapter.find_stream(
+                "events", {"kind": "click"}, batch_size=5, page_size=10
+            )
+        ]
+
+        assert [d["_id"] for d in documents] == list(range(25))
+        assert len(collection.find_calls) == 3
+        assert collection.find_calls[0]["filter"] == {"kind": "click"}
+        assert collection.find_calls[2]["filter"] == {
+            "$and": [{"kind": "click"}, {"_id": {"$gt": 19}}]
+        }
+
+    @pytest.mark.asyncio
+    async def test_find_stream_limit_resume_and_projection(self):
+        """Limit stops early, start_after resumes, excluded _id is dropped."""
+        collection = _FakeCollection([{"_id": i, "n": i} for i in range(25)])
+        adapter = self._adapter(collection)
+
+        documents = [
+            d
+            async for d in adapter.find_stream(
+                "events",
+                projection={"n": 1, "_id": 0},
+                page_size=10,
+                start_after=4,
+                limit=12,
+            )
+        ]
+
+        assert [d["n"] for d in documents] == list(range(5, 17))
+        assert all("_id" not in d for d in documents)
+        assert collection.find_calls[0]["projection"] == {"n": 1, "_id": True}
+        assert collection.find_calls[1]["limit"] == 2
+
+    @pytest.mark.asyncio
+    async def test_find_stream_sort_option(self):
+        """An _id sort is accepted; any other order is rejected up front."""
+        collection = _FakeCollection([{"_id": i} for i in range(3)])
+        adapter = self._adapter(collection)
+
+        documents = [d async for d in adapter.find_stream("events", sort=[("_id", 1)])]
+        assert [d["_id"] for d in documents] == [0, 1, 2]
+
+        with pytest.raises(ValueError, match="ascending _id order"):
+            async for _ in adapter.find_stream("events", sort={"ts": -1}):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_find_stream_not_connected(self):
+        """Test streaming when not connected."""
+        adapter = MongoDBAdapter("mongodb://localhost:27017/testdb")
+
+        with pytest.raises(ConnectionError, match="Not connected to MongoDB"):
+            async for _ in adapter.find_stream("events"):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_batches_mixed_operations(self):
+        """Mixed operations are converted and sent in unordered batches."""
+        from pymongo import DeleteMany, InsertOne, UpdateOne
+
+        mock_collection = MagicMock()
+        results = [
+            MagicMock(
+                bulk_api_result={
+                    "nInserted": 1,
+                    "nMatched": 1,
+                    "nModified": 1,
+                    "nUpserted": 0,
+                }
+            ),
+            MagicMock(
+                bulk_api_result={
+                    "nRemoved": 4,
+                    "nUpserted": 1,
+                    "upserted": [{"index": 0, "_id": "new"}],
+                }
+            ),
+        ]
+        mock_collection.bulk_write = AsyncMock(side_effect=results)
+        adapter = self._adapter(mock_collection)
+
+        result = await adapter.bulk_write(
+            "users",
+            [
+                {"op": "insert", "document": {"name": "Alice"}},
+                {
+                    "op": "update_one",
+                    "filter": {"name": "Bob"},
+                    "update": {"$set": {"active": True}},
+                },
+                UpdateOne({"name": "Eve"}, {"$set": {"x": 1}}, upsert=True),
+                {"op": "delete_many", "filter": {"active": False}},
+            ],
+            batch_size=2,
+        )
+
+        assert result["batches"] == 2
+        assert result["inserted_count"] == 1
+        assert result["modified_count"] == 1
+        assert result["deleted_count"] == 4
+        assert result["upserted_ids"] == {2: "new"}
+        assert result["errors"] == []
+        first_batch = mock_collection.bulk_write.call_args_list[0]
+        assert isinstance(first_batch.args[0][0], InsertOne)
+        assert isinstance(first_batch.args[0][1], UpdateOne)
+        assert first_batch.kwargs["ordered"] is False
+        second_batch = mock_collection.bulk_write.call_args_list[1]
+        assert isinstance(second_batch.args[0][1], DeleteMany)
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_errors_carry_operation_index(self):
+        """Unordered writes continue past errors; ordered writes stop."""
+        from pymongo.errors import BulkWriteError
+
+        error = BulkWriteError(
+            {
+                "nInserted": 1,
+                "writeErrors": [{"index": 1, "code": 11000, "errmsg": "dup key"}],
+            }
+        )
+        ok = MagicMock(bulk_api_result={"nInserted": 2})
+        operations = [{"op": "insert", "document": {"_id": i % 3}} for i in range(4)]
+
+        mock_collection = MagicMock()
+        mock_collection.bulk_write = AsyncMock(side_effect=[ok, error])
+        adapter = self._adapter(mock_collection)
+        result = await adapter.bulk_write("users", operations, batch_size=2)
+
+        assert result["inserted_count"] == 3
+        assert result["errors"] == [{"index": 3, "code": 11000, "message": "dup key"}]
+
+        mock_collection.bulk_write = AsyncMock(side_effect=[error, ok])
+        result = await adapter.bulk_write(
+            "users", operations, ordered=True, batch_size=2
+        )
+
+        assert result["batches"] == 1
+        assert result["errors"][0]["index"] == 1
+
+    @pytest.mark.asyncio
+    async def test_bulk_write_rejects_unknown_operation(self):
+        """Test unknown operation names."""
+        adapter = self._adapter(MagicMock())
+
+        with pytest.raises(ValueError, match="Unknown bulk operation"):
+            await adapter.bulk_write("users", [{"op": "upsert", "filter": {}}])
+        with pytest.raises(ValueError, match="cannot be empty"):
+            await adapter.bulk_write("users", [])
+
+
 class TestMongoDBAdapterIndexOperations:
     """Test MongoDB adapter index operations (with mocks)."""
 
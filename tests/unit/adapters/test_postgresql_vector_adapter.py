@@ -4,15 +4,43 @@ Tests for PostgreSQLVectorAdapter.
 Unit tests for PostgreSQL vector similarity search adapter.
 """
 
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+
 from dataflow.adapters import (
     BaseAdapter,
     DatabaseAdapter,
     PostgreSQLAdapter,
     PostgreSQLVectorAdapter,
 )
+from dataflow.adapters.postgresql_vector import (
+    decode_vector,
+    encode_vector,
+    register_vector_codec,
+)
+
+
+def _pooled_adapter(rows):
+    """Adapter whose pool yields a mock asyncpg connection returning rows."""
+    adapter = PostgreSQLVectorAdapter("postgresql://localhost/vectordb")
+    connection = MagicMock()
+    connection.execute = AsyncMock()
+    connection.fetch = AsyncMock(return_value=rows)
+
+    @asynccontextmanager
+    async def transaction():
+        yield
+
+    @asynccontextmanager
+    async def acquire():
+        yield connection
+
+    connection.transaction = transaction
+    adapter.connection_pool = MagicMock(acquire=acquire)
+    adapter.is_connected = True
+    return adapter, connection
 
 
 class TestPostgreSQLVectorAdapter:
@@ -384,6 +412,131 @@ class TestPostgreSQLVectorAdapter:
         assert "COUNT(embedding)" in call_args
         assert "array_length(embedding, 1)" in call_args
 
+    @pytest.mark.asyncio
+    async def test_vector_search_binds_query_vector(self):
+        """Query vector is a bound parameter, not SQL text."""
+        adapter = PostgreSQLVectorAdapter("postgresql://localhost/vectordb")
+        adapter.execute_query = AsyncMock(return_value=[])
+
+        await adapter.vector_search("documents", [0.25, 0.5], k=3)
+
+        query, params = adapter.execute_query.call_args[0]
+        assert "ORDER BY embedding <=> $1::vector" in query
+        assert "0.25" not in query
+        assert params == [[0.25, 0.5]]
+
+    @pytest.mark.asyncio
+    async def test_vector_search_batch_single_lateral_query(self):
+        """Batched search runs one LATERAL query and groups rows per vector."""
+        rows = [
+            {"_query_index": 1, "id": "a", "_vector_distance": 0.1},
+            {"_query_index": 1, "id": "b", "_vector_distance": 0.2},
+            {"_query_index": 3, "id": "c", "_vector_distance": 0.3},
+        ]
+        adapter, connection = _pooled_adapter(rows)
+        vectors = [[0.1, 0.2], [0.3, 0.4], [0.5, 0.6]]
+
+        results = await adapter.vector_search_batch(
+            "documents", vectors, k=2, distance="l2", filter_conditions="lang = 'en'"
+        )
+
+        assert results == [
+            [{"id": "a", "distance": 0.1}, {"id": "b", "distance": 0.2}],
+            [],
+            [{"id": "c", "distance": 0.3}],
+        ]
+        connection.fetch.assert_awaited_once()
+        query, params = connection.fetch.call_args[0]
+        assert "unnest($1::vector[]) WITH ORDINALITY" in query
+        assert "CROSS JOIN LATERAL" in query
+        assert "ORDER BY embedding <-> q.query_vector" in query
+        assert "ORDER BY q.query_index, r._vector_distance" in query
+        assert "WHERE lang = 'en'" in query and "LIMIT 2" in query
+        assert params == vectors
+        connection.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_vector_search_batch_index_tuning(self):
+        """ef_search / probes are applied with SET LOCAL inside the transaction."""
+        adapter, connection = _pooled_adapter(
+            [{"_query_index": 1, "id": "a", "_vector_distance": 0.1}]
+        )
+
+        results = await adapter.vector_search(
+            "documents",
+            [0.1, 0.2],
+            ef_search=80,
+            probes=10,
+            return_distance=False,
+        )
+
+        statements = [call.args[0] for call in connection.execute.call_args_list]
+        assert statements == [
+            "SET LOCAL hnsw.ef_search = 80",
+            "SET LOCAL ivfflat.probes = 10",
+        ]
+        assert results == [{"id": "a"}]
+
+    @pytest.mark.asyncio
+    async def test_vector_search_batch_requires_connection(self):
+        """Batched search fails fast without a pool."""
+        adapter = PostgreSQLVectorAdapter("postgresql://localhost/vectordb")
+
+        assert await adapter.vector_search_batch("documents", []) == []
+        with pytest.raises(Exception, match="Not connected"):
+            await adapter.vector_search_batch("documents", [[0.1]])
+
+    def test_vector_codec_round_trip(self):
+        """Binary codec matches pgvector's wire format."""
+        data = encode_vector([1.0, -2.5, 0.5])
+
+        assert data[:4] == b"\x00\x03\x00\x00"
+        assert len(data) == 4 + 3 * 4
+        assert decode_vector(data) == [1.0, -2.5, 0.5]
+
+    @pytest.mark.asyncio
+    async def test_vector_codec_registered_on_pool_connections(self):
+        """Pool connections get the binary codec via the init hook."""
+        adapter = PostgreSQLVectorAdapter("postgresql://localhost/vectordb")
+        assert adapter.get_connection_parameters()["init"] is register_vector_codec
+
+        connection = MagicMock(set_type_codec=AsyncMock())
+        assert await register_vector_codec(connection) is True
+        assert connection.set_type_codec.call_args.kwargs["format"] == "binary"
+
+        connection.set_type_codec.side_effect = ValueError("unknown type: vector")
+        assert await register_vector_codec(connection) is False
+
+    def test_vector_codec_decodes_to_list(self):
+        """Vector columns come back as lists of floats, not pgvector text."""
+        value = decode_vector(encode_vector([0.5, 0.25]))
+
+        assert isinstance(value, list)
+        assert value == [0.5, 0.25]
+
+    @pytest.mark.asyncio
+    async def test_existing_init_hook_is_chained(self):
+        """A configured init hook still runs before the codec is registered."""
+        calls = []
+
+        async def existing_init(connection):
+            calls.append("existing")
+
+        adapter = PostgreSQLVectorAdapter("postgresql://localhost/vectordb")
+        with patch.object(
+            PostgreSQLAdapter,
+            "get_connection_parameters",
+            return_value={"init": existing_init},
+        ):
+            init = adapter.get_connection_parameters()["init"]
+
+        connection = MagicMock(
+            set_type_codec=AsyncMock(side_effect=lambda *a, **k: calls.append("codec"))
+        )
+        await init(connection)
+
+        assert calls == ["existing", "codec"]
+
     def test_adapter_repr(self):
         """Test __repr__ method."""
         adapter = PostgreSQLVectorAdapter("postgresql://localhost/vectordb")
@@ -0,0 +1,156 @@
+"""
+Unit tests for the SQLite single-writer mode.
+
+Runs against real SQLite files: concurrent writes must be group-committed
+by the single writer, reads must use query_only connections, and one failed
+write must not roll back the other writes of its batch.
+"""
+
+import asyncio
+import sqlite3
+
+import pytest
+
+from dataflow.adapters.exceptions import QueryError, TransactionError
+from dataflow.adapters.sqlite import SQLiteAdapter
+
+
+@pytest.fixture
+async def adapter(tmp_path):
+    adapter = SQLiteAdapter(
+        str(tmp_path / "single_writer.db"),
+        single_writer=True,
+        read_pool_size=2,
+        enable_performance_monitoring=False,
+    )
+    await adapter.connect()
+    await adapter.execute_query(
+        "CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT UNIQUE)"
+    )
+    yield adapter
+    await adapter.disconnect()
+
+
+@pytest.mark.unit
+class TestSQLiteSingleWriter:
+    @pytest.mark.asyncio
+    async def test_concurrent_writes_are_group_committed(self, adapter):
+        await asyncio.gather(
+            *(
+                adapter.execute_query("INSERT INTO items (name) VALUES (?)", [f"n{i}"])
+                for i in range(200)
+            )
+        )
+
+        rows = await adapter.execute_query("SELECT COUNT(*) AS n FROM items")
+        stats = adapter.get_write_queue_stats()
+
+        assert rows == [{"n": 200}]
+        assert stats["requests_committed"] == 201  # includes CREATE TABLE
+        assert stats["batches_committed"] < 200
+        assert stats["max_batch_size"] > 1
+        assert stats["queue_depth"] == 0
+        assert stats["busy_retries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_write_does_not_abort_its_batch(self, adapter):
+        results = await asyncio.gather(
+            adapter.execute_query("INSERT INTO items (name) VALUES ('a')"),
+            adapter.execute_query("INSERT INTO items (name) VALUES ('a')"),
+            adapter.execute_query("INSERT INTO items (name) VALUES ('b')"),
+            return_exceptions=True,
+        )
+
+        assert results[0] == [{"rows_affected": 1, "lastrowid": 1}]
+        assert isinstance(results[1], QueryError)
+        names = await adapter.execute_query("SELECT name FROM items ORDER BY name")
+        assert names == [{"name": "a"}, {"name": "b"}]
+        assert adapter.get_write_queue_stats()["requests_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_savepoint_failure_keeps_writer_running(self, adapter, monkeypatch):
+        conn = adapter._writer_connection
+        execute = conn.execute
+        failures = []
+
+        def failing_execute(sql, *args):
+            if sql.startswith("SAVEPOINT") and not failures:
+                failures.append(sql)
+                raise sqlite3.OperationalError("injected savepoint failure")
+            return execute(sql, *args)
+
+        monkeypatch.setattr(conn, "execute", failing_execute)
+
+        with pytest.raises(QueryError, match="injected savepoint failure"):
+            await adapter.execute_query("INSERT INTO items (name) VALUES ('lost')")
+        await adapter.execute_query("INSERT INTO items (name) VALUES ('kept')")
+
+        names = await adapter.execute_query("SELECT name FROM items")
+        assert names == [{"name": "kept"}]
+        assert not adapter._writer_task.done()
+        assert not conn.in_transaction
+        assert adapter.get_write_queue_stats()["requests_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_readers_are_query_only(self, adapter):
+        async with adapter._read_connection() as conn:
+            with pytest.raises(sqlite3.OperationalError):
+                await conn.execute("INSERT INTO items (name) VALUES ('x')")
+
+        assert adapter.get_write_queue_stats()["readers_idle"] == 2
+
+    @pytest.mark.asyncio
+    async def test_transaction_statements_are_atomic(self, adapter):
+        with pytest.raises(TransactionError):
+            await adapter.execute_transaction(
+                [
+                    ("INSERT INTO items (name) VALUES (?)", ["t1"]),
+                    ("INSERT INTO items (name) VALUES (?)", ["t1"]),
+                ]
+            )
+        results = await adapter.execute_transaction(
+            [
+                ("INSERT INTO items (name) VALUES (?)", ["t2"]),
+                ("SELECT name FROM items", []),
+            ]
+        )
+
+        assert results[1] == [{"name": "t2"}]
+
+    @pytest.mark.asyncio
+    async def test_insert_helpers_and_transaction_context(self, adapter):
+        inserted = await adapter.execute_insert(
+            "INSERT INTO items (name) VALUES (?)", ["first"]
+        )
+        await adapter.execute_bulk_insert(
+            "INSERT INTO items (name) VALUES (?)", [("x",), ("y",)]
+        )
+        async with adapter.transaction() as tx:
+            await tx.connection.execute("INSERT INTO items (name) VALUES ('z')")
+
+        rows = await adapter.execute_query("SELECT COUNT(*) AS n FROM items")
+        assert inserted == {"lastrowid": 1, "rowcount": 1}
+        assert rows == [{"n": 4}]
+
+    @pytest.mark.asyncio
+    async def test_disconnect_drains_queued_writes(self, tmp_path):
+        path = str(tmp_path / "drain.db")
+        adapter = SQLiteAdapter(path, single_writer=True)
+        await adapter.connect()
+        await adapter.execute_query("CREATE TABLE t (v INTEGER)")
+        pending = [
+            asyncio.create_task(adapter.execute_query("INSERT INTO t VALUES (1)"))
+            for _ in range(20)
+        ]
+        await asyncio.sleep(0)
+        await adapter.disconnect()
+        await asyncio.gather(*pending)
+
+        conn = sqlite3.connect(path)
+        assert conn.execute("SELECT COUNT(*) FROM t").fetchone() == (20,)
+        conn.close()
+
+    def test_memory_database_keeps_shared_pool(self):
+        adapter = SQLiteAdapter(":memory:", single_writer=True)
+        assert adapter.single_writer is False
+        assert adapter.get_write_queue_stats() == {}
@@ -5,10 +5,12 @@ Tests the bulk create node with connection pool functionality.
 """
 
 import asyncio
+import contextlib
+import sqlite3
 from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
-from dataflow.nodes.bulk_create_pool import BulkCreatePoolNode
+from dataflow.nodes.bulk_create_pool import AdaptiveBatchSizer, BulkCreatePoolNode
 
 from kailash.sdk_exceptions import NodeExecutionError, NodeValidationError
 
@@ -295,7 +297,8 @@ class TestBulkCreatePoolNode:
         """Test single batch execution with connection."""
         node = BulkCreatePoolNode(node_id="test_bulk_create", table_name="users")
 
-        mock_connection = Mock()
+        mock_connection = AsyncMock()
+        mock_connection.fetch.return_value = [{"id": 7}, {"id": 8}]
         batch_data = [
             {"name": "Alice", "email": "alice@example.com"},
             {"name": "Bob", "email": "bob@example.com"},
@@ -306,7 +309,12 @@ class TestBulkCreatePoolNode:
         )
 
         assert result["created_count"] == 2
-        assert len(result["created_ids"]) == 2
+        assert result["created_ids"] == [7, 8]
+        query, *params = mock_connection.fetch.call_args.args
+        assert query == (
+            "INSERT INTO users (name, email) VALUES ($1, $2), ($3, $4) RETURNING id"
+        )
+        assert params == ["Alice", "alice@example.com", "Bob", "bob@example.com"]
 
     @pytest.mark.asyncio
     async def test_error_handling_in_pool_processing(self):
@@ -543,3 +551,227 @@ class TestBulkCreatePoolNodeAdvanced:
         assert result["created_count"] == 0
         assert result["skipped_count"] == 2
         assert "skipped_count" in result
+
+
+class _SQLiteConnection:
+    """asyncpg-style connection over a SQLite file, with a little latency."""
+
+    def __init__(self, path, pool):
+        self._conn = sqlite3.connect(path, isolation_level=None)
+        self._pool = pool
+
+    async def _run(self, query, params):
+        self._pool.in_flight += 1
+        self._pool.peak = max(self._pool.peak, self._pool.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self._conn.execute(query, params)
+        finally:
+            self._pool.in_flight -= 1
+
+    async def fetch(self, query, *params):
+        cursor = await self._run(query, params)
+        return [{"id": row[0]} for row in cursor.fetchall()]
+
+    async def execute(self, query, *params):
+        cursor = await self._run(query, params)
+        return f"INSERT 0 {cursor.rowcount}"
+
+    @contextlib.asynccontextmanager
+    async def transaction(self):
+        self._conn.execute("BEGIN")
+        try:
+            yield
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+
+
+class _SQLitePool:
+    def __init__(self, path, size):
+        self.max_connections = size
+        self.in_flight = 0
+        self.peak = 0
+        self._idle = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(_SQLiteConnection(path, self))
+
+    @contextlib.asynccontextmanager
+    async def acquire(self):
+        conn = await self._idle.get()
+        try:
+            yield conn
+        finally:
+            self._idle.put_nowait(conn)
+
+
+@pytest.fixture
+def sqlite_path(tmp_path):
+    path = str(tmp_path / "bulk.db")
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute(
+        "CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT, email TEXT UNIQUE)"
+    )
+    conn.close()
+    return path
+
+
+def _count(path):
+    conn = sqlite3.connect(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM users").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestConcurrentPoolIngest:
+    """Pooled ingest against real SQLite connections."""
+
+    @pytest.mark.asyncio
+    async def test_batches_run_concurrently_and_ids_keep_input_order(self, sqlite_path):
+        node = BulkCreatePoolNode(
+            node_id="ingest",
+            table_name="users",
+            database_type="sqlite",
+            batch_size=10,
+            max_concurrent_batches=4,
+        )
+        pool = _SQLitePool(sqlite_path, size=3)
+        data = [
+            {"id": i, "name": f"user{i}", "email": f"u{i}@example.com"}
+            for i in range(1, 101)
+        ]
+
+        result = await node._execute_batched_inserts_with_pool(
+            pool, data, tenant_id=None, return_ids=True, dry_run=False
+        )
+
+        assert result["created_count"] == 100
+        assert result["batches"] == 10
+        assert result["created_ids"] == list(range(1, 101))
+        assert result["concurrency"] == 3  # capped by the pool size
+        assert pool.peak == 3
+        assert _count(sqlite_path) == 100
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_rolls_back_only_itself(self, sqlite_path):
+        node = BulkCreatePoolNode(
+            node_id="ingest",
+            table_name="users",
+            database_type="sqlite",
+            batch_size=5,
+            batch_transactions=True,
+            conflict_resolution="skip_errors",
+        )
+        # Force one statement per row so a batch spans several statements
+        node._split_for_bind_limit = lambda batch, columns: [[row] for row in batch]
+        data = [{"name": f"user{i}", "email": f"u{i}@example.com"} for i in range(10)]
+        data[7]["email"] = "u5@example.com"  # duplicate inside the second batch
+
+        # SQLite allows one writer, so transactional batches share one connection
+        result = await node._execute_batched_inserts_with_pool(
+            _SQLitePool(sqlite_path, size=1),
+            data,
+            tenant_id=None,
+            return_ids=False,
+            dry_run=False,
+        )
+
+        assert result["created_count"] == 5
+        assert result["error_count"] == 5
+        assert "UNIQUE" in result["errors"][0]
+        assert _count(sqlite_path) == 5
+
+    @pytest.mark.asyncio
+    async def test_error_mode_stops_taking_new_batches(self, sqlite_path):
+        node = BulkCreatePoolNode(
+            node_id="ingest",
+            table_name="users",
+            database_type="sqlite",
+            batch_size=2,
+            max_concurrent_batches=1,
+        )
+        data = [{"name": f"user{i}", "email": "same@example.com"} for i in range(6)]
+
+        result = await node._execute_batched_inserts_with_pool(
+            _SQLitePool(sqlite_path, size=1),
+            data,
+            tenant_id=None,
+            return_ids=False,
+            dry_run=False,
+        )
+
+        assert result["batches"] == 1
+        assert result["error_count"] == 2
+        assert _count(sqlite_path) == 0
+
+    @pytest.mark.asyncio
+    async def test_adaptive_batch_size_follows_latency(self, sqlite_path):
+        node = BulkCreatePoolNode(
+            node_id="ingest",
+            table_name="users",
+            database_type="sqlite",
+            batch_size=4,
+            adaptive_batch_size=True,
+            min_batch_size=2,
+            max_batch_size=64,
+            target_batch_latency_ms=1000,
+            max_concurrent_batches=1,
+        )
+        data = [{"name": f"user{i}", "email": f"u{i}@example.com"} for i in range(200)]
+
+        result = await node._execute_batched_inserts_with_pool(
+            _SQLitePool(sqlite_path, size=1),
+            data,
+            tenant_id=None,
+            return_ids=False,
+            dry_run=False,
+        )
+
+        # Fast batches grow the size 4 -> 8 -> 16 -> 32 -> 64
+        assert result["created_count"] == 200
+        assert result["final_batch_size"] == 64
+        assert result["batches"] < 200 / 4
+
+    def test_sizer_shrinks_slow_batches(self):
+        sizer = AdaptiveBatchSizer(1000, 10, 5000, target_latency=0.1)
+        sizer.record(1000, 1.0)
+        assert sizer.size == 500  # at most halves per batch
+        for _ in range(10):
+            sizer.record(sizer.size, sizer.size * 0.001)
+        assert sizer.size == 100
+
+    def test_large_batches_split_at_bind_limit(self):
+        node = BulkCreatePoolNode(
+            node_id="ingest", table_name="users", database_type="postgresql"
+        )
+        batch = [{"a": i, "b": i} for i in range(40000)]
+
+        chunks = node._split_for_bind_limit(batch, ["a", "b"])
+
+        assert [len(chunk) for chunk in chunks] == [16383, 16383, 7234]
+
+    @pytest.mark.asyncio
+    async def test_workflow_connection_pool_protocol(self):
+        from kailash.nodes.data.workflow_connection_pool import WorkflowConnectionPool
+
+        pool = Mock(spec=WorkflowConnectionPool)
+        pool.async_run = AsyncMock(
+            side_effect=[
+                {"connection_id": "c1"},
+                {"success": True, "data": [{"id": 1}, {"id": 2}]},
+                {"status": "released"},
+            ]
+        )
+        node = BulkCreatePoolNode(node_id="ingest", table_name="users")
+
+        result = await node._execute_batched_inserts_with_pool(
+            pool, [{"name": "a"}, {"name": "b"}], None, True, False
+        )
+
+        assert result["created_ids"] == [1, 2]
+        operations = [c.kwargs["operation"] for c in pool.async_run.call_args_list]
+        assert operations == ["acquire", "execute", "release"]
+        assert pool.async_run.call_args_list[1].kwargs["connection_id"] == "c1"
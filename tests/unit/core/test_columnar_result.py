@@ -0,0 +1,216 @@
+"""
+Unit tests for columnar query results.
+
+Covers building NumPy columns from records (dtypes, NULL masks, lossless
+round trips), columnar List/express.list results, and AggregateNode
+consuming a ColumnarResult without converting it back to records.
+"""
+
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from dataflow import DataFlow
+from dataflow.core.columnar import (
+    PYARROW_AVAILABLE,
+    ColumnarResult,
+    validate_result_format,
+)
+from dataflow.features.express import ExpressDataFlow
+from dataflow.nodes.aggregate_operations import AggregateNode
+from dataflow.nodes.columnar_aggregation import aggregate_records
+
+
+def _records():
+    return [
+        {"id": 1, "score": 1.5, "active": True, "name": "a", "qty": 3, "price": None},
+        {"id": 2, "score": 2, "active": False, "name": None, "qty": None, "price": 1},
+        {"id": 3, "score": None, "active": None, "name": "c", "qty": 5, "price": 2**70},
+    ]
+
+
+@pytest.mark.unit
+class TestColumnarResult:
+    def test_columns_use_native_dtypes_and_masks(self):
+        result = ColumnarResult.from_records(_records())
+
+        assert result.column_names == ["id", "score", "active", "name", "qty", "price"]
+        assert result["id"].dtype == np.int64
+        assert result["score"].dtype == np.float64
+        assert result["active"].dtype == np.bool_
+        assert result["qty"].dtype == np.int64
+        assert result["name"].dtype == object
+        assert result["price"].dtype == object  # exceeds int64
+        assert not result.has_nulls("id")
+        assert result.is_valid("qty").tolist() == [True, False, True]
+        assert len(result) == 3
+
+    def test_round_trip_is_lossless(self):
+        records = _records() + [
+            {
+                "id": 4,
+                "score": 0.0,
+                "active": True,
+                "name": "d",
+                "qty": 0,
+                "price": Decimal("1.10"),
+            }
+        ]
+        result = ColumnarResult.from_records(records)
+
+        assert result.to_records() == records
+        assert list(result) == records
+        assert result.row(1) == records[1]
+        assert type(result.row(0)["id"]) is int
+        assert result.to_dict()["qty"] == [3, None, 5, 0]
+
+    def test_take_keeps_masks(self):
+        result = ColumnarResult.from_records(_records())
+
+        subset = result.take(np.array([False, True, True]))
+
+        assert len(subset) == 2
+        assert subset.to_pylist("qty") == [None, 5]
+        assert result.take(np.array([2])).to_records() == [_records()[2]]
+
+    def test_empty_and_mismatched_columns(self):
+        assert len(ColumnarResult.from_records([])) == 0
+        assert not ColumnarResult({})
+        with pytest.raises(ValueError):
+            ColumnarResult({"a": np.zeros(2), "b": np.zeros(3)})
+
+    def test_result_format_validation(self):
+        assert validate_result_format("Columnar") == "columnar"
+        with pytest.raises(ValueError):
+            validate_result_format("arrow")
+
+    @pytest.mark.skipif(PYARROW_AVAILABLE, reason="pyarrow is installed")
+    def test_to_arrow_requires_pyarrow(self):
+        with pytest.raises(ImportError):
+            ColumnarResult.from_records(_records()).to_arrow()
+
+    @pytest.mark.skipif(not PYARROW_AVAILABLE, reason="pyarrow is not installed")
+    def test_to_arrow(self):
+        batch = ColumnarResult.from_records(_records()).to_arrow()
+
+        assert batch.num_rows == 3
+        assert batch.column("qty").to_pylist() == [3, None, 5]
+
+
+@pytest.mark.unit
+class TestColumnarAggregation:
+    @pytest.mark.parametrize("function", ["sum", "average", "count", "max", "mode"])
+    @pytest.mark.parametrize("group_by", [[], ["region"], ["region", "tier"]])
+    def test_matches_record_input(self, function, group_by):
+        rng = random.Random(11)
+        records = [
+            {
+                "amount": rng.choice([rng.randint(0, 9), rng.random(), None]),
+                "region": rng.choice(["eu", "us", None]),
+                "tier": rng.choice([1, 2]),
+            }
+            for _ in range(300)
+        ]
+
+        expected = aggregate_records(records, [(function, "amount")], group_by)
+        actual = aggregate_records(
+            ColumnarResult.from_records(records), [(function, "amount")], group_by
+        )
+
+        assert actual == expected
+
+    def test_aggregate_node_accepts_columnar_data(self):
+        records = [
+            {"amount": 10, "status": "active", "region": "eu"},
+            {"amount": 5, "status": "inactive", "region": "eu"},
+            {"amount": 7, "status": "active", "region": "us"},
+        ]
+        data = ColumnarResult.from_records(records)
+
+        result = AggregateNode().execute(
+            data=data,
+            aggregate_expression="sum of amount by region",
+            filter_expression="where status is active",
+        )
+
+        assert result["parsed_successfully"] is True
+        assert result["filtered_records"] == 2
+        assert result["result"]["eu"]["value"] == 10
+        assert result["result"]["us"]["value"] == 7
+
+
+@pytest.mark.unit
+class TestColumnarList:
+    @pytest.mark.asyncio
+    async def test_express_list_returns_columns(self, tmp_path):
+        db = DataFlow(f"sqlite:///{tmp_path / 'columnar.db'}")
+
+        @db.model
+        class Order:
+            region: str
+            amount: float
+
+        express = ExpressDataFlow(db)
+        for i in range(1, 7):
+            await express.create(
+                "Order", {"id": i, "region": "eu" if i % 2 else "us", "amount": i}
+            )
+
+        records = await express.list("Order", limit=10)
+        columns = await express.list("Order", limit=10, result_format="columnar")
+
+        assert isinstance(columns, ColumnarResult)
+        assert columns.to_records() == records
+        assert columns["id"].dtype == np.int64
+        assert columns["amount"].sum() == 21
+
+        filtered = await express.list(
+            "Order", filter={"region": "eu"}, result_format="columnar"
+        )
+        assert sorted(filtered["id"].tolist()) == [1, 3, 5]
+
+        with pytest.raises(Exception, match="result_format"):
+            await express.list("Order", result_format="arrow")
+
+        await db.close_async()
+
+    def test_list_node_feeds_aggregate_node_in_workflow(self, tmp_path):
+        from kailash.runtime.local import LocalRuntime
+        from kailash.workflow.builder import WorkflowBuilder
+
+        db = DataFlow(f"sqlite:///{tmp_path / 'workflow.db'}")
+
+        @db.model
+        class Sale:
+            region: str
+            amount: float
+
+        workflow = WorkflowBuilder()
+        for i in range(1, 5):
+            workflow.add_node(
+                "SaleCreateNode",
+                f"create_{i}",
+                {"id": i, "region": "eu" if i < 3 else "us", "amount": i * 10},
+            )
+        with LocalRuntime() as runtime:
+            runtime.execute(workflow.build())
+
+        workflow = WorkflowBuilder()
+        workflow.add_node(
+            "SaleListNode", "sales", {"limit": 100, "result_format": "columnar"}
+        )
+        workflow.add_node(AggregateNode, "totals")
+        workflow.add_connection("sales", "records", "totals", "data")
+        with LocalRuntime() as runtime:
+            results, _ = runtime.execute(
+                workflow.build(),
+                parameters={
+                    "totals": {"aggregate_expression": "sum of amount by region"}
+                },
+            )
+
+        assert isinstance(results["sales"]["records"], ColumnarResult)
+        assert results["totals"]["result"]["eu"]["value"] == 30
+        assert results["totals"]["result"]["us"]["value"] == 70
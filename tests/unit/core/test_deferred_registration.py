@@ -0,0 +1,119 @@
+"""
+Unit tests for deferred model registration.
+
+With deferred_registration=True, @db.model only queues the model; the
+tables and indexes of all queued models are created by reconcile_schema()
+(called from initialize()) from one catalog snapshot in one transaction.
+"""
+
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+
+from dataflow import DataFlow
+from dataflow.migrations.sync_ddl_executor import SyncDDLExecutor
+
+
+def _schema(path):
+    conn = sqlite3.connect(path)
+    try:
+        return {
+            name
+            for (name,) in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type IN ('table', 'index')"
+            )
+        }
+    finally:
+        conn.close()
+
+
+def _register_models(db):
+    @db.model
+    class Customer:
+        name: str
+        email: str
+        __dataflow__ = {
+            "indexes": [
+                {"name": "idx_customer_email", "fields": ["email"], "unique": True}
+            ]
+        }
+
+    @db.model
+    class Invoice:
+        customer_id: int
+        total: float
+
+
+@pytest.mark.unit
+class TestDeferredRegistration:
+    def test_models_are_queued_until_initialize(self, tmp_path):
+        path = str(tmp_path / "deferred.db")
+        db = DataFlow(f"sqlite:///{path}", deferred_registration=True)
+
+        with patch.object(db, "_create_table_sync") as per_model_ddl:
+            _register_models(db)
+
+        per_model_ddl.assert_not_called()
+        assert db.has_pending_migrations is True
+        assert "customers" not in _schema(path)
+
+    @pytest.mark.asyncio
+    async def test_initialize_reconciles_in_one_transaction(self, tmp_path):
+        path = str(tmp_path / "deferred.db")
+        db = DataFlow(f"sqlite:///{path}", deferred_registration=True)
+        _register_models(db)
+
+        with patch.object(
+            SyncDDLExecutor,
+            "execute_ddl_transaction",
+            autospec=True,
+            side_effect=SyncDDLExecutor.execute_ddl_transaction,
+        ) as transaction:
+            await db.initialize()
+
+        transaction.assert_called_once()
+        assert {"customers", "invoices", "idx_customer_email"} <= _schema(path)
+        assert db.has_pending_migrations is False
+        assert db._schema_cache.is_table_ensured("Invoice", f"sqlite:///{path}")
+
+    def test_existing_objects_are_diffed_out(self, tmp_path):
+        path = str(tmp_path / "deferred.db")
+        first = DataFlow(f"sqlite:///{path}", deferred_registration=True)
+        _register_models(first)
+        assert first.reconcile_schema()["executed_count"] == 3
+
+        second = DataFlow(f"sqlite:///{path}", deferred_registration=True)
+        _register_models(second)
+        result = second.reconcile_schema()
+
+        assert result["success"] is True
+        assert result["models"] == ["Customer", "Invoice"]
+        assert result["executed_count"] == 0
+
+    def test_failed_transaction_falls_back_to_per_model_ddl(self, tmp_path):
+        path = str(tmp_path / "deferred.db")
+        db = DataFlow(f"sqlite:///{path}", deferred_registration=True)
+        _register_models(db)
+
+        failure = {"success": False, "error": "boom", "executed_count": 0}
+        with patch.object(
+            SyncDDLExecutor, "execute_ddl_transaction", return_value=failure
+        ):
+            result = db.reconcile_schema()
+
+        assert result["success"] is False
+        assert {"customers", "invoices"} <= _schema(path)
+
+    def test_in_memory_database_stays_lazy(self):
+        db = DataFlow(":memory:", deferred_registration=True)
+        _register_models(db)
+
+        result = db.reconcile_schema()
+
+        assert result == {
+            "success": False,
+            "models": ["Customer", "Invoice"],
+            "executed_count": 0,
+        }
+        assert db.has_pending_migrations is False
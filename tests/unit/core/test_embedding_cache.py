@@ -0,0 +1,155 @@
+"""
+Unit tests for the caching, deduplicating embedding provider.
+
+Uses a deterministic local fake provider that records every request so
+cache hits, in-flight deduplication and micro-batching can be asserted
+without network access.
+"""
+
+import asyncio
+import hashlib
+
+import numpy as np
+import pytest
+from dataflow.semantic.embedding_cache import (
+    CachedEmbeddingProvider,
+    SQLiteEmbeddingStore,
+)
+from dataflow.semantic.embeddings import EmbeddingProvider, EmbeddingResult
+
+
+class FakeEmbeddings(EmbeddingProvider):
+    """Deterministic embeddings derived from a hash of the text."""
+
+    def __init__(self, dimension=4, delay=0.0, fail=False):
+        super().__init__("fake-model", dimension)
+        self.delay = delay
+        self.fail = fail
+        self.requests = []
+
+    @staticmethod
+    def vector(text, dimension=4):
+        digest = hashlib.sha256(text.encode()).digest()
+        return np.frombuffer(digest[: dimension * 4], dtype=np.uint32) / 2**32
+
+    async def embed_text(self, text):
+        texts = [text] if isinstance(text, str) else list(text)
+        self.requests.append(texts)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        if self.fail:
+            raise ValueError("provider down")
+        return EmbeddingResult(
+            embeddings=np.vstack([self.vector(t, self.dimension) for t in texts]),
+            model=self.model_name,
+            dimension=self.dimension,
+            metadata={},
+        )
+
+    async def embed_batch(self, texts, batch_size=100):
+        return await self.embed_text(texts)
+
+
+class TestCachedEmbeddingProvider:
+    @pytest.mark.asyncio
+    async def test_results_match_provider_and_repeat_calls_hit_memory(self):
+        fake = FakeEmbeddings()
+        provider = CachedEmbeddingProvider(fake)
+
+        first = await provider.embed_text(["a", "b", "a"])
+        second = await provider.embed_text(["b", "a"])
+
+        assert np.allclose(first.embeddings[0], FakeEmbeddings.vector("a"))
+        assert np.allclose(first.embeddings[2], first.embeddings[0])
+        assert np.allclose(second.embeddings[0], first.embeddings[1])
+        assert fake.requests == [["a", "b"]]
+        assert second.metadata["cached"] is True
+        assert provider.stats["memory_hits"] == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_are_deduplicated_and_coalesced(self):
+        fake = FakeEmbeddings(delay=0.01)
+        provider = CachedEmbeddingProvider(fake, batch_window_ms=20)
+
+        results = await asyncio.gather(
+            provider.embed_text("shared"),
+            provider.embed_text(["shared", "x"]),
+            provider.embed_text(["y", "shared"]),
+        )
+
+        assert fake.requests == [["shared", "x", "y"]]
+        assert np.allclose(results[2].embeddings[1], FakeEmbeddings.vector("shared"))
+        assert provider.stats["deduplicated"] == 2
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped_at_max_batch_size(self):
+        fake = FakeEmbeddings()
+        provider = CachedEmbeddingProvider(fake, max_batch_size=4)
+
+        result = await provider.embed_text([f"text-{i}" for i in range(10)])
+
+        assert [len(batch) for batch in fake.requests] == [4, 4, 2]
+        assert result.embeddings.shape == (10, 4)
+
+    @pytest.mark.asyncio
+    async def test_persistent_store_survives_new_instances(self, tmp_path):
+        path = str(tmp_path / "embeddings.db")
+        first = CachedEmbeddingProvider(FakeEmbeddings(), store_path=path)
+        await first.embed_text(["alpha", "beta"])
+        await first.close()
+
+        fake = FakeEmbeddings()
+        second = CachedEmbeddingProvider(fake, store_path=path)
+        result = await second.embed_text(["beta", "alpha", "gamma"])
+
+        assert fake.requests == [["gamma"]]
+        assert second.stats["store_hits"] == 2
+        assert np.array_equal(result.embeddings[1], FakeEmbeddings.vector("alpha"))
+        await second.close()
+
+    @pytest.mark.asyncio
+    async def test_lru_is_bounded(self):
+        provider = CachedEmbeddingProvider(FakeEmbeddings(), max_memory_entries=2)
+
+        await provider.embed_text(["a", "b", "c"])
+
+        assert len(provider._lru) == 2
+        assert provider._get_cache_key("a") not in provider._lru
+
+    @pytest.mark.asyncio
+    async def test_provider_errors_propagate_and_are_not_cached(self):
+        fake = FakeEmbeddings(fail=True)
+        provider = CachedEmbeddingProvider(fake)
+
+        with pytest.raises(ValueError, match="provider down"):
+            await provider.embed_text(["a", "b"])
+
+        fake.fail = False
+        result = await provider.embed_text(["a"])
+        assert result.metadata["computed"] == 1
+        assert provider._in_flight == {}
+
+
+class TestSQLiteEmbeddingStore:
+    def test_round_trip_preserves_dtype(self):
+        store = SQLiteEmbeddingStore()
+        vector = np.arange(3, dtype=np.float32)
+
+        store.put_many("m", [("k", vector)])
+        loaded = store.get_many(["k", "missing"])
+
+        assert list(loaded) == ["k"]
+        assert loaded["k"].dtype == np.float32
+        assert np.array_equal(loaded["k"], vector)
+        store.clear()
+        assert store.count() == 0
+
+
+def test_base_provider_cache_is_bounded():
+    provider = FakeEmbeddings()
+    provider.cache_size = 2
+    for text in ("a", "b", "c"):
+        provider._add_to_cache(text, FakeEmbeddings.vector(text))
+
+    assert provider._get_from_cache("a") is None
+    assert provider._get_from_cache("c") is not None
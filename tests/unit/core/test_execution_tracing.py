@@ -0,0 +1,176 @@
+"""
+Unit Tests for Execution Tracing
+
+Covers ExecutionTracer span recording and percentile histograms, the
+tracing hooks in generated nodes and ExpressDataFlow, and the measured
+Inspector performance profile built from recorded spans.
+"""
+
+import asyncio
+
+import pytest
+
+from dataflow import DataFlow
+from dataflow.core.tracing import ExecutionTracer, NodeSpan, get_tracer, percentile
+from dataflow.platform.inspector import Inspector
+
+
+@pytest.mark.unit
+class TestExecutionTracer:
+    def test_percentile_nearest_rank(self):
+        values = [float(v) for v in range(1, 101)]
+        assert percentile(values, 0.50) == 50.0
+        assert percentile(values, 0.95) == 95.0
+        assert percentile(values, 0.99) == 99.0
+        assert percentile([], 0.5) == 0.0
+
+    def test_trace_records_rows_bytes_and_db_time(self):
+        tracer = ExecutionTracer(measure_bytes=True)
+
+        with tracer.trace("list_users", "UserListNode") as span:
+            ExecutionTracer.add_db_time(2.5)
+            ExecutionTracer.add_db_time(1.5)
+            tracer.annotate_result(span, {"records": [{"id": 1}, {"id": 2}]})
+
+        (recorded,) = tracer.spans()
+        assert recorded.rows == 2
+        assert recorded.bytes > 0
+        assert recorded.db_time_ms == 4.0
+        assert recorded.db_calls == 2
+        assert tracer.current_span() is None
+
+    def test_bytes_are_not_measured_by_default(self):
+        tracer = ExecutionTracer()
+
+        with tracer.trace("list_users", "UserListNode") as span:
+            tracer.annotate_result(span, {"records": [{"id": 1}]})
+
+        (recorded,) = tracer.spans()
+        assert recorded.rows == 1
+        assert recorded.bytes is None
+
+    def test_errors_are_recorded_and_reraised(self):
+        tracer = ExecutionTracer()
+        with pytest.raises(ValueError):
+            with tracer.trace("create_user", "UserCreateNode"):
+                raise ValueError("boom")
+
+        assert tracer.node_stats()["create_user"]["errors"] == 1
+
+    def test_node_type_histogram(self):
+        tracer = ExecutionTracer(buckets_ms=(1, 10))
+        for duration in (0.5, 5.0, 5.0, 50.0):
+            tracer.record(NodeSpan("n", "UserListNode", duration_ms=duration))
+
+        stats = tracer.node_type_stats()["UserListNode"]
+        assert stats["count"] == 4
+        assert stats["histogram_ms"] == {"1": 1, "10": 2, "+Inf": 1}
+        assert stats["p50_ms"] == 5.0
+        assert stats["max_ms"] == 50.0
+
+    def test_get_tracer_respects_enabled_flag(self, memory_dataflow):
+        db = memory_dataflow
+        assert get_tracer(db) is None
+
+        tracer = db.enable_tracing()
+        assert get_tracer(db) is tracer
+
+        db.disable_tracing()
+        assert get_tracer(db) is None
+        assert db.tracer is tracer
+
+
+@pytest.mark.unit
+class TestTracingHooks:
+    def test_workflow_nodes_are_traced(self, tmp_path):
+        db = DataFlow(f"sqlite:///{tmp_path / 'trace.db'}", auto_migrate=True)
+
+        @db.model
+        class User:
+            name: str
+
+        tracer = db.enable_tracing()
+        workflow = db.create_workflow()
+        db.add_node(workflow, "User", "Create", "create", {"name": "alice"})
+        db.add_node(workflow, "User", "List", "users", {"filter": {}})
+        workflow.add_connection("create", "id", "users", "offset")
+        db.execute_workflow(workflow)
+
+        stats = tracer.node_stats(["create", "users"])
+        assert stats["create"]["node_type"] == "UserCreateNode"
+        assert stats["users"]["node_type"] == "UserListNode"
+        assert stats["users"]["mean_db_time_ms"] > 0
+        assert "UserListNode" in tracer.node_type_stats()
+
+    def test_express_operations_absorb_node_spans(self, tmp_path):
+        db = DataFlow(f"sqlite:///{tmp_path / 'trace.db'}", auto_migrate=True)
+
+        @db.model
+        class User:
+            name: str
+
+        tracer = db.enable_tracing()
+
+        async def run():
+            await db.express.create("User", {"name": "alice"})
+            return await db.express.list("User")
+
+        rows = asyncio.run(run())
+
+        spans = tracer.spans(source="express")
+        assert [s.node_id for s in spans] == ["User.create", "User.list"]
+        assert spans[-1].rows == len(rows)
+        assert spans[-1].db_calls >= 1
+        assert tracer.spans(source="workflow") == []
+
+
+@pytest.mark.unit
+class TestMeasuredPerformanceProfile:
+    def _workflow(self, db):
+        workflow = db.create_workflow()
+        for node_id in ("a", "b", "c", "d"):
+            workflow.add_node("PythonCodeNode", node_id, {"code": "result = 1"})
+        workflow.add_connection("a", "result", "b", "data")
+        workflow.add_connection("a", "result", "c", "data")
+        workflow.add_connection("b", "result", "d", "left")
+        workflow.add_connection("c", "result", "d", "right")
+        return workflow.build()
+
+    def test_profile_uses_critical_path_of_measured_spans(self, memory_dataflow):
+        db = memory_dataflow
+        workflow = self._workflow(db)
+        tracer = db.enable_tracing()
+        for node_id, duration in (("a", 5.0), ("b", 20.0), ("c", 2.0), ("d", 1.0)):
+            tracer.record(NodeSpan(node_id, "PythonCodeNode", duration_ms=duration))
+
+        profile = Inspector(db, workflow).workflow_performance_profile()
+
+        assert profile.measured
+        assert profile.critical_path == ["a", "b", "d"]
+        assert profile.critical_path_ms == 26.0
+        assert profile.estimated_execution_time_ms == 26.0
+        assert profile.parallelization_potential == pytest.approx(1 - 26.0 / 28.0)
+        assert profile.untraced_nodes == []
+        assert profile.node_type_histograms["PythonCodeNode"]["count"] == 4
+        assert "Measured Critical Path" in profile.show(color=False)
+
+    def test_untraced_nodes_are_reported(self, memory_dataflow):
+        db = memory_dataflow
+        workflow = self._workflow(db)
+        tracer = db.enable_tracing()
+        tracer.record(NodeSpan("c", "PythonCodeNode", duration_ms=3.0))
+
+        profile = Inspector(db, workflow).workflow_performance_profile()
+
+        assert profile.critical_path == ["a", "c", "d"]
+        assert profile.untraced_nodes == ["a", "b", "d"]
+
+    def test_falls_back_to_estimate_without_spans(self, memory_dataflow):
+        db = memory_dataflow
+        workflow = self._workflow(db)
+        db.enable_tracing()
+
+        profile = Inspector(db, workflow).workflow_performance_profile()
+
+        assert not profile.measured
+        assert profile.estimated_execution_time_ms == 20.0
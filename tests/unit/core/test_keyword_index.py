@@ -0,0 +1,220 @@
+"""
+Unit tests for the hybrid search keyword index backends.
+
+The SQLite FTS5 backend runs against a real in-memory SQLite database behind
+a small asyncpg-style connection adapter; the PostgreSQL backend is checked
+for the SQL it issues.
+"""
+
+import asyncio
+import sqlite3
+from contextlib import asynccontextmanager
+from datetime import datetime
+from unittest.mock import AsyncMock, Mock
+
+import numpy as np
+import pytest
+from dataflow.semantic.keyword_index import (
+    PostgresTsvectorKeywordIndex,
+    SQLiteFTS5KeywordIndex,
+)
+from dataflow.semantic.memory import MemoryItem, VectorStore
+from dataflow.semantic.search import HybridSearchEngine, SearchResult
+
+
+class SQLiteConnection:
+    """asyncpg-style facade over a sqlite3 connection."""
+
+    def __init__(self, conn):
+        self._conn = conn
+
+    async def execute(self, sql, *args):
+        self._conn.execute(sql, args)
+        self._conn.commit()
+
+    async def fetch(self, sql, *args):
+        return self._conn.execute(sql, args).fetchall()
+
+
+class SQLiteConnectionBuilder:
+    def __init__(self):
+        self.adapter = Mock(dialect_type="sqlite")
+        self._conn = sqlite3.connect(":memory:")
+        self._conn.row_factory = sqlite3.Row
+
+    @asynccontextmanager
+    async def get_connection(self):
+        yield SQLiteConnection(self._conn)
+
+
+def _item(content, collection="default", **metadata):
+    now = datetime.utcnow()
+    return MemoryItem(
+        id="",
+        content=content,
+        embedding=np.zeros(3),
+        metadata=metadata,
+        created_at=now,
+        updated_at=now,
+        collection=collection,
+    )
+
+
+@pytest.fixture
+def builder():
+    return SQLiteConnectionBuilder()
+
+
+class TestSQLiteFTS5KeywordIndex:
+    @pytest.mark.asyncio
+    async def test_existing_rows_are_backfilled_and_ranked(self, builder):
+        store = VectorStore(builder)
+        await store.add(
+            [
+                _item("postgres tuning guide for postgres indexes"),
+                _item("gardening tips"),
+                _item("a short note on postgres"),
+            ]
+        )
+
+        index = SQLiteFTS5KeywordIndex(store.table_name)
+        async with builder.get_connection() as conn:
+            await index.ensure(conn)
+            results = await index.search(conn, ["postgres"], limit=10)
+
+        assert [r.content for r in results] == [
+            "postgres tuning guide for postgres indexes",
+            "a short note on postgres",
+        ]
+        assert 0 < results[1].score < results[0].score < 1
+
+    @pytest.mark.asyncio
+    async def test_triggers_track_inserts_updates_and_deletes(self, builder):
+        store = VectorStore(builder)
+        await store.initialize()
+        index = SQLiteFTS5KeywordIndex(store.table_name)
+        async with builder.get_connection() as conn:
+            await index.ensure(conn)
+
+        ids = await store.add([_item("searching documents"), _item("other text")])
+        async with builder.get_connection() as conn:
+            assert len(await index.search(conn, ["documents"], 10)) == 1
+
+            await conn.execute(
+                f"UPDATE {store.table_name} SET content = ? WHERE id = ?",
+                "renamed entry",
+                ids[0],
+            )
+            assert await index.search(conn, ["documents"], 10) == []
+            assert len(await index.search(conn, ["renamed"], 10)) == 1
+
+        await store.delete(ids[0])
+        async with builder.get_connection() as conn:
+            assert await index.search(conn, ["renamed"], 10) == []
+
+    @pytest.mark.asyncio
+    async def test_collection_and_metadata_filters(self, builder):
+        store = VectorStore(builder)
+        await store.add(
+            [
+                _item("report alpha", collection="a", team="red"),
+                _item("report beta", collection="a", team="blue"),
+                _item("report gamma", collection="b", team="red"),
+            ]
+        )
+        index = SQLiteFTS5KeywordIndex(store.table_name)
+
+        async with builder.get_connection() as conn:
+            await index.ensure(conn)
+            results = await index.search(
+                conn, ["report"], 10, collection="a", metadata_filter={"team": "red"}
+            )
+
+        assert [r.content for r in results] == ["report alpha"]
+        assert results[0].metadata == {"team": "red"}
+
+    @pytest.mark.asyncio
+    async def test_quotes_in_tokens_are_escaped(self, builder):
+        store = VectorStore(builder)
+        await store.add(_item("plain text"))
+        index = SQLiteFTS5KeywordIndex(store.table_name)
+
+        async with builder.get_connection() as conn:
+            await index.ensure(conn)
+            assert await index.search(conn, ['te"xt'], 10) == []
+
+
+class TestHybridSearchWithKeywordIndex:
+    @pytest.mark.asyncio
+    async def test_auto_index_feeds_score_fusion(self, builder):
+        store = VectorStore(builder)
+        await store.add([_item("vector databases explained"), _item("cooking")])
+        memory = Mock(vector_store=store)
+
+        engine = HybridSearchEngine(memory, builder, keyword_index="auto")
+        assert isinstance(engine.keyword_index, SQLiteFTS5KeywordIndex)
+
+        semantic = SearchResult(id="s1", content="semantic hit", score=0.9)
+        engine.semantic_engine.search = AsyncMock(return_value=[semantic])
+
+        results = await engine.search("databases", limit=5)
+
+        assert {r.source for r in results} == {"semantic", "keyword"}
+        keyword = next(r for r in results if r.source == "keyword")
+        assert keyword.content == "vector databases explained"
+        assert keyword.score == pytest.approx(
+            keyword.keyword_score * engine.keyword_weight
+        )
+
+
+class TestPostgresTsvectorKeywordIndex:
+    @pytest.mark.asyncio
+    async def test_generated_column_and_gin_index(self):
+        conn = AsyncMock()
+        await PostgresTsvectorKeywordIndex("docs").initialize(conn)
+
+        statements = " ".join(call.args[0] for call in conn.execute.call_args_list)
+        assert "GENERATED ALWAYS AS" in statements
+        assert "USING GIN(content_tsv)" in statements
+
+    @pytest.mark.asyncio
+    async def test_ensure_only_checks_the_column(self):
+        conn = AsyncMock()
+        conn.fetch.return_value = [{"?column?": 1}]
+        index = PostgresTsvectorKeywordIndex("docs")
+
+        await asyncio.gather(*(index.ensure(conn) for _ in range(5)))
+
+        conn.execute.assert_not_called()
+        assert conn.fetch.await_count == 1
+        assert "information_schema.columns" in conn.fetch.call_args.args[0]
+
+    @pytest.mark.asyncio
+    async def test_ensure_requires_explicit_setup(self):
+        conn = AsyncMock()
+        conn.fetch.return_value = []
+        index = PostgresTsvectorKeywordIndex("docs")
+
+        with pytest.raises(RuntimeError, match="setup_keyword_index"):
+            await index.ensure(conn)
+        conn.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_query_parameters(self):
+        conn = AsyncMock()
+        conn.fetch.return_value = [
+            {"id": 1, "content": "x", "metadata": {"k": "v"}, "rank": 1.0}
+        ]
+
+        results = await PostgresTsvectorKeywordIndex("docs").search(
+            conn, ["fast", "search"], 5, collection="c", metadata_filter={"k": "v"}
+        )
+
+        sql, *params = conn.fetch.call_args.args
+        assert "content_tsv @@ query" in sql and "$4" in sql
+        assert params == ["fast | search", "c", '{"k": "v"}', 5]
+        assert results[0].score == 0.5
+
+    def test_rejects_unsafe_table_names(self):
+        with pytest.raises(ValueError):
+            PostgresTsvectorKeywordIndex("docs; DROP TABLE x")
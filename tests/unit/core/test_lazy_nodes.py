@@ -0,0 +1,108 @@
+"""
+Unit tests for lazy node-class generation and the startup timing report.
+
+With lazy_nodes=True, @db.model registers lightweight proxies; the real node
+class is generated when it is first looked up through DataFlow or first
+instantiated, and every registration is then repointed at the real class.
+"""
+
+import pytest
+from kailash.nodes.base import NodeRegistry
+
+from dataflow import DataFlow
+from dataflow.core.nodes import LazyNodeProxy
+
+NODE_COUNT = 11
+
+
+def _is_proxy(node_class):
+    return issubclass(node_class, LazyNodeProxy)
+
+
+@pytest.fixture
+def lazy_db():
+    db = DataFlow(":memory:", lazy_nodes=True, enable_model_persistence=False)
+
+    @db.model
+    class Gadget:
+        name: str
+        price: float
+
+    yield db
+    db.cleanup_nodes()
+
+
+@pytest.mark.unit
+class TestLazyNodes:
+    def test_proxies_are_registered_without_building_classes(self, lazy_db):
+        assert _is_proxy(NodeRegistry.get("GadgetCreateNode"))
+        assert _is_proxy(NodeRegistry.get("GadgetBulkUpsertNode"))
+        assert len(lazy_db._nodes.pending()) == NODE_COUNT
+
+    def test_instantiation_builds_the_real_class(self, lazy_db):
+        node = NodeRegistry.get("GadgetCreateNode")()
+
+        node_class = type(node)
+        assert not _is_proxy(node_class)
+        assert node_class.__name__ == "GadgetCreateNode"
+        assert node.model_name == "Gadget"
+        assert NodeRegistry.get("GadgetCreateNode") is node_class
+        assert dict.get(lazy_db._nodes, "GadgetCreateNode") is node_class
+        assert len(lazy_db._nodes.pending()) == NODE_COUNT - 1
+
+    def test_dataflow_lookup_builds_the_real_class_once(self, lazy_db):
+        first = lazy_db._nodes["GadgetListNode"]
+        second = lazy_db._nodes.get("GadgetListNode")
+
+        assert first is second
+        assert not _is_proxy(first)
+        assert first.__name__ == "GadgetListNode"
+
+    @pytest.mark.asyncio
+    async def test_express_operations_work_with_lazy_nodes(self, tmp_path):
+        db = DataFlow(f"sqlite:///{tmp_path / 'lazy.db'}", lazy_nodes=True)
+
+        @db.model
+        class Lamp:
+            name: str
+            watts: int
+
+        created = await db.express.create("Lamp", {"name": "desk", "watts": 40})
+        rows = await db.express.list("Lamp")
+
+        assert created["name"] == "desk"
+        assert [row["name"] for row in rows] == ["desk"]
+        assert "LampCreateNode" not in db._nodes.pending()
+        db.cleanup_nodes()
+
+
+@pytest.mark.unit
+class TestStartupReport:
+    def test_report_breaks_down_cost_per_model(self, lazy_db):
+        lazy_db._nodes["GadgetReadNode"]
+
+        report = lazy_db.startup_report()
+
+        gadget = report["models"]["Gadget"]
+        assert gadget["nodes"] == NODE_COUNT
+        assert gadget["lazy_nodes"] is True
+        assert gadget["materialized_nodes"] == 1
+        assert gadget["materialize_ms"] > 0
+        assert gadget["total_ms"] >= gadget["nodes_ms"]
+        assert report["slowest"] == ["Gadget"]
+        assert report["pending_nodes"] == NODE_COUNT - 1
+        assert report["totals"]["models"] == 1
+
+    def test_eager_generation_reports_no_pending_nodes(self):
+        db = DataFlow(":memory:", enable_model_persistence=False)
+
+        @db.model
+        class Widget:
+            name: str
+
+        report = db.startup_report()
+        assert report["models"]["Widget"]["nodes"] == NODE_COUNT
+        assert report["models"]["Widget"]["lazy_nodes"] is False
+        assert report["pending_nodes"] == 0
+        assert not _is_proxy(NodeRegistry.get("WidgetCreateNode"))
+        db.cleanup_nodes()
@@ -0,0 +1,229 @@
+"""
+Unit Tests for Query→Merge→Aggregate Fusion
+
+Covers chain detection, the fallback rules that keep fused results identical
+to the Python execution, AggregateNode output shaping, and an end-to-end
+comparison of fused and unfused execution on a SQLite file database.
+"""
+
+import pytest
+from kailash.runtime import LocalRuntime
+
+from dataflow import DataFlow
+from dataflow.nodes.aggregate_operations import AggregateNode
+from dataflow.optimization.query_fusion import (
+    QueryMergeAggregateFuser,
+    shape_aggregate_result,
+)
+
+
+def _register_models(db):
+    @db.model
+    class Customer:
+        name: str
+        region: str
+
+    @db.model
+    class Invoice:
+        customer_id: int
+        amount: float
+        status: str
+
+
+def _build_chain(db, expression, merge_config=None, **aggregate_config):
+    workflow = db.create_workflow()
+    db.add_node(workflow, "Customer", "List", "customers", {"limit": 100})
+    db.add_node(
+        workflow,
+        "Invoice",
+        "List",
+        "invoices",
+        {"filter": {"status": "paid"}, "limit": 100},
+    )
+    workflow.add_node(
+        "SmartMergeNode",
+        "merge",
+        merge_config
+        or {
+            "merge_type": "inner",
+            "join_conditions": {"left_key": "id", "right_key": "customer_id"},
+        },
+    )
+    workflow.add_node(
+        AggregateNode,
+        "agg",
+        {"aggregate_expression": expression, **aggregate_config},
+    )
+    workflow.add_connection("customers", "records", "merge", "left_data")
+    workflow.add_connection("invoices", "records", "merge", "right_data")
+    workflow.add_connection("merge", "merged_data", "agg", "data")
+    return workflow
+
+
+@pytest.mark.unit
+class TestFusionPlanning:
+    def test_chain_is_fused_into_join_group_by(self, memory_dataflow):
+        db = memory_dataflow
+        _register_models(db)
+        workflow = _build_chain(db, "sum of amount by region")
+
+        fused, results = QueryMergeAggregateFuser(db).rewrite(workflow)
+
+        assert len(results) == 1 and results[0].fused
+        assert set(fused.nodes) == {"agg"}
+        assert fused.connections == []
+        sql = results[0].sql
+        assert "INNER JOIN" in sql and "GROUP BY" in sql
+        assert 'SUM(r."amount")' in sql
+        assert results[0].params == ["paid"]
+        # The original workflow is left untouched
+        assert set(workflow.nodes) == {"customers", "invoices", "merge", "agg"}
+
+    def test_right_prefixed_fields_resolve_to_right_columns(self, memory_dataflow):
+        db = memory_dataflow
+        _register_models(db)
+        workflow = _build_chain(db, "max of right_id by region")
+
+        _, results = QueryMergeAggregateFuser(db).rewrite(workflow)
+
+        assert results[0].fused
+        assert 'MAX(r."id")' in results[0].sql
+
+    @pytest.mark.parametrize(
+        "expression, aggregate_config, reason",
+        [
+            ("median of amount", {}, "no exact SQL aggregate"),
+            ("sum of amount", {"filter_expression": "where status is paid"}, "filter"),
+            ("sum of status", {}, "not numeric"),
+            ("sum of missing", {}, "not in the merged records"),
+        ],
+    )
+    def test_aggregate_fallbacks(
+        self, memory_dataflow, expression, aggregate_config, reason
+    ):
+        db = memory_dataflow
+        _register_models(db)
+        workflow = _build_chain(db, expression, **aggregate_config)
+
+        fused, results = QueryMergeAggregateFuser(db).rewrite(workflow)
+
+        assert fused is workflow
+        assert not results[0].fused
+        assert reason in results[0].reason
+
+    def test_data_dependent_join_keys_fall_back(self, memory_dataflow):
+        db = memory_dataflow
+        _register_models(db)
+        workflow = _build_chain(
+            db, "sum of amount", merge_config={"merge_type": "auto"}
+        )
+
+        _, results = QueryMergeAggregateFuser(db).rewrite(workflow)
+
+        assert not results[0].fused
+        assert "auto" in results[0].reason
+
+    def test_intermediate_results_consumed_elsewhere_fall_back(self, memory_dataflow):
+        db = memory_dataflow
+        _register_models(db)
+        workflow = _build_chain(db, "sum of amount")
+        workflow.add_node("PythonCodeNode", "audit", {"code": "result = data"})
+        workflow.add_connection("merge", "merged_data", "audit", "data")
+
+        _, results = QueryMergeAggregateFuser(db).rewrite(workflow)
+
+        assert not results[0].fused
+        assert "consumed outside the chain" in results[0].reason
+
+    def test_node_scoped_inputs_are_applied(self, memory_dataflow):
+        db = memory_dataflow
+        _register_models(db)
+        workflow = _build_chain(db, "sum of amount")
+
+        _, results = QueryMergeAggregateFuser(db).rewrite(
+            workflow, {"invoices": {"filter": {"status": "open"}}}
+        )
+
+        assert results[0].fused
+        assert results[0].params == ["open"]
+
+
+@pytest.mark.unit
+class TestAggregateShaping:
+    def test_empty_join_matches_aggregate_node(self):
+        plan = {
+            "function": "sum",
+            "field": "amount",
+            "group_by": [],
+            "aggregate_expression": "sum of amount",
+        }
+        assert shape_aggregate_result(plan, [{"row_count": 0}]) == {
+            "result": None,
+            "aggregate_expression": "sum of amount",
+            "total_records": 0,
+            "parsed_successfully": True,
+        }
+
+    def test_groups_colliding_after_str_are_combined(self):
+        plan = {
+            "function": "average",
+            "field": "amount",
+            "group_by": ["code"],
+            "aggregate_expression": "average amount by code",
+        }
+        rows = [
+            {"group_0": 1, "row_count": 1, "agg_value": 2.0, "agg_count": 1},
+            {"group_0": "1", "row_count": 2, "agg_value": 4.0, "agg_count": 2},
+        ]
+
+        output = shape_aggregate_result(plan, rows)
+
+        assert output["result"] == {
+            "1": {"value": 2.0, "count": 3, "group_fields": {"code": "1"}}
+        }
+        assert output["total_records"] == 3
+
+
+@pytest.mark.unit
+class TestFusedExecution:
+    @pytest.mark.parametrize(
+        "expression",
+        [
+            "sum of amount by region",
+            "average of amount",
+            "max amount by region, name",
+            "count of amount by region",
+        ],
+    )
+    def test_fused_results_match_python_execution(self, tmp_path, expression):
+        db = DataFlow(f"sqlite:///{tmp_path / 'fusion.db'}", auto_migrate=True)
+        _register_models(db)
+
+        seed = db.create_workflow()
+        for i, (name, region) in enumerate([("a", "eu"), ("b", "us"), ("c", "eu")]):
+            db.add_node(
+                seed, "Customer", "Create", f"c{i}", {"name": name, "region": region}
+            )
+        invoices = [(1, 10.0, "paid"), (1, 5.5, "open"), (2, 7.0, "paid")]
+        invoices += [(3, 1.0, "paid"), (3, 2.0, "paid")]
+        for i, (customer_id, amount, status) in enumerate(invoices):
+            db.add_node(
+                seed,
+                "Invoice",
+                "Create",
+                f"i{i}",
+                {"customer_id": customer_id, "amount": amount, "status": status},
+            )
+        db.execute_workflow(seed)
+
+        workflow = _build_chain(db, expression)
+        with LocalRuntime() as runtime:
+            plain, _ = runtime.execute(
+                workflow.build(),
+                parameters={"agg": {"aggregate_expression": expression}},
+            )
+        fused, _ = db.execute_workflow(workflow, optimize=True)
+
+        assert workflow._dataflow_fusion_results[0].fused
+        assert set(fused) == {"agg"}
+        assert fused["agg"] == plain["agg"]
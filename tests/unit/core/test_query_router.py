@@ -0,0 +1,331 @@
+"""
+Unit tests for health-aware read replica routing.
+
+Covers replica selection by outstanding requests and latency, exclusion of
+lagging or failed replicas, read-your-writes stickiness, write detection,
+replica fallback, and end-to-end routing of generated List nodes across two
+SQLite file copies.
+"""
+
+import asyncio
+import shutil
+import sqlite3
+import threading
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from kailash.runtime.local import LocalRuntime
+from kailash.sdk_exceptions import NodeExecutionError
+from kailash.workflow.builder import WorkflowBuilder
+
+from dataflow import DataFlow
+from dataflow.core.database_registry import DatabaseConfig, DatabaseRegistry
+from dataflow.core.query_router import (
+    DatabaseQueryRouter,
+    QueryType,
+    is_unavailable_error,
+    is_write_statement,
+)
+from dataflow.features.express import ExpressDataFlow
+
+
+def _router(replicas=2, **kwargs):
+    registry = DatabaseRegistry()
+    registry.register_database(
+        DatabaseConfig("primary", "postgresql://p/db", "postgresql", is_primary=True)
+    )
+    for i in range(replicas):
+        registry.register_database(
+            DatabaseConfig(
+                f"replica_{i}",
+                f"postgresql://r{i}/db",
+                "postgresql",
+                is_read_replica=True,
+            )
+        )
+    return DatabaseQueryRouter(registry, **kwargs)
+
+
+@pytest.mark.unit
+class TestReplicaSelection:
+    def test_reads_rotate_across_idle_replicas(self):
+        router = _router()
+
+        names = {router.route_read_query().name for _ in range(4)}
+
+        assert names == {"replica_0", "replica_1"}
+        assert router.route_query(QueryType.WRITE).name == "primary"
+
+    def test_least_outstanding_requests_win(self):
+        router = _router()
+        router.increment_connection_count("replica_0")
+
+        assert {router.route_read_query().name for _ in range(4)} == {"replica_1"}
+
+    def test_slow_replica_receives_fewer_reads(self):
+        router = _router()
+        router.record_latency("replica_0", 50.0)
+        router.record_latency("replica_1", 5.0)
+
+        assert router.route_read_query().name == "replica_1"
+        # Five in-flight requests on the fast replica outweigh the slow one
+        for _ in range(10):
+            router.increment_connection_count("replica_1")
+        assert router.route_read_query().name == "replica_0"
+
+    def test_lagging_and_failed_replicas_are_excluded(self):
+        router = _router(max_replication_lag=5.0)
+        router.update_replication_lag("replica_0", 30.0)
+        assert {router.route_read_query().name for _ in range(4)} == {"replica_1"}
+
+        router.record_failure("replica_1")
+        assert router.route_read_query().name == "primary"
+
+        stats = router.get_routing_statistics()["replicas"]
+        assert stats["replica_0"]["eligible"] is False
+
+    def test_track_request_records_latency_and_failures(self):
+        router = _router(failure_cooldown=0)
+        with router.track_request("replica_0"):
+            pass
+        with pytest.raises(ConnectionRefusedError):
+            with router.track_request("replica_1"):
+                raise ConnectionRefusedError("down")
+        with pytest.raises(ValueError):
+            with router.track_request("replica_0"):
+                raise ValueError("syntax error at or near SELEC")
+
+        stats = router.get_routing_statistics()["replicas"]
+        assert stats["replica_0"]["requests"] == 1
+        assert stats["replica_1"]["failures"] == 1
+        assert router.get_connection_counts() == {"replica_0": 0, "replica_1": 0}
+
+
+@pytest.mark.unit
+class TestReadYourWrites:
+    def test_explicit_context_sticks_to_primary(self):
+        router = _router(read_your_writes_window=60)
+        router.record_write(context="user-1")
+
+        assert router.route_read_query(context="user-1").name == "primary"
+        assert router.route_read_query(context="user-2").is_read_replica
+
+    def test_stickiness_is_scoped_to_the_thread(self):
+        router = _router(read_your_writes_window=60)
+        other = []
+
+        writer = threading.Thread(target=router.record_write)
+        writer.start()
+        writer.join()
+        reader = threading.Thread(
+            target=lambda: other.append(router.route_read_query().name)
+        )
+        reader.start()
+        reader.join()
+
+        router.record_write()
+
+        assert other[0].startswith("replica_")
+        assert router.route_read_query().name == "primary"
+
+    @pytest.mark.asyncio
+    async def test_stickiness_is_scoped_to_the_task(self):
+        router = _router(read_your_writes_window=60)
+        wrote = asyncio.Event()
+
+        async def writer():
+            router.record_write()
+            wrote.set()
+            return router.route_read_query().name
+
+        async def other_request():
+            await wrote.wait()
+            return router.has_recent_write(), router.route_read_query().name
+
+        own, (other_wrote, other) = await asyncio.gather(writer(), other_request())
+
+        assert own == "primary"
+        assert other_wrote is False
+        assert other.startswith("replica_")
+
+    def test_scope_survives_event_loop_changes(self):
+        router = _router(read_your_writes_window=60)
+
+        async def write():
+            router.record_write()
+
+        async def read():
+            return router.route_read_query().name
+
+        with router.read_your_writes_scope("request-1"):
+            asyncio.run(write())
+            assert asyncio.run(read()) == "primary"
+
+        assert asyncio.run(read()).startswith("replica_")
+
+    def test_window_expires(self):
+        router = _router(read_your_writes_window=0)
+        router.record_write(context="user-1")
+
+        assert router.route_read_query(context="user-1").is_read_replica
+
+
+@pytest.mark.unit
+class TestStatementClassification:
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "INSERT INTO notes (title) VALUES ('x')",
+            "  update notes SET title = 'x'",
+            "WITH moved AS (DELETE FROM a RETURNING *) INSERT INTO b SELECT * FROM moved",
+            "WITH t AS (SELECT 1) UPDATE notes SET title = 'x'",
+            "SELECT * FROM notes FOR UPDATE",
+            "CREATE TABLE t (id int)",
+        ],
+    )
+    def test_writes(self, sql):
+        assert is_write_statement(sql)
+
+    @pytest.mark.parametrize(
+        "sql",
+        [
+            "SELECT * FROM notes",
+            "(SELECT updated_at FROM notes)",
+            "WITH recent AS (SELECT * FROM notes) SELECT * FROM recent",
+            "SELECT * FROM audit WHERE action = 'DELETE' -- not an UPDATE",
+            'SELECT "insert" FROM notes',
+            "",
+        ],
+    )
+    def test_reads(self, sql):
+        assert not is_write_statement(sql)
+
+    def test_unavailable_errors_are_found_through_wrappers(self):
+        try:
+            try:
+                raise ConnectionRefusedError(111, "Connect call failed")
+            except OSError as e:
+                raise NodeExecutionError(f"Database query failed: {e}")
+        except NodeExecutionError as wrapped:
+            assert is_unavailable_error(wrapped)
+
+        assert is_unavailable_error(NodeExecutionError("could not connect to server"))
+        assert not is_unavailable_error(
+            NodeExecutionError('relation "notes" does not exist')
+        )
+
+
+@pytest.mark.unit
+class TestReplicaFallback:
+    def _routed(self, tmp_path, error):
+        db = DataFlow(
+            f"sqlite:///{tmp_path / 'primary.db'}",
+            read_replicas=[f"sqlite:///{tmp_path / 'replica.db'}"],
+            cache_enabled=False,
+        )
+        replica = SimpleNamespace(async_run=AsyncMock(side_effect=error))
+        primary = SimpleNamespace(async_run=AsyncMock(return_value={"from": "p"}))
+        db._get_or_create_async_sql_node = lambda database_type: primary
+        db._route_sql_node(replica, "sqlite", "replica_0")
+        return db, replica, primary
+
+    @pytest.mark.asyncio
+    async def test_unreachable_replica_falls_back_to_primary(self, tmp_path):
+        db, replica, primary = self._routed(
+            tmp_path, NodeExecutionError("Database query failed: connection refused")
+        )
+
+        assert await replica.async_run(query="SELECT 1") == {"from": "p"}
+        assert (
+            db.query_router.get_routing_statistics()["replicas"]["replica_0"][
+                "failures"
+            ]
+            == 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_query_errors_are_not_retried_on_primary(self, tmp_path):
+        db, replica, primary = self._routed(
+            tmp_path, NodeExecutionError('relation "notes" does not exist')
+        )
+
+        with pytest.raises(NodeExecutionError, match="does not exist"):
+            await replica.async_run(query="SELECT * FROM notes")
+        primary.async_run.assert_not_called()
+        assert db.query_router.route_read_query().name == "replica_0"
+
+
+@pytest.mark.unit
+class TestDataFlowReplicaRouting:
+    @pytest.mark.asyncio
+    async def test_list_reads_replica_and_writes_stick_to_primary(self, tmp_path):
+        primary = tmp_path / "primary.db"
+        replica = tmp_path / "replica.db"
+        db = DataFlow(
+            f"sqlite:///{primary}",
+            read_replicas=[f"sqlite:///{replica}"],
+            read_your_writes_window=0,
+            cache_enabled=False,
+        )
+
+        @db.model
+        class Note:
+            title: str
+
+        express = ExpressDataFlow(db, cache_enabled=False)
+        await express.create("Note", {"id": 1, "title": "shared"})
+        shutil.copy(primary, replica)
+        conn = sqlite3.connect(replica)
+        conn.execute("INSERT INTO notes (id, title) VALUES (2, 'replica only')")
+        conn.commit()
+        conn.close()
+
+        titles = {row["title"] for row in await express.list("Note")}
+        assert titles == {"shared", "replica only"}
+
+        db.query_router.read_your_writes_window = 60
+        await express.create("Note", {"id": 3, "title": "fresh"})
+        titles = {row["title"] for row in await express.list("Note")}
+        assert titles == {"shared", "fresh"}
+
+        db.query_router.read_your_writes_window = 0
+        db.query_router.update_replication_lag("replica_0", 3600)
+        titles = {row["title"] for row in await express.list("Note")}
+        assert titles == {"shared", "fresh"}
+
+        await db.close_async()
+
+    def test_local_runtime_reads_stick_to_primary_after_write(self, tmp_path):
+        primary = tmp_path / "primary.db"
+        replica = tmp_path / "replica.db"
+        db = DataFlow(
+            f"sqlite:///{primary}",
+            read_replicas=[f"sqlite:///{replica}"],
+            read_your_writes_window=0,
+            cache_enabled=False,
+        )
+
+        @db.model
+        class Note:
+            title: str
+
+        def run(node_type, node_id, params):
+            workflow = WorkflowBuilder()
+            workflow.add_node(node_type, node_id, params)
+            results, _ = runtime.execute(workflow.build())
+            return results[node_id]
+
+        with LocalRuntime() as runtime:
+            run("NoteCreateNode", "seed", {"id": 1, "title": "shared"})
+            shutil.copy(primary, replica)
+
+            # Each execute() runs in a fresh task on the runtime's event loop;
+            # the scope ties them to one request
+            db.query_router.read_your_writes_window = 60
+            with db.query_router.read_your_writes_scope("request-1"):
+                run("NoteCreateNode", "create", {"id": 2, "title": "fresh"})
+                listed = run("NoteListNode", "list", {})
+
+        assert {row["title"] for row in listed["records"]} == {"shared", "fresh"}
+        assert db.query_router.get_routing_statistics()["round_robin_index"] == 0
@@ -0,0 +1,315 @@
+"""
+Unit Tests for TenantPoolRouter
+
+Uses an in-memory fake pool factory so routing, search_path pinning,
+LRU eviction under the connection budget and metrics can be verified
+without a PostgreSQL server.
+"""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from dataflow.core.multi_tenancy import TenantConfig, TenantManager, TenantRegistry
+from dataflow.core.tenant_pool_router import (
+    SHARED_POOL_KEY,
+    TenantPoolExhaustedError,
+    TenantPoolRouter,
+)
+
+
+class FakePool:
+    """Minimal asyncpg-like pool recording its creation parameters."""
+
+    def __init__(self, params):
+        self.params = params
+        self.closed = False
+
+    @asynccontextmanager
+    async def acquire(self):
+        yield {
+            "search_path": self.params.get("server_settings", {}).get("search_path"),
+            "database": self.params.get("database"),
+        }
+
+    async def close(self):
+        self.closed = True
+
+
+class FakePoolFactory:
+    def __init__(self):
+        self.created = []
+        self.calls = 0
+        # search_path -> event that must be set before that pool is created
+        self.gates = {}
+
+    async def __call__(self, **params):
+        self.calls += 1
+        gate = self.gates.get(params.get("server_settings", {}).get("search_path"))
+        if gate is not None:
+            await gate.wait()
+        pool = FakePool(params)
+        self.created.append(pool)
+        return pool
+
+
+class RecordingConnection:
+    """Connection stand-in recording the statements tenant strategies run."""
+
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(str(statement))
+
+    def commit(self):
+        pass
+
+
+def _registry(*configs):
+    registry = TenantRegistry()
+    for tenant_id, strategy in configs:
+        registry.register_tenant(
+            TenantConfig(
+                tenant_id=tenant_id,
+                name=tenant_id.title(),
+                isolation_strategy=strategy,
+            )
+        )
+    return registry
+
+
+@pytest.mark.unit
+class TestTenantPoolRouting:
+    def test_resolve_pool_key_per_strategy(self):
+        registry = _registry(
+            ("acme", "schema"), ("globex", "database"), ("initech", "row_level")
+        )
+        router = TenantPoolRouter(registry, pool_factory=FakePoolFactory())
+
+        assert router.resolve_pool_key("acme") == "schema:tenant_acme"
+        assert router.resolve_pool_key("globex") == "database:tenant_globex_db"
+        assert router.resolve_pool_key("initech") == SHARED_POOL_KEY
+
+    def test_unknown_tenant_raises(self):
+        router = TenantPoolRouter(TenantRegistry(), pool_factory=FakePoolFactory())
+        with pytest.raises(ValueError, match="not found"):
+            router.resolve_pool_key("missing")
+
+    @pytest.mark.asyncio
+    async def test_search_path_pinned_at_connect_time(self):
+        factory = FakePoolFactory()
+        router = TenantPoolRouter(
+            _registry(("acme", "schema")),
+            connection_params={"host": "localhost", "database": "app"},
+            pool_factory=factory,
+        )
+
+        async with router.acquire("acme") as conn:
+            assert conn["search_path"] == '"tenant_acme", public'
+            assert conn["database"] == "app"
+
+        # Second acquisition reuses the warm pool
+        async with router.acquire("acme"):
+            pass
+        assert len(factory.created) == 1
+        assert router.get_metrics()["pool_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_database_isolation_overrides_database(self):
+        router = TenantPoolRouter(
+            _registry(("globex", "database")),
+            connection_params={"database": "app"},
+            pool_factory=FakePoolFactory(),
+        )
+        async with router.acquire("globex") as conn:
+            assert conn["database"] == "tenant_globex_db"
+            assert conn["search_path"] is None
+
+
+@pytest.mark.unit
+class TestTenantPoolBudget:
+    @pytest.mark.asyncio
+    async def test_lru_eviction_under_budget(self):
+        factory = FakePoolFactory()
+        router = TenantPoolRouter(
+            _registry(("a", "schema"), ("b", "schema"), ("c", "schema")),
+            max_total_connections=4,
+            per_tenant_max_size=2,
+            pool_factory=factory,
+        )
+
+        async with router.acquire("a"):
+            pass
+        async with router.acquire("b"):
+            pass
+        async with router.acquire("a"):
+            pass  # "b" is now least recently used
+        async with router.acquire("c"):
+            pass
+
+        assert router.list_warm_pools() == ["schema:tenant_a", "schema:tenant_c"]
+        assert factory.created[1].closed is True
+        assert router.get_metrics()["evictions"] == 1
+        assert router.reserved_connections <= 4
+
+    @pytest.mark.asyncio
+    async def test_busy_pools_are_not_evicted(self):
+        router = TenantPoolRouter(
+            _registry(("a", "schema"), ("b", "schema")),
+            max_total_connections=2,
+            per_tenant_max_size=2,
+            pool_factory=FakePoolFactory(),
+        )
+
+        async with router.acquire("a"):
+            with pytest.raises(TenantPoolExhaustedError):
+                async with router.acquire("b"):
+                    pass
+
+    @pytest.mark.asyncio
+    async def test_evict_idle_and_close_all(self):
+        factory = FakePoolFactory()
+        router = TenantPoolRouter(
+            _registry(("a", "schema"), ("b", "database")), pool_factory=factory
+        )
+        async with router.acquire("a"):
+            pass
+        async with router.acquire("b"):
+            pass
+
+        assert await router.evict_idle(max_idle_seconds=3600) == 0
+        assert await router.evict_idle(max_idle_seconds=0) == 2
+        assert all(pool.closed for pool in factory.created)
+
+        async with router.acquire("a"):
+            pass
+        await router.close_all()
+        assert router.list_warm_pools() == []
+
+
+@pytest.mark.unit
+class TestTenantPoolConcurrency:
+    @pytest.mark.asyncio
+    async def test_slow_pool_creation_does_not_block_warm_tenants(self):
+        factory = FakePoolFactory()
+        router = TenantPoolRouter(
+            _registry(("a", "schema"), ("b", "schema")), pool_factory=factory
+        )
+        async with router.acquire("b"):
+            pass
+
+        gate = asyncio.Event()
+        factory.gates['"tenant_a", public'] = gate
+        cold = asyncio.create_task(router.acquire("a").__aenter__())
+        await asyncio.sleep(0)
+
+        async def warm_acquire():
+            async with router.acquire("b") as conn:
+                return conn["search_path"]
+
+        path = await asyncio.wait_for(warm_acquire(), timeout=1.0)
+        assert path == '"tenant_b", public'
+        assert not cold.done()
+        assert router.reserved_connections == 10  # b's pool plus a's reservation
+
+        gate.set()
+        await cold
+        assert router.list_warm_pools() == ["schema:tenant_b", "schema:tenant_a"]
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_acquires_create_one_pool(self):
+        factory = FakePoolFactory()
+        router = TenantPoolRouter(_registry(("a", "schema")), pool_factory=factory)
+        gate = asyncio.Event()
+        factory.gates['"tenant_a", public'] = gate
+
+        async def use():
+            async with router.acquire("a"):
+                pass
+
+        tasks = [asyncio.create_task(use()) for _ in range(5)]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(*tasks)
+
+        assert factory.calls == 1
+        assert router.get_metrics()["pool_hits"] == 4
+
+
+@pytest.mark.unit
+class TestTenantPoolMetrics:
+    @pytest.mark.asyncio
+    async def test_per_tenant_metrics(self):
+        router = TenantPoolRouter(
+            _registry(("acme", "schema")), pool_factory=FakePoolFactory()
+        )
+        assert router.get_tenant_metrics("acme") is None
+
+        for _ in range(3):
+            async with router.acquire("acme"):
+                pass
+
+        metrics = router.get_tenant_metrics("acme")
+        assert metrics["acquisitions"] == 3
+        assert metrics["in_use"] == 0
+        assert metrics["errors"] == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_are_counted(self):
+        router = TenantPoolRouter(
+            _registry(("acme", "schema")), pool_factory=FakePoolFactory()
+        )
+        with pytest.raises(RuntimeError):
+            async with router.acquire("acme"):
+                raise RuntimeError("boom")
+
+        metrics = router.get_tenant_metrics("acme")
+        assert metrics["errors"] == 1
+        assert metrics["in_use"] == 0
+
+
+@pytest.mark.unit
+class TestTenantManagerPoolIntegration:
+    def test_schema_query_not_rewritten_with_router(self):
+        registry = _registry(("acme", "schema"))
+        router = TenantPoolRouter(registry, pool_factory=FakePoolFactory())
+        manager = TenantManager(registry=registry, pool_router=router)
+
+        result = manager.execute_tenant_query(None, "acme", "SELECT * FROM users")
+
+        assert result["query"] == "SELECT * FROM users"
+        assert result["pool_key"] == "schema:tenant_acme"
+
+    def test_hybrid_query_keeps_row_level_context_with_router(self):
+        registry = _registry(("acme", "hybrid"))
+        router = TenantPoolRouter(registry, pool_factory=FakePoolFactory())
+        manager = TenantManager(registry=registry, pool_router=router)
+        db = RecordingConnection()
+
+        result = manager.execute_tenant_query(db, "acme", "SELECT * FROM users")
+
+        assert result["query"] == "SELECT * FROM users"
+        assert result["pool_key"] == "schema:tenant_acme"
+        assert db.statements == ["SET row_security.tenant_id = 'acme'"]
+
+    def test_schema_query_rewritten_without_router(self):
+        manager = TenantManager(registry=_registry(("acme", "schema")))
+
+        result = manager.execute_tenant_query(None, "acme", "SELECT * FROM users")
+
+        assert result["query"] == "SELECT * FROM acme.users"
+
+    @pytest.mark.asyncio
+    async def test_acquire_tenant_connection(self):
+        registry = _registry(("acme", "schema"))
+        manager = TenantManager(
+            registry=registry,
+            pool_router=TenantPoolRouter(registry, pool_factory=FakePoolFactory()),
+        )
+        async with manager.acquire_tenant_connection("acme") as conn:
+            assert conn["search_path"] == '"tenant_acme", public'
+
+        with pytest.raises(ValueError):
+            TenantManager(registry=registry).acquire_tenant_connection("acme")
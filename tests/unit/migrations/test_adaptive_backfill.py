@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the adaptive, resumable NOT NULL backfill.
+
+The controller is tested directly; the handler runs against an in-memory
+stand-in for an asyncpg connection that applies the keyed batch UPDATEs and
+checkpoint writes with transaction rollback semantics.
+"""
+
+import copy
+from contextlib import asynccontextmanager
+
+import asyncpg
+import pytest
+
+from dataflow.migrations.adaptive_backfill import (
+    AdaptiveBackfillController,
+    BackfillBudget,
+)
+from dataflow.migrations.not_null_handler import (
+    AdditionResult,
+    ColumnDefinition,
+    DefaultValueType,
+    NotNullAdditionPlan,
+    NotNullColumnHandler,
+)
+
+
+class FakeBackfillConnection:
+    """Emulates the statements issued by a throttled backfill."""
+
+    def __init__(self, rows=2500, lag=None, lock_failures=0):
+        self.state = {"rows": {key: None for key in range(1, rows + 1)}, "cp": None}
+        self.lag = list(lag or [])
+        self.lock_failures = lock_failures
+        self.statements = []
+        self.batches = []
+        self.batch_sql = None
+        self.after_batch = None
+
+    @asynccontextmanager
+    async def _transaction(self):
+        snapshot = copy.deepcopy(self.state)
+        try:
+            yield
+        except Exception:
+            self.state = snapshot
+            raise
+
+    def transaction(self):
+        return self._transaction()
+
+    async def execute(self, sql, *args):
+        self.statements.append(" ".join(sql.split()))
+        if "INSERT INTO dataflow_backfill_checkpoints" in sql:
+            self.state["cp"] = {
+                "last_key": args[2],
+                "rows_processed": args[3],
+                "batch_size": args[4],
+                "status": args[5],
+                "updated_at": None,
+            }
+        elif "DELETE FROM dataflow_backfill_checkpoints" in sql:
+            self.state["cp"] = None
+
+    async def fetchrow(self, sql, *args):
+        if "FROM dataflow_backfill_checkpoints" in sql:
+            return self.state["cp"]
+        assert "WITH batch AS" in sql
+        self.batch_sql = " ".join(sql.split())
+        if self.lock_failures:
+            self.lock_failures -= 1
+            raise asyncpg.exceptions.LockNotAvailableError("lock timeout")
+
+        limit = args[0]
+        after = int(args[1]) if len(args) > 1 else 0
+        keys = sorted(k for k in self.state["rows"] if k > after)[:limit]
+        updated = 0
+        for key in keys:
+            if self.state["rows"][key] is None:
+                self.state["rows"][key] = "pending"
+                updated += 1
+        self.batches.append(limit)
+        if self.after_batch:
+            self.after_batch()
+        return {
+            "last_key": str(keys[-1]) if keys else None,
+            "scanned": len(keys),
+            "updated": updated,
+        }
+
+    async def fetchval(self, sql, *args):
+        if "format_type" in sql:
+            return "bigint"
+        if "pg_stat_replication" in sql:
+            return self.lag.pop(0) if self.lag else 0.0
+        return 0
+
+
+def _plan(**budget):
+    budget.setdefault("min_batch_size", 100)
+    budget.setdefault("max_sleep", 0.01)
+    return NotNullAdditionPlan(
+        table_name="accounts",
+        column=ColumnDefinition(
+            name="status",
+            data_type="VARCHAR(20)",
+            default_value="pending",
+            default_type=DefaultValueType.STATIC,
+        ),
+        execution_strategy="batched_update",
+        batch_size=500,
+        backfill_budget=BackfillBudget(**budget),
+    )
+
+
+class TestAdaptiveBackfillController:
+    def test_grows_within_budget_and_shrinks_on_slow_batches(self):
+        controller = AdaptiveBackfillController(
+            BackfillBudget(target_batch_latency=1.0, min_sleep=0.0), 1000
+        )
+
+        controller.record_batch(1000, latency=0.2)
+        assert controller.batch_size == 1250
+        assert controller.sleep_seconds == 0.0
+
+        controller.record_batch(1250, latency=4.0)
+        assert controller.batch_size == 625
+        assert controller.sleep_seconds == pytest.approx(0.1)
+
+        controller.record_batch(625, latency=0.8)
+        assert controller.batch_size == 781  # capped by target / latency
+        assert controller.stats["throttled_batches"] == 1
+
+    def test_replication_lag_backs_off_for_the_excess(self):
+        controller = AdaptiveBackfillController(
+            BackfillBudget(max_replication_lag=5.0, max_sleep=60.0), 10000
+        )
+
+        controller.record_batch(10000, latency=0.1, replication_lag=12.0)
+
+        assert controller.batch_size == 5000
+        assert controller.sleep_seconds == pytest.approx(7.0)
+        assert controller.get_stats()["max_replication_lag"] == 12.0
+
+    def test_lock_timeouts_are_retried_up_to_budget(self):
+        controller = AdaptiveBackfillController(
+            BackfillBudget(max_lock_retries=2, min_batch_size=100), 400
+        )
+
+        assert controller.record_lock_timeout()
+        assert controller.record_lock_timeout()
+        assert not controller.record_lock_timeout()
+        assert controller.batch_size == 100
+
+    def test_budget_validation(self):
+        with pytest.raises(ValueError):
+            BackfillBudget(min_batch_size=100, max_batch_size=10)
+
+
+class TestThrottledNotNullAddition:
+    @pytest.mark.asyncio
+    async def test_backfill_commits_batches_and_finalizes(self):
+        handler = NotNullColumnHandler()
+        connection = FakeBackfillConnection(rows=2500)
+
+        result = await handler.execute_not_null_addition(_plan(), connection)
+
+        assert result.result == AdditionResult.SUCCESS
+        assert result.affected_rows == 2500
+        assert all(v == "pending" for v in connection.state["rows"].values())
+        assert connection.state["cp"] is None  # checkpoint removed when done
+        assert connection.batches[0] == 500
+        assert connection.batches[1] > 500  # fast batches grow
+        assert any("SET NOT NULL" in sql for sql in connection.statements)
+        assert "SET LOCAL lock_timeout = 2000" in connection.statements
+        assert result.performance_metrics["backfill"]["rows"] == 2500
+        # The CTE key is aliased so default expressions using it stay unambiguous
+        assert "SELECT id AS batch_key FROM accounts" in connection.batch_sql
+        assert "accounts.id = batch.batch_key" in connection.batch_sql
+        assert "MAX(batch_key)::text" in connection.batch_sql
+
+    @pytest.mark.asyncio
+    async def test_pause_and_resume_from_checkpoint(self):
+        handler = NotNullColumnHandler()
+        connection = FakeBackfillConnection(rows=2500)
+        connection.after_batch = lambda: handler.pause_backfill("accounts", "status")
+
+        paused = await handler.execute_not_null_addition(_plan(), connection)
+
+        assert paused.result == AdditionResult.PAUSED
+        assert paused.rollback_executed is False
+        assert paused.affected_rows == 500
+        assert connection.state["cp"]["last_key"] == "500"
+        assert connection.state["cp"]["status"] == "paused"
+        assert not any("SET NOT NULL" in sql for sql in connection.statements)
+
+        connection.after_batch = None
+        connection.statements.clear()
+        resumed = await handler.execute_not_null_addition(_plan(), connection)
+
+        assert resumed.result == AdditionResult.SUCCESS
+        assert resumed.affected_rows == 2500
+        assert not any("ADD COLUMN" in sql for sql in connection.statements)
+        assert all(v == "pending" for v in connection.state["rows"].values())
+
+    @pytest.mark.asyncio
+    async def test_lock_timeout_and_replication_lag_throttle(self):
+        handler = NotNullColumnHandler()
+        connection = FakeBackfillConnection(
+            rows=1200, lag=[30.0, 30.0], lock_failures=1
+        )
+
+        result = await handler.execute_not_null_addition(
+            _plan(max_replication_lag=5.0), connection
+        )
+
+        stats = result.performance_metrics["backfill"]
+        assert result.result == AdditionResult.SUCCESS
+        assert stats["lock_timeouts"] == 1
+        assert stats["max_replication_lag"] == 30.0
+        assert stats["throttled_batches"] >= 3
+        # Halved after the lock timeout, then again for each lagging batch
+        assert connection.batches[:3] == [250, 125, 100]
+
+    @pytest.mark.asyncio
+    async def test_failure_keeps_committed_batches(self):
+        handler = NotNullColumnHandler()
+        connection = FakeBackfillConnection(rows=1000, lock_failures=10)
+
+        result = await handler.execute_not_null_addition(
+            _plan(max_lock_retries=1), connection
+        )
+
+        assert result.result == AdditionResult.ROLLBACK_REQUIRED
+        assert result.rollback_executed is False
+        assert connection.state["cp"]["status"] == "running"
@@ -5,6 +5,8 @@ Tests DDL operation batching logic and parallel execution safety
 without external dependencies.
 """
 
+import asyncio
+from contextlib import asynccontextmanager
 from typing import List
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -16,7 +18,10 @@ from dataflow.migrations.auto_migration_system import (
     MigrationStatus,
     MigrationType,
 )
-from dataflow.migrations.batched_migration_executor import BatchedMigrationExecutor
+from dataflow.migrations.batched_migration_executor import (
+    BatchedMigrationExecutor,
+    BatchExecutionStrategy,
+)
 
 
 class TestBatchedMigrationExecutor:
@@ -341,3 +346,143 @@ class TestBatchedMigrationExecutor:
         assert len(batches) <= 10  # Should reduce to reasonable number of batches
         total_operations = sum(len(batch) for batch in batches)
         assert total_operations == 50  # All operations should be included
+
+
+class _FakeConnection:
+    """asyncpg-style connection that records statements and transactions."""
+
+    def __init__(self, pool):
+        self.pool = pool
+        self.in_transaction = False
+
+    @asynccontextmanager
+    async def _transaction(self):
+        self.in_transaction = True
+        try:
+            yield
+        finally:
+            self.in_transaction = False
+
+    def transaction(self):
+        return self._transaction()
+
+    async def execute(self, sql):
+        self.pool.log.append((sql, self.in_transaction))
+        if sql.startswith(("SET", "RESET")):
+            return
+        if "fail" in sql:
+            raise RuntimeError("lock timeout")
+        self.pool.running += 1
+        self.pool.peak = max(self.pool.peak, self.pool.running)
+        await asyncio.sleep(0.01)
+        self.pool.running -= 1
+
+
+class _FakePool:
+    """Bounded pool handing out a distinct connection per acquire()."""
+
+    def __init__(self, size=8):
+        self.slots = asyncio.Semaphore(size)
+        self.log = []
+        self.running = 0
+        self.peak = 0
+        self.acquired = 0
+
+    @asynccontextmanager
+    async def acquire(self):
+        async with self.slots:
+            self.acquired += 1
+            yield _FakeConnection(self)
+
+
+class TestBatchedMigrationExecutorPooledParallelism:
+    """Parallel DDL on pooled connections with per-statement timeouts."""
+
+    INDEXES = [
+        f"CREATE INDEX CONCURRENTLY idx_t{i}_a ON table_{i} (a);" for i in range(6)
+    ]
+
+    @pytest.mark.asyncio
+    async def test_independent_indexes_run_concurrently(self):
+        pool = _FakePool()
+        executor = BatchedMigrationExecutor(
+            Mock(), pool=pool, max_parallel=3, lock_timeout=5
+        )
+
+        assert await executor.execute_batched_migrations([self.INDEXES])
+
+        metrics = executor.get_execution_metrics()
+        assert pool.peak == 3
+        assert pool.acquired == 6
+        assert metrics.parallel_batches == 1
+        assert metrics.strategy_used == BatchExecutionStrategy.PARALLEL
+        assert len(metrics.statement_timings) == 6
+        assert all(t.parallel and t.success for t in metrics.statement_timings)
+        # CONCURRENTLY cannot run in a transaction; session timeout is reset
+        ddl = [entry for entry in pool.log if "INDEX" in entry[0]]
+        assert all(in_tx is False for _, in_tx in ddl)
+        assert pool.log.count(("SET lock_timeout = 5000", False)) == 6
+        assert pool.log.count(("RESET lock_timeout", False)) == 6
+
+    @pytest.mark.asyncio
+    async def test_dependent_or_unknown_batches_stay_sequential(self):
+        pool = _FakePool()
+        executor = BatchedMigrationExecutor(Mock(), pool=pool)
+        executor.connection = _FakeConnection(pool)
+
+        batches = [
+            [
+                "CREATE TABLE users (id SERIAL PRIMARY KEY);",
+                "CREATE TABLE posts (id SERIAL, user_id INT REFERENCES users(id));",
+            ],
+            ["ALTER TABLE users ADD COLUMN email TEXT;", "VACUUM users;"],
+        ]
+        assert await executor.execute_batched_migrations(batches)
+
+        metrics = executor.get_execution_metrics()
+        assert metrics.sequential_batches == 2
+        assert pool.acquired == 0
+        assert pool.peak == 1
+
+    @pytest.mark.asyncio
+    async def test_statement_timeout_is_local_inside_transactions(self):
+        pool = _FakePool()
+        executor = BatchedMigrationExecutor(Mock(), pool=pool, statement_timeout=1.5)
+
+        batch = [f"CREATE TABLE t{i} (id INT);" for i in range(2)]
+        assert await executor.execute_batched_migrations([batch])
+
+        assert pool.log.count(("SET LOCAL statement_timeout = 1500", True)) == 2
+        assert not any(sql.startswith("RESET") for sql, _ in pool.log)
+
+    @pytest.mark.asyncio
+    async def test_failed_statement_is_reported_with_timing(self):
+        pool = _FakePool()
+        executor = BatchedMigrationExecutor(Mock(), pool=pool)
+
+        batch = self.INDEXES[:2] + ["CREATE INDEX idx_fail ON other (a);"]
+        assert not await executor.execute_batched_migrations([batch])
+
+        timings = executor._statement_timings
+        assert len(timings) == 3
+        assert [t.success for t in timings].count(False) == 1
+
+    def test_parse_statement_and_fk_safety(self):
+        executor = BatchedMigrationExecutor(Mock())
+
+        operation = executor._parse_statement(
+            'CREATE UNIQUE INDEX IF NOT EXISTS idx ON "public"."Orders" (id)'
+        )
+        assert operation.operation_type == MigrationType.ADD_INDEX
+        assert operation.table_name == "orders"
+        assert executor._parse_statement("DROP TABLE users") is None
+
+        users = executor._parse_statement("CREATE TABLE users (id INT)")
+        posts = executor._parse_statement(
+            "CREATE TABLE posts (user_id INT REFERENCES users(id))"
+        )
+        tags = executor._parse_statement("CREATE TABLE tags (id INT)")
+        assert not executor._is_safe_for_parallel([users, posts])
+        assert executor._is_safe_for_parallel([users, tags])
+        # Parallel execution needs a pool
+        assert not executor._can_run_in_parallel(self.INDEXES)
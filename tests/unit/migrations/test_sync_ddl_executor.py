@@ -71,13 +71,11 @@ class TestSyncDDLExecutor:
         try:
             executor = SyncDDLExecutor(f"sqlite:///{db_path}")
 
-            executor.execute_ddl(
-                """CREATE TABLE test_columns (
+            executor.execute_ddl("""CREATE TABLE test_columns (
                     id INTEGER PRIMARY KEY,
                     name TEXT NOT NULL,
                     email TEXT
-                )"""
-            )
+                )""")
 
             columns = executor.get_table_columns("test_columns")
 
@@ -241,3 +239,42 @@ class TestSyncDDLEdgeCases:
         finally:
             if os.path.exists(db_path):
                 os.unlink(db_path)
+
+
+@pytest.mark.unit
+class TestSyncDDLTransaction:
+    """Test single-transaction DDL and catalog snapshots."""
+
+    def test_transaction_applies_all_statements(self, tmp_path):
+        """All statements are applied over one connection."""
+        executor = SyncDDLExecutor(f"sqlite:///{tmp_path / 'tx.db'}")
+        result = executor.execute_ddl_transaction(
+            [
+                "CREATE TABLE a (id INTEGER PRIMARY KEY, name TEXT)",
+                "CREATE TABLE b (id INTEGER PRIMARY KEY)",
+                "CREATE INDEX idx_a_name ON a (name)",
+            ]
+        )
+
+        assert result["success"] is True
+        assert result["executed_count"] == 3
+        assert result["transactional"] is True
+
+        snapshot = executor.get_catalog_snapshot()
+        assert {"a", "b"} <= snapshot["tables"]
+        assert "idx_a_name" in snapshot["indexes"]
+
+    def test_transaction_rolls_back_on_failure(self, tmp_path):
+        """A failing statement leaves no partial schema behind."""
+        executor = SyncDDLExecutor(f"sqlite:///{tmp_path / 'tx.db'}")
+        result = executor.execute_ddl_transaction(
+            [
+                "CREATE TABLE kept (id INTEGER PRIMARY KEY)",
+                "CREATE INDEX idx_missing ON no_such_table (id)",
+            ]
+        )
+
+        assert result["success"] is False
+        assert result["executed_count"] == 0
+        assert "no_such_table" in result["failed_sql"]
+        assert executor.table_exists("kept") is False
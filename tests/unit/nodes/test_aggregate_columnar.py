@@ -0,0 +1,116 @@
+"""
+Unit Tests for the columnar AggregateNode engine
+
+Checks that the vectorized aggregation returns the same results as the
+row-wise implementation for every function, with and without grouping,
+and that several aggregates can be computed in one call.
+"""
+
+import random
+
+import pytest
+
+from dataflow.nodes.aggregate_operations import AggregateNode
+from dataflow.nodes.columnar_aggregation import aggregate_records
+
+FUNCTIONS = ["sum", "average", "count", "min", "max", "median", "mode", "std"]
+FUNCTIONS += ["variance", "unknown"]
+
+
+def _records(count=500, seed=7):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        amount = rng.choice([rng.randint(0, 20), rng.random() * 100, None, "n/a"])
+        records.append(
+            {
+                "id": i,
+                "amount": amount,
+                "region": rng.choice(["eu", "us", "apac", None]),
+                "tier": rng.choice([1, 2, "1"]),
+            }
+        )
+    return records
+
+
+def _assert_same(columnar, rowwise):
+    if isinstance(rowwise, dict):
+        assert list(columnar) == list(rowwise)
+        for name, group in rowwise.items():
+            assert columnar[name]["count"] == group["count"]
+            assert columnar[name]["group_fields"] == group["group_fields"]
+            _assert_same(columnar[name]["value"], group["value"])
+    elif rowwise is None:
+        assert columnar is None
+    else:
+        assert columnar == pytest.approx(rowwise)
+
+
+@pytest.mark.unit
+class TestColumnarAggregation:
+    @pytest.mark.parametrize("function", FUNCTIONS)
+    @pytest.mark.parametrize("group_by", [[], ["region"], ["region", "tier"]])
+    def test_matches_rowwise_implementation(self, function, group_by):
+        node = AggregateNode()
+        data = _records()
+
+        (columnar,) = aggregate_records(data, [(function, "amount")], group_by)
+        if group_by:
+            rowwise = node._aggregate_grouped(data, function, "amount", group_by)
+        else:
+            rowwise = node._aggregate_values(data, function, "amount")
+
+        _assert_same(columnar, rowwise)
+
+    def test_groups_follow_str_of_value(self):
+        data = [{"g": 1, "v": 1}, {"g": True, "v": 2}, {"g": 1.0, "v": 3}]
+        data += [{"g": "1", "v": 4}]
+
+        (result,) = aggregate_records(data, [("sum", "v")], ["g"])
+
+        assert {name: group["value"] for name, group in result.items()} == {
+            "1": 5.0,
+            "True": 2.0,
+            "1.0": 3.0,
+        }
+
+    def test_mode_returns_first_seen_value_on_ties(self):
+        data = [{"v": 3}, {"v": 1}, {"v": 1}, {"v": 3}, {"v": 2}]
+        assert aggregate_records(data, [("mode", "v")], []) == [3.0]
+
+    def test_single_value_spread_is_zero_and_empty_groups_are_none(self):
+        data = [{"g": "a", "v": 5}, {"g": "b", "v": None}]
+
+        std, count = aggregate_records(data, [("std", "v"), ("count", None)], ["g"])
+
+        assert std["a"]["value"] == 0
+        assert std["b"]["value"] is None
+        assert count["b"] == {"value": 1, "count": 1, "group_fields": {"g": "b"}}
+
+    def test_node_computes_multiple_aggregations(self):
+        data = [
+            {"region": "eu", "amount": 10.0, "qty": 1},
+            {"region": "us", "amount": 4.0, "qty": 3},
+            {"region": "eu", "amount": 2.0, "qty": 5},
+        ]
+
+        output = AggregateNode().execute(
+            data=data,
+            aggregate_expression="sum of amount by region",
+            aggregations=[
+                "max of qty",
+                {"function": "average", "field": "amount", "name": "avg"},
+            ],
+        )
+
+        assert output["result"]["eu"]["value"] == 12.0
+        assert output["aggregations"]["max_qty"]["eu"]["value"] == 5.0
+        assert output["aggregations"]["avg"]["us"]["value"] == 4.0
+
+    def test_node_output_unchanged_without_aggregations(self):
+        output = AggregateNode().execute(
+            data=[{"amount": 1}, {"amount": 2}], aggregate_expression="sum of amount"
+        )
+
+        assert output["result"] == 3.0
+        assert "aggregations" not in output
@@ -12,6 +12,7 @@ from dataflow.adapters.mongodb import MongoDBAdapter
 from dataflow.nodes.mongodb_nodes import (
     AggregateNode,
     BulkDocumentInsertNode,
+    BulkDocumentWriteNode,
     CreateIndexNode,
     DocumentCountNode,
     DocumentDeleteNode,
@@ -512,6 +513,85 @@ class TestBulkDocumentInsertNode:
         assert "error" in result
 
 
+class TestBulkDocumentWriteNode:
+    """Test BulkDocumentWriteNode."""
+
+    def test_node_parameters(self):
+        """Test node parameters are properly defined."""
+        params = BulkDocumentWriteNode().get_parameters()
+
+        assert params["collection"].required is True
+        assert params["operations"].required is True
+        assert params["ordered"].default is False
+        assert params["batch_size"].default == 1000
+
+    @pytest.mark.asyncio
+    async def test_async_run_success(self):
+        """Test successful bulk write."""
+        node = BulkDocumentWriteNode()
+
+        mock_adapter = MagicMock(spec=MongoDBAdapter)
+        mock_adapter.bulk_write = AsyncMock(
+            return_value={
+                "inserted_count": 1,
+                "matched_count": 1,
+                "modified_count": 1,
+                "deleted_count": 0,
+                "upserted_count": 0,
+                "upserted_ids": {},
+                "batches": 1,
+                "errors": [],
+            }
+        )
+        mock_dataflow = MagicMock()
+        mock_dataflow.adapter = mock_adapter
+        node.dataflow_instance = mock_dataflow
+
+        operations = [
+            {"op": "insert", "document": {"name": "Alice"}},
+            {"op": "update_one", "filter": {"name": "Bob"}, "update": {"$set": {}}},
+        ]
+        result = await node.async_run(
+            collection="users", operations=operations, batch_size=500
+        )
+
+        assert result["success"] is True
+        assert result["inserted_count"] == 1
+        assert result["collection"] == "users"
+        call = mock_adapter.bulk_write.call_args.kwargs
+        assert call["ordered"] is False
+        assert call["batch_size"] == 500
+
+    @pytest.mark.asyncio
+    async def test_async_run_reports_write_errors(self):
+        """Partial failures are reported, not raised."""
+        node = BulkDocumentWriteNode()
+
+        mock_adapter = MagicMock(spec=MongoDBAdapter)
+        mock_adapter.bulk_write = AsyncMock(
+            return_value={
+                "inserted_count": 0,
+                "matched_count": 0,
+                "modified_count": 0,
+                "deleted_count": 0,
+                "upserted_count": 0,
+                "upserted_ids": {},
+                "batches": 1,
+                "errors": [{"index": 0, "code": 11000, "message": "dup key"}],
+            }
+        )
+        mock_dataflow = MagicMock()
+        mock_dataflow.adapter = mock_adapter
+        node.dataflow_instance = mock_dataflow
+
+        result = await node.async_run(
+            collection="users", operations=[{"op": "insert", "document": {}}]
+        )
+
+        assert result["success"] is False
+        assert result["errors"][0]["index"] == 0
+
+
 class TestCreateIndexNode:
     """Test CreateIndexNode."""
 
@@ -0,0 +1,203 @@
+"""Unit tests for DataFlowSagaCoordinatorNode.
+
+Steps are plain async callables that record their calls; durable
+checkpoints go to a SQLite file under tmp_path.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from dataflow.nodes.saga_checkpoint_store import (
+    SagaCheckpointStore,
+    definition_fingerprint,
+)
+from dataflow.nodes.saga_coordinator import DataFlowSagaCoordinatorNode
+
+
+class StepRecorder:
+    """Builds step actions and compensations that log their invocations."""
+
+    def __init__(self, delay=0.0, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.calls = []
+
+    def action(self, step_id, updates=None):
+        async def run(context):
+            self.calls.append(("run", step_id))
+            await asyncio.sleep(self.delay)
+            if step_id in self.fail:
+                raise RuntimeError(f"{step_id} failed")
+            return {"step": step_id, "context_updates": updates or {}}
+
+        return run
+
+    def compensation(self, step_id):
+        async def undo(context):
+            self.calls.append(("undo", step_id))
+            await asyncio.sleep(self.delay)
+
+        return undo
+
+    def step(self, step_id, depends_on=None, updates=None):
+        step = {
+            "id": step_id,
+            "name": step_id,
+            "action": self.action(step_id, updates),
+            "compensation": self.compensation(step_id),
+        }
+        if depends_on is not None:
+            step["depends_on"] = depends_on
+        return step
+
+    def ran(self, kind):
+        return [step_id for call, step_id in self.calls if call == kind]
+
+
+def _node(**config):
+    config.setdefault("max_retries", 1)
+    return DataFlowSagaCoordinatorNode(**config)
+
+
+def _diamond(recorder, **updates):
+    return {
+        "steps": [
+            recorder.step("reserve", depends_on=[], updates=updates.get("reserve")),
+            recorder.step("charge", depends_on=["reserve"]),
+            recorder.step("notify", depends_on=["reserve"]),
+            recorder.step("ship", depends_on=["charge", "notify"]),
+        ]
+    }
+
+
+def _fingerprint(recorder):
+    return definition_fingerprint(_diamond(recorder)["steps"])
+
+
+class TestSagaStepLevels:
+    @pytest.mark.asyncio
+    async def test_independent_steps_run_concurrently(self):
+        recorder = StepRecorder(delay=0.2)
+        definition = {
+            "steps": [recorder.step(f"s{i}", depends_on=[]) for i in range(4)]
+        }
+
+        start = time.perf_counter()
+        result = await _node().async_run(saga_definition=definition)
+        elapsed = time.perf_counter() - start
+
+        assert result["success"] is True
+        assert result["metadata"]["parallel_levels"] == 1
+        assert elapsed < 0.6  # one step latency, not four
+
+    @pytest.mark.asyncio
+    async def test_steps_without_dependencies_stay_sequential(self):
+        recorder = StepRecorder()
+        definition = {"steps": [recorder.step(f"s{i}") for i in range(3)]}
+
+        result = await _node().async_run(saga_definition=definition)
+
+        assert result["success"] is True
+        assert result["metadata"]["parallel_levels"] == 3
+        assert recorder.ran("run") == ["s0", "s1", "s2"]
+
+    @pytest.mark.parametrize(
+        "depends_on, message",
+        [(["missing"], "unknown steps"), (["b"], "cycle")],
+    )
+    def test_invalid_dependencies_are_rejected(self, depends_on, message):
+        recorder = StepRecorder()
+        definition = {
+            "steps": [
+                recorder.step("a", depends_on=depends_on),
+                recorder.step("b", depends_on=["a"]),
+            ]
+        }
+
+        validation = _node()._validate_saga_definition(definition)
+
+        assert validation["valid"] is False
+        assert message in validation["errors"][0]
+
+    @pytest.mark.asyncio
+    async def test_failure_compensates_levels_in_reverse(self):
+        recorder = StepRecorder(fail={"ship"})
+
+        result = await _node().async_run(saga_definition=_diamond(recorder))
+
+        assert result["success"] is False
+        assert result["failed_step"]["id"] == "ship"
+        assert result["final_state"] == "compensated"
+        undone = recorder.ran("undo")
+        assert sorted(undone[:2]) == ["charge", "notify"]
+        assert undone[2] == "reserve"
+
+
+class TestSagaCheckpoints:
+    @pytest.mark.asyncio
+    async def test_checkpoints_hold_only_step_deltas(self, tmp_path):
+        recorder = StepRecorder()
+        node = _node(checkpoint_path=str(tmp_path / "sagas.db"))
+
+        result = await node.async_run(
+            saga_definition=_diamond(recorder, reserve={"reservation": "r-1"}),
+            initial_context={"order": 1},
+        )
+
+        assert result["success"] is True
+        assert result["metadata"]["checkpoints_created"] == 4
+
+        restored = await node.checkpoint_store.load(
+            result["saga_id"], _fingerprint(recorder)
+        )
+        assert restored.state == "completed"
+        assert restored.context == {"order": 1, "reservation": "r-1"}
+        assert [step["id"] for step in restored.completed_steps][0] == "reserve"
+        events = node.checkpoint_store._connection.execute(
+            "SELECT context_updates FROM saga_step_events"
+        ).fetchall()
+        # Only the reserve step changed the context; no full snapshots
+        assert [updates for (updates,) in events if updates] == [
+            '{"reservation": "r-1"}'
+        ]
+
+    @pytest.mark.asyncio
+    async def test_restart_resumes_after_completed_steps(self, tmp_path):
+        path = str(tmp_path / "sagas.db")
+        first = StepRecorder(fail={"charge"})
+        failing = _node(checkpoint_path=path, compensation_strategy="none")
+        definition = _diamond(first, reserve={"reservation": "r-1"})
+
+        crashed = await failing.async_run(
+            saga_id="order-1", saga_definition=definition, initial_context={}
+        )
+        assert crashed["success"] is False
+        failing.checkpoint_store.close()
+
+        # Pretend the process died mid-run, before the failure was recorded
+        store = SagaCheckpointStore(path)
+        await store.set_state("order-1", "running")
+        second = StepRecorder()
+        resumed = await _node(checkpoint_store=store).async_run(
+            saga_id="order-1",
+            saga_definition=_diamond(second),
+            initial_context={},
+        )
+
+        assert resumed["success"] is True
+        assert resumed["metadata"]["resumed_steps"] == 2
+        assert sorted(second.ran("run")) == ["charge", "ship"]
+        assert resumed["final_context"] == {"reservation": "r-1"}
+
+    @pytest.mark.asyncio
+    async def test_changed_definition_is_not_resumed(self, tmp_path):
+        path = str(tmp_path / "sagas.db")
+        recorder = StepRecorder()
+        node = _node(checkpoint_path=path)
+        await node.async_run(saga_id="order-2", saga_definition=_diamond(recorder))
+
+        changed = {"steps": _diamond(recorder)["steps"][:3]}
+        with pytest.raises(ValueError, match="different definition"):
+            await node.async_run(saga_id="order-2", saga_definition=changed)
@@ -0,0 +1,254 @@
+"""Unit tests for DataFlowTwoPhaseCommitNode and its decision log.
+
+Participants are driven through a recording participant handler with
+configurable latencies and votes; the decision log writes to tmp_path.
+"""
+
+import asyncio
+import json
+import time
+
+import pytest
+
+from dataflow.nodes.two_phase_commit_coordinator import DataFlowTwoPhaseCommitNode
+from dataflow.nodes.two_phase_commit_log import TwoPhaseCommitLog
+
+
+class RecordingHandler:
+    """Participant handler with per-participant latency, votes and failures."""
+
+    def __init__(self, delay=0.0, votes=None, commit_failures=None):
+        self.delay = delay
+        self.votes = votes or {}
+        self.commit_failures = dict(commit_failures or {})
+        self.calls = []
+
+    async def prepare(self, participant, transaction_id, data):
+        self.calls.append(("prepare", participant["id"]))
+        await asyncio.sleep(participant.get("delay", self.delay))
+        return self.votes.get(participant["id"], True)
+
+    async def commit(self, participant, transaction_id, data):
+        self.calls.append(("commit", participant["id"]))
+        if self.commit_failures.get(participant["id"], 0) > 0:
+            self.commit_failures[participant["id"]] -= 1
+            raise ConnectionError("participant unreachable")
+
+    async def abort(self, participant, transaction_id, data):
+        self.calls.append(("abort", participant["id"]))
+
+    def actions(self, action):
+        return sorted(pid for kind, pid in self.calls if kind == action)
+
+
+def _node(handler, **config):
+    config.setdefault("recovery_interval", 0)
+    return DataFlowTwoPhaseCommitNode(participant_handler=handler, **config)
+
+
+def _participants(count, **extra):
+    return [{"id": f"db{i}", "name": f"db{i}", **extra} for i in range(count)]
+
+
+class TestTwoPhaseCommitCoordinator:
+    @pytest.mark.asyncio
+    async def test_prepare_runs_concurrently(self):
+        handler = RecordingHandler(delay=0.1)
+        node = _node(handler)
+
+        start = time.perf_counter()
+        result = await node.async_run(
+            participants=_participants(5), transaction_data={"amount": 10}
+        )
+        elapsed = time.perf_counter() - start
+
+        assert result["success"] is True
+        assert result["final_phase"] == "committed"
+        assert result["participants_committed"] == 5
+        assert elapsed < 0.4  # max of the latencies, not their sum
+        assert handler.actions("commit") == [f"db{i}" for i in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_no_vote_cancels_outstanding_prepares_and_aborts(self):
+        handler = RecordingHandler(votes={"db0": False})
+        participants = _participants(3)
+        participants[1]["delay"] = 5.0
+        node = _node(handler)
+
+        start = time.perf_counter()
+        result = await node.async_run(participants=participants, transaction_data={})
+
+        assert time.perf_counter() - start < 1.0
+        assert result["success"] is False
+        assert result["final_phase"] == "aborted"
+        # db0 voted no; db1 was cancelled mid-prepare and db2 prepared
+        assert handler.actions("abort") == ["db1", "db2"]
+        assert handler.actions("commit") == []
+
+    @pytest.mark.asyncio
+    async def test_prepare_timeout_aborts(self):
+        handler = RecordingHandler()
+        participants = _participants(2)
+        participants[0]["delay"] = 1.0
+        node = _node(handler, prepare_timeout=0.05)
+
+        result = await node.async_run(participants=participants, transaction_data={})
+
+        assert result["success"] is False
+        assert "timed out" in result["failure_reasons"][0]
+        assert handler.actions("abort") == ["db0", "db1"]
+
+    @pytest.mark.asyncio
+    async def test_synchronous_prepare_stops_at_first_failure(self):
+        handler = RecordingHandler(votes={"db1": False})
+        node = _node(handler)
+
+        result = await node.async_run(
+            participants=_participants(4),
+            transaction_data={},
+            synchronous_prepare=True,
+        )
+
+        assert result["success"] is False
+        assert handler.actions("prepare") == ["db0", "db1"]
+        assert handler.actions("abort") == ["db0"]
+
+    @pytest.mark.asyncio
+    async def test_commit_retries_after_decision(self):
+        handler = RecordingHandler(commit_failures={"db1": 2})
+        node = _node(handler, max_commit_retries=3)
+
+        result = await node.async_run(
+            participants=_participants(2), transaction_data={}
+        )
+
+        assert result["success"] is True
+        assert result["metadata"]["recovered_after_commit_failure"] is True
+        assert handler.actions("commit").count("db1") == 3
+
+    @pytest.mark.asyncio
+    async def test_failure_after_commit_decision_reports_committed(self):
+        handler = RecordingHandler()
+        node = _node(handler)
+
+        async def crashing_commit_phase(*args, **kwargs):
+            raise RuntimeError("coordinator lost its connection")
+
+        node._commit_phase = crashing_commit_phase
+        result = await node.async_run(
+            participants=_participants(2), transaction_data={}
+        )
+
+        assert result["final_phase"] == "committed"
+        assert result["success"] is False
+        assert result["pending_participants"] == ["db0", "db1"]
+        assert "lost its connection" in result["failure_reasons"][0]
+        assert handler.actions("abort") == []
+
+
+class TestDecisionLogRecovery:
+    @pytest.mark.asyncio
+    async def test_commit_decision_is_forced_before_commit(self, tmp_path):
+        path = tmp_path / "2pc.log"
+        seen = []
+
+        class CheckingHandler(RecordingHandler):
+            async def commit(self, participant, transaction_id, data):
+                seen.append(path.read_text())
+                await super().commit(participant, transaction_id, data)
+
+        node = _node(CheckingHandler(), decision_log_path=str(path))
+        result = await node.async_run(
+            participants=_participants(2), transaction_data={}
+        )
+
+        assert result["success"] is True
+        decision = {"t": "c", "x": result["transaction_id"]}
+        assert all(json.dumps(decision, separators=(",", ":")) in s for s in seen)
+        assert await node.decision_log.unfinished() == {}
+
+    @pytest.mark.asyncio
+    async def test_recovery_replays_commits_and_presumes_abort(self, tmp_path):
+        path = str(tmp_path / "2pc.log")
+        log = TwoPhaseCommitLog(path)
+        participants = _participants(3)
+        # Crash after the commit decision, with db0 already committed
+        await log.log_begin("tx-commit", participants)
+        await log.log_decision("tx-commit", commit=True)
+        await log.log_ack("tx-commit", "db0")
+        # Crash during prepare: no decision was logged
+        await log.log_begin("tx-prepare", participants[:2])
+        await log.flush()
+        log.close()
+        with open(path, "a") as log_file:
+            log_file.write('{"t":"c","x":"tx-to')  # torn write
+
+        handler = RecordingHandler()
+        node = _node(handler, decision_log_path=path)
+        result = await node.async_run(
+            participants=_participants(1), transaction_data={}
+        )
+
+        assert result["success"] is True
+        # Recovery: commit db1/db2 of tx-commit, abort both of tx-prepare
+        assert handler.actions("commit") == ["db0", "db1", "db2"]
+        assert handler.actions("abort") == ["db0", "db1"]
+        assert await node.decision_log.unfinished() == {}
+
+        with open(path) as log_file:
+            records = [json.loads(line) for line in log_file]
+        # Compacted: only the newest (already finished) transaction remains
+        assert {r["x"] for r in records} == {result["transaction_id"]}
+
+    @pytest.mark.asyncio
+    async def test_failed_recovery_keeps_transaction(self, tmp_path):
+        path = str(tmp_path / "2pc.log")
+        log = TwoPhaseCommitLog(path)
+        await log.log_begin("tx-1", _participants(2))
+        await log.log_decision("tx-1", commit=True)
+
+        node = _node(RecordingHandler(commit_failures={"db1": 1}), decision_log=log)
+        outcomes = await node.recover_transactions()
+
+        assert outcomes == [
+            {
+                "transaction_id": "tx-1",
+                "decision": "commit",
+                "participants": 2,
+                "resolved": False,
+            }
+        ]
+        unfinished = await log.unfinished()
+        assert unfinished["tx-1"]["acked"] == {"db0"}
+
+        outcomes = await node.recover_transactions()
+        assert outcomes[0]["resolved"] and outcomes[0]["participants"] == 1
+        assert await log.unfinished() == {}
+
+
+class TestTwoPhaseCommitLog:
+    @pytest.mark.asyncio
+    async def test_concurrent_decisions_share_fsyncs(self, tmp_path):
+        log = TwoPhaseCommitLog(str(tmp_path / "2pc.log"))
+
+        await asyncio.gather(
+            *(log.log_decision(f"tx-{i}", commit=True) for i in range(50))
+        )
+
+        assert log.stats["records"] == 50
+        assert log.stats["fsyncs"] < 10
+        assert len(await log.unfinished()) == 50
+
+    @pytest.mark.asyncio
+    async def test_compacts_after_threshold(self, tmp_path):
+        log = TwoPhaseCommitLog(str(tmp_path / "2pc.log"), compact_threshold=5)
+
+        for i in range(6):
+            await log.log_begin(f"tx-{i}", _participants(1))
+            await log.log_decision(f"tx-{i}", commit=True)
+            if i < 5:
+                await log.log_end(f"tx-{i}")
+        await log.flush()
+
+        assert log.stats["compactions"] == 1
+        assert list(await log.unfinished()) == ["tx-5"]
@@ -0,0 +1,194 @@
+"""Unit tests for TokenBucketRateLimiter and its use by TenantSecurityManager.
+
+Time is driven by a manual clock; the shared backend runs against a
+dictionary-backed stand-in for a synchronous Redis client.
+"""
+
+import threading
+
+import pytest
+
+from dataflow.tenancy.rate_limiter import TokenBucketRateLimiter
+from dataflow.tenancy.security import TenantSecurityManager
+
+
+class ManualClock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class FakeRedis:
+    """The INCR / DECR / GET / EXPIRE subset used by the shared limiter."""
+
+    def __init__(self):
+        self.values = {}
+        self.ttls = {}
+        self.fail = False
+
+    def _check(self):
+        if self.fail:
+            raise ConnectionError("redis unavailable")
+
+    def incr(self, key):
+        self._check()
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def decr(self, key):
+        self._check()
+        self.values[key] = self.values.get(key, 0) - 1
+        return self.values[key]
+
+    def get(self, key):
+        self._check()
+        value = self.values.get(key)
+        return None if value is None else str(value).encode()
+
+    def expire(self, key, seconds):
+        self._check()
+        self.ttls[key] = seconds
+
+
+class TestLocalTokenBucket:
+    def test_burst_then_sustained_rate(self):
+        clock = ManualClock()
+        limiter = TokenBucketRateLimiter(clock=clock)
+
+        admitted = [limiter.acquire("t1", 60, burst=10).allowed for _ in range(12)]
+        assert admitted == [True] * 10 + [False] * 2
+
+        rejected = limiter.acquire("t1", 60, burst=10)
+        assert rejected.retry_after == pytest.approx(1.0)
+
+        clock.advance(2.5)  # refills 2.5 tokens at one per second
+        assert [limiter.acquire("t1", 60, burst=10).allowed for _ in range(3)] == [
+            True,
+            True,
+            False,
+        ]
+
+    def test_refill_is_capped_at_capacity(self):
+        clock = ManualClock()
+        limiter = TokenBucketRateLimiter(clock=clock)
+        limiter.acquire("t1", 120)
+
+        clock.advance(3600)
+        decision = limiter.acquire("t1", 120)
+
+        assert decision.allowed and decision.remaining == 119
+
+    def test_tenants_have_separate_buckets_and_metrics(self):
+        limiter = TokenBucketRateLimiter(clock=ManualClock())
+        for _ in range(3):
+            limiter.acquire("busy", 2)
+        limiter.acquire("quiet", 2)
+
+        assert limiter.get_metrics("busy")["rejected"] == 1
+        assert limiter.get_metrics("quiet") == {
+            "allowed": 1,
+            "rejected": 0,
+            "rejection_rate": 0.0,
+            "backend": "local",
+            "backend_errors": 0,
+        }
+        assert limiter.get_metrics()["allowed"] == 3
+
+    def test_metrics_are_exact_under_concurrent_threads(self):
+        limiter = TokenBucketRateLimiter(clock=ManualClock())
+
+        def worker():
+            for _ in range(500):
+                limiter.acquire("t1", 1000)
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics = limiter.get_metrics("t1")
+        assert metrics["allowed"] == 1000
+        assert metrics["rejected"] == 3000
+
+    def test_state_does_not_grow_with_query_volume(self):
+        limiter = TokenBucketRateLimiter(clock=ManualClock())
+        for _ in range(10_000):
+            limiter.acquire("t1", 5000)
+
+        assert len(limiter._buckets) == 1
+
+
+class TestSharedBackend:
+    def test_limit_holds_across_workers(self):
+        clock = ManualClock(now=600.0)  # start of a window
+        redis = FakeRedis()
+        workers = [
+            TokenBucketRateLimiter(redis_client=redis, clock=clock) for _ in range(3)
+        ]
+
+        admitted = sum(workers[i % 3].acquire("t1", 60).allowed for i in range(90))
+
+        assert admitted == 60
+        # Rejected queries give their slot back
+        assert redis.values["dataflow:ratelimit:t1:10"] == 60
+        assert redis.ttls["dataflow:ratelimit:t1:10"] == 120
+
+    def test_previous_window_is_weighted(self):
+        clock = ManualClock(now=600.0)
+        limiter = TokenBucketRateLimiter(redis_client=FakeRedis(), clock=clock)
+        for _ in range(60):
+            limiter.acquire("t1", 60)
+
+        clock.advance(75)  # a quarter into the next window: 45 still count
+        admitted = sum(limiter.acquire("t1", 60).allowed for _ in range(30))
+
+        assert admitted == 15
+        assert limiter.acquire("t1", 60).retry_after == pytest.approx(1.0)
+
+    def test_burst_widens_the_window(self):
+        clock = ManualClock(now=1200.0)
+        redis = FakeRedis()
+        limiter = TokenBucketRateLimiter(redis_client=redis, clock=clock)
+
+        admitted = sum(limiter.acquire("t1", 60, burst=120).allowed for _ in range(150))
+
+        assert admitted == 120
+        assert redis.ttls["dataflow:ratelimit:t1:10"] == 240
+
+    def test_falls_back_to_local_bucket_when_redis_fails(self):
+        redis = FakeRedis()
+        redis.fail = True
+        limiter = TokenBucketRateLimiter(redis_client=redis, clock=ManualClock())
+
+        admitted = [limiter.acquire("t1", 2).allowed for _ in range(3)]
+
+        assert admitted == [True, True, False]
+        assert limiter.get_metrics()["backend_errors"] == 3
+
+
+class TestTenantSecurityManagerRateLimit:
+    def test_validate_operation_enforces_burst_capacity(self):
+        manager = TenantSecurityManager(
+            rate_limiter=TokenBucketRateLimiter(clock=ManualClock())
+        )
+        manager.register_tenant("t1", max_queries_per_minute=60, burst_capacity=3)
+
+        results = [
+            manager.validate_operation("t1", "SELECT", "SELECT 1", ["users"])
+            for _ in range(4)
+        ]
+
+        assert [r["valid"] for r in results] == [True, True, True, False]
+        assert [r.get("rate_limit_remaining") for r in results[:3]] == [2, 1, 0]
+        assert "Rate limit exceeded" in results[3]["error"]
+
+        metrics = manager.get_security_metrics("t1")
+        assert metrics["rate_limit_violations"] == 1
+        assert metrics["rate_limited_queries"] == 1
+        assert metrics["rate_limit_rejection_rate"] == pytest.approx(0.25)
@@ -235,3 +235,112 @@ def test_confidence_threshold(categorizer):
         "RUNTIME",
         "UNKNOWN",
     ]
+
+
+def _brute_force_categorize(categorizer, error):
+    """Reference categorization scoring every pattern (pre-index behavior)."""
+    features = categorizer._extract_features(error)
+    matches = []
+    for pattern_id, pattern in categorizer.knowledge_base.patterns.items():
+        score = categorizer._match_pattern(pattern_id, pattern, error, features)
+        if score >= 0.5:
+            matches.append((pattern_id, pattern, score))
+    if not matches:
+        return "UNKNOWN", 0.0
+    best_pattern_id, _, confidence = max(matches, key=lambda x: x[2])
+    return best_pattern_id, confidence
+
+
+def test_indexed_categorize_matches_brute_force(categorizer, knowledge_base):
+    """Test the compiled index never changes the selected pattern."""
+    error_types = ["ValueError", "KeyError", "TypeError", "Exception"]
+    messages = [
+        example
+        for pattern in knowledge_base.patterns.values()
+        for example in pattern.get("examples", [])
+    ]
+    messages += ["Generic error message", "", "ıd required"]
+
+    for message in messages:
+        for error_type in error_types:
+            error = CapturedError(
+                exception=Exception(message),
+                error_type=error_type,
+                message=message,
+                stacktrace=[],
+                context={},
+                timestamp=datetime.now(),
+            )
+            expected_id, expected_confidence = _brute_force_categorize(
+                categorizer, error
+            )
+            category = categorizer.categorize(error)
+            assert category.pattern_id == expected_id, message
+            assert category.confidence == expected_confidence
+
+
+def test_index_prefilters_candidates(categorizer):
+    """Test candidates are narrowed before regex scoring."""
+    index = categorizer._get_index()
+    candidates = index.candidates("Source node 'user_create' not found", "KeyError")
+
+    assert 0 < len(candidates) < len(index.patterns)
+
+
+def test_categorize_memoizes_error_signature(categorizer):
+    """Test repeated identical errors are served from the memo."""
+    error = CapturedError(
+        exception=ValueError("Missing required parameter 'id'"),
+        error_type="ValueError",
+        message="Missing required parameter 'id'",
+        stacktrace=[],
+        context={"operation": "CREATE"},
+        timestamp=datetime.now(),
+    )
+
+    first = categorizer.categorize(error)
+    second = categorizer.categorize(error)
+
+    assert categorizer.cache_hits == 1
+    assert second.pattern_id == first.pattern_id
+    assert second.features["operation"] == "CREATE"
+
+
+def test_categorize_cache_is_bounded(knowledge_base):
+    """Test the memo evicts least recently used signatures."""
+    categorizer = ErrorCategorizer(knowledge_base, cache_size=2)
+
+    for i in range(5):
+        categorizer.categorize(
+            CapturedError(
+                exception=Exception(f"error {i}"),
+                error_type="Exception",
+                message=f"error {i}",
+                stacktrace=[],
+                context={},
+                timestamp=datetime.now(),
+            )
+        )
+
+    assert len(categorizer._cache) == 2
+
+
+def test_index_rebuilt_after_reload(categorizer, knowledge_base):
+    """Test reloading patterns rebuilds the compiled index."""
+    index = categorizer._get_index()
+    knowledge_base.reload_patterns()
+
+    assert categorizer._get_index() is not index
+
+
+def test_index_rebuilt_after_pattern_swap(categorizer, knowledge_base):
+    """Test swapping one pattern for another, same count, rebuilds the index."""
+    index = categorizer._get_index()
+    patterns = knowledge_base.patterns
+    removed_id = next(iter(patterns))
+    patterns["DF-TEST"] = patterns.pop(removed_id)
+
+    rebuilt = categorizer._get_index()
+
+    assert rebuilt is not index
+    assert "DF-TEST" in [compiled.pattern_id for compiled in rebuilt.patterns]
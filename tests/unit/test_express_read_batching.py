@@ -0,0 +1,131 @@
+"""Unit tests for batched ExpressDataFlow.read coalescing.
+
+Concurrent reads of a model in one event-loop tick must be served by a
+single query while every caller still gets the same result as an
+unbatched read.
+"""
+
+import asyncio
+
+import pytest
+
+from dataflow import DataFlow
+from dataflow.core.tenant_context import _current_tenant, get_current_tenant_id
+from dataflow.features.express import ExpressDataFlow, ExpressReadLoader
+
+
+@pytest.fixture
+def db(tmp_path):
+    db = DataFlow(f"sqlite:///{tmp_path / 'batching.db'}")
+
+    @db.model
+    class Author:
+        name: str
+
+    return db
+
+
+async def _seed(express, count=5):
+    for i in range(1, count + 1):
+        await express.create("Author", {"id": i, "name": f"author-{i}"})
+
+
+class TestExpressReadLoader:
+    @pytest.mark.asyncio
+    async def test_same_tick_loads_share_one_fetch(self):
+        calls = []
+
+        async def fetch_many(model, ids):
+            calls.append((model, ids))
+            return {str(i): {"id": i} for i in ids if i != 3}
+
+        loader = ExpressReadLoader(fetch_many)
+        results = await asyncio.gather(
+            *(loader.load("Author", i) for i in (1, 2, 2, 3))
+        )
+
+        assert calls == [("Author", [1, 2, 3])]
+        assert results == [{"id": 1}, {"id": 2}, {"id": 2}, None]
+        assert results[1] is not results[2]
+        assert loader.get_stats()["deduplicated"] == 1
+
+    @pytest.mark.asyncio
+    async def test_batches_are_capped(self):
+        sizes = []
+
+        async def fetch_many(model, ids):
+            sizes.append(len(ids))
+            return {}
+
+        loader = ExpressReadLoader(fetch_many, max_batch_size=4)
+        await asyncio.gather(*(loader.load("Author", i) for i in range(10)))
+
+        assert sizes == [4, 4, 2]
+
+    @pytest.mark.asyncio
+    async def test_fetch_errors_reach_every_caller(self):
+        async def fetch_many(model, ids):
+            raise RuntimeError("database down")
+
+        loader = ExpressReadLoader(fetch_many)
+        results = await asyncio.gather(
+            loader.load("Author", 1), loader.load("Author", 2), return_exceptions=True
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_tenants_are_batched_separately(self):
+        calls = []
+
+        async def fetch_many(model, ids):
+            tenant_id = get_current_tenant_id()
+            calls.append((tenant_id, ids))
+            return {str(i): {"id": i, "tenant_id": tenant_id} for i in ids}
+
+        loader = ExpressReadLoader(fetch_many)
+
+        async def load_as(tenant_id, id):
+            token = _current_tenant.set(tenant_id)
+            try:
+                return await loader.load("Author", id)
+            finally:
+                _current_tenant.reset(token)
+
+        results = await asyncio.gather(
+            load_as("a", 2), load_as("b", 1), load_as("a", 3), load_as("b", 2)
+        )
+
+        assert sorted(calls) == [("a", [2, 3]), ("b", [1, 2])]
+        assert [r["tenant_id"] for r in results] == ["a", "b", "a", "b"]
+
+
+class TestBatchedExpressRead:
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_match_unbatched_reads(self, db):
+        batched = ExpressDataFlow(db, cache_enabled=False)
+        plain = ExpressDataFlow(db, cache_enabled=False, batch_reads=False)
+        await _seed(batched)
+
+        ids = ["1", 2, 3, 3, 99]
+        results = await asyncio.gather(*(batched.read("Author", i) for i in ids))
+        expected = [await plain.read("Author", i) for i in ids]
+
+        assert results == expected
+        assert results[0]["name"] == "author-1" and results[0]["found"] is True
+        assert results[-1] is None
+        stats = batched.get_read_batch_stats()
+        assert stats["batches"] == 1 and stats["requested"] == 5
+
+    @pytest.mark.asyncio
+    async def test_cache_hits_skip_the_batch(self, db):
+        express = ExpressDataFlow(db)
+        await _seed(express)
+        await express.read("Author", 1)
+
+        await asyncio.gather(express.read("Author", 1), express.read("Author", 2))
+
+        stats = express.get_read_batch_stats()
+        assert stats["requested"] == 2
+        assert stats["batches"] == 2
+
@@ -0,0 +1,174 @@
+"""Unit tests for the bounded quantile sketch histograms.
+
+Covers DDSketch accuracy and memory bounds, Prometheus bucket export, and
+the ExpressDataFlow latency statistics built on top of them.
+"""
+
+import random
+from unittest.mock import Mock
+
+import pytest
+
+from dataflow.features.express import ExpressDataFlow
+from dataflow.platform.metrics import (
+    HistogramMetric,
+    MetricsExporter,
+    PrometheusMetrics,
+    QuantileSketch,
+)
+
+
+def _exact_quantile(values, q):
+    ordered = sorted(values)
+    return ordered[int(q * (len(ordered) - 1))]
+
+
+class TestQuantileSketch:
+    @pytest.mark.parametrize("q", [0.1, 0.5, 0.9, 0.95, 0.99])
+    def test_quantiles_within_relative_accuracy(self, q):
+        rng = random.Random(3)
+        values = [rng.lognormvariate(0, 2) for _ in range(20000)]
+        sketch = QuantileSketch(relative_accuracy=0.01)
+        for value in values:
+            sketch.add(value)
+
+        exact = _exact_quantile(values, q)
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.011)
+
+    def test_negative_and_zero_values(self):
+        sketch = QuantileSketch()
+        for value in (-10.0, -1.0, 0.0, 0.0, 1.0, 10.0, 100.0):
+            sketch.add(value)
+
+        assert sketch.quantile(0) == -10.0
+        assert sketch.quantile(0.5) == 0.0
+        assert sketch.quantile(0.2) == pytest.approx(-1.0, rel=0.01)
+        assert sketch.quantile(1) == 100.0
+        assert sketch.count == 7 and sketch.sum == 100.0
+
+    def test_memory_is_bounded(self):
+        sketch = QuantileSketch(relative_accuracy=0.01, max_bins=64)
+        for i in range(1, 100000):
+            sketch.add(i * 1e-6)
+
+        assert sketch.bin_count <= 64
+        # Collapsing only affects the lowest values
+        assert sketch.quantile(0.99) == pytest.approx(0.099, rel=0.02)
+
+    def test_merge_matches_single_sketch(self):
+        rng = random.Random(5)
+        values = [rng.expovariate(1) for _ in range(5000)]
+        whole, left, right = QuantileSketch(), QuantileSketch(), QuantileSketch()
+        for i, value in enumerate(values):
+            whole.add(value)
+            (left if i % 2 else right).add(value)
+
+        left.merge(right)
+
+        assert left.count == whole.count
+        assert left.quantile(0.9) == whole.quantile(0.9)
+        assert left.sum == pytest.approx(whole.sum)
+
+    def test_merge_rejects_different_accuracy(self):
+        with pytest.raises(ValueError):
+            QuantileSketch(0.01).merge(QuantileSketch(0.02))
+
+    def test_empty_sketch(self):
+        assert QuantileSketch().quantile(0.5) is None
+
+
+class TestHistogramMetric:
+    def test_cumulative_buckets(self):
+        histogram = HistogramMetric(buckets=[0.1, 1.0])
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative_buckets() == [
+            (0.1, 2),
+            (1.0, 3),
+            (float("inf"), 4),
+        ]
+
+    def test_merge_requires_same_buckets(self):
+        with pytest.raises(ValueError):
+            HistogramMetric([1.0]).merge(HistogramMetric([2.0]))
+
+
+class TestPrometheusMetricsHistograms:
+    def test_stats_include_quantiles(self):
+        metrics = PrometheusMetrics()
+        for i in range(1, 101):
+            metrics.observe_histogram("latency", i / 100, labels={"op": "read"})
+
+        stats = metrics.get_histogram_stats("latency", labels={"op": "read"})
+
+        assert stats["count"] == 100
+        assert stats["sum"] == pytest.approx(50.5)
+        assert stats["p50"] == pytest.approx(0.5, rel=0.03)
+        assert stats["p99"] == pytest.approx(0.99, rel=0.02)
+        assert metrics.get_histogram_stats("missing") == {"count": 0, "sum": 0}
+
+    def test_aggregate_and_merge(self):
+        first, second = PrometheusMetrics(), PrometheusMetrics()
+        first.observe_histogram("latency", 1.0, labels={"op": "a"})
+        first.observe_histogram("latency", 2.0, labels={"op": "b"})
+        second.observe_histogram("latency", 3.0, labels={"op": "a"})
+        second.increment_counter("requests", value=2)
+
+        first.merge(second)
+
+        assert first.get_histogram_stats("latency", {"op": "a"})["count"] == 2
+        assert first.get_aggregate_histogram("latency").count == 3
+        assert first.get_counter_value("requests") == 2
+
+    def test_export_text(self):
+        metrics = PrometheusMetrics(histogram_buckets=[0.5, 1.0])
+        metrics.increment_counter("requests_total", labels={"path": '/a"b'})
+        metrics.set_gauge("pool_size", 4)
+        metrics.observe_histogram("latency", 0.25, labels={"op": "read"})
+        metrics.observe_histogram("latency", 2.0, labels={"op": "read"})
+
+        text = metrics.export_text()
+
+        assert '# TYPE requests_total counter\nrequests_total{path="/a\\"b"} 1' in text
+        assert "pool_size 4" in text
+        assert "# TYPE latency histogram" in text
+        assert 'latency_bucket{op="read",le="0.5"} 1' in text
+        assert 'latency_bucket{op="read",le="1.0"} 1' in text
+        assert 'latency_bucket{op="read",le="+Inf"} 2' in text
+        assert 'latency_sum{op="read"} 2.25' in text
+        assert 'latency_count{op="read"} 2' in text
+
+    def test_workflow_durations_are_histograms(self):
+        exporter = MetricsExporter()
+        exporter.register_workflow_execution("etl", 0.5, "success")
+        exporter.register_workflow_execution("etl", 1.5, "success")
+
+        durations = exporter.get_metrics()["workflow_execution_duration_seconds"]
+        assert durations["etl"].count == 2
+        assert durations["etl"].sum == 2.0
+
+
+class TestExpressPerformanceStats:
+    @pytest.mark.asyncio
+    async def test_stats_and_export(self):
+        express = ExpressDataFlow(Mock(_execution_tracer=None))
+
+        async def noop():
+            return None
+
+        for _ in range(25):
+            await express._execute_with_timing("User.read", noop())
+        await express._execute_with_timing("User.create", noop())
+
+        stats = express.get_performance_stats()
+        assert stats["total_operations"] == 26
+        assert stats["min_time_ms"] <= stats["p50_time_ms"] <= stats["max_time_ms"]
+        assert stats["p99_time_ms"] == stats["max_time_ms"]
+
+        text = express.get_metrics_text()
+        assert 'operation="User.read"' in text
+        assert 'operation="User.create",le="+Inf"} 1' in text
+
+        express.reset_stats()
+        assert express.get_performance_stats()["total_operations"] == 0
@@ -730,3 +730,49 @@ def test_get_pattern_effectiveness_mixed_feedback(pattern_engine, knowledge_base
     assert -0.1 <= effectiveness["effectiveness_score"] <= 0.1  # 1 up, 1 down = ~0
     assert effectiveness["feedback"]["thumbs_up"] == 1
     assert effectiveness["feedback"]["thumbs_down"] == 1
+
+
+def test_find_similar_patterns_parses_keys_once(
+    pattern_engine, knowledge_base, sample_error_analysis, monkeypatch
+):
+    """Test cached pattern keys are parsed once and indexed incrementally."""
+    for pattern_key in ["DF-101:parameter", "DF-999:runtime", "DF-102:parameter"]:
+        knowledge_base.store_ranking(pattern_key, [])
+
+    pattern_engine.find_similar_patterns(sample_error_analysis)
+
+    parse_calls = []
+    original_parse = pattern_engine._parse_pattern_key
+    monkeypatch.setattr(
+        pattern_engine,
+        "_parse_pattern_key",
+        lambda key: parse_calls.append(key) or original_parse(key),
+    )
+
+    knowledge_base.store_ranking("DF-103:parameter", [])
+    results = pattern_engine.find_similar_patterns(sample_error_analysis)
+
+    assert parse_calls == ["DF-103:parameter"]
+    assert [r["pattern_key"] for r in results] == [
+        "DF-101:parameter",
+        "DF-102:parameter",
+        "DF-103:parameter",
+    ]
+
+
+def test_find_similar_patterns_sees_swapped_pattern(
+    pattern_engine, knowledge_base, sample_error_analysis
+):
+    """Test replacing a cached pattern with another keeps the index fresh."""
+    for pattern_key in ["DF-101:parameter", "DF-102:parameter"]:
+        knowledge_base.store_ranking(pattern_key, [])
+    pattern_engine.find_similar_patterns(sample_error_analysis)
+
+    del knowledge_base.patterns["DF-102:parameter"]
+    knowledge_base.store_ranking("DF-103:parameter", [])
+    results = pattern_engine.find_similar_patterns(sample_error_analysis)
+
+    assert [r["pattern_key"] for r in results] == [
+        "DF-101:parameter",
+        "DF-103:parameter",
+    ]
@@ -0,0 +1,206 @@
+"""
+Write Protection Rule Index Tests
+
+Tests the compiled rule index of WriteProtectionEngine: lookups stay
+consistent with the configured rules, are rebuilt when protections change,
+and checks report latency metrics.
+"""
+
+import pytest
+
+from dataflow.core.protection import (
+    ConnectionProtection,
+    FieldProtection,
+    ModelProtection,
+    OperationType,
+    ProtectionLevel,
+    ProtectionViolation,
+    WriteProtectionConfig,
+    WriteProtectionEngine,
+)
+from dataflow.core.protection_middleware import AsyncSQLProtectionWrapper
+
+
+def _many_models(count):
+    return [
+        ModelProtection(
+            model_name=f"Model{i}",
+            allowed_operations={OperationType.READ},
+            protected_fields=[
+                FieldProtection(
+                    field_name="secret",
+                    protection_level=ProtectionLevel.AUDIT,
+                    allowed_operations=set(),
+                )
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+class TestProtectionRuleIndex:
+    """Test the compiled protection rule index."""
+
+    def test_model_and_field_lookups_match_rules(self):
+        """Test indexed lookups give the same verdicts as the rules."""
+        config = WriteProtectionConfig(model_protections=_many_models(300))
+        engine = WriteProtectionEngine(config)
+
+        engine.check_operation("read", model_name="Model150")
+        engine.check_operation("update", model_name="Unprotected")
+
+        with pytest.raises(ProtectionViolation) as exc_info:
+            engine.check_operation("update", model_name="Model299")
+        assert "Model protection blocks update" in str(exc_info.value)
+        assert exc_info.value.level == ProtectionLevel.BLOCK
+
+        with pytest.raises(ProtectionViolation) as exc_info:
+            engine.check_operation("read", model_name="Model7", field_name="secret")
+        assert "Field protection blocks read" in str(exc_info.value)
+        assert exc_info.value.level == ProtectionLevel.AUDIT
+
+        assert engine.get_metrics()["index_builds"] == 1
+        assert engine.get_metrics()["indexed_models"] == 300
+
+    def test_every_matching_model_protection_is_checked(self):
+        """Test later protections of the same model still apply."""
+        config = WriteProtectionConfig(
+            model_protections=[
+                ModelProtection(
+                    model_name="Order", allowed_operations=set(OperationType)
+                ),
+                ModelProtection(
+                    model_name="Order",
+                    allowed_operations={OperationType.READ},
+                    reason="Orders are frozen",
+                ),
+            ]
+        )
+        engine = WriteProtectionEngine(config)
+
+        with pytest.raises(ProtectionViolation, match="Orders are frozen"):
+            engine.check_operation("delete", model_name="Order")
+
+    def test_index_rebuilds_when_protections_change(self):
+        """Test added model and field protections take effect."""
+        config = WriteProtectionConfig()
+        engine = WriteProtectionEngine(config)
+        engine.check_operation("update", model_name="User", field_name="email")
+
+        config.model_protections.append(
+            ModelProtection(model_name="User", allowed_operations=set(OperationType))
+        )
+        engine.check_operation("update", model_name="User", field_name="email")
+
+        config.model_protections[0].protected_fields.append(
+            FieldProtection(field_name="email")
+        )
+        with pytest.raises(ProtectionViolation, match="Field protection"):
+            engine.check_operation("update", model_name="User", field_name="email")
+
+        # In-place edits of an existing rule need an explicit invalidate()
+        config.model_protections[0].protected_fields[0].allowed_operations.add(
+            OperationType.UPDATE
+        )
+        engine.invalidate()
+        engine.check_operation("update", model_name="User", field_name="email")
+        assert engine.get_metrics()["index_builds"] == 3
+
+    def test_index_rebuilds_when_a_protection_is_replaced(self):
+        """Test a protection swapped in at the same position is enforced."""
+        config = WriteProtectionConfig(
+            model_protections=[
+                ModelProtection(
+                    model_name="Order", allowed_operations=set(OperationType)
+                )
+            ]
+        )
+        engine = WriteProtectionEngine(config)
+        engine.check_operation("delete", model_name="Order")
+
+        config.model_protections[0] = ModelProtection(
+            model_name="Order",
+            allowed_operations={OperationType.READ},
+            reason="Orders are frozen",
+        )
+
+        with pytest.raises(ProtectionViolation, match="Orders are frozen"):
+            engine.check_operation("delete", model_name="Order")
+        assert engine.get_metrics()["index_builds"] == 2
+
+    def test_time_windows_and_conditions_are_evaluated_per_check(self):
+        """Test dynamic rules are not served from the decision cache."""
+        state = {"frozen": False}
+        config = WriteProtectionConfig(
+            model_protections=[
+                ModelProtection(
+                    model_name="Invoice",
+                    allowed_operations=set(OperationType),
+                    conditions=[lambda context: not state["frozen"]],
+                )
+            ]
+        )
+        engine = WriteProtectionEngine(config)
+        engine.check_operation("update", model_name="Invoice", context={"id": 1})
+
+        state["frozen"] = True
+        with pytest.raises(ProtectionViolation, match="Custom condition failed"):
+            engine.check_operation("update", model_name="Invoice", context={"id": 1})
+
+    def test_connection_matches_are_memoized(self):
+        """Test connection patterns are matched once per connection string."""
+        config = WriteProtectionConfig.production_safe()
+        config.connection_protections.append(
+            ConnectionProtection(
+                connection_pattern=r".*analytics.*",
+                allowed_operations=set(OperationType),
+            )
+        )
+        engine = WriteProtectionEngine(config)
+        prod = "postgresql://app@prod-db:5432/app"
+
+        for _ in range(100):
+            engine.check_operation("read", connection_string=prod)
+        engine.check_operation("create", connection_string="sqlite:///dev.db")
+        with pytest.raises(ProtectionViolation, match="Connection protection"):
+            engine.check_operation("create", connection_string=prod)
+
+        assert [p.reason for p in engine._connection_matches[prod]] == [
+            "Production database protection"
+        ]
+        assert engine.get_metrics()["cached_connections"] == 2
+
+    def test_check_latency_metrics(self):
+        """Test every check, allowed or blocked, is timed."""
+        engine = WriteProtectionEngine(WriteProtectionConfig.read_only_global())
+
+        engine.check_operation("read")
+        with pytest.raises(ProtectionViolation):
+            engine.check_operation("create")
+
+        metrics = engine.get_metrics()
+        assert metrics["checks"] == 2
+        assert 0 < metrics["avg_check_latency_us"] <= metrics["max_check_latency_us"]
+
+
+class TestSQLOperationDetection:
+    """Test operation detection from SQL text."""
+
+    @pytest.mark.parametrize(
+        "query, operation",
+        [
+            ("  select * from users", "read"),
+            ("\nWITH recent AS (SELECT 1) SELECT * FROM recent", "read"),
+            ("INSERT INTO users VALUES (1)", "create"),
+            ("update users set name = 'x'", "update"),
+            ("DELETE FROM users", "delete"),
+            ("DROP TABLE users", "custom_query"),
+            ("", "custom_query"),
+        ],
+    )
+    def test_detects_leading_keyword(self, query, operation):
+        """Test only the leading keyword decides the operation."""
+        wrapper = AsyncSQLProtectionWrapper(
+            WriteProtectionEngine(WriteProtectionConfig())
+        )
+        assert wrapper._detect_operation_from_sql(query) == operation